@@ -2,27 +2,43 @@
 Backtesting API Endpoints
 
 POST /run              — Start a backtest (async, returns ID)
-GET  /results/{id}     — Get backtest results (poll until completed)
-GET  /list             — List recent backtests
+GET  /results/{id}     — Get backtest results (poll until completed; ?points= equity resolution)
+GET  /list             — List recent backtests (metrics only, no equity curve / trade log)
 DELETE /{id}           — Delete a backtest
+
+POST /sweep            — Start a parameter sweep / walk-forward (async, returns ID)
+GET  /sweep/{id}       — Get sweep status and ranking (?rows=true for the per-run table)
+GET  /sweep/{id}/stream — SSE: ranked runs as they finish, then the final ranking
+GET  /sweeps           — List recent sweeps
+DELETE /sweep/{id}     — Delete a sweep
 """
 import asyncio
 import threading
 from datetime import date, datetime
-from typing import Optional
+from math import prod
+from typing import AsyncGenerator, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, field_validator
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from loguru import logger
 
 from app.database import get_db, SessionLocal
+from app.models.backtest_artifact import BacktestArtifact
 from app.models.backtest_result import BacktestResult
-from app.services.backtesting.engine import backtest_engine
+from app.models.backtest_sweep import BacktestSweep
+from app.services.backtesting.artifacts import DEFAULT_POINTS, MAX_POINTS
+from app.services.backtesting.engine import BACKTEST_ENGINES, STRATEGY_NAMES, backtest_engine
+from app.services.backtesting.sweep import (
+    INTEGER_PARAMS, MAX_COMBINATIONS, MAX_RUNS, MAX_SYMBOLS, RANK_METRICS, SWEEPABLE_PARAMS,
+    get_progress, sweep_engine,
+)
+from app.services.screening.scan_stream import RunningTopN, sse_event
 
 # Limit concurrent backtest threads (Backtrader is CPU+memory intensive)
 _BACKTEST_SEMAPHORE = threading.Semaphore(3)
-from app.services.backtesting.strategies import STRATEGY_MAP
 
 router = APIRouter()
 
@@ -40,12 +56,13 @@ class BacktestRequest(BaseModel):
     end_date: str                         # YYYY-MM-DD
     initial_capital: float = 100000.0
     position_size_pct: float = 10.0
+    engine: str = "vectorized"            # vectorized, backtrader
 
     @field_validator("strategy")
     @classmethod
     def validate_strategy(cls, v):
-        if v not in STRATEGY_MAP:
-            raise ValueError(f"Unknown strategy: {v}. Options: {list(STRATEGY_MAP.keys())}")
+        if v not in STRATEGY_NAMES:
+            raise ValueError(f"Unknown strategy: {v}. Options: {list(STRATEGY_NAMES)}")
         return v
 
     @field_validator("timeframe")
@@ -64,6 +81,93 @@ class BacktestRequest(BaseModel):
             raise ValueError(f"Invalid cap_size: {v}. Options: {valid}")
         return v
 
+    @field_validator("engine")
+    @classmethod
+    def validate_engine(cls, v):
+        if v not in BACKTEST_ENGINES:
+            raise ValueError(f"Invalid engine: {v}. Options: {list(BACKTEST_ENGINES)}")
+        return v
+
+
+class WalkForwardConfig(BaseModel):
+    folds: int = 4                        # rolling in-sample/out-of-sample folds
+    train_ratio: float = 0.7              # in-sample share of each fold
+
+    @field_validator("folds")
+    @classmethod
+    def validate_folds(cls, v):
+        if not 2 <= v <= 20:
+            raise ValueError("folds must be between 2 and 20")
+        return v
+
+    @field_validator("train_ratio")
+    @classmethod
+    def validate_train_ratio(cls, v):
+        if not 0.5 <= v <= 0.9:
+            raise ValueError("train_ratio must be between 0.5 and 0.9")
+        return v
+
+
+class SweepRequest(BaseModel):
+    symbols: List[str]
+    strategy: str
+    timeframe: str = "15m"
+    cap_size: str = "large_cap"
+    start_date: str                       # YYYY-MM-DD
+    end_date: str                         # YYYY-MM-DD
+    initial_capital: float = 100000.0
+    position_size_pct: float = 10.0
+    grid: Dict[str, List[Union[int, float]]]  # e.g. {"stop_atr_mult": [0.5, 0.75, 1.0], "min_rvol": [0.8, 1.2]}
+    walk_forward: Optional[WalkForwardConfig] = None
+    rank_by: str = "total_return_pct"     # total_return_pct, sharpe_ratio, profit_factor, win_rate
+
+    @field_validator("strategy")
+    @classmethod
+    def validate_strategy(cls, v):
+        return BacktestRequest.validate_strategy(v)
+
+    @field_validator("timeframe")
+    @classmethod
+    def validate_timeframe(cls, v):
+        return BacktestRequest.validate_timeframe(v)
+
+    @field_validator("cap_size")
+    @classmethod
+    def validate_cap_size(cls, v):
+        return BacktestRequest.validate_cap_size(v)
+
+    @field_validator("symbols")
+    @classmethod
+    def validate_symbols(cls, v):
+        symbols = list(dict.fromkeys(s.upper().strip() for s in v if s.strip()))
+        if not symbols or len(symbols) > MAX_SYMBOLS:
+            raise ValueError(f"symbols must list 1-{MAX_SYMBOLS} tickers")
+        return symbols
+
+    @field_validator("grid")
+    @classmethod
+    def validate_grid(cls, v):
+        unknown = sorted(set(v) - SWEEPABLE_PARAMS)
+        if unknown:
+            raise ValueError(f"Unknown grid params: {unknown}. Options: {sorted(SWEEPABLE_PARAMS)}")
+        if not v or any(not values for values in v.values()):
+            raise ValueError("grid needs at least one param with at least one value")
+        for key in set(v) & INTEGER_PARAMS:
+            if any(value != int(value) for value in v[key]):
+                raise ValueError(f"{key} takes whole numbers")
+            v[key] = [int(value) for value in v[key]]
+        combinations = prod(len(set(values)) for values in v.values())
+        if combinations > MAX_COMBINATIONS:
+            raise ValueError(f"grid has {combinations} combinations (max {MAX_COMBINATIONS})")
+        return {k: sorted(set(values)) for k, values in v.items()}
+
+    @field_validator("rank_by")
+    @classmethod
+    def validate_rank_by(cls, v):
+        if v not in RANK_METRICS:
+            raise ValueError(f"Invalid rank_by: {v}. Options: {list(RANK_METRICS)}")
+        return v
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Background task runner
@@ -107,6 +211,29 @@ def _run_backtest_sync(backtest_id: int):
         _BACKTEST_SEMAPHORE.release()
 
 
+def _run_sweep_sync(sweep_id: int):
+    """Run a sweep in a fresh DB session (for background thread).
+    Shares the backtest semaphore — the runs themselves fan out over the compute pool."""
+    acquired = _BACKTEST_SEMAPHORE.acquire(timeout=300)
+    db = SessionLocal()
+    try:
+        if not acquired:
+            logger.warning(f"Sweep {sweep_id}: timed out waiting for semaphore slot")
+            record = db.query(BacktestSweep).filter(BacktestSweep.id == sweep_id).first()
+            if record:
+                record.status = "failed"
+                record.error_message = "Too many concurrent backtests. Try again later."
+                db.commit()
+            return
+        sweep_engine.run_sweep(sweep_id, db)
+    except Exception as e:
+        logger.error(f"Background sweep {sweep_id} failed: {e}")
+    finally:
+        db.close()
+        if acquired:
+            _BACKTEST_SEMAPHORE.release()
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # Endpoints
 # ═════════════════════════════════════════════════════════════════════════════
@@ -142,6 +269,7 @@ async def run_backtest(req: BacktestRequest, db: Session = Depends(get_db)):
         end_date=end_date,
         initial_capital=req.initial_capital,
         position_size_pct=req.position_size_pct,
+        parameters={"engine": req.engine},
         status="pending",
     )
     db.add(record)
@@ -151,7 +279,7 @@ async def run_backtest(req: BacktestRequest, db: Session = Depends(get_db)):
     # Launch in background thread (cerebro.run() is blocking)
     asyncio.get_event_loop().run_in_executor(None, _run_backtest_sync, record.id)
 
-    logger.info(f"Backtest {record.id} started: {req.symbol} {req.strategy} {req.timeframe}")
+    logger.info(f"Backtest {record.id} started: {req.symbol} {req.strategy} {req.timeframe} ({req.engine})")
 
     return {
         "id": record.id,
@@ -161,12 +289,19 @@ async def run_backtest(req: BacktestRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/results/{backtest_id}")
-def get_results(backtest_id: int, db: Session = Depends(get_db)):
-    """Get backtest results. Poll this until status='completed' or 'failed'."""
+def get_results(
+    backtest_id: int,
+    points: int = Query(DEFAULT_POINTS, ge=0, le=MAX_POINTS),
+    db: Session = Depends(get_db),
+):
+    """
+    Get backtest results. Poll this until status='completed' or 'failed'.
+    The equity curve is LTTB-downsampled to `points` (0 = every bar).
+    """
     record = db.query(BacktestResult).filter(BacktestResult.id == backtest_id).first()
     if not record:
         raise HTTPException(404, f"Backtest {backtest_id} not found")
-    return record.to_dict()
+    return record.to_dict(include_data=record.status == "completed", points=points)
 
 
 @router.get("/list")
@@ -178,15 +313,19 @@ def list_backtests(
     strategy: Optional[str] = None,
 ):
     """List recent backtests, newest first."""
-    query = db.query(BacktestResult).order_by(BacktestResult.created_at.desc())
+    query = db.query(BacktestResult)
 
     if symbol:
         query = query.filter(BacktestResult.symbol == symbol.upper())
     if strategy:
         query = query.filter(BacktestResult.strategy == strategy)
 
-    total = query.count()
-    records = query.offset(offset).limit(min(limit, 50)).all()
+    # Count ids only (Query.count() would wrap every column in a subquery)
+    total = query.with_entities(func.count(BacktestResult.id)).scalar()
+    records = (
+        query.order_by(BacktestResult.created_at.desc())
+        .offset(offset).limit(min(limit, 50)).all()
+    )
 
     return {
         "total": total,
@@ -201,6 +340,172 @@ def delete_backtest(backtest_id: int, db: Session = Depends(get_db)):
     if not record:
         raise HTTPException(404, f"Backtest {backtest_id} not found")
 
+    db.query(BacktestArtifact).filter(BacktestArtifact.backtest_id == backtest_id).delete()
     db.delete(record)
     db.commit()
     return {"message": f"Backtest {backtest_id} deleted"}
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# Parameter sweeps
+# ═════════════════════════════════════════════════════════════════════════════
+
+@router.post("/sweep")
+async def start_sweep(req: SweepRequest, db: Session = Depends(get_db)):
+    """
+    Start a parameter sweep over symbols × grid combinations (vectorized
+    engine), optionally walk-forward. Returns immediately with the sweep ID —
+    follow /sweep/{id}/stream or poll /sweep/{id}.
+    """
+    try:
+        start_date = date.fromisoformat(req.start_date)
+        end_date = date.fromisoformat(req.end_date)
+    except ValueError:
+        raise HTTPException(400, "Invalid date format. Use YYYY-MM-DD.")
+
+    if end_date <= start_date:
+        raise HTTPException(400, "end_date must be after start_date")
+
+    if req.initial_capital < 1000:
+        raise HTTPException(400, "initial_capital must be at least $1,000")
+
+    if req.position_size_pct < 1 or req.position_size_pct > 100:
+        raise HTTPException(400, "position_size_pct must be between 1 and 100")
+
+    runs = len(req.symbols) * prod(len(values) for values in req.grid.values())
+    if runs > MAX_RUNS:
+        raise HTTPException(400, f"Sweep has {runs} runs (symbols × combinations, max {MAX_RUNS})")
+
+    record = BacktestSweep(
+        symbols=req.symbols,
+        strategy=req.strategy,
+        timeframe=req.timeframe,
+        cap_size=req.cap_size,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=req.initial_capital,
+        position_size_pct=req.position_size_pct,
+        grid=req.grid,
+        walk_forward=req.walk_forward.model_dump() if req.walk_forward else None,
+        rank_by=req.rank_by,
+        total_runs=runs,
+        status="pending",
+    )
+    db.add(record)
+    db.commit()
+    db.refresh(record)
+
+    asyncio.get_event_loop().run_in_executor(None, _run_sweep_sync, record.id)
+
+    logger.info(f"Sweep {record.id} started: {len(req.symbols)} symbols × {runs // len(req.symbols)} combinations")
+
+    return {
+        "id": record.id,
+        "status": "pending",
+        "total_runs": runs,
+        "message": f"Sweep started for {', '.join(req.symbols)} ({req.strategy})",
+    }
+
+
+@router.get("/sweep/{sweep_id}")
+def get_sweep(sweep_id: int, rows: bool = False, db: Session = Depends(get_db)):
+    """Sweep status, ranking and walk-forward summary (per-run table with rows=true)."""
+    record = db.query(BacktestSweep).filter(BacktestSweep.id == sweep_id).first()
+    if not record:
+        raise HTTPException(404, f"Sweep {sweep_id} not found")
+    return record.to_dict(include_results=rows)
+
+
+@router.get("/sweep/{sweep_id}/stream")
+async def stream_sweep(sweep_id: int):
+    """
+    SSE stream of a sweep:
+
+        progress  {processed, total, rows, removed, ranks}   top runs by rank_by (diffs)
+        complete  {status, ranking, walk_forward_summary, ...}
+    """
+    def load() -> Optional[dict]:
+        db = SessionLocal()
+        try:
+            record = db.query(BacktestSweep).filter(BacktestSweep.id == sweep_id).first()
+            return record.to_dict() if record else None
+        finally:
+            db.close()
+
+    async def generate_events() -> AsyncGenerator[bytes, None]:
+        try:
+            sweep = await asyncio.to_thread(load)
+            if sweep is None:
+                yield sse_event({"type": "error", "message": f"Sweep {sweep_id} not found"})
+                return
+
+            top = RunningTopN(key="id")
+            seen = 0
+            while sweep["status"] in ("pending", "running"):
+                progress = get_progress(sweep_id)
+                if progress is not None:
+                    rows = progress.rows[seen:]
+                    seen += len(rows)
+                    for row in rows:
+                        top.push(row)
+                    if rows:
+                        yield sse_event({
+                            "type": "progress",
+                            "processed": progress.processed,
+                            "total": progress.total,
+                            **top.diff(),
+                        })
+                    if progress.done:
+                        sweep = await asyncio.to_thread(load)
+                        continue
+                await asyncio.sleep(0.5)
+                if progress is None:
+                    sweep = await asyncio.to_thread(load) or {"status": "failed"}
+
+            yield sse_event({"type": "complete", **sweep})
+
+        except Exception as e:
+            logger.error(f"Error in sweep stream {sweep_id}: {e}")
+            yield sse_event({"type": "error", "message": str(e)})
+
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.get("/sweeps")
+def list_sweeps(
+    db: Session = Depends(get_db),
+    limit: int = 20,
+    offset: int = 0,
+    strategy: Optional[str] = None,
+):
+    """List recent sweeps, newest first (without per-run tables)."""
+    query = db.query(BacktestSweep).order_by(BacktestSweep.created_at.desc())
+    if strategy:
+        query = query.filter(BacktestSweep.strategy == strategy)
+
+    total = query.count()
+    records = query.offset(offset).limit(min(limit, 50)).all()
+    return {
+        "total": total,
+        "sweeps": [r.to_dict() for r in records],
+    }
+
+
+@router.delete("/sweep/{sweep_id}")
+def delete_sweep(sweep_id: int, db: Session = Depends(get_db)):
+    """Delete a sweep."""
+    record = db.query(BacktestSweep).filter(BacktestSweep.id == sweep_id).first()
+    if not record:
+        raise HTTPException(404, f"Sweep {sweep_id} not found")
+
+    db.delete(record)
+    db.commit()
+    return {"message": f"Sweep {sweep_id} deleted"}
@@ -15,6 +15,7 @@ from app.api.auth import require_trading_auth
 from app.models.bot_config import BotConfiguration, ExecutionMode, SizingMode
 from app.models.bot_state import BotState
 from app.models.executed_trade import ExecutedTrade, TradeStatus
+from app.services.signals.signal_engine import signal_engine
 from app.services.trading.auto_trader import auto_trader
 from app.services.trading.trade_journal import TradeJournal
 
@@ -162,6 +163,7 @@ def pause_bot(db: Session = Depends(get_db)):
         raise HTTPException(400, f"Bot is not running (current: {state.status})")
     state.status = "paused"
     db.commit()
+    auto_trader.publish_state(state)
     return {"status": "paused"}
 
 
@@ -190,6 +192,7 @@ def resume_bot(db: Session = Depends(get_db)):
     state.status = "running"
     state.circuit_breaker_level = "none"
     db.commit()
+    auto_trader.publish_state(state)
     return {"status": "running"}
 
 
@@ -222,6 +225,7 @@ def approve_signal(signal_id: int, db: Session = Depends(get_db)):
     trade = auto_trader.approve_signal(signal_id, db)
     if not trade:
         raise HTTPException(400, "Signal could not be executed")
+    signal_engine.publish_unread_count(db)
     return trade.to_dict()
 
 
@@ -301,6 +305,7 @@ def execute_signal(signal_id: int, db: Session = Depends(get_db)):
     result = auto_trader.execute_manual_signal(signal_id, db)
     if "error" in result:
         raise HTTPException(400, result["error"])
+    signal_engine.publish_unread_count(db)
     return result
 
 
@@ -8,6 +8,7 @@ from fastapi import APIRouter
 from loguru import logger
 
 from app.services.health_monitor import health_monitor
+from app.services.startup import startup_profile
 
 router = APIRouter()
 
@@ -62,6 +63,16 @@ async def get_scheduler_job(job_id: str):
     return result
 
 
+@router.get("/startup")
+async def get_startup_profile():
+    """
+    Cold-start profile of this process: the slowest endpoint-module imports,
+    the total import time, and the durations of the background warm-up
+    phases (init_db, seeders, scan cleanup, optional API clients).
+    """
+    return startup_profile.report()
+
+
 @router.post("/check")
 async def force_health_check():
     """
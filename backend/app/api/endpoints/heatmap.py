@@ -48,7 +48,7 @@ async def get_market_overview() -> Dict[str, Any]:
         logger.info(f"Fetching market data for {len(all_symbols)} symbols")
 
         # Get snapshots for all symbols at once
-        snapshots = alpaca_service.get_multi_snapshots(all_symbols)
+        snapshots = await alpaca_service.get_multi_snapshots_async(all_symbols)
 
         if not snapshots:
             raise HTTPException(
@@ -116,7 +116,7 @@ async def get_sector_data(sector_name: str) -> Dict[str, Any]:
 
     try:
         symbols = SECTORS[sector_name]
-        snapshots = alpaca_service.get_multi_snapshots(symbols)
+        snapshots = await alpaca_service.get_multi_snapshots_async(symbols)
 
         stocks = []
         for symbol in symbols:
@@ -180,7 +180,7 @@ async def get_alpaca_status() -> Dict[str, Any]:
     # Test single snapshot if service is available
     if alpaca_service.is_available:
         try:
-            test_snapshot = alpaca_service.get_snapshot("AAPL")
+            test_snapshot = await alpaca_service.get_snapshot_async("AAPL")
             if test_snapshot:
                 status["test_snapshot"] = test_snapshot
                 status["test_snapshot_status"] = "SUCCESS"
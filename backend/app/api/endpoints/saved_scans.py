@@ -2,9 +2,14 @@
 Saved Scans API endpoints
 Persist and manage screening results across sessions
 """
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+import base64
+import json
+from decimal import Decimal
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, load_only
+from typing import List, Optional, Dict, Any, Literal, Tuple
 from pydantic import BaseModel
 from loguru import logger
 from datetime import datetime
@@ -56,16 +61,75 @@ async def get_saved_scan_categories(db: Session = Depends(get_db)) -> Dict[str,
     }
 
 
+# Columns loaded for fields=summary (stock_data JSON is never read)
+_SUMMARY_COLUMNS = (
+    SavedScanResult.id,
+    SavedScanResult.scan_type,
+    SavedScanResult.symbol,
+    SavedScanResult.company_name,
+    SavedScanResult.score,
+    SavedScanResult.current_price,
+    SavedScanResult.market_cap,
+    SavedScanResult.iv_rank,
+    SavedScanResult.iv_percentile,
+    SavedScanResult.rsi,
+    SavedScanResult.sector,
+    SavedScanResult.scanned_at,
+)
+
+MAX_PAGE_SIZE = 1000
+
+
+def _encode_cursor(row: SavedScanResult) -> str:
+    """Opaque keyset cursor: (score, id) of the last row on the page."""
+    score = str(row.score) if row.score is not None else None
+    raw = json.dumps([score, row.id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[Decimal], int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (Decimal(score) if score is not None else None), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_cursor(cursor: str):
+    """
+    WHERE clause for rows after the cursor in (score DESC NULLS LAST, id DESC)
+    order — keyset pagination, so deep pages cost the same as the first.
+    """
+    score, row_id = _decode_cursor(cursor)
+    if score is None:
+        return and_(SavedScanResult.score.is_(None), SavedScanResult.id < row_id)
+    return or_(
+        SavedScanResult.score < score,
+        and_(SavedScanResult.score == score, SavedScanResult.id < row_id),
+        SavedScanResult.score.is_(None),
+    )
+
+
 @router.get("/results/{scan_type}")
-async def get_saved_scan_results(scan_type: str, db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_saved_scan_results(
+    scan_type: str,
+    fields: Literal["summary", "full"] = Query("full", description="summary omits the stock_data blob"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (all rows if omitted)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
     """
-    Get all saved results for a specific scan type.
+    Get saved results for a specific scan type, sorted by score.
 
     Args:
         scan_type: The preset name (e.g., "iv_crush", "momentum")
+        fields: "summary" for list-view columns only, "full" to include stock_data
+        limit: Page size; pages are chained with next_cursor
+        cursor: Cursor returned by the previous page
 
     Returns:
-        List of stocks saved under this scan type
+        Page of stocks saved under this scan type
     """
     # Get metadata
     metadata = db.query(SavedScanMetadata).filter(
@@ -78,24 +142,55 @@ async def get_saved_scan_results(scan_type: str, db: Session = Depends(get_db))
             "display_name": scan_type,
             "stocks": [],
             "stock_count": 0,
-            "last_run_at": None
+            "last_run_at": None,
+            "next_cursor": None,
         }
 
-    # Get results sorted by score
-    results = db.query(SavedScanResult).filter(
-        SavedScanResult.scan_type == scan_type
-    ).order_by(SavedScanResult.score.desc()).all()
+    query = db.query(SavedScanResult).filter(SavedScanResult.scan_type == scan_type)
+    total = query.count()
+
+    if fields == "summary":
+        query = query.options(load_only(*_SUMMARY_COLUMNS))
+    if cursor:
+        query = query.filter(_after_cursor(cursor))
+    query = query.order_by(SavedScanResult.score.desc().nulls_last(), SavedScanResult.id.desc())
+
+    # Fetch one extra row to know whether another page exists
+    results = query.limit(limit + 1).all() if limit else query.all()
+    next_cursor = None
+    if limit and len(results) > limit:
+        results = results[:limit]
+        next_cursor = _encode_cursor(results[-1])
+
+    serialize = SavedScanResult.to_summary_dict if fields == "summary" else SavedScanResult.to_dict
 
     return {
         "scan_type": scan_type,
         "display_name": metadata.display_name or scan_type,
         "description": metadata.description,
-        "stocks": [r.to_dict() for r in results],
-        "stock_count": len(results),
-        "last_run_at": metadata.last_run_at.isoformat() if metadata.last_run_at else None
+        "stocks": [serialize(r) for r in results],
+        "stock_count": total,
+        "last_run_at": metadata.last_run_at.isoformat() if metadata.last_run_at else None,
+        "next_cursor": next_cursor,
     }
 
 
+@router.get("/results/{scan_type}/{symbol}")
+async def get_saved_scan_stock(scan_type: str, symbol: str, db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """
+    Get one saved stock with its full stock_data (detail view for summary lists).
+    """
+    result = db.query(SavedScanResult).filter(
+        SavedScanResult.scan_type == scan_type,
+        SavedScanResult.symbol == symbol.upper()
+    ).first()
+
+    if not result:
+        raise HTTPException(status_code=404, detail=f"Stock {symbol} not found in {scan_type}")
+
+    return result.to_dict()
+
+
 @router.post("/save")
 async def save_scan_results(request: SaveScanRequest, db: Session = Depends(get_db)) -> Dict[str, Any]:
     """
@@ -121,20 +216,7 @@ async def save_scan_results(request: SaveScanRequest, db: Session = Depends(get_
         # Save new results
         saved_count = 0
         for stock in request.results:
-            # Extract common fields from stock data
-            saved_result = SavedScanResult(
-                scan_type=scan_type,
-                symbol=stock.get("symbol", ""),
-                company_name=stock.get("company_name") or stock.get("name"),
-                score=stock.get("composite_score") or stock.get("score"),
-                current_price=stock.get("current_price") or stock.get("price"),
-                market_cap=stock.get("market_cap"),
-                iv_rank=stock.get("iv_rank"),
-                iv_percentile=stock.get("iv_percentile"),
-                stock_data=stock,  # Store full data as JSON
-                scanned_at=datetime.utcnow()
-            )
-            db.add(saved_result)
+            db.add(SavedScanResult.from_stock(scan_type, stock, scanned_at=datetime.utcnow()))
             saved_count += 1
 
         # Update or create metadata
@@ -17,9 +17,9 @@ from loguru import logger
 
 from app.database import get_db
 from app.models.saved_scan import SavedScanResult
-from app.models.signal_queue import SignalQueue
+from app.services.signals.queue_writer import insert_queue_items
 from app.services.signals.strategy_selector import strategy_selector
-from app.services.data_fetcher.fmp_service import fmp_service
+from app.services.data_fetcher.strategy_metrics import local_strategy_metrics
 from app.services.data_fetcher.alpaca_service import alpaca_service
 from app.services.ai.claude_service import get_claude_service
 
@@ -67,7 +67,7 @@ async def process_scan(request: ProcessRequest, db: Session = Depends(get_db)):
     Run the StrategySelector pipeline on all stocks from a saved scan.
 
     1. Fetch all stocks from SavedScanResult for the given scan_type
-    2. Batch-fetch fresh FMP technical indicators
+    2. Batch-compute fresh technical indicators (local bars, FMP fallback)
     3. Batch-fetch Alpaca snapshots
     4. Run StrategySelector on each stock
     5. Auto-queue HIGH confidence stocks to signal queue
@@ -100,21 +100,19 @@ async def process_scan(request: ProcessRequest, db: Session = Depends(get_db)):
         symbols = [s["symbol"] for s in stocks_data]
         logger.info(f"[ScanProcessing] Processing {len(symbols)} stocks from '{request.scan_type}'")
 
-        # 2. Fetch fresh FMP indicators (parallel, async)
+        # 2. Compute fresh indicators from batched daily bars (FMP fallback)
         bulk_metrics = {}
         try:
             bulk_metrics = await asyncio.to_thread(
-                fmp_service.get_bulk_strategy_metrics, symbols
+                local_strategy_metrics.get_bulk_strategy_metrics, symbols
             )
         except Exception as e:
-            logger.warning(f"[ScanProcessing] FMP bulk fetch failed, continuing without: {e}")
+            logger.warning(f"[ScanProcessing] Strategy metrics fetch failed, continuing without: {e}")
 
-        # 3. Fetch Alpaca snapshots (sync call, wrap in thread)
+        # 3. Fetch Alpaca snapshots
         bulk_snapshots = {}
         try:
-            bulk_snapshots = await asyncio.to_thread(
-                alpaca_service.get_multi_snapshots, symbols
-            )
+            bulk_snapshots = await alpaca_service.get_multi_snapshots_async(symbols)
         except Exception as e:
             logger.warning(f"[ScanProcessing] Alpaca snapshot fetch failed, continuing without: {e}")
 
@@ -123,45 +121,23 @@ async def process_scan(request: ProcessRequest, db: Session = Depends(get_db)):
             stocks_data, bulk_metrics, bulk_snapshots
         )
 
-        # 5. Auto-queue HIGH confidence stocks
-        queued_items = []
+        # 5. Auto-queue HIGH confidence stocks (one query for active keys, one INSERT)
+        stocks_by_symbol = {s["symbol"]: s for s in stocks_data}
+        rows = []
         for result in categorized["auto_queued"]:
-            symbol = result["symbol"]
-            name = next(
-                (s.get("name") for s in stocks_data if s["symbol"] == symbol), None
-            )
-            cap_size = next(
-                (s.get("cap_size") for s in stocks_data if s["symbol"] == symbol), None
-            )
-
+            stock = stocks_by_symbol.get(result["symbol"], {})
             for tf_entry in result["timeframes"]:
-                tf = tf_entry["tf"]
-                # Check if already in active queue for this symbol+timeframe
-                existing = db.query(SignalQueue).filter(
-                    SignalQueue.symbol == symbol,
-                    SignalQueue.timeframe == tf,
-                    SignalQueue.status == "active",
-                ).first()
-                if existing:
-                    continue
-
-                queue_item = SignalQueue(
-                    symbol=symbol,
-                    name=name,
-                    timeframe=tf,
-                    strategy=tf_entry.get("strategy", "auto"),
-                    cap_size=cap_size,
-                    source="auto_process",
-                    status="active",
-                    confidence_level=result["confidence"],
-                    strategy_reasoning=result["reasoning"],
-                )
-                db.add(queue_item)
-                queued_items.append({
-                    "symbol": symbol,
-                    "timeframe": tf,
-                    "confidence": result["confidence"],
+                rows.append({
+                    "symbol": result["symbol"],
+                    "name": stock.get("name"),
+                    "timeframe": tf_entry["tf"],
+                    "strategy": tf_entry.get("strategy", "auto"),
+                    "cap_size": stock.get("cap_size"),
+                    "source": "auto_process",
+                    "confidence_level": result["confidence"],
+                    "strategy_reasoning": result["reasoning"],
                 })
+        queued_items = insert_queue_items(db, rows)
 
         db.commit()
 
@@ -308,8 +284,8 @@ async def queue_reviewed_stocks(request: QueueReviewedRequest, db: Session = Dep
         raise HTTPException(400, "No stocks provided")
 
     try:
-        added = []
         skipped = []
+        rows = []
 
         for stock in request.stocks:
             symbol = stock.symbol.upper().strip()
@@ -319,33 +295,29 @@ async def queue_reviewed_stocks(request: QueueReviewedRequest, db: Session = Dep
                     skipped.append({"symbol": symbol, "timeframe": tf, "reason": "invalid timeframe"})
                     continue
 
-                # Check for existing active entry
-                existing = db.query(SignalQueue).filter(
-                    SignalQueue.symbol == symbol,
-                    SignalQueue.timeframe == tf,
-                    SignalQueue.status == "active",
-                ).first()
-
-                if existing:
-                    skipped.append({"symbol": symbol, "timeframe": tf, "reason": "already active"})
-                    continue
-
-                queue_item = SignalQueue(
-                    symbol=symbol,
-                    name=stock.name,
-                    timeframe=tf,
-                    strategy=stock.strategy,
-                    cap_size=stock.cap_size,
-                    source="ai_review",
-                    status="active",
-                    confidence_level=stock.confidence_level,
-                    strategy_reasoning=stock.reasoning,
-                )
-                db.add(queue_item)
-                added.append({"symbol": symbol, "timeframe": tf})
+                rows.append({
+                    "symbol": symbol,
+                    "name": stock.name,
+                    "timeframe": tf,
+                    "strategy": stock.strategy,
+                    "cap_size": stock.cap_size,
+                    "source": "ai_review",
+                    "confidence_level": stock.confidence_level,
+                    "strategy_reasoning": stock.reasoning,
+                })
 
+        written = insert_queue_items(db, rows)
         db.commit()
 
+        added = [{"symbol": r["symbol"], "timeframe": r["timeframe"]} for r in written]
+        written_keys = {(r["symbol"], r["timeframe"]) for r in written}
+        for r in rows:
+            key = (r["symbol"], r["timeframe"])
+            if key in written_keys:
+                written_keys.discard(key)   # first row per key was written, repeats are skipped
+            else:
+                skipped.append({"symbol": key[0], "timeframe": key[1], "reason": "already active"})
+
         logger.info(f"[ScanProcessing] Queued {len(added)} reviewed items, skipped {len(skipped)}")
 
         return {
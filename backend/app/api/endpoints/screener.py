@@ -3,57 +3,26 @@ Screening API endpoints
 """
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from typing import List, Optional, Any, Dict, AsyncGenerator
+from typing import List, Optional, Dict, AsyncGenerator
 from pydantic import BaseModel
 from loguru import logger
-import numpy as np
-import json
 import asyncio
 import time
+from contextlib import aclosing
 
 from app.services.screening.engine import screening_engine
+from app.services.screening.planner import ScreeningStats
+from app.services.screening.scan_stream import TOP_N, RunningTopN, result_chunks, sse_event
 from app.services.data_fetcher.finviz import finviz_service
 from app.services.analysis.options import OptionsAnalysis
-from app.data.stock_universe import get_universe_by_criteria, get_dynamic_universe, FULL_UNIVERSE
+from app.data.stock_universe import get_universe_by_criteria, get_dynamic_universe_rows, get_stock_universe
 from app.data.presets_catalog import LEAPS_PRESETS, _PRESET_DISPLAY_NAMES
 from app.schemas.screening import ScreenResponse, ScreeningResultV1
+from app.utils.serialization import FastJSONResponse, to_native
 
 router = APIRouter()
 
 
-def convert_numpy_types(obj: Any) -> Any:
-    """
-    Recursively convert numpy types to native Python types for JSON serialization
-    """
-    if isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif hasattr(obj, 'item'):  # Catch any other numpy scalar types
-        return obj.item()
-    # Handle any remaining numpy types by checking module (catches deprecated numpy.bool, etc.)
-    elif type(obj).__module__ == 'numpy':
-        type_name = type(obj).__name__.lower()
-        if 'bool' in type_name:
-            return bool(obj)
-        elif 'int' in type_name:
-            return int(obj)
-        elif 'float' in type_name:
-            return float(obj)
-        else:
-            return str(obj)  # Fallback to string representation
-    else:
-        return obj
-
-
 class ScreeningCriteria(BaseModel):
     """Custom screening criteria"""
     # --- Original fields (backward-compatible) ---
@@ -118,7 +87,7 @@ async def screen_stocks(request: ScreenRequest):
         )
 
         # Convert numpy types to native Python types
-        results = convert_numpy_types(results)
+        results = to_native(results)
 
         # Count how many passed all filters
         passed_count = sum(1 for r in results if r.get('passed_all', False))
@@ -159,7 +128,7 @@ async def screen_single_stock(symbol: str):
             raise HTTPException(status_code=404, detail=f"Unable to screen {symbol}")
 
         # Convert numpy types to native Python types
-        result = convert_numpy_types(result)
+        result = to_native(result)
 
         return result
 
@@ -202,14 +171,11 @@ async def batch_scores(request: BatchScoresRequest):
             None, screening_engine.calculate_batch_scores, symbols
         )
 
-        # Convert numpy types
-        scores = convert_numpy_types(scores)
-
-        return {
+        return FastJSONResponse({
             "scores": scores,
             "total": len(symbols),
             "scored": len(scores)
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error in batch scoring: {e}")
@@ -239,13 +205,10 @@ async def get_top_candidates(
             None, screening_engine.get_top_candidates, symbols, top_n
         )
 
-        # Convert numpy types to native Python types
-        top_candidates = convert_numpy_types(top_candidates)
-
-        return {
+        return FastJSONResponse({
             "candidates": top_candidates,
             "count": len(top_candidates)
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error getting top candidates: {e}")
@@ -334,7 +297,7 @@ async def screen_with_finviz(request: FinvizScreenRequest):
         )
 
         # Convert numpy types to native Python types
-        results = convert_numpy_types(results)
+        results = to_native(results)
 
         # Count how many passed all filters
         passed_count = sum(1 for r in results if r.get('passed_all', False))
@@ -388,7 +351,7 @@ async def scan_market(criteria: Optional[ScreeningCriteria] = None):
             universe_name = "targeted"
         else:
             # Use full universe for comprehensive scan
-            stock_universe = FULL_UNIVERSE
+            stock_universe = get_stock_universe("all")
             universe_name = "full"
 
         logger.info(f"Starting automated market scan ({universe_name} universe: {len(stock_universe)} stocks)...")
@@ -400,7 +363,7 @@ async def scan_market(criteria: Optional[ScreeningCriteria] = None):
         )
 
         # Convert numpy types
-        results = convert_numpy_types(results)
+        results = to_native(results)
 
         # Count passed
         passed_count = sum(1 for r in results if r.get('passed_all', False))
@@ -476,7 +439,7 @@ async def quick_scan(request: QuickScanRequest):
         )
 
         # Convert numpy types
-        results = convert_numpy_types(results)
+        results = to_native(results)
 
         # Count passed
         passed_count = sum(1 for r in results if r.get('passed_all', False))
@@ -595,74 +558,68 @@ async def stream_scan(preset: str = "moderate"):
     Returns:
         SSE stream with progress updates and results
     """
-    async def generate_events() -> AsyncGenerator[str, None]:
+    async def generate_events() -> AsyncGenerator[bytes, None]:
         try:
             preset_data = LEAPS_PRESETS.get(preset)
             if not preset_data:
                 logger.warning(f"[StreamScan] Unknown preset '{preset}', falling back to 'moderate'")
                 preset_data = LEAPS_PRESETS["moderate"]
             preset_criteria = {k: v for k, v in preset_data.items() if k != "description"}
-            stock_universe = get_dynamic_universe(preset_criteria)
+            stock_universe, universe_rows = await asyncio.to_thread(get_dynamic_universe_rows, preset_criteria)
+            stage_stats = ScreeningStats()
             total_stocks = len(stock_universe)
 
             # Send initial status
-            yield f"data: {json.dumps({'type': 'start', 'total': total_stocks, 'preset': preset})}\n\n"
+            yield sse_event({'type': 'start', 'total': total_stocks, 'preset': preset, 'top_n': TOP_N})
 
             all_passed = []
+            top = RunningTopN()
             processed = 0
-            batch_size = 15
-
-            # Process in batches
-            for i in range(0, total_stocks, batch_size):
-                batch = stock_universe[i:i + batch_size]
-
-                # Run screening for batch (in thread to not block)
-                loop = asyncio.get_event_loop()
-                batch_results = await loop.run_in_executor(
-                    None,
-                    screening_engine.screen_multiple_stocks,
-                    batch,
-                    preset_criteria
-                )
-
-                processed += len(batch)
+            progress_every = 15
 
-                # Collect passed stocks
-                if batch_results:
-                    batch_results = convert_numpy_types(batch_results)
-                    for r in batch_results:
-                        if r.get('passed_all', False):
-                            all_passed.append(r)
-
-                # Sort by score
-                all_passed.sort(key=lambda x: x.get('composite_score', 0), reverse=True)
-
-                # Send progress update
-                progress_data = {
-                    'type': 'progress',
-                    'processed': processed,
-                    'total': total_stocks,
-                    'passed': len(all_passed),
-                    'top_candidates': all_passed[:20]  # Send top 20 so far
-                }
-                yield f"data: {json.dumps(progress_data)}\n\n"
-
-                # Small delay to prevent overwhelming the client
-                await asyncio.sleep(0.1)
-
-            # Send final results (no artificial cap — return all passing stocks)
-            final_data = {
+            # Screen the whole universe concurrently; report every N completions
+            screened = screening_engine.iter_screen_async(
+                stock_universe, preset_criteria, universe_rows=universe_rows, stats=stage_stats,
+            )
+            async with aclosing(screened):
+                async for r in screened:
+                    processed += 1
+
+                    # Collect passed stocks
+                    if r.get('passed_all', False):
+                        all_passed.append(r)
+                        top.push(r)
+
+                    if processed % progress_every and processed < total_stocks:
+                        continue
+
+                    # Send progress update (top-N changes only)
+                    yield sse_event({
+                        'type': 'progress',
+                        'processed': processed,
+                        'total': total_stocks,
+                        'passed': len(all_passed),
+                        **top.diff(),
+                    })
+
+            # Send final results in chunks (no artificial cap — all passing stocks)
+            all_passed.sort(key=lambda x: x.get('score') or 0, reverse=True)
+            chunks = result_chunks(all_passed)
+            for chunk in chunks:
+                yield chunk
+
+            yield sse_event({
                 'type': 'complete',
                 'processed': processed,
                 'total': total_stocks,
                 'passed': len(all_passed),
-                'results': all_passed
-            }
-            yield f"data: {json.dumps(final_data)}\n\n"
+                'chunks': len(chunks),
+                'stage_stats': stage_stats.to_dict(),
+            })
 
         except Exception as e:
             logger.error(f"Error in streaming scan: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         generate_events(),
@@ -805,57 +762,51 @@ async def stream_scan_all():
     then tags each passing stock with the presets it matches.
     Result stocks include a ``matched_presets`` list.
     """
-    async def generate_events() -> AsyncGenerator[str, None]:
+    async def generate_events() -> AsyncGenerator[bytes, None]:
         try:
             start_time = time.time()
-            stock_universe = get_dynamic_universe(_ALL_PRESETS_CRITERIA)
+            stock_universe, universe_rows = await asyncio.to_thread(
+                get_dynamic_universe_rows, _ALL_PRESETS_CRITERIA
+            )
+            stage_stats = ScreeningStats()
             total_stocks = len(stock_universe)
 
-            yield f"data: {json.dumps({'type': 'start', 'total': total_stocks, 'preset': 'all'})}\n\n"
+            yield sse_event({'type': 'start', 'total': total_stocks, 'preset': 'all', 'top_n': TOP_N})
 
             all_passed = []
+            top = RunningTopN()
             processed = 0
-            batch_size = 15
+            progress_every = 15
             preset_ids = list(LEAPS_PRESETS.keys())
 
-            for i in range(0, total_stocks, batch_size):
-                batch = stock_universe[i:i + batch_size]
-
-                loop = asyncio.get_event_loop()
-                batch_results = await loop.run_in_executor(
-                    None,
-                    screening_engine.screen_multiple_stocks,
-                    batch,
-                    _ALL_PRESETS_CRITERIA
-                )
+            screened = screening_engine.iter_screen_async(
+                stock_universe, _ALL_PRESETS_CRITERIA, universe_rows=universe_rows, stats=stage_stats,
+            )
+            async with aclosing(screened):
+                async for r in screened:
+                    processed += 1
+
+                    if r.get('passed_all', False):
+                        # Tag with matching presets
+                        matched = [pid for pid in preset_ids if _matches_preset(r, pid)]
+                        r['matched_presets'] = matched
+                        r['matched_preset_names'] = [
+                            _PRESET_DISPLAY_NAMES.get(p, p) for p in matched
+                        ]
+                        if matched:
+                            all_passed.append(r)
+                            top.push(r)
 
-                processed += len(batch)
-
-                if batch_results:
-                    batch_results = convert_numpy_types(batch_results)
-                    for r in batch_results:
-                        if r.get('passed_all', False):
-                            # Tag with matching presets
-                            matched = [pid for pid in preset_ids if _matches_preset(r, pid)]
-                            r['matched_presets'] = matched
-                            r['matched_preset_names'] = [
-                                _PRESET_DISPLAY_NAMES.get(p, p) for p in matched
-                            ]
-                            if matched:
-                                all_passed.append(r)
-
-                all_passed.sort(key=lambda x: x.get('composite_score', 0), reverse=True)
-
-                progress_data = {
-                    'type': 'progress',
-                    'processed': processed,
-                    'total': total_stocks,
-                    'passed': len(all_passed),
-                    'top_candidates': all_passed[:20],
-                }
-                yield f"data: {json.dumps(progress_data)}\n\n"
+                    if processed % progress_every and processed < total_stocks:
+                        continue
 
-                await asyncio.sleep(0.1)
+                    yield sse_event({
+                        'type': 'progress',
+                        'processed': processed,
+                        'total': total_stocks,
+                        'passed': len(all_passed),
+                        **top.diff(),
+                    })
 
             # Build per-preset hit counts
             preset_summary = {}
@@ -866,21 +817,26 @@ async def stream_scan_all():
                     'count': count,
                 }
 
-            # No artificial cap — return all passing stocks
-            final_data = {
+            # No artificial cap — return all passing stocks, in chunks
+            all_passed.sort(key=lambda x: x.get('score') or 0, reverse=True)
+            chunks = result_chunks(all_passed)
+            for chunk in chunks:
+                yield chunk
+
+            yield sse_event({
                 'type': 'complete',
                 'processed': processed,
                 'total': total_stocks,
                 'passed': len(all_passed),
-                'results': all_passed,
+                'chunks': len(chunks),
                 'preset_summary': preset_summary,
+                'stage_stats': stage_stats.to_dict(),
                 'duration_seconds': round(time.time() - start_time, 1),
-            }
-            yield f"data: {json.dumps(final_data)}\n\n"
+            })
 
         except Exception as e:
             logger.error(f"Error in scan-all streaming: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         generate_events(),
@@ -938,7 +894,7 @@ async def calculate_5x_return(request: ReturnCalculatorRequest):
             target_multipliers=request.target_multipliers
         )
 
-        return convert_numpy_types(result)
+        return FastJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Error in 5x return calculator: {e}")
@@ -977,7 +933,7 @@ async def calculate_pl_table(request: PLTableRequest):
             num_points=request.num_points
         )
 
-        return convert_numpy_types(result)
+        return FastJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Error in P/L table calculator: {e}")
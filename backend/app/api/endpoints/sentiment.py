@@ -280,8 +280,9 @@ async def get_stock_news(
 
         # Score each headline
         scored_news = []
-        for item in news_items[:limit]:
-            sentiment = fetcher.score_headline_sentiment(item.title)
+        news_items = news_items[:limit]
+        scores = fetcher.score_headlines_sentiment([item.title for item in news_items])
+        for item, sentiment in zip(news_items, scores):
             scored_news.append({
                 'title': item.title,
                 'source': item.source,
@@ -9,10 +9,13 @@ from datetime import datetime
 from loguru import logger
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.models.signal_queue import SignalQueue
 from app.models.trading_signal import TradingSignal
+from app.services.signals.queue_writer import insert_queue_items
+from app.services.signals.signal_engine import signal_engine
 
 router = APIRouter()
 
@@ -113,37 +116,23 @@ async def add_to_queue(request: AddToQueueRequest, db: Session = Depends(get_db)
             raise HTTPException(400, f"Invalid symbol: '{sym}'. Must be 1-5 uppercase letters.")
 
     try:
-        added = []
-        skipped = []
-
-        for symbol in request.symbols:
-            symbol = symbol.upper().strip()
-
-            # Check if already in active queue
-            existing = db.query(SignalQueue).filter(
-                SignalQueue.symbol == symbol,
-                SignalQueue.timeframe == request.timeframe,
-                SignalQueue.status == "active"
-            ).first()
-
-            if existing:
-                skipped.append(symbol)
-                continue
-
-            # Add to queue
-            queue_item = SignalQueue(
-                symbol=symbol,
-                timeframe=request.timeframe,
-                strategy=request.strategy,
-                cap_size=request.cap_size,
-                source=request.source,
-                status="active"
-            )
-            db.add(queue_item)
-            added.append(symbol)
-
+        symbols = list(dict.fromkeys(s.upper().strip() for s in request.symbols))
+        written = insert_queue_items(db, [
+            {
+                "symbol": symbol,
+                "timeframe": request.timeframe,
+                "strategy": request.strategy,
+                "cap_size": request.cap_size,
+                "source": request.source,
+            }
+            for symbol in symbols
+        ])
         db.commit()
 
+        # Symbols already in the active queue are skipped
+        added = [r["symbol"] for r in written]
+        skipped = [s for s in symbols if s not in set(added)]
+
         logger.info(f"Added {len(added)} symbols to signal queue: {added}")
 
         return {
@@ -300,6 +289,10 @@ async def update_queue_item(item_id: int, request: UpdateQueueItemRequest, db: S
             "message": "Queue item updated"
         }
 
+    except IntegrityError:
+        # uq_queue_active_symbol_tf: one active item per symbol + timeframe
+        db.rollback()
+        raise HTTPException(409, "An active queue item already exists for this symbol and timeframe")
     except Exception as e:
         logger.error(f"Error updating queue item: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -391,12 +384,18 @@ async def resume_queue_item(item_id: int, db: Session = Depends(get_db)):
     if not item:
         raise HTTPException(status_code=404, detail="Queue item not found")
 
+    symbol, timeframe = item.symbol, item.timeframe
     item.status = "active"
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # uq_queue_active_symbol_tf: one active item per symbol + timeframe
+        db.rollback()
+        raise HTTPException(409, f"{symbol} is already active for {timeframe}")
 
     return {
         "success": True,
-        "message": f"Resumed monitoring for {item.symbol}",
+        "message": f"Resumed monitoring for {symbol}",
         "status": "active"
     }
 
@@ -450,13 +449,8 @@ async def list_signals(
 async def get_unread_count(db: Session = Depends(get_db)):
     """Get count of unread signals - used for bell icon badge"""
     try:
-        count = db.query(TradingSignal).filter(
-            TradingSignal.is_read == False,
-            TradingSignal.status == "active"
-        ).count()
-
         return {
-            "unread_count": count
+            "unread_count": signal_engine.count_unread(db)
         }
 
     except Exception as e:
@@ -484,6 +478,7 @@ async def mark_signal_read(signal_id: int, db: Session = Depends(get_db)):
     signal.is_read = True
     signal.read_at = datetime.utcnow()
     db.commit()
+    signal_engine.publish_unread_count(db)
 
     return {
         "success": True,
@@ -501,6 +496,7 @@ async def mark_all_signals_read(db: Session = Depends(get_db)):
         "read_at": datetime.utcnow()
     })
     db.commit()
+    signal_engine.publish_unread_count(db)
 
     return {
         "success": True,
@@ -518,6 +514,7 @@ async def invalidate_signal(signal_id: int, db: Session = Depends(get_db)):
 
     signal.status = "invalidated"
     db.commit()
+    signal_engine.publish_unread_count(db)
 
     return {
         "success": True,
@@ -541,6 +538,7 @@ async def clear_signals(
 
         count = query.delete()
         db.commit()
+        signal_engine.publish_unread_count(db)
 
         return {
             "success": True,
@@ -563,6 +561,7 @@ async def delete_signal(signal_id: int, db: Session = Depends(get_db)):
     try:
         db.delete(signal)
         db.commit()
+        signal_engine.publish_unread_count(db)
 
         return {
             "success": True,
@@ -235,7 +235,7 @@ async def get_tastytrade_metrics_batch(symbols: str):
 
     try:
         symbol_list = [s.strip().upper() for s in symbols.split(",")]
-        metrics = service.get_market_metrics(symbol_list)
+        metrics = service.metrics.get_many(symbol_list, wait_for_batch=False)
 
         results = {}
         for symbol, m in metrics.items():
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.services.trading.alpaca_trading_service import alpaca_trading_service
 from app.models.trading_signal import TradingSignal
+from app.services.signals.signal_engine import signal_engine
 from app.api.auth import require_trading_auth
 
 router = APIRouter(dependencies=[Depends(require_trading_auth)])
@@ -198,6 +199,7 @@ async def place_order(request: PlaceOrderRequest, db: Session = Depends(get_db))
                 signal.trade_execution_id = result.get("order_id")
                 signal.status = "executed"
                 db.commit()
+                signal_engine.publish_unread_count(db)
 
         return {
             "success": True,
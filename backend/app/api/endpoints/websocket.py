@@ -1,5 +1,6 @@
 """
-WebSocket endpoints for real-time data streaming
+WebSocket endpoints for real-time data streaming: live prices (/ws/prices)
+and app events (/ws/events) pushed from the event bus.
 """
 import asyncio
 import json
@@ -7,10 +8,13 @@ from typing import Dict, Set, Any
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from loguru import logger
 
+from app.api.endpoints.app_auth import verify_token
 from app.services.data_fetcher.price_stream_service import (
     get_price_stream_service,
     PriceStreamService,
 )
+from app.services.event_bus import Subscription, get_event_bus
+from app.utils.serialization import dumps_str
 
 router = APIRouter()
 
@@ -207,3 +211,64 @@ async def get_stream_status():
         "subscribed_symbols": list(service.subscribed_symbols),
         "cached_prices": len(service.get_all_latest_prices()),
     }
+
+
+async def _send_events(websocket: WebSocket, sub: Subscription) -> None:
+    """Single writer for an /ws/events client: drains its subscription queue."""
+    while True:
+        event = await sub.get()
+        await websocket.send_text(dumps_str(event))
+
+
+@router.websocket("/events")
+async def websocket_events(websocket: WebSocket, token: str = "", topics: str = ""):
+    """
+    WebSocket endpoint for app events — replaces dashboard polling.
+
+    Protocol:
+    - Client connects to /ws/events?token=<session token>&topics=signals,bot
+      (token required when APP_PASSWORD is set; no topics = all)
+    - Server sends the latest retained state events, then live events:
+      {"type": "event", "topic": "signals.unread", "data": {"unread_count": 3}, "ts": "..."}
+    - Client can send: {"action": "subscribe", "topics": ["signals", "bot"]} to change topics
+    - Client can send: {"action": "ping"} to keep alive
+    """
+    if not verify_token(token):
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+
+    bus = get_event_bus()
+    sub = bus.subscribe([t.strip() for t in topics.split(",") if t.strip()])
+    # Retained state goes in after subscribing, so a concurrent publish is never lost
+    for event in bus.retained(sub.topics):
+        sub.put(event)
+    sender = asyncio.create_task(_send_events(websocket, sub))
+
+    try:
+        while True:
+            data = await websocket.receive_json()
+            action = data.get("action")
+
+            if action == "subscribe":
+                sub.topics = set(data.get("topics") or [])
+                for event in bus.retained(sub.topics):
+                    sub.put(event)
+                sub.put({"type": "subscribed", "topics": sorted(sub.topics)})
+
+            elif action == "ping":
+                sub.put({"type": "pong"})
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Event WebSocket error: {e}")
+    finally:
+        sender.cancel()
+        bus.unsubscribe(sub)
+
+
+@router.get("/events/status")
+async def get_event_bus_status():
+    """Event bus subscribers, throughput and retained topics"""
+    return get_event_bus().stats()
@@ -56,6 +56,16 @@ class Settings(BaseSettings):
     ALPHA_VANTAGE_REQUESTS_PER_MINUTE: int = 5
     ALPHA_VANTAGE_REQUESTS_PER_DAY: int = 500
 
+    # CPU offload — worker processes for indicator/scoring/backtest math (0 = run inline)
+    COMPUTE_POOL_WORKERS: int = 2
+    COMPUTE_POOL_MAX_QUEUE: int = 64  # queued tasks beyond this run inline in the caller
+
+    # Local ATM IV history (IV rank fallback when TastyTrade is unavailable)
+    IV_HISTORY_DIR: str = ""  # default: backend/data/iv_history
+
+    # Event bus behind /ws/events (redis = fan out across uvicorn workers)
+    EVENT_BUS_BACKEND: str = "memory"  # memory | redis
+
     # Cache TTLs (in seconds)
     CACHE_TTL_QUOTE_MARKET_HOURS: int = 60  # 1 minute
     CACHE_TTL_QUOTE_AFTER_HOURS: int = 3600  # 1 hour
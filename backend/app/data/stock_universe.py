@@ -105,11 +105,11 @@ def get_stock_universe(universe_name: str = "all"):
         List of stock symbols
     """
     if universe_name == "all":
-        # Combine all universes, remove duplicates
+        # Combine all universes, remove duplicates (first occurrence order)
         all_stocks = []
         for stocks in ALL_UNIVERSES.values():
             all_stocks.extend(stocks)
-        return list(set(all_stocks))
+        return list(dict.fromkeys(all_stocks))
 
     return ALL_UNIVERSES.get(universe_name, [])
 
@@ -133,65 +133,58 @@ def get_universe_by_criteria(market_cap_max: int = None):
         # Small to mid cap (highest 5x potential)
         return MID_CAP_GROWTH + SMALL_CAP_GROWTH
 
-def get_dynamic_universe(criteria: dict = None) -> list:
+def get_dynamic_universe_rows(criteria: dict = None) -> tuple:
     """
-    Get a dynamic stock universe from FMP screener, with fallback to hardcoded lists.
+    Get a dynamic stock universe from the daily FMP snapshot, with fallback to hardcoded lists.
 
-    Extracts market_cap_min/max and price_min/max from the preset criteria dict,
-    calls FMP's company-screener API, and returns a deduplicated list of symbols.
+    Filters the day's universe snapshot (app.data.universe_snapshot: one wide
+    FMP screener pull) by the preset's market_cap_min/max and price_min/max,
+    and returns a deduplicated list of symbols plus the screener row (price,
+    market_cap, volume, sector) of each FMP symbol. Hardcoded symbols have
+    no row.
 
-    Falls back to get_universe_by_criteria() if FMP fails or returns empty.
+    Falls back to get_universe_by_criteria() if FMP fails or too few symbols match.
 
     Args:
         criteria: Optional preset criteria dict with market_cap_min, market_cap_max, etc.
 
     Returns:
-        List of stock symbols (500-1000+ from FMP, or 200 from hardcoded)
+        (symbols, {symbol: screener row})
     """
     criteria = criteria or {}
 
     try:
-        from app.services.data_fetcher.fmp_service import fmp_service
-
-        if fmp_service.is_available:
-            symbols = fmp_service.get_screener_universe(
-                market_cap_min=criteria.get('market_cap_min', 500_000_000),
-                market_cap_max=criteria.get('market_cap_max', 100_000_000_000),
-                price_min=criteria.get('price_min', 5.0),
-                price_max=criteria.get('price_max', 500.0),
-                volume_min=100_000,
-                limit=1000,
-            )
-            if symbols and len(symbols) >= 50:
+        from app.data.universe_snapshot import get_universe_snapshot
+
+        snapshot = get_universe_snapshot()
+        if snapshot is not None:
+            symbols, rows = snapshot.member_rows(criteria)
+            if len(symbols) >= 50:
                 # Merge with hardcoded universe to ensure coverage of known good stocks
                 hardcoded = get_universe_by_criteria(criteria.get('market_cap_max', 100_000_000_000))
                 merged = list(dict.fromkeys(symbols + hardcoded))  # dedupe, preserve order
                 logger.info(
                     f"Dynamic universe: {len(symbols)} FMP + {len(hardcoded)} hardcoded = {len(merged)} total"
                 )
-                return merged
+                return merged, rows
             else:
                 logger.warning(
-                    f"FMP screener returned only {len(symbols) if symbols else 0} symbols, "
+                    f"Universe snapshot matched only {len(symbols)} symbols, "
                     f"falling back to hardcoded universe"
                 )
     except Exception as e:
-        logger.warning(f"FMP screener failed, using hardcoded universe: {e}")
+        logger.warning(f"Universe snapshot failed, using hardcoded universe: {e}")
 
     # Fallback to hardcoded
-    return get_universe_by_criteria(criteria.get('market_cap_max', 100_000_000_000))
+    return get_universe_by_criteria(criteria.get('market_cap_max', 100_000_000_000)), {}
+
+
+def get_dynamic_universe(criteria: dict = None) -> list:
+    """Symbols only from get_dynamic_universe_rows() (500-1000+ from FMP, or 200 hardcoded)."""
+    return get_dynamic_universe_rows(criteria)[0]
 
 
 # Quick access to different size categories
 LARGE_CAP_UNIVERSE = SP500_TOP_100
 MID_CAP_UNIVERSE = GROWTH_STOCKS + MID_CAP_GROWTH
 SMALL_CAP_UNIVERSE = SMALL_CAP_GROWTH
-FULL_UNIVERSE = get_stock_universe("all")
-
-# Stats
-print(f"Stock Universe Loaded:")
-print(f"  S&P 500 Top 100: {len(SP500_TOP_100)} stocks")
-print(f"  Growth Stocks: {len(GROWTH_STOCKS)} stocks")
-print(f"  Mid Cap Growth: {len(MID_CAP_GROWTH)} stocks")
-print(f"  Small Cap Growth: {len(SMALL_CAP_GROWTH)} stocks")
-print(f"  Total Unique: {len(FULL_UNIVERSE)} stocks")
@@ -0,0 +1,162 @@
+"""
+Daily universe snapshot — one wide FMP screener pull, filtered per preset in memory.
+
+Each preset used to call the FMP company screener with its own cap/price
+bounds, so 29 presets meant up to 29 remote calls and 29 separate cache
+entries. Instead, the first universe request of the (Eastern) day pulls
+every US stock inside the union of all preset bounds once and keeps it
+as columns:
+
+    symbol, market_cap, price, volume, sector
+
+A preset's universe is then a vectorized filter over those columns. The
+result is kept as a packed bitmap (one bit per snapshot row) keyed by the
+criteria's bounds, and is precomputed for every catalog preset when the
+snapshot is built, so a scan looks its members up instead of refiltering.
+"""
+from datetime import date, datetime
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from loguru import logger
+
+ET = ZoneInfo("America/New_York")
+
+# Union of the catalog presets' bounds (and the all-presets stream scan)
+SNAPSHOT_PULL = {
+    "market_cap_min": 300_000_000,
+    "market_cap_max": 10_000_000_000_000,
+    "price_min": 3.0,
+    "price_max": 600.0,
+    "volume_min": 100_000,
+    "limit": 5000,
+}
+
+# Defaults get_dynamic_universe_rows has always applied to missing criteria
+DEFAULT_BOUNDS = (500_000_000, 100_000_000_000, 5.0, 500.0)
+
+# Symbols per preset (the per-preset screener pull's limit)
+PRESET_LIMIT = 1000
+
+Bounds = Tuple[float, float, float, float]
+
+
+def criteria_bounds(criteria: Optional[Dict[str, Any]]) -> Bounds:
+    """(market_cap_min, market_cap_max, price_min, price_max) of a criteria dict."""
+    criteria = criteria or {}
+    cap_min, cap_max, price_min, price_max = DEFAULT_BOUNDS
+    return (
+        float(criteria.get("market_cap_min", cap_min)),
+        float(criteria.get("market_cap_max", cap_max)),
+        float(criteria.get("price_min", price_min)),
+        float(criteria.get("price_max", price_max)),
+    )
+
+
+def _float_column(rows: Sequence[Dict[str, Any]], key: str) -> np.ndarray:
+    return np.array(
+        [np.nan if row.get(key) is None else row[key] for row in rows], dtype=np.float64
+    )
+
+
+class UniverseSnapshot:
+    """Screener rows for one day, as columns, with per-bounds membership bitmaps."""
+
+    def __init__(self, rows: Sequence[Dict[str, Any]], as_of: date):
+        self.as_of = as_of
+        self.rows = list(rows)
+        self.symbols = np.array([row["symbol"] for row in self.rows], dtype=object)
+        self.market_cap = _float_column(self.rows, "market_cap")
+        self.price = _float_column(self.rows, "price")
+        self.volume = _float_column(self.rows, "volume")
+        self.sector = np.array([row.get("sector") for row in self.rows], dtype=object)
+        self._bitmaps: Dict[Bounds, np.ndarray] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def mask(self, criteria: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Boolean row mask for criteria's cap/price bounds (missing values fail)."""
+        cap_min, cap_max, price_min, price_max = criteria_bounds(criteria)
+        return (
+            (self.market_cap >= cap_min) & (self.market_cap <= cap_max)
+            & (self.price >= price_min) & (self.price <= price_max)
+        )
+
+    def bitmap(self, criteria: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Packed membership bitmap for criteria, computed once per distinct bounds."""
+        key = criteria_bounds(criteria)
+        with self._lock:
+            bits = self._bitmaps.get(key)
+            if bits is None:
+                bits = self._bitmaps[key] = np.packbits(self.mask(criteria))
+            return bits
+
+    def precompute(self, presets: Sequence[Dict[str, Any]]) -> int:
+        """Build the bitmaps of the given criteria dicts; returns distinct bounds cached."""
+        for criteria in presets:
+            self.bitmap(criteria)
+        return len(self._bitmaps)
+
+    def member_indices(self, criteria: Optional[Dict[str, Any]], limit: Optional[int] = PRESET_LIMIT) -> np.ndarray:
+        """Row indices of criteria's members, in snapshot order (first `limit`)."""
+        bits = np.unpackbits(self.bitmap(criteria), count=len(self))
+        return np.flatnonzero(bits)[:limit]
+
+    def members(self, criteria: Optional[Dict[str, Any]], limit: Optional[int] = PRESET_LIMIT) -> List[str]:
+        return self.symbols[self.member_indices(criteria, limit)].tolist()
+
+    def member_rows(
+        self, criteria: Optional[Dict[str, Any]], limit: Optional[int] = PRESET_LIMIT
+    ) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        """(symbols, {symbol: screener row}) of criteria's members."""
+        picked = [self.rows[i] for i in self.member_indices(criteria, limit)]
+        return [row["symbol"] for row in picked], {row["symbol"]: row for row in picked}
+
+
+_snapshot: Optional[UniverseSnapshot] = None
+_snapshot_lock = Lock()
+
+
+def get_universe_snapshot() -> Optional[UniverseSnapshot]:
+    """
+    Today's snapshot, pulling it on the first call of the Eastern day.
+
+    Concurrent callers wait for one pull. If FMP is unavailable or the pull
+    fails, the previous snapshot (if any) is kept and returned.
+    """
+    global _snapshot
+    today = datetime.now(ET).date()
+    with _snapshot_lock:
+        if _snapshot is not None and _snapshot.as_of == today:
+            return _snapshot
+
+        try:
+            from app.services.data_fetcher.fmp_service import fmp_service
+            from app.data.presets_catalog import LEAPS_PRESETS
+
+            rows = fmp_service.get_screener_rows(**SNAPSHOT_PULL) if fmp_service.is_available else []
+            if rows:
+                snapshot = UniverseSnapshot(rows, today)
+                presets = snapshot.precompute(list(LEAPS_PRESETS.values()))
+                logger.info(
+                    f"Universe snapshot for {today}: {len(snapshot)} symbols, "
+                    f"{presets} preset bitmaps"
+                )
+                _snapshot = snapshot
+            else:
+                logger.warning("FMP screener returned no rows for the universe snapshot")
+        except Exception as e:
+            logger.warning(f"Universe snapshot pull failed: {e}")
+
+        return _snapshot
+
+
+def reset_universe_snapshot():
+    """Drop the cached snapshot (the next request pulls a new one)."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
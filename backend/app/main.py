@@ -7,39 +7,49 @@ from datetime import datetime, timedelta
 
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from app.config import get_settings
-from app.api.endpoints import screener, stocks, ai_analysis, sentiment, strategy
-from app.api.endpoints import settings as settings_endpoints
-from app.api.endpoints import command_center
-from app.api.endpoints import webhooks
-from app.api.endpoints import user_alerts
-from app.api.endpoints import signals
-from app.api.endpoints import trading
-from app.api.endpoints import heatmap
-from app.api.endpoints import saved_scans
-from app.api.endpoints import portfolio
-from app.api.endpoints import macro
-from app.api.endpoints import macro_intelligence
-from app.api.endpoints import websocket as ws_endpoints
-from app.api.endpoints import bot as bot_endpoints
-from app.api.endpoints import backtesting as backtesting_endpoints
-from app.api.endpoints import scan_processing
-from app.api.endpoints import autopilot as autopilot_endpoints
-from app.api.endpoints import logs as logs_endpoints
-from app.api.endpoints import health as health_endpoints
+from app.services.startup import prepare_database, startup_profile, warm_start
+
+# Endpoint modules, each import timed for the /health startup report.
+# Heavy SDKs (anthropic, tastytrade, backtrader, telegram) load on first use.
+_endpoint = startup_profile.import_module
+with startup_profile.phase("import_endpoints"):
+    screener = _endpoint("app.api.endpoints.screener")
+    stocks = _endpoint("app.api.endpoints.stocks")
+    ai_analysis = _endpoint("app.api.endpoints.ai_analysis")
+    sentiment = _endpoint("app.api.endpoints.sentiment")
+    strategy = _endpoint("app.api.endpoints.strategy")
+    settings_endpoints = _endpoint("app.api.endpoints.settings")
+    command_center = _endpoint("app.api.endpoints.command_center")
+    webhooks = _endpoint("app.api.endpoints.webhooks")
+    user_alerts = _endpoint("app.api.endpoints.user_alerts")
+    signals = _endpoint("app.api.endpoints.signals")
+    trading = _endpoint("app.api.endpoints.trading")
+    heatmap = _endpoint("app.api.endpoints.heatmap")
+    saved_scans = _endpoint("app.api.endpoints.saved_scans")
+    portfolio = _endpoint("app.api.endpoints.portfolio")
+    macro = _endpoint("app.api.endpoints.macro")
+    macro_intelligence = _endpoint("app.api.endpoints.macro_intelligence")
+    ws_endpoints = _endpoint("app.api.endpoints.websocket")
+    bot_endpoints = _endpoint("app.api.endpoints.bot")
+    backtesting_endpoints = _endpoint("app.api.endpoints.backtesting")
+    scan_processing = _endpoint("app.api.endpoints.scan_processing")
+    autopilot_endpoints = _endpoint("app.api.endpoints.autopilot")
+    logs_endpoints = _endpoint("app.api.endpoints.logs")
+    health_endpoints = _endpoint("app.api.endpoints.health")
+
 from app.services.health_monitor import health_monitor
-from app.services.data_fetcher.finviz import initialize_finviz_service
+from app.services import event_bus
 from app.services.settings_service import settings_service
-from app.services.data_fetcher.tastytrade import initialize_tastytrade_service
-from app.services.telegram_bot import initialize_telegram_bot, get_telegram_bot
-from app.services.ai.claude_service import initialize_claude_service, get_claude_service
 from app.services.alerts.alert_service import alert_service
 from app.services.signals.signal_engine import signal_engine
 from app.database import SessionLocal
+from app.utils.serialization import FastJSONResponse
 from app.api.auth import require_trading_auth
 from app.api.endpoints.app_auth import router as app_auth_router, verify_token, _get_app_password
 
@@ -60,7 +70,8 @@ except Exception as e:
 app = FastAPI(
     title=app_settings.PROJECT_NAME,
     version="1.0.0",
-    description="Stock screening tool for identifying 5x LEAPS opportunities"
+    description="Stock screening tool for identifying 5x LEAPS opportunities",
+    default_response_class=FastJSONResponse,
 )
 
 # Configure CORS
@@ -72,6 +83,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (saved scans, screener results); SSE is excluded
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ── App-wide password protection middleware ──────────────────────────────────
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -343,13 +357,15 @@ async def health_check():
     """
     Enhanced health check — pings all critical dependencies.
     Returns 200 for healthy/degraded, 503 only when truly critical (DB/Redis down).
-    Cached 60s to keep Railway's 30s probe fast.
+    Cached 60s to keep Railway's 30s probe fast. `startup` reports per-module
+    import times and the background warm-up's phases (app.services.startup).
     """
     try:
         deps = await health_monitor.check_all_dependencies()
         overall = health_monitor._compute_overall_status(
             deps, health_monitor.get_all_jobs_health(), health_monitor._get_bot_info()
         )
+        health_monitor.publish_status(overall)
         status_code = 503 if overall == "critical" else 200
         return JSONResponse(
             status_code=status_code,
@@ -358,11 +374,12 @@ async def health_check():
                 "service": "leaps-trader-api",
                 "uptime_seconds": round(health_monitor.get_uptime_seconds(), 0),
                 "dependencies": deps,
+                "startup": startup_profile.report(),
             },
         )
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return {"status": "healthy", "service": "leaps-trader-api"}
+        return {"status": "healthy", "service": "leaps-trader-api", "startup": startup_profile.report()}
 
 
 @app.exception_handler(Exception)
@@ -424,6 +441,15 @@ async def check_signals_job():
 
     db = SessionLocal()
     try:
+        # Keep intraday queue symbols on the price stream so bars come from ticks
+        try:
+            if settings_service.get_setting("automation.live_bars_enabled") is not False:
+                from app.services.data_fetcher.price_stream_service import get_price_stream_service
+                queue_symbols = await asyncio.to_thread(signal_engine.get_streamable_symbols, db)
+                await get_price_stream_service().track_symbols("signal_queue", queue_symbols)
+        except Exception as e:
+            logger.warning(f"Live bar subscription skipped: {e}")
+
         new_signals = await asyncio.to_thread(signal_engine.process_all_queue_items, db)
         if new_signals:
             logger.info(f"Signal check complete: {len(new_signals)} signals generated")
@@ -466,6 +492,7 @@ async def check_signals_job():
                 )
                 if executed_trades:
                     logger.info(f"Auto-trader executed {len(executed_trades)} trades")
+                    signal_engine.publish_unread_count(db)   # executed signals leave the badge
             except Exception as e:
                 logger.error(f"Auto-trader error: {e}")
 
@@ -626,9 +653,12 @@ async def monitor_positions_job():
     db = SessionLocal()
     try:
         from app.services.trading.auto_trader import auto_trader
+        from app.services.trading.exit_watcher import exit_watcher
         result = await asyncio.to_thread(auto_trader.run_position_monitor, db)
         if result.get("exits", 0) > 0:
             logger.info(f"Position monitor: {result['exits']} exits executed")
+        # Keep open-position symbols subscribed for tick-driven exits
+        await exit_watcher.refresh_subscriptions()
     except Exception as e:
         logger.error(f"Position monitor error: {e}")
         _status, _error = "error", str(e)
@@ -776,6 +806,10 @@ async def auto_scan_job(skip_market_check: bool = False):
                         log_db.close()
                 except Exception:
                     pass
+                event_bus.publish(event_bus.SCAN_PROGRESS, {
+                    "stage": "skipped",
+                    "reasoning": smart_selection.get("reasoning") if smart_selection else "selector failed",
+                }, retain=True)
                 return
 
             presets = smart_selection["presets"]
@@ -826,13 +860,16 @@ async def auto_scan_job(skip_market_check: bool = False):
             log_db.close()
     except Exception:
         pass
+    event_bus.publish(event_bus.SCAN_PROGRESS, {
+        "stage": "started", "presets": presets, "smart": smart_mode,
+    }, retain=True)
 
     # Imports needed for screening + saving
     from app.data.presets_catalog import LEAPS_PRESETS, _PRESET_DISPLAY_NAMES, resolve_preset
-    from app.api.endpoints.screener import (
-        screening_engine, convert_numpy_types
-    )
-    from app.data.stock_universe import get_dynamic_universe
+    from app.api.endpoints.screener import screening_engine
+    from app.utils.serialization import to_native
+    from app.data.stock_universe import get_dynamic_universe_rows
+    from app.services.screening.planner import ScreeningStats
     from app.models.saved_scan import SavedScanResult, SavedScanMetadata
 
     db = SessionLocal()
@@ -842,7 +879,11 @@ async def auto_scan_job(skip_market_check: bool = False):
         total_queued = 0
         preset_summaries = []
 
-        for preset in presets:
+        for index, preset in enumerate(presets):
+            event_bus.publish(event_bus.SCAN_PROGRESS, {
+                "stage": "preset", "preset": preset, "index": index, "total": len(presets),
+                "saved": total_saved, "queued": total_queued,
+            }, retain=True)
             try:
                 # Validate preset exists (strict=False: skip unknown, don't crash)
                 preset_data = resolve_preset(preset, source="auto_scan", strict=False)
@@ -854,31 +895,30 @@ async def auto_scan_job(skip_market_check: bool = False):
                 logger.info(f"[AutoScan] Running preset: {preset} ({display_name})")
 
                 # Get dynamic stock universe for this preset (FMP screener + fallback)
-                stock_universe = get_dynamic_universe(preset_criteria)
+                stock_universe, universe_rows = await asyncio.to_thread(
+                    get_dynamic_universe_rows, preset_criteria
+                )
                 logger.info(f"[AutoScan] Preset '{preset}': screening {len(stock_universe)} stocks")
 
-                # Run screening engine in batches (same as stream_scan endpoint)
+                # Run the async screening pipeline (same as stream_scan endpoint)
                 all_passed = []
                 fail_counts: dict = {}  # Diagnostic: aggregate failure reasons
-                batch_size = 15
-
-                for i in range(0, len(stock_universe), batch_size):
-                    batch = stock_universe[i:i + batch_size]
-                    batch_results = await asyncio.to_thread(
-                        screening_engine.screen_multiple_stocks,
-                        batch,
-                        preset_criteria
-                    )
-                    if batch_results:
-                        batch_results = convert_numpy_types(batch_results)
-                        for r in batch_results:
-                            if r.get('passed_all', False):
-                                all_passed.append(r)
-                            else:
-                                fa = r.get('failed_at', 'unknown')
-                                fail_counts[fa] = fail_counts.get(fa, 0) + 1
-
-                all_passed.sort(key=lambda x: x.get('composite_score', 0), reverse=True)
+                stage_stats = ScreeningStats()
+
+                results = await screening_engine.screen_multiple_stocks_async(
+                    stock_universe,
+                    preset_criteria,
+                    universe_rows=universe_rows,
+                    stats=stage_stats,
+                )
+                for r in to_native(results):
+                    if r.get('passed_all', False):
+                        all_passed.append(r)
+                    else:
+                        fa = r.get('failed_at', 'unknown')
+                        fail_counts[fa] = fail_counts.get(fa, 0) + 1
+
+                all_passed.sort(key=lambda x: x.get('score') or 0, reverse=True)
                 # No artificial cap — save all passing stocks
                 total_scanned += len(stock_universe)
 
@@ -891,6 +931,12 @@ async def auto_scan_job(skip_market_check: bool = False):
                     )
 
                 logger.info(f"[AutoScan] Preset '{preset}': {len(all_passed)} stocks passed screening")
+                stages = stage_stats.to_dict()
+                logger.info(
+                    f"[AutoScan] Preset '{preset}': stages "
+                    + ", ".join(f"{st['stage']}={st['entered']}/-{st['rejected']}" for st in stages['stages'])
+                    + f"; fetch cost {stages['fetch_cost']}"
+                )
 
                 if not all_passed:
                     preset_summaries.append(f"  {display_name}: 0 passed")
@@ -904,18 +950,7 @@ async def auto_scan_job(skip_market_check: bool = False):
 
                 saved_count = 0
                 for stock in all_passed:
-                    db.add(SavedScanResult(
-                        scan_type=preset,
-                        symbol=stock.get("symbol", ""),
-                        company_name=stock.get("company_name") or stock.get("name"),
-                        score=stock.get("composite_score") or stock.get("score"),
-                        current_price=stock.get("current_price") or stock.get("price"),
-                        market_cap=stock.get("market_cap"),
-                        iv_rank=stock.get("iv_rank"),
-                        iv_percentile=stock.get("iv_percentile"),
-                        stock_data=stock,
-                        scanned_at=datetime.now()
-                    ))
+                    db.add(SavedScanResult.from_stock(preset, stock, scanned_at=datetime.now()))
                     saved_count += 1
 
                 # Update or create metadata
@@ -943,9 +978,9 @@ async def auto_scan_job(skip_market_check: bool = False):
                 if auto_process and all_passed:
                     try:
                         from app.services.signals.strategy_selector import strategy_selector
-                        from app.services.data_fetcher.fmp_service import fmp_service
+                        from app.services.data_fetcher.strategy_metrics import local_strategy_metrics
                         from app.services.data_fetcher.alpaca_service import alpaca_service
-                        from app.models.signal_queue import SignalQueue
+                        from app.services.signals.queue_writer import insert_queue_items
 
                         stocks_data = []
                         for stock in all_passed:
@@ -960,16 +995,14 @@ async def auto_scan_job(skip_market_check: bool = False):
                         bulk_metrics = {}
                         try:
                             bulk_metrics = await asyncio.to_thread(
-                                fmp_service.get_bulk_strategy_metrics, symbols
+                                local_strategy_metrics.get_bulk_strategy_metrics, symbols
                             )
                         except Exception:
                             pass
 
                         bulk_snapshots = {}
                         try:
-                            bulk_snapshots = await asyncio.to_thread(
-                                alpaca_service.get_multi_snapshots, symbols
-                            )
+                            bulk_snapshots = await alpaca_service.get_multi_snapshots_async(symbols)
                         except Exception:
                             pass
 
@@ -977,26 +1010,19 @@ async def auto_scan_job(skip_market_check: bool = False):
                             stocks_data, bulk_metrics, bulk_snapshots
                         )
 
-                        # Queue HIGH confidence stocks
-                        for result in categorized["auto_queued"]:
-                            symbol = result["symbol"]
-                            for tf_entry in result["timeframes"]:
-                                existing = db.query(SignalQueue).filter(
-                                    SignalQueue.symbol == symbol,
-                                    SignalQueue.timeframe == tf_entry["tf"],
-                                    SignalQueue.status == "active",
-                                ).first()
-                                if not existing:
-                                    db.add(SignalQueue(
-                                        symbol=symbol,
-                                        timeframe=tf_entry["tf"],
-                                        strategy="auto",
-                                        source="auto_scan",
-                                        status="active",
-                                        confidence_level=result["confidence"],
-                                        strategy_reasoning=result["reasoning"],
-                                    ))
-                                    queued_this_preset += 1
+                        # Queue HIGH confidence stocks (skips active symbol + timeframe)
+                        queued_this_preset = len(insert_queue_items(db, [
+                            {
+                                "symbol": result["symbol"],
+                                "timeframe": tf_entry["tf"],
+                                "strategy": "auto",
+                                "source": "auto_scan",
+                                "confidence_level": result["confidence"],
+                                "strategy_reasoning": result["reasoning"],
+                            }
+                            for result in categorized["auto_queued"]
+                            for tf_entry in result["timeframes"]
+                        ]))
 
                         db.commit()
                         total_queued += queued_this_preset
@@ -1020,6 +1046,7 @@ async def auto_scan_job(skip_market_check: bool = False):
 
         # Send Telegram summary
         try:
+            from app.services.telegram_bot import get_telegram_bot
             bot = get_telegram_bot()
             if bot and bot.is_running:
                 summary_text = (
@@ -1080,6 +1107,10 @@ async def auto_scan_job(skip_market_check: bool = False):
                 log_db2.close()
         except Exception:
             pass
+        event_bus.publish(event_bus.SCAN_PROGRESS, {
+            "stage": "complete", "presets": presets, "scanned": total_scanned,
+            "saved": total_saved, "queued": total_queued,
+        }, retain=True)
 
         logger.info(
             f"[AutoScan] Complete: {len(presets)} presets, "
@@ -1108,6 +1139,7 @@ async def auto_scan_job(skip_market_check: bool = False):
                 fail_db.close()
         except Exception:
             pass
+        event_bus.publish(event_bus.SCAN_PROGRESS, {"stage": "failed", "error": str(e)}, retain=True)
     finally:
         db.close()
         health_monitor.record_job_run("auto_scan", _status, time.monotonic() - _start, _error)
@@ -1123,6 +1155,7 @@ async def health_alert_job():
 
         if health_monitor.should_alert(current_status):
             message = health_monitor.format_alert_message(dashboard)
+            from app.services.telegram_bot import get_telegram_bot
             bot = get_telegram_bot()
             if bot and bot._running:
                 sent = await bot.broadcast_to_allowed_users(message)
@@ -1136,6 +1169,10 @@ async def health_alert_job():
         health_monitor.record_job_run("health_alert", _status, time.monotonic() - _start, _error)
 
 
+# Keeps a reference to fire-and-forget startup tasks (asyncio holds them weakly)
+_background_tasks: set = set()
+
+
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup"""
@@ -1152,88 +1189,28 @@ async def startup_event():
     logger.info(f"Database: {db_url}")
     logger.info(f"Redis: {app_settings.REDIS_HOST}:{app_settings.REDIS_PORT}")
 
-    # Initialize database settings
+    # Tables and seeded settings must exist before the reads below (the exit
+    # watcher flag and the auto-scan schedule), so the DB phase is awaited
+    await asyncio.to_thread(prepare_database)
+
+    # Optional API clients run in the background so /health answers meanwhile
+    warmup = asyncio.create_task(warm_start(app_settings))
+    _background_tasks.add(warmup)
+    warmup.add_done_callback(_background_tasks.discard)
+
+    # Streaming exits: SL/TP/trailing evaluated on live ticks between position polls
     try:
-        from app.database import init_db
-        init_db()
-        settings_service.seed_defaults()
-        settings_service.seed_api_status()
-        settings_service.seed_sector_mappings()
-        logger.info("Database and settings initialized")
-
-        # Clean up orphaned scan_started events from deploys that killed mid-scan
-        try:
-            from app.models.autopilot_log import AutopilotLog
-            from sqlalchemy import func
-            cleanup_db = SessionLocal()
-            try:
-                # Find scan_started events with no matching scan_complete/scan_failed after them
-                orphaned = cleanup_db.query(AutopilotLog).filter(
-                    AutopilotLog.event_type == "scan_started",
-                ).all()
-                cleaned = 0
-                for started in orphaned:
-                    # Check if there's a completion event after this start
-                    has_completion = cleanup_db.query(AutopilotLog).filter(
-                        AutopilotLog.event_type.in_(["scan_complete", "scan_failed"]),
-                        AutopilotLog.timestamp > started.timestamp,
-                    ).first()
-                    if not has_completion:
-                        started.event_type = "scan_interrupted"
-                        started.details = {"reason": "Process restarted before scan completed"}
-                        cleaned += 1
-                if cleaned:
-                    cleanup_db.commit()
-                    logger.info(f"Cleaned up {cleaned} orphaned scan_started events")
-            finally:
-                cleanup_db.close()
-        except Exception as e:
-            logger.warning(f"Scan cleanup skipped: {e}")
+        if settings_service.get_setting("automation.streaming_exits_enabled") is not False:
+            from app.services.trading.exit_watcher import exit_watcher
+            exit_watcher.start()
     except Exception as e:
-        logger.warning(f"Settings initialization skipped: {e}")
-
-    # Initialize Finviz service if token is configured
-    if app_settings.FINVIZ_API_TOKEN:
-        initialize_finviz_service(app_settings.FINVIZ_API_TOKEN)
-        logger.info("Finviz Elite API enabled")
-    else:
-        logger.info("Finviz Elite API not configured (optional)")
-
-    # Initialize TastyTrade service if credentials are configured
-    if app_settings.TASTYTRADE_PROVIDER_SECRET and app_settings.TASTYTRADE_REFRESH_TOKEN:
-        if initialize_tastytrade_service(
-            app_settings.TASTYTRADE_PROVIDER_SECRET,
-            app_settings.TASTYTRADE_REFRESH_TOKEN
-        ):
-            logger.info("TastyTrade API enabled (enhanced options data)")
-        else:
-            logger.warning("TastyTrade API initialization failed")
-    else:
-        logger.info("TastyTrade API not configured (optional - for enhanced Greeks/IV data)")
-
-    # Initialize Claude AI service if API key is configured
-    if app_settings.ANTHROPIC_API_KEY:
-        if initialize_claude_service(app_settings.ANTHROPIC_API_KEY):
-            logger.info(f"Claude AI enabled (model: {app_settings.CLAUDE_MODEL_PRIMARY})")
-        else:
-            logger.warning("Claude AI initialization failed")
-    else:
-        logger.info("Claude AI not configured (optional - for AI-powered analysis)")
-
-    # Initialize Telegram bot if token is configured
-    if app_settings.TELEGRAM_BOT_TOKEN:
-        if initialize_telegram_bot(
-            app_settings.TELEGRAM_BOT_TOKEN,
-            app_settings.TELEGRAM_ALLOWED_USERS
-        ):
-            # Start the bot
-            bot = get_telegram_bot()
-            await bot.start()
-            logger.info("Telegram bot started")
-        else:
-            logger.warning("Telegram bot initialization failed")
-    else:
-        logger.info("Telegram bot not configured (optional - for remote commands)")
+        logger.warning(f"Streaming exit watcher not started: {e}")
+
+    # Event bus: pushes signals/trades/bot/scan/health events to /ws/events
+    try:
+        event_bus.get_event_bus().start()
+    except Exception as e:
+        logger.warning(f"Event bus not started: {e}")
 
     # ┌─────────────────────────────────────────────────────────────────────┐
     # │ DOC UPDATE: Adding/removing a scheduler job? Also update:          │
@@ -1409,7 +1386,28 @@ async def shutdown_event():
         scheduler.shutdown(wait=False)
         logger.info("Alert scheduler stopped")
 
+    # Stop streaming exit watcher
+    try:
+        from app.services.trading.exit_watcher import exit_watcher
+        exit_watcher.stop()
+    except Exception:
+        pass
+
+    # Stop event bus (Redis listener)
+    try:
+        event_bus.get_event_bus().stop()
+    except Exception:
+        pass
+
+    # Stop compute pool workers
+    try:
+        from app.services.compute import compute_pool
+        compute_pool.shutdown()
+    except Exception:
+        pass
+
     # Stop Telegram bot if running
+    from app.services.telegram_bot import get_telegram_bot
     bot = get_telegram_bot()
     if bot.is_running():
         await bot.stop()
@@ -1423,6 +1421,12 @@ async def shutdown_event():
         sessions_closed += 1
     except Exception:
         pass
+    try:
+        from app.services.data_fetcher.alpaca_service import alpaca_service
+        await alpaca_service.close()
+        sessions_closed += 1
+    except Exception:
+        pass
     try:
         from app.services.command_center import (
             get_market_data_service, get_news_service, get_news_feed_service,
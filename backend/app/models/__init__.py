@@ -28,7 +28,10 @@ from app.models.bot_config import BotConfiguration
 from app.models.executed_trade import ExecutedTrade
 from app.models.bot_state import BotState
 from app.models.daily_bot_performance import DailyBotPerformance
+from app.models.daily_trade_rollup import DailyTradeRollup
 from app.models.backtest_result import BacktestResult
+from app.models.backtest_artifact import BacktestArtifact
+from app.models.backtest_sweep import BacktestSweep
 from app.models.autopilot_log import AutopilotLog
 
 __all__ = [
@@ -63,6 +66,9 @@ __all__ = [
     "ExecutedTrade",
     "BotState",
     "DailyBotPerformance",
+    "DailyTradeRollup",
     "BacktestResult",
+    "BacktestArtifact",
+    "BacktestSweep",
     "AutopilotLog",
 ]
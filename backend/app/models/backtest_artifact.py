@@ -0,0 +1,38 @@
+"""
+Backtest Artifact model — the equity curve and trade log of a completed backtest.
+
+Kept out of backtest_results so listing backtests never reads them. Blobs
+are struct-of-arrays .npz encodings; see app.services.backtesting.artifacts.
+"""
+from sqlalchemy import (
+    Column, Integer, LargeBinary, DateTime, ForeignKey,
+)
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class BacktestArtifact(Base):
+    """Binary equity curve + trade log for one BacktestResult."""
+    __tablename__ = "backtest_artifacts"
+
+    id = Column(Integer, primary_key=True)
+    backtest_id = Column(
+        Integer, ForeignKey("backtest_results.id", ondelete="CASCADE"),
+        nullable=False, unique=True, index=True,
+    )
+
+    # ── Data ─────────────────────────────────────────────────────────────
+    equity = Column(LargeBinary, nullable=True)      # t int32 minutes, v float32
+    trades = Column(LargeBinary, nullable=True)      # columns per trade field
+    equity_points = Column(Integer, nullable=False, default=0)   # full-resolution length
+    trade_count = Column(Integer, nullable=False, default=0)
+
+    # ── Timestamp ────────────────────────────────────────────────────────
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return (
+            f"<BacktestArtifact(backtest_id={self.backtest_id}, "
+            f"equity_points={self.equity_points}, trades={self.trade_count})>"
+        )
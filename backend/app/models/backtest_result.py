@@ -2,13 +2,18 @@
 Backtest Result model — stores configuration, status, and results of backtests.
 
 Each row represents one backtest run: strategy + symbol + date range → performance metrics.
+The equity curve and trade log live in BacktestArtifact (loaded only on access).
 """
+from typing import Optional
+
 from sqlalchemy import (
     Column, Integer, Float, String, Text, Date, DateTime, JSON,
 )
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.backtest_artifact import BacktestArtifact
 
 
 class BacktestResult(Base):
@@ -50,10 +55,16 @@ class BacktestResult(Base):
     worst_trade_pct = Column(Float, nullable=True)
     avg_trade_duration = Column(String(50), nullable=True)  # human-readable
 
-    # ── Data (JSON columns) ──────────────────────────────────────────────
-    equity_curve = Column(JSON, nullable=True)     # [{date, value}, ...]
-    trade_log = Column(JSON, nullable=True)        # [{entry_date, exit_date, direction, pnl, pnl_pct, ...}, ...]
-    parameters = Column(JSON, nullable=True)       # Strategy params used
+    # ── Data ─────────────────────────────────────────────────────────────
+    # Equity curve + trade log: binary arrays in BacktestArtifact
+    artifact = relationship(
+        BacktestArtifact, uselist=False, lazy="select",
+        cascade="all, delete-orphan", passive_deletes=True,
+    )
+    # Legacy JSON copies (rows saved before artifacts); never selected unless read
+    equity_curve = deferred(Column(JSON, nullable=True))     # [{date, value}, ...]
+    trade_log = deferred(Column(JSON, nullable=True))        # [{entry_date, exit_date, direction, pnl, pnl_pct, ...}, ...]
+    parameters = Column(JSON, nullable=True)                 # Strategy params used
 
     # ── Timestamps ───────────────────────────────────────────────────────
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -65,9 +76,12 @@ class BacktestResult(Base):
             f"strategy={self.strategy}, status={self.status})>"
         )
 
-    def to_dict(self) -> dict:
-        """Serialise for API responses."""
-        return {
+    def to_dict(self, include_data: bool = False, points: Optional[int] = None) -> dict:
+        """
+        Serialise for API responses. The equity curve (LTTB-downsampled to
+        `points`, 0 = full resolution) and trade log only with include_data.
+        """
+        data = {
             "id": self.id,
             # Config
             "symbol": self.symbol,
@@ -96,11 +110,23 @@ class BacktestResult(Base):
             "best_trade_pct": self.best_trade_pct,
             "worst_trade_pct": self.worst_trade_pct,
             "avg_trade_duration": self.avg_trade_duration,
-            # Data
-            "equity_curve": self.equity_curve,
-            "trade_log": self.trade_log,
             "parameters": self.parameters,
             # Timestamps
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
+        if include_data:
+            from app.services.backtesting import artifacts
+
+            if points is None:
+                points = artifacts.DEFAULT_POINTS
+            art = self.artifact
+            if art is not None:
+                data["equity_curve"] = artifacts.equity_points(art.equity, points) if art.equity else []
+                data["trade_log"] = artifacts.trade_records(art.trades) if art.trades else []
+                data["equity_points_total"] = art.equity_points
+            else:
+                data["equity_curve"] = artifacts.downsample_points(self.equity_curve, points)
+                data["trade_log"] = self.trade_log
+                data["equity_points_total"] = len(self.equity_curve or [])
+        return data
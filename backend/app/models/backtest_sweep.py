@@ -0,0 +1,94 @@
+"""
+Backtest Sweep model — one row per parameter sweep (symbols × parameter grid,
+optionally walk-forward).
+
+Per-run results are stored compactly: summary metrics only (no equity
+curves or trade logs), as one columnar JSON table {columns, rows} rather
+than a BacktestResult row per combination.
+"""
+from sqlalchemy import (
+    Column, Integer, Float, String, Text, Date, DateTime, JSON,
+)
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class BacktestSweep(Base):
+    """
+    Persisted parameter sweep.
+    Created with status='pending', updated to 'running'/'completed'/'failed'.
+    """
+    __tablename__ = "backtest_sweeps"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # ── Configuration ────────────────────────────────────────────────────
+    symbols = Column(JSON, nullable=False)                  # ["AAPL", "MSFT", ...]
+    strategy = Column(String(50), nullable=False)
+    timeframe = Column(String(10), nullable=False)
+    cap_size = Column(String(20), default="large_cap")
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    initial_capital = Column(Float, default=100000.0)
+    position_size_pct = Column(Float, default=10.0)
+    grid = Column(JSON, nullable=False)                     # {param: [values, ...]}
+    walk_forward = Column(JSON, nullable=True)              # {folds, train_ratio} or null
+    rank_by = Column(String(30), default="total_return_pct")
+
+    # ── Status ───────────────────────────────────────────────────────────
+    status = Column(String(20), default="pending", index=True)  # pending, running, completed, failed
+    error_message = Column(Text, nullable=True)
+    total_runs = Column(Integer, default=0)                 # symbols × combinations
+    completed_runs = Column(Integer, default=0)
+
+    # ── Results (populated on completion) ────────────────────────────────
+    combinations = Column(JSON, nullable=True)              # [{param: value}, ...] — index = combo id
+    ranking = Column(JSON, nullable=True)                   # combos ranked by rank_by (aggregated over symbols)
+    walk_forward_summary = Column(JSON, nullable=True)      # per-symbol fold selections + out-of-sample metrics
+    results = Column(JSON, nullable=True)                   # {columns: [...], rows: [[...], ...]}
+    skipped_symbols = Column(JSON, nullable=True)           # [{symbol, reason}, ...]
+
+    # ── Timestamps ───────────────────────────────────────────────────────
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<BacktestSweep(id={self.id}, strategy={self.strategy}, "
+            f"symbols={len(self.symbols or [])}, status={self.status})>"
+        )
+
+    def to_dict(self, include_results: bool = False) -> dict:
+        """Serialise for API responses (the per-run table only on request)."""
+        data = {
+            "id": self.id,
+            # Config
+            "symbols": self.symbols,
+            "strategy": self.strategy,
+            "timeframe": self.timeframe,
+            "cap_size": self.cap_size,
+            "start_date": self.start_date.isoformat() if self.start_date else None,
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "initial_capital": self.initial_capital,
+            "position_size_pct": self.position_size_pct,
+            "grid": self.grid,
+            "walk_forward": self.walk_forward,
+            "rank_by": self.rank_by,
+            # Status
+            "status": self.status,
+            "error_message": self.error_message,
+            "total_runs": self.total_runs,
+            "completed_runs": self.completed_runs,
+            # Results
+            "combinations": self.combinations,
+            "ranking": self.ranking,
+            "walk_forward_summary": self.walk_forward_summary,
+            "skipped_symbols": self.skipped_symbols,
+            # Timestamps
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+        if include_results:
+            data["results"] = self.results
+        return data
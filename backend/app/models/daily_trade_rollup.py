@@ -0,0 +1,65 @@
+"""
+Daily Trade Rollup model — closed-trade aggregates per day, strategy,
+asset type and exit reason.
+
+Maintained by TradeJournal.update_daily_stats whenever trades close. The
+performance summary and exit-reason breakdown sum these rows instead of
+loading ExecutedTrades, so their cost depends on the number of days in the
+range, not the number of trades.
+"""
+from sqlalchemy import (
+    Column, Integer, Float, String, Date, DateTime, Index,
+)
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class DailyTradeRollup(Base):
+    """
+    One row per (date, strategy, asset_type, exit_reason) with closed trades.
+    Sums are kept (not averages) so any date range can be re-aggregated.
+    """
+    __tablename__ = "daily_trade_rollups"
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)                     # Exit date
+
+    # ── Grouping ──────────────────────────────────────────────────────────
+    strategy = Column(String(100), nullable=False)          # Signal strategy, else notes, else "unknown"
+    asset_type = Column(String(10), nullable=False)         # stock, option
+    exit_reason = Column(String(30), nullable=False)        # ExitReason value or "unknown"
+
+    # ── Counts ────────────────────────────────────────────────────────────
+    trades_count = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+
+    # ── P&L sums ──────────────────────────────────────────────────────────
+    gross_pl = Column(Float, nullable=False, default=0.0)
+    win_pl = Column(Float, nullable=False, default=0.0)     # Sum of winning trades
+    loss_pl = Column(Float, nullable=False, default=0.0)    # Sum of losing trades (<= 0)
+    total_fees = Column(Float, nullable=False, default=0.0)
+    best_trade_pl = Column(Float, nullable=True)
+    worst_trade_pl = Column(Float, nullable=True)
+
+    # ── Hold time (sum + count, for averages over any range) ──────────────
+    hold_minutes_total = Column(Integer, nullable=False, default=0)
+    hold_count = Column(Integer, nullable=False, default=0)
+
+    # ── Timestamp ─────────────────────────────────────────────────────────
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "uq_trade_rollup_key", "date", "strategy", "asset_type", "exit_reason",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<DailyTradeRollup(date={self.date}, strategy={self.strategy}, "
+            f"asset_type={self.asset_type}, exit_reason={self.exit_reason}, "
+            f"trades={self.trades_count}, gross_pl={self.gross_pl})>"
+        )
@@ -26,6 +26,10 @@ class SavedScanResult(Base):
     iv_rank = Column(DECIMAL(10, 2))
     iv_percentile = Column(DECIMAL(10, 2))
 
+    # Summary columns denormalized out of stock_data (list views skip the JSON)
+    rsi = Column(DECIMAL(10, 2))
+    sector = Column(String(100))
+
     # Store full stock data as JSON for flexibility
     stock_data = Column(JSON)  # All metrics, options data, etc.
 
@@ -43,6 +47,42 @@ class SavedScanResult(Base):
     def __repr__(self):
         return f"<SavedScanResult(scan_type={self.scan_type}, symbol={self.symbol}, score={self.score})>"
 
+    @classmethod
+    def from_stock(cls, scan_type: str, stock: dict, scanned_at=None) -> "SavedScanResult":
+        """Build a row from a screener result, filling the summary columns."""
+        indicators = stock.get("technical_indicators") or {}
+        return cls(
+            scan_type=scan_type,
+            symbol=stock.get("symbol", ""),
+            company_name=stock.get("company_name") or stock.get("name"),
+            score=stock.get("composite_score") or stock.get("score"),
+            current_price=stock.get("current_price") or stock.get("price"),
+            market_cap=stock.get("market_cap"),
+            iv_rank=stock.get("iv_rank"),
+            iv_percentile=stock.get("iv_percentile"),
+            rsi=indicators.get("rsi") or indicators.get("rsi_14") or stock.get("rsi"),
+            sector=stock.get("sector"),
+            stock_data=stock,  # Store full data as JSON
+            scanned_at=scanned_at,
+        )
+
+    def to_summary_dict(self):
+        """List-view fields only — no stock_data blob."""
+        return {
+            "id": self.id,
+            "scan_type": self.scan_type,
+            "symbol": self.symbol,
+            "company_name": self.company_name,
+            "score": float(self.score) if self.score else None,
+            "current_price": float(self.current_price) if self.current_price else None,
+            "market_cap": float(self.market_cap) if self.market_cap else None,
+            "iv_rank": float(self.iv_rank) if self.iv_rank else None,
+            "iv_percentile": float(self.iv_percentile) if self.iv_percentile else None,
+            "rsi": float(self.rsi) if self.rsi else None,
+            "sector": self.sector,
+            "scanned_at": self.scanned_at.isoformat() if self.scanned_at else None,
+        }
+
     def to_dict(self):
         """Convert to dictionary for API response"""
         return {
@@ -55,6 +95,8 @@ class SavedScanResult(Base):
             "market_cap": float(self.market_cap) if self.market_cap else None,
             "iv_rank": float(self.iv_rank) if self.iv_rank else None,
             "iv_percentile": float(self.iv_percentile) if self.iv_percentile else None,
+            "rsi": float(self.rsi) if self.rsi else None,
+            "sector": self.sector,
             "stock_data": self.stock_data,
             "scanned_at": self.scanned_at.isoformat() if self.scanned_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
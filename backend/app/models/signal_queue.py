@@ -1,7 +1,7 @@
 """
 Signal Queue model for tracking stocks being monitored for trading signals
 """
-from sqlalchemy import Column, Integer, String, DateTime, Index, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Index, Boolean, Text, text
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -59,6 +59,12 @@ class SignalQueue(Base):
         Index('idx_queue_status', 'status'),
         Index('idx_queue_timeframe', 'timeframe'),
         Index('idx_queue_created', 'created_at'),
+        # One active item per symbol+timeframe (existing DBs: scripts/add_signal_queue_active_unique_index.py)
+        Index(
+            'uq_queue_active_symbol_tf', 'symbol', 'timeframe', unique=True,
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
     )
 
     def __repr__(self):
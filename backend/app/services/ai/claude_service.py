@@ -12,19 +12,20 @@ Enhanced with:
 import json
 import re
 import asyncio
+import importlib.util
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from loguru import logger
 
-try:
-    import anthropic
-    from anthropic import APIError, RateLimitError as AnthropicRateLimitError
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# The SDK takes over a second to import, so initialize() imports it
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+if not ANTHROPIC_AVAILABLE:
     logger.warning("anthropic package not installed. Run: pip install anthropic")
 
+if TYPE_CHECKING:
+    import anthropic
+
 from app.config import get_settings
 from app.services.ai.prompts import (
     STOCK_ANALYSIS_PROMPT,
@@ -306,7 +307,7 @@ class ClaudeAnalysisService:
     DEFAULT_DAILY_BUDGET = 10.0  # $10 default daily budget
 
     def __init__(self):
-        self.client: Optional[anthropic.Anthropic] = None
+        self.client: Optional["anthropic.Anthropic"] = None
         self.settings = get_settings()
         self._available = False
 
@@ -355,6 +356,8 @@ class ClaudeAnalysisService:
             return False
 
         try:
+            import anthropic
+
             self.client = anthropic.Anthropic(api_key=key)
             self._available = True
             logger.info(
@@ -395,6 +398,8 @@ class ClaudeAnalysisService:
             logger.warning("Claude service not available")
             return None, None
 
+        from anthropic import APIError, RateLimitError as AnthropicRateLimitError
+
         # Check budget
         if not self.cost_tracker.check_budget(self._daily_budget):
             logger.warning(
@@ -1,6 +1,7 @@
 """
 Market Regime Detection - Analyze VIX, breadth, and market conditions
 """
+import asyncio
 import json
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -31,19 +32,23 @@ class MarketRegimeDetector:
         try:
             data = {}
 
-            # Get VIX data
-            vix_data = alpaca_service.get_historical_prices("^VIX", period="1mo")
+            vix_data, spy_data = await asyncio.gather(
+                alpaca_service.get_historical_prices_async("^VIX", period="1mo"),
+                alpaca_service.get_historical_prices_async("SPY", period="3mo"),
+            )
+
+            # VIX
             if vix_data is not None and len(vix_data) > 0:
-                data['vix'] = float(vix_data['Close'].iloc[-1])
+                data['vix'] = float(vix_data['close'].iloc[-1])
                 # Calculate 20-day SMA of VIX
                 if len(vix_data) >= 20:
-                    data['vix_sma'] = float(vix_data['Close'].tail(20).mean())
+                    data['vix_sma'] = float(vix_data['close'].tail(20).mean())
                 else:
                     data['vix_sma'] = data['vix']
 
                 # VIX trend
                 if len(vix_data) >= 5:
-                    vix_5d_ago = float(vix_data['Close'].iloc[-5])
+                    vix_5d_ago = float(vix_data['close'].iloc[-5])
                     if data['vix'] < vix_5d_ago * 0.95:
                         data['vix_trend'] = 'falling'
                     elif data['vix'] > vix_5d_ago * 1.05:
@@ -57,18 +62,17 @@ class MarketRegimeDetector:
                 data['vix_sma'] = 20.0
                 data['vix_trend'] = 'unknown'
 
-            # Get SPY data for RSI and trend
-            spy_data = alpaca_service.get_historical_prices("SPY", period="3mo")
+            # SPY RSI and trend
             if spy_data is not None and len(spy_data) > 0:
                 # Calculate RSI
                 indicators = self.tech_analysis.calculate_all_indicators(spy_data)
                 latest = self.tech_analysis.get_latest_indicators(indicators)
                 data['spy_rsi'] = latest.get('rsi_14', 50)
-                data['spy_price'] = float(spy_data['Close'].iloc[-1])
+                data['spy_price'] = float(spy_data['close'].iloc[-1])
 
                 # SPY vs 200 SMA
                 if len(spy_data) >= 200:
-                    sma_200 = float(spy_data['Close'].tail(200).mean())
+                    sma_200 = float(spy_data['close'].tail(200).mean())
                     pct_diff = ((data['spy_price'] - sma_200) / sma_200) * 100
                     data['spy_vs_200sma'] = f"{pct_diff:+.1f}%"
                     data['spy_above_200sma'] = data['spy_price'] > sma_200
@@ -3,27 +3,70 @@ Dynamic Alert Service
 Checks alert conditions and triggers notifications
 """
 import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from loguru import logger
+import pandas as pd
 from sqlalchemy.orm import Session
+from ta.momentum import RSIIndicator
 
 from app.models.user_alert import UserAlert, AlertNotification, AlertType
 from app.services.data_fetcher.fmp_service import fmp_service
 from app.services.data_fetcher.alpaca_service import alpaca_service
-from app.services.analysis.technical import TechnicalAnalysis
 from app.services.analysis.options import OptionsAnalysis
-from app.services.telegram_bot import get_telegram_bot
 from app.config import get_settings
 
 
+# Alert types that need daily bars (RSI / SMA) or IV rank on top of the quote
+_DAILY_BAR_ALERTS = {
+    AlertType.RSI_OVERSOLD.value,
+    AlertType.RSI_OVERBOUGHT.value,
+    AlertType.PRICE_CROSS_SMA.value,
+}
+_IV_ALERTS = {
+    AlertType.IV_RANK_BELOW.value,
+    AlertType.IV_RANK_ABOVE.value,
+}
+
+
+class SymbolMarketData:
+    """Market data for one symbol, shared by every alert on that symbol in a cycle."""
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.current_price: Optional[float] = None
+        self.iv_rank: Optional[float] = None
+        self.rsi_14: Optional[float] = None
+        self._closes: Optional[pd.Series] = None
+        self._sma_cache: Dict[int, Tuple[Optional[float], Optional[float], Optional[float]]] = {}
+
+    def set_daily_closes(self, closes: pd.Series) -> None:
+        self._closes = closes.reset_index(drop=True).astype(float)
+        if len(self._closes) > 14:
+            rsi = RSIIndicator(close=self._closes, window=14).rsi().iloc[-1]
+            self.rsi_14 = float(rsi) if pd.notna(rsi) else None
+
+    def sma(self, period: int) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """(latest SMA, previous SMA, previous close) — computed once per period."""
+        if period not in self._sma_cache:
+            closes = self._closes
+            if closes is None or len(closes) < period + 1:
+                self._sma_cache[period] = (None, None, None)
+            else:
+                sma = closes.rolling(window=period).mean()
+                self._sma_cache[period] = (
+                    float(sma.iloc[-1]), float(sma.iloc[-2]), float(closes.iloc[-2]),
+                )
+        return self._sma_cache[period]
+
+
 class AlertService:
     """
     Service for managing and checking dynamic alerts
     """
 
     def __init__(self):
-        self.tech_analysis = TechnicalAnalysis()
         self.opt_analysis = OptionsAnalysis()
         self._settings = get_settings()
 
@@ -50,6 +93,8 @@ class AlertService:
             if not chat_ids:
                 return False
 
+            from app.services.telegram_bot import get_telegram_bot
+
             telegram_bot = get_telegram_bot()
             if not telegram_bot.is_running():
                 logger.warning("Telegram bot not running, cannot send alert")
@@ -109,223 +154,271 @@ class AlertService:
         if getattr(alert, 'alert_scope', 'ticker') == "macro":
             return self._check_macro_alert(alert, db)
 
-        # Continue with ticker-level alert checking
-        # Check if expired
-        if alert.expires_at and datetime.now(alert.expires_at.tzinfo) > alert.expires_at:
-            alert.is_active = False
+        if self._expire_if_due(alert):
             db.commit()
             return None
 
-        try:
-            symbol = alert.symbol
-            if not symbol:
-                return None
-
-            # Get current data for the symbol
-            stock_info = fmp_service.get_stock_info(symbol)
-            if not stock_info:
-                logger.warning(f"Alert {alert.id}: Could not get stock info for {symbol}")
-                return None
-
-            current_price = stock_info.get('current_price')
+        if not alert.symbol:
+            return None
 
-            # Check condition based on alert type
-            triggered = False
-            triggered_value = None
-            message = ""
+        market_data = self._fetch_market_data([alert])
+        notification = self._check_ticker_alert(
+            alert, market_data.get(alert.symbol.upper()), db,
+        )
+        db.commit()
+        return notification
 
-            if alert.alert_type == AlertType.IV_RANK_BELOW.value:
-                triggered, triggered_value, message = self._check_iv_rank_below(
-                    symbol, alert.threshold_value, current_price
-                )
+    # -------------------------------------------------------------------------
+    # TICKER ALERT HANDLING (batched by symbol and data need)
+    # -------------------------------------------------------------------------
 
-            elif alert.alert_type == AlertType.IV_RANK_ABOVE.value:
-                triggered, triggered_value, message = self._check_iv_rank_above(
-                    symbol, alert.threshold_value, current_price
-                )
+    @staticmethod
+    def _expire_if_due(alert: UserAlert) -> bool:
+        """Deactivate an alert past its expiry. Returns True if it expired."""
+        if alert.expires_at and datetime.now(alert.expires_at.tzinfo) > alert.expires_at:
+            alert.is_active = False
+            return True
+        return False
 
-            elif alert.alert_type == AlertType.PRICE_ABOVE.value:
-                if current_price and current_price > alert.threshold_value:
-                    triggered = True
-                    triggered_value = current_price
-                    message = f"{symbol} price ${current_price:.2f} crossed above ${alert.threshold_value:.2f}"
-
-            elif alert.alert_type == AlertType.PRICE_BELOW.value:
-                if current_price and current_price < alert.threshold_value:
-                    triggered = True
-                    triggered_value = current_price
-                    message = f"{symbol} price ${current_price:.2f} dropped below ${alert.threshold_value:.2f}"
-
-            elif alert.alert_type == AlertType.RSI_OVERSOLD.value:
-                triggered, triggered_value, message = self._check_rsi(
-                    symbol, alert.threshold_value or 30, "below"
-                )
+    def _fetch_market_data(self, alerts: List[UserAlert]) -> Dict[str, SymbolMarketData]:
+        """
+        Fetch each dataset the alerts need exactly once per symbol:
+          quote       — live stream bar, else one multi-snapshot call, else FMP
+          daily bars  — one batched bars request for all RSI/SMA symbols
+          IV rank     — one TastyTrade lookup per IV-alert symbol
+        """
+        needs: Dict[str, Set[str]] = defaultdict(set)
+        for alert in alerts:
+            if alert.symbol:
+                needs[alert.symbol.upper()].add(alert.alert_type)
+
+        market: Dict[str, SymbolMarketData] = {s: SymbolMarketData(s) for s in needs}
+        if not market:
+            return market
+
+        # Each stage below fails on its own: a provider error leaves only that
+        # stage's fields unset, and alerts whose inputs did load still evaluate.
+
+        # Quotes
+        missing = []
+        for symbol, data in market.items():
+            data.current_price = self._get_live_price(symbol)
+            if data.current_price is None:
+                missing.append(symbol)
+        if missing:
+            try:
+                snapshots = alpaca_service.get_multi_snapshots(missing) or {}
+            except Exception as e:
+                logger.error(f"Error fetching snapshots for {len(missing)} symbols: {e}")
+                snapshots = {}
+            for symbol in missing:
+                price = (snapshots.get(symbol) or {}).get("current_price")
+                if price is None:
+                    try:
+                        stock_info = fmp_service.get_stock_info(symbol)
+                        price = stock_info.get("current_price") if stock_info else None
+                    except Exception as e:
+                        logger.error(f"Error fetching quote for {symbol}: {e}")
+                market[symbol].current_price = price
+
+        # Daily bars → RSI / SMA computed once per symbol
+        bar_symbols = [s for s, types in needs.items() if types & _DAILY_BAR_ALERTS]
+        if bar_symbols:
+            try:
+                history = alpaca_service.get_multi_historical_prices(bar_symbols, period="1y") or {}
+            except Exception as e:
+                logger.error(f"Error fetching daily bars for {len(bar_symbols)} symbols: {e}")
+                history = {}
+            for symbol in bar_symbols:
+                df = history.get(symbol)
+                if df is not None and not df.empty:
+                    try:
+                        market[symbol].set_daily_closes(df["close"])
+                    except Exception as e:
+                        logger.error(f"Error computing RSI/SMA for {symbol}: {e}")
+
+        # IV rank
+        for symbol, types in needs.items():
+            if types & _IV_ALERTS:
+                try:
+                    enhanced = self.opt_analysis.get_enhanced_iv_data(symbol)
+                    market[symbol].iv_rank = enhanced.get("iv_rank") if enhanced else None
+                except Exception as e:
+                    logger.error(f"Error fetching IV rank for {symbol}: {e}")
 
-            elif alert.alert_type == AlertType.RSI_OVERBOUGHT.value:
-                triggered, triggered_value, message = self._check_rsi(
-                    symbol, alert.threshold_value or 70, "above"
-                )
+        logger.debug(
+            f"Alert data: {len(market)} symbols | quotes via snapshot: {len(missing)} | "
+            f"daily bars: {len(bar_symbols)} | iv: {sum(1 for t in needs.values() if t & _IV_ALERTS)}"
+        )
+        return market
 
-            elif alert.alert_type == AlertType.PRICE_CROSS_SMA.value:
-                triggered, triggered_value, message = self._check_sma_cross(
-                    symbol, alert.sma_period or 200, current_price
-                )
+    def _check_ticker_alert(
+        self, alert: UserAlert, data: Optional[SymbolMarketData], db: Session,
+    ) -> Optional[AlertNotification]:
+        """Evaluate one ticker alert against shared per-symbol data."""
+        try:
+            if data is None:
+                return None
 
-            elif alert.alert_type == AlertType.EARNINGS_APPROACHING.value:
-                triggered, triggered_value, message = self._check_earnings(
-                    symbol, int(alert.threshold_value or 14)
-                )
+            triggered, triggered_value, message = self._evaluate_ticker_alert(alert, data)
 
             # Update last checked
             alert.last_checked_at = datetime.utcnow()
 
             if triggered:
-                # Create notification
-                channels_sent = []
-                notification = AlertNotification(
-                    alert_id=alert.id,
-                    alert_name=alert.name,
-                    symbol=symbol,
-                    alert_type=alert.alert_type,
-                    triggered_value=triggered_value,
-                    threshold_value=alert.threshold_value,
-                    message=message,
-                    channels_sent=channels_sent
-                )
+                return self._record_trigger(alert, alert.symbol, triggered_value, message, db)
+            return None
 
-                # Update alert
-                alert.times_triggered += 1
-                alert.last_triggered_at = datetime.utcnow()
-                alert.last_triggered_value = triggered_value
+        except Exception as e:
+            logger.error(f"Error checking alert {alert.id}: {e}")
+            return None
 
-                # Send notifications based on configured channels
-                notification_channels = alert.notification_channels or ["app"]
+    def _evaluate_ticker_alert(
+        self, alert: UserAlert, data: SymbolMarketData,
+    ) -> tuple[bool, Optional[float], str]:
+        """Apply an alert's predicate. Returns (triggered, value, message)."""
+        symbol = data.symbol
+        current_price = data.current_price
+        alert_type = alert.alert_type
 
-                if "telegram" in notification_channels:
-                    if self._send_telegram_notification(alert, message):
-                        channels_sent.append("telegram")
-                        logger.info(f"Telegram notification sent for alert: {alert.name}")
+        if alert_type == AlertType.IV_RANK_BELOW.value:
+            return self._check_iv_rank_below(symbol, alert.threshold_value, data.iv_rank)
 
-                # App notification is always recorded
-                if "app" in notification_channels:
-                    channels_sent.append("app")
+        if alert_type == AlertType.IV_RANK_ABOVE.value:
+            return self._check_iv_rank_above(symbol, alert.threshold_value, data.iv_rank)
 
-                notification.channels_sent = channels_sent
+        if alert_type == AlertType.PRICE_ABOVE.value:
+            if current_price and current_price > alert.threshold_value:
+                return True, current_price, f"{symbol} price ${current_price:.2f} crossed above ${alert.threshold_value:.2f}"
+            return False, current_price, ""
 
-                # Deactivate if frequency is 'once'
-                if alert.frequency == "once":
-                    alert.is_active = False
+        if alert_type == AlertType.PRICE_BELOW.value:
+            if current_price and current_price < alert.threshold_value:
+                return True, current_price, f"{symbol} price ${current_price:.2f} dropped below ${alert.threshold_value:.2f}"
+            return False, current_price, ""
 
-                db.add(notification)
-                db.commit()
+        if alert_type == AlertType.RSI_OVERSOLD.value:
+            return self._check_rsi(symbol, data.rsi_14, alert.threshold_value or 30, "below")
 
-                logger.info(f"Alert triggered: {alert.name} for {symbol} - {message}")
-                return notification
+        if alert_type == AlertType.RSI_OVERBOUGHT.value:
+            return self._check_rsi(symbol, data.rsi_14, alert.threshold_value or 70, "above")
 
-            db.commit()
-            return None
+        if alert_type == AlertType.PRICE_CROSS_SMA.value:
+            return self._check_sma_cross(data, alert.sma_period or 200)
 
-        except Exception as e:
-            logger.error(f"Error checking alert {alert.id}: {e}")
-            return None
+        if alert_type == AlertType.EARNINGS_APPROACHING.value:
+            return self._check_earnings(symbol, int(alert.threshold_value or 14))
 
-    def _check_iv_rank_below(
-        self, symbol: str, threshold: float, current_price: float
-    ) -> tuple[bool, float, str]:
-        """Check if IV Rank dropped below threshold"""
-        try:
-            options_data = alpaca_service.get_options_chain(symbol)
-            if not options_data or 'calls' not in options_data:
-                return False, None, ""
+        return False, None, ""
 
-            enhanced_data = self.opt_analysis.get_enhanced_iv_data(symbol)
-            iv_rank = enhanced_data.get('iv_rank') if enhanced_data else None
+    def _record_trigger(
+        self, alert: UserAlert, symbol: str, triggered_value: Optional[float],
+        message: str, db: Session,
+    ) -> AlertNotification:
+        """Create the notification, update alert counters and send channels."""
+        channels_sent = []
+        notification = AlertNotification(
+            alert_id=alert.id,
+            alert_name=alert.name,
+            symbol=symbol,
+            alert_type=alert.alert_type,
+            triggered_value=triggered_value,
+            threshold_value=alert.threshold_value,
+            message=message,
+            channels_sent=channels_sent
+        )
 
-            if iv_rank is not None and iv_rank < threshold:
-                return True, iv_rank, f"{symbol} IV Rank dropped to {iv_rank:.1f}% (below {threshold}%)"
+        # Update alert
+        alert.times_triggered += 1
+        alert.last_triggered_at = datetime.utcnow()
+        alert.last_triggered_value = triggered_value
 
-            return False, iv_rank, ""
+        # Send notifications based on configured channels
+        notification_channels = alert.notification_channels or ["app"]
 
-        except Exception as e:
-            logger.error(f"Error checking IV rank for {symbol}: {e}")
-            return False, None, ""
+        if "telegram" in notification_channels:
+            if self._send_telegram_notification(alert, message):
+                channels_sent.append("telegram")
+                logger.info(f"Telegram notification sent for alert: {alert.name}")
 
-    def _check_iv_rank_above(
-        self, symbol: str, threshold: float, current_price: float
-    ) -> tuple[bool, float, str]:
-        """Check if IV Rank rose above threshold"""
-        try:
-            enhanced_data = self.opt_analysis.get_enhanced_iv_data(symbol)
-            iv_rank = enhanced_data.get('iv_rank') if enhanced_data else None
+        # App notification is always recorded
+        if "app" in notification_channels:
+            channels_sent.append("app")
 
-            if iv_rank is not None and iv_rank > threshold:
-                return True, iv_rank, f"{symbol} IV Rank rose to {iv_rank:.1f}% (above {threshold}%)"
+        notification.channels_sent = channels_sent
 
-            return False, iv_rank, ""
+        # Deactivate if frequency is 'once'
+        if alert.frequency == "once":
+            alert.is_active = False
 
-        except Exception as e:
-            logger.error(f"Error checking IV rank for {symbol}: {e}")
-            return False, None, ""
+        db.add(notification)
 
-    def _check_rsi(
-        self, symbol: str, threshold: float, direction: str
-    ) -> tuple[bool, float, str]:
-        """Check RSI conditions"""
+        logger.info(f"Alert triggered: {alert.name} for {symbol} - {message}")
+        return notification
+
+    @staticmethod
+    def _get_live_price(symbol: str) -> Optional[float]:
+        """Close of the in-progress 1m bar from the price stream, if streaming."""
         try:
-            price_data = alpaca_service.get_historical_prices(symbol, period="3mo")
-            if price_data is None or price_data.empty:
-                return False, None, ""
+            from app.services.data_fetcher.price_stream_service import get_price_stream_service
+            bar = get_price_stream_service().get_latest_bar(symbol.upper(), "1m")
+            if bar and bar.get("close"):
+                return float(bar["close"])
+        except Exception as e:
+            logger.debug(f"Live price unavailable for {symbol}: {e}")
+        return None
 
-            price_data = self.tech_analysis.calculate_all_indicators(price_data)
-            indicators = self.tech_analysis.get_latest_indicators(price_data)
+    @staticmethod
+    def _check_iv_rank_below(
+        symbol: str, threshold: float, iv_rank: Optional[float]
+    ) -> tuple[bool, float, str]:
+        """Check if IV Rank dropped below threshold"""
+        if iv_rank is not None and iv_rank < threshold:
+            return True, iv_rank, f"{symbol} IV Rank dropped to {iv_rank:.1f}% (below {threshold}%)"
+        return False, iv_rank, ""
 
-            rsi = indicators.get('rsi_14')
-            if rsi is None:
-                return False, None, ""
+    @staticmethod
+    def _check_iv_rank_above(
+        symbol: str, threshold: float, iv_rank: Optional[float]
+    ) -> tuple[bool, float, str]:
+        """Check if IV Rank rose above threshold"""
+        if iv_rank is not None and iv_rank > threshold:
+            return True, iv_rank, f"{symbol} IV Rank rose to {iv_rank:.1f}% (above {threshold}%)"
+        return False, iv_rank, ""
 
-            if direction == "below" and rsi < threshold:
-                return True, rsi, f"{symbol} RSI dropped to {rsi:.1f} (oversold below {threshold})"
-            elif direction == "above" and rsi > threshold:
-                return True, rsi, f"{symbol} RSI rose to {rsi:.1f} (overbought above {threshold})"
+    @staticmethod
+    def _check_rsi(
+        symbol: str, rsi: Optional[float], threshold: float, direction: str
+    ) -> tuple[bool, float, str]:
+        """Check RSI conditions"""
+        if rsi is None:
+            return False, None, ""
 
-            return False, rsi, ""
+        if direction == "below" and rsi < threshold:
+            return True, rsi, f"{symbol} RSI dropped to {rsi:.1f} (oversold below {threshold})"
+        elif direction == "above" and rsi > threshold:
+            return True, rsi, f"{symbol} RSI rose to {rsi:.1f} (overbought above {threshold})"
 
-        except Exception as e:
-            logger.error(f"Error checking RSI for {symbol}: {e}")
-            return False, None, ""
+        return False, rsi, ""
 
+    @staticmethod
     def _check_sma_cross(
-        self, symbol: str, sma_period: int, current_price: float
+        data: SymbolMarketData, sma_period: int
     ) -> tuple[bool, float, str]:
         """Check if price crossed above SMA"""
-        try:
-            price_data = alpaca_service.get_historical_prices(symbol, period="1y")
-            if price_data is None or price_data.empty:
-                return False, None, ""
-
-            price_data = self.tech_analysis.calculate_all_indicators(price_data)
-            indicators = self.tech_analysis.get_latest_indicators(price_data)
-
-            sma_key = f'sma_{sma_period}'
-            sma_value = indicators.get(sma_key)
-
-            if sma_value is None:
-                return False, None, ""
-
-            # Check if price just crossed above SMA
-            # We look at previous close to detect crossover
-            if len(price_data) >= 2:
-                prev_close = price_data['close'].iloc[-2]
-                prev_sma = price_data[sma_key].iloc[-2] if sma_key in price_data.columns else None
+        symbol = data.symbol
+        current_price = data.current_price
+        sma_value, prev_sma, prev_close = data.sma(sma_period)
 
-                if prev_sma and prev_close < prev_sma and current_price > sma_value:
-                    return True, current_price, f"{symbol} crossed above SMA{sma_period} (${current_price:.2f} > ${sma_value:.2f})"
+        if sma_value is None or current_price is None:
+            return False, None, ""
 
-            return False, current_price, ""
+        # Check if price just crossed above SMA
+        # We look at previous close to detect crossover
+        if prev_sma and prev_close is not None and prev_close < prev_sma and current_price > sma_value:
+            return True, current_price, f"{symbol} crossed above SMA{sma_period} (${current_price:.2f} > ${sma_value:.2f})"
 
-        except Exception as e:
-            logger.error(f"Error checking SMA cross for {symbol}: {e}")
-            return False, None, ""
+        return False, current_price, ""
 
     def _check_earnings(
         self, symbol: str, days_threshold: int
@@ -659,6 +752,10 @@ class AlertService:
         """
         Check all active alerts
 
+        Ticker alerts are grouped by symbol so quotes, daily bars and IV rank
+        are fetched once per cycle regardless of how many alerts share a
+        symbol; macro alerts are checked individually.
+
         Args:
             db: Database session
 
@@ -670,11 +767,25 @@ class AlertService:
         # Get all active alerts
         alerts = db.query(UserAlert).filter(UserAlert.is_active == True).all()
 
+        ticker_alerts = []
         for alert in alerts:
-            notification = self.check_alert(alert, db)
-            if notification:
-                triggered.append(notification)
+            if getattr(alert, 'alert_scope', 'ticker') == "macro":
+                notification = self._check_macro_alert(alert, db)
+                if notification:
+                    triggered.append(notification)
+            elif not self._expire_if_due(alert) and alert.symbol:
+                ticker_alerts.append(alert)
+
+        if ticker_alerts:
+            market_data = self._fetch_market_data(ticker_alerts)
+            for alert in ticker_alerts:
+                notification = self._check_ticker_alert(
+                    alert, market_data.get(alert.symbol.upper()), db,
+                )
+                if notification:
+                    triggered.append(notification)
 
+        db.commit()
         return triggered
 
     def get_alert_type_description(self, alert_type: str) -> str:
@@ -0,0 +1,244 @@
+"""
+Local IV history — ATM implied volatility per symbol per day, and IV rank /
+IV percentile computed from it.
+
+TastyTrade is the primary source of IV rank. When it's unconfigured or down,
+the options stage and strategy selector fall back to this store, which is
+filled from the option chains the screener already pulls (the LEAPS ATM call
+picked by OptionsAnalysis.find_atm_option).
+
+Storage is one append-only file per symbol of fixed 8-byte records
+(int32 date ordinal, float32 IV):
+
+    <root>/AAPL.ivh
+
+A new trading day appends a record; later captures on the same day
+overwrite the last record in place (the day's value is its latest capture).
+Files are read with np.fromfile and need nothing but the local disk, so
+replays and offline runs work from whatever history was recorded.
+
+Per symbol, a 52-week window is kept in memory with running min/max
+(monotonic deques) and a sorted list of the window's values, so IV rank is
+O(1) and IV percentile one bisect (O(log n)) per lookup. Days roll into the
+window as they complete; the current day's value is held aside so repeated
+same-day captures never touch the window. Lookups as of an earlier date
+(replays) are computed directly from the stored arrays instead.
+"""
+import os
+import threading
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import date
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from app.config import get_settings
+
+RECORD = np.dtype([("day", "<i4"), ("iv", "<f4")])
+
+WINDOW_DAYS = 365          # 52 weeks of calendar days
+MIN_HISTORY_DAYS = 20      # fewer observations than this → no rank
+MAX_STALE_DAYS = 7         # latest IV older than this (vs as-of) → no rank
+
+DEFAULT_ROOT = Path(__file__).resolve().parents[3] / "data" / "iv_history"
+
+
+class _IVWindow:
+    """Trailing 52-week window of completed days plus the current day's value."""
+
+    def __init__(self):
+        self.days: Deque[int] = deque()
+        self.values: Deque[float] = deque()
+        self._min: Deque[Tuple[int, float]] = deque()   # increasing IV
+        self._max: Deque[Tuple[int, float]] = deque()   # decreasing IV
+        self._sorted: List[float] = []
+        self.current: Optional[Tuple[int, float]] = None
+
+    def push(self, day: int, iv: float) -> bool:
+        """Add (day, iv). Same day overwrites; an older day is rejected."""
+        if self.current is not None:
+            if day < self.current[0]:
+                return False
+            if day > self.current[0]:
+                self._commit(*self.current)
+        self.current = (day, iv)
+        self._evict(day - WINDOW_DAYS)
+        return True
+
+    def _commit(self, day: int, iv: float):
+        self.days.append(day)
+        self.values.append(iv)
+        insort(self._sorted, iv)
+        while self._min and self._min[-1][1] >= iv:
+            self._min.pop()
+        self._min.append((day, iv))
+        while self._max and self._max[-1][1] <= iv:
+            self._max.pop()
+        self._max.append((day, iv))
+
+    def _evict(self, cutoff: int):
+        while self.days and self.days[0] <= cutoff:
+            day, iv = self.days.popleft(), self.values.popleft()
+            del self._sorted[bisect_left(self._sorted, iv)]
+            if self._min[0][0] == day:
+                self._min.popleft()
+            if self._max[0][0] == day:
+                self._max.popleft()
+
+    def stats(self) -> Optional[Dict[str, float]]:
+        if self.current is None:
+            return None
+        day, iv = self.current
+        low = min(iv, self._min[0][1]) if self._min else iv
+        high = max(iv, self._max[0][1]) if self._max else iv
+        prior = len(self._sorted)
+        return _stats(day, iv, low, high, bisect_left(self._sorted, iv), prior)
+
+
+def _stats(day: int, iv: float, low: float, high: float, below: int, prior: int) -> Dict[str, float]:
+    """IV rank: position of iv in the window's range. IV percentile: share of prior days below it."""
+    rank = (iv - low) / (high - low) * 100 if high > low else 0.0
+    return {
+        "iv": round(float(iv), 4),
+        "iv_rank": round(float(rank), 1),
+        "iv_percentile": round(below / prior * 100, 1) if prior else 0.0,
+        "iv_low": round(float(low), 4),
+        "iv_high": round(float(high), 4),
+        "days": prior + 1,
+        "as_of": date.fromordinal(day).isoformat(),
+    }
+
+
+class IVHistoryStore:
+    """Per-symbol ATM IV history with 52-week IV rank / percentile (thread-safe)."""
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        clock: Callable[[], date] = date.today,
+        read_only: bool = False,
+    ):
+        self.root = Path(root or get_settings().IV_HISTORY_DIR or DEFAULT_ROOT)
+        self.clock = clock
+        self.read_only = read_only
+        self._windows: Dict[str, _IVWindow] = {}
+        self._lock = threading.Lock()
+
+    def path(self, symbol: str) -> Path:
+        return self.root / f"{symbol.upper()}.ivh"
+
+    def history(self, symbol: str) -> np.ndarray:
+        """All stored records for a symbol (structured array: day ordinal, iv)."""
+        path = self.path(symbol)
+        if not path.exists():
+            return np.empty(0, dtype=RECORD)
+        try:
+            return np.fromfile(path, dtype=RECORD)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable IV history {path}: {e}")
+            return np.empty(0, dtype=RECORD)
+
+    def symbols(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.stem for p in self.root.glob("*.ivh"))
+
+    def _window(self, symbol: str) -> _IVWindow:
+        """The symbol's window, loaded from disk on first use (caller holds the lock)."""
+        window = self._windows.get(symbol)
+        if window is None:
+            window = self._windows[symbol] = _IVWindow()
+            for day, iv in self.history(symbol).tolist():
+                window.push(day, iv)
+        return window
+
+    def record(self, symbol: str, iv: Optional[float], day: Optional[date] = None) -> bool:
+        """
+        Store one ATM IV observation (decimal, 0.45 = 45%). IV <= 0 means the
+        chain had no IV and is ignored; so are days older than the latest.
+        """
+        if self.read_only or iv is None or not np.isfinite(iv) or iv <= 0:
+            return False
+        symbol = symbol.upper()
+        day_num = (day or self.clock()).toordinal()
+        iv = float(np.float32(iv))   # as stored, so in-memory and reloaded windows agree
+
+        with self._lock:
+            window = self._window(symbol)
+            same_day = window.current is not None and window.current[0] == day_num
+            if not window.push(day_num, iv):
+                return False
+            path = self.path(symbol)
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                with open(path, "r+b" if path.exists() else "wb") as f:
+                    f.seek(-RECORD.itemsize if same_day else 0, os.SEEK_END)
+                    np.array([(day_num, iv)], dtype=RECORD).tofile(f)
+            except OSError as e:
+                logger.warning(f"Could not write IV history for {symbol}: {e}")
+        return True
+
+    def stats(self, symbol: str, as_of: Optional[date] = None) -> Optional[Dict[str, float]]:
+        """
+        {'iv', 'iv_rank', 'iv_percentile', 'iv_low', 'iv_high', 'days', 'as_of'}
+        over the 52 weeks ending at as_of (default: today), or None without
+        enough recent history. Rank and percentile are on a 0-100 scale.
+        """
+        symbol = symbol.upper()
+        as_of_num = (as_of or self.clock()).toordinal()
+
+        with self._lock:
+            window = self._window(symbol)
+            current = window.current
+            if current is not None and current[0] <= as_of_num:
+                result = window.stats()
+            else:
+                result = self._stats_as_of(symbol, as_of_num)
+
+        if result is None or result["days"] < MIN_HISTORY_DAYS:
+            return None
+        if as_of_num - date.fromisoformat(result["as_of"]).toordinal() > MAX_STALE_DAYS:
+            return None
+        return result
+
+    def _stats_as_of(self, symbol: str, as_of_num: int) -> Optional[Dict[str, float]]:
+        """Window ending at an earlier date, computed from the stored arrays."""
+        records = self.history(symbol)
+        records = records[records["day"] <= as_of_num]
+        if not len(records):
+            return None
+        day, iv = int(records["day"][-1]), float(records["iv"][-1])
+        prior = records["iv"][:-1][records["day"][:-1] > day - WINDOW_DAYS]
+        window = np.append(prior, iv)
+        return _stats(day, iv, window.min(), window.max(), int((prior < iv).sum()), len(prior))
+
+    def iv_rank(self, symbol: str, as_of: Optional[date] = None) -> Optional[float]:
+        result = self.stats(symbol, as_of)
+        return result["iv_rank"] if result else None
+
+    def iv_percentile(self, symbol: str, as_of: Optional[date] = None) -> Optional[float]:
+        result = self.stats(symbol, as_of)
+        return result["iv_percentile"] if result else None
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop in-memory windows (they reload from disk on next use)."""
+        with self._lock:
+            if symbol is None:
+                self._windows.clear()
+            else:
+                self._windows.pop(symbol.upper(), None)
+
+
+# Global store instance
+_iv_history_store: Optional[IVHistoryStore] = None
+
+
+def get_iv_history_store() -> IVHistoryStore:
+    """Get the global IV history store."""
+    global _iv_history_store
+    if _iv_history_store is None:
+        _iv_history_store = IVHistoryStore()
+    return _iv_history_store
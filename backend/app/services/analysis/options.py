@@ -3,7 +3,7 @@ Options analysis module - Greeks, IV, LEAPS analysis
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from loguru import logger
 
@@ -23,6 +23,9 @@ try:
 except ImportError:
     TASTYTRADE_AVAILABLE = False
 
+# Local ATM IV history (IV rank fallback when TastyTrade is unavailable)
+from app.services.analysis.iv_history import get_iv_history_store
+
 
 class OptionsAnalysis:
     """Analyze options data for LEAPS screening"""
@@ -559,31 +562,57 @@ class OptionsAnalysis:
             return {'available': False}
 
     @staticmethod
-    def get_enhanced_iv_data(symbol: str) -> Dict[str, Any]:
+    def get_enhanced_iv_data(symbol: str, as_of: Optional[date] = None) -> Dict[str, Any]:
         """
         Get enhanced IV data from TastyTrade if available.
 
         Provides IV rank, IV percentile, and historical volatility
-        for more accurate options analysis.
+        for more accurate options analysis. When TastyTrade has no IV rank
+        (unconfigured, down, or no data for the symbol), IV rank and
+        percentile come from the local ATM IV history instead.
 
         Args:
             symbol: Stock symbol
+            as_of: Date for the local IV history lookup (default: today)
 
         Returns:
-            Dict with IV metrics or empty dict if unavailable
+            Dict with IV metrics ('iv_source': 'tastytrade' | 'local')
+            or empty dict if unavailable
         """
-        if not TASTYTRADE_AVAILABLE:
-            return {}
+        data: Dict[str, Any] = {}
+        if TASTYTRADE_AVAILABLE:
+            try:
+                service = get_tastytrade_service()
+                if service.is_available():
+                    data = service.get_enhanced_options_data(symbol) or {}
+            except Exception as e:
+                logger.debug(f"TastyTrade data unavailable for {symbol}: {e}")
+
+        if data.get('iv_rank') is not None:
+            return {**data, 'iv_source': 'tastytrade'}
+
+        local = get_iv_history_store().stats(symbol, as_of)
+        if local is None:
+            return data
+        return {
+            **data,
+            'iv_rank': local['iv_rank'],
+            'iv_percentile': local['iv_percentile'],
+            'iv_source': 'local',
+        }
 
+    @staticmethod
+    def record_atm_iv(symbol: str, atm_option: Optional[Dict[str, Any]], current_date: datetime) -> bool:
+        """Store the ATM option's IV in the local IV history (no-op without IV)."""
+        if not atm_option:
+            return False
         try:
-            service = get_tastytrade_service()
-            if not service.is_available():
-                return {}
-
-            return service.get_enhanced_options_data(symbol)
+            return get_iv_history_store().record(
+                symbol, atm_option.get('implied_volatility'), current_date.date()
+            )
         except Exception as e:
-            logger.debug(f"TastyTrade data unavailable for {symbol}: {e}")
-            return {}
+            logger.debug(f"Could not record IV history for {symbol}: {e}")
+            return False
 
     @staticmethod
     def calculate_options_score_enhanced(
@@ -660,13 +689,17 @@ class OptionsAnalysis:
         if not summary.get('available'):
             return summary
 
-        # Enhance with TastyTrade data
-        enhanced_data = OptionsAnalysis.get_enhanced_iv_data(symbol)
+        # Capture today's ATM IV for the local IV rank history
+        OptionsAnalysis.record_atm_iv(symbol, summary['atm_option'], current_date)
+
+        # Enhance with TastyTrade data (local IV history as the IV rank fallback)
+        enhanced_data = OptionsAnalysis.get_enhanced_iv_data(symbol, current_date.date())
 
         if enhanced_data:
             summary['tastytrade'] = {
                 'iv_rank': enhanced_data.get('iv_rank'),
                 'iv_percentile': enhanced_data.get('iv_percentile'),
+                'iv_source': enhanced_data.get('iv_source'),
                 'iv_30_day': enhanced_data.get('iv_30_day'),
                 'hv_30_day': enhanced_data.get('hv_30_day'),
                 'beta': enhanced_data.get('beta'),
@@ -0,0 +1,192 @@
+"""
+Backtest artifacts — equity curves and trade logs as compact binary arrays.
+
+A completed backtest stores its full-resolution equity curve and its trade
+log in BacktestArtifact (a side table, so listing backtests never reads
+them). Both are struct-of-arrays .npz blobs:
+
+    equity:  t  int32   bar time, minutes since 1970-01-01 (wall clock of the label)
+             v  float32 portfolio value
+    trades:  entry_t / exit_t int32 (minutes), side int8 (+1 buy, -1 sell),
+             entry_price / exit_price / size / pnl / pnl_pct float64,
+             bars_held int32
+
+A 10,000-bar curve is ~80 KB instead of ~490 KB of JSON. Reads decode only
+what a request needs, and equity_points downsamples with LTTB
+(Largest-Triangle-Three-Buckets) to the resolution the client asks for, so
+peaks and troughs survive where striding would skip them.
+"""
+import io
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+# Default and maximum equity points returned per request
+DEFAULT_POINTS = 500
+MAX_POINTS = 5000
+
+_LABEL_FORMAT_LEN = len("YYYY-MM-DD HH:MM")
+
+
+class EquitySeries(NamedTuple):
+    """Full-resolution equity curve: bar times (minutes since epoch) and values."""
+    minutes: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_points(cls, points: Sequence[Dict[str, Any]]) -> "EquitySeries":
+        """From [{date: 'YYYY-MM-DD HH:MM', value}, ...] (the Backtrader strategies' curve)."""
+        return cls(
+            to_minutes([p["date"] for p in points]),
+            np.array([p["value"] for p in points], dtype=np.float64),
+        )
+
+
+EquityInput = Union[EquitySeries, Sequence[Dict[str, Any]], None]
+
+
+def as_series(equity: EquityInput) -> EquitySeries:
+    if isinstance(equity, EquitySeries):
+        return equity
+    return EquitySeries.from_points(equity or [])
+
+
+def to_minutes(labels: Sequence[str]) -> np.ndarray:
+    """'YYYY-MM-DD HH:MM' labels → int64 minutes since 1970-01-01."""
+    if not len(labels):
+        return np.empty(0, dtype=np.int64)
+    return np.array(labels, dtype="datetime64[m]").astype(np.int64)
+
+
+def to_labels(minutes: np.ndarray) -> List[str]:
+    """Inverse of to_minutes."""
+    text = np.datetime_as_string(np.asarray(minutes, dtype=np.int64).astype("datetime64[m]"))
+    return [s.replace("T", " ")[:_LABEL_FORMAT_LEN] for s in text.tolist()]
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Downsampling
+# ─────────────────────────────────────────────────────────────────────────
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps: the first and
+    last point, plus from each of threshold-2 buckets the point forming the
+    largest triangle with the previous pick and the next bucket's mean.
+    """
+    n = len(y)
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+
+    a = 0
+    for b in range(threshold - 2):
+        start, stop = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            nxt = slice(edges[b + 1], edges[b + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - cx) * (y[start:stop] - ay) - (ax - x[start:stop]) * (cy - ay))
+        a = start + int(area.argmax())
+        picked[b + 1] = a
+    return picked
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Encoding
+# ─────────────────────────────────────────────────────────────────────────
+
+def _pack(**arrays: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    np.savez(buf, **arrays)
+    return buf.getvalue()
+
+
+def _unpack(blob: bytes) -> Dict[str, np.ndarray]:
+    with np.load(io.BytesIO(blob), allow_pickle=False) as npz:
+        return {k: npz[k] for k in npz.files}
+
+
+def pack_equity(equity: EquityInput) -> bytes:
+    series = as_series(equity)
+    return _pack(
+        t=np.asarray(series.minutes, dtype=np.int32),
+        v=np.asarray(series.values, dtype=np.float32),
+    )
+
+
+def pack_trades(trade_log: Optional[Sequence[Dict[str, Any]]]) -> bytes:
+    trade_log = trade_log or []
+
+    def col(key, dtype):
+        return np.array([t.get(key) or 0 for t in trade_log], dtype=dtype)
+
+    return _pack(
+        entry_t=to_minutes([t["entry_date"] for t in trade_log]).astype(np.int32),
+        exit_t=to_minutes([t["exit_date"] for t in trade_log]).astype(np.int32),
+        side=np.array([1 if t.get("direction") == "buy" else -1 for t in trade_log], dtype=np.int8),
+        entry_price=col("entry_price", np.float64),
+        exit_price=col("exit_price", np.float64),
+        size=col("size", np.float64),
+        pnl=col("pnl", np.float64),
+        pnl_pct=col("pnl_pct", np.float64),
+        bars_held=col("bars_held", np.int32),
+    )
+
+
+def equity_points(blob: bytes, points: int = DEFAULT_POINTS) -> List[Dict[str, Any]]:
+    """[{date, value}, ...] downsampled to at most `points` (0 = full resolution)."""
+    cols = _unpack(blob)
+    minutes, values = cols["t"], cols["v"]
+    if points:
+        keep = lttb_indices(minutes, values, points)
+        minutes, values = minutes[keep], values[keep]
+    return [
+        {"date": d, "value": v}
+        for d, v in zip(to_labels(minutes), np.round(values.astype(np.float64), 2).tolist())
+    ]
+
+
+def downsample_points(curve: Sequence[Dict[str, Any]], points: int = DEFAULT_POINTS) -> List[Dict[str, Any]]:
+    """LTTB over a [{date, value}, ...] list (rows stored before artifacts existed)."""
+    curve = list(curve or [])
+    if not points or len(curve) <= points:
+        return curve
+    values = np.array([p["value"] for p in curve], dtype=np.float64)
+    return [curve[i] for i in lttb_indices(np.arange(len(curve)), values, points)]
+
+
+def trade_records(blob: bytes) -> List[Dict[str, Any]]:
+    """The stored trade log as [{entry_date, exit_date, direction, ...}, ...]."""
+    cols = _unpack(blob)
+    if not len(cols["side"]):
+        return []
+    entry_dates = to_labels(cols["entry_t"])
+    exit_dates = to_labels(cols["exit_t"])
+    sizes = cols["size"].tolist()
+    return [
+        {
+            "entry_date": entry_dates[k],
+            "exit_date": exit_dates[k],
+            "direction": "buy" if side > 0 else "sell",
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "size": int(sizes[k]) if float(sizes[k]).is_integer() else sizes[k],
+            "pnl": pnl,
+            "pnl_pct": pnl_pct,
+            "bars_held": bars_held,
+        }
+        for k, (side, entry_price, exit_price, pnl, pnl_pct, bars_held) in enumerate(zip(
+            cols["side"].tolist(), cols["entry_price"].tolist(), cols["exit_price"].tolist(),
+            cols["pnl"].tolist(), cols["pnl_pct"].tolist(), cols["bars_held"].tolist(),
+        ))
+    ]
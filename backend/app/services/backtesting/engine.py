@@ -1,28 +1,49 @@
 """
-Backtest Engine — orchestrates backtest execution using Backtrader.
+Backtest Engine — orchestrates backtest execution.
 
 Flow:
 1. Load config from BacktestResult DB record
 2. Fetch historical data via Alpaca
-3. Feed into Backtrader Cerebro
-4. Run backtest (blocking — called via asyncio.to_thread)
-5. Extract results and save back to DB
+3. Run the selected engine in the compute pool (bars go over shared
+   memory; the caller thread blocks — called via asyncio.to_thread):
+   - "vectorized" (default): SignalEngine rules over whole columns
+     (vectorized.py)
+   - "backtrader": bar-by-bar Cerebro run of strategies.py, kept for
+     validating the vectorized results
+4. Extract results and save back to DB (metrics on the row, equity curve
+   and trade log as a binary BacktestArtifact)
 """
-import backtrader as bt
+from datetime import datetime, date, timedelta, timezone
+from typing import TYPE_CHECKING
+
 import pandas as pd
 import numpy as np
-from datetime import datetime, date, timedelta, timezone
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from app.models.backtest_artifact import BacktestArtifact
 from app.models.backtest_result import BacktestResult
 from app.services.data_fetcher.alpaca_service import alpaca_service
 from app.services.signals.signal_engine import SignalEngine
-from app.services.backtesting.strategies import STRATEGY_MAP
+from app.services.backtesting.artifacts import pack_equity, pack_trades
+from app.services.backtesting.metrics import build_metrics
+from app.services.compute import compute_pool
+from app.services.compute.tasks import backtrader_run, vectorized_run
+
+if TYPE_CHECKING:
+    import backtrader as bt
+
+# Selectable via BacktestResult.parameters["engine"]; the first is the default
+BACKTEST_ENGINES = ("vectorized", "backtrader")
+
+# Strategies both engines implement (strategies.STRATEGY_MAP and
+# vectorized.EXIT_TARGET). Backtrader itself is only imported by a
+# "backtrader" run, so listing and validating strategies stays cheap.
+STRATEGY_NAMES = ("orb_breakout", "vwap_pullback", "range_breakout", "trend_following", "mean_reversion")
 
 
 class BacktestEngine:
-    """Orchestrates Backtrader-powered backtests."""
+    """Orchestrates backtests on the vectorized or Backtrader engine."""
 
     def run_backtest(self, backtest_id: int, db: Session):
         """
@@ -39,9 +60,12 @@ class BacktestEngine:
             bt_record.status = "running"
             db.commit()
 
-            # Validate strategy
-            if bt_record.strategy not in STRATEGY_MAP:
+            # Validate strategy and engine
+            if bt_record.strategy not in STRATEGY_NAMES:
                 raise ValueError(f"Unknown strategy: {bt_record.strategy}")
+            engine = (bt_record.parameters or {}).get("engine", BACKTEST_ENGINES[0])
+            if engine not in BACKTEST_ENGINES:
+                raise ValueError(f"Unknown backtest engine: {engine}")
 
             # Fetch historical data
             df = self._fetch_data(
@@ -58,32 +82,24 @@ class BacktestEngine:
 
             logger.info(
                 f"Backtest {backtest_id}: {bt_record.symbol} {bt_record.strategy} "
-                f"{bt_record.timeframe} — {len(df)} bars loaded"
+                f"{bt_record.timeframe} ({engine}) — {len(df)} bars loaded"
             )
 
-            # Build feed
-            feed = self._build_feed(df)
-
             # Get strategy params from SignalEngine (stay in sync)
             strategy_params = self._get_strategy_params(
                 bt_record.strategy, bt_record.cap_size, bt_record.timeframe
             )
             strategy_params["position_size_pct"] = bt_record.position_size_pct
 
-            # Configure and run cerebro
-            cerebro = self._configure_cerebro(
-                strategy_name=bt_record.strategy,
-                params=strategy_params,
-                capital=bt_record.initial_capital,
-                feed=feed,
+            # Run the selected engine and extract results in a worker process
+            if engine == "backtrader":
+                task, bars = backtrader_run, self._feed_frame(df)
+            else:
+                task, bars = vectorized_run, df  # rules read the indicator columns
+            metrics = compute_pool.run(
+                task, bars, bt_record.strategy, strategy_params, bt_record.initial_capital,
             )
 
-            results = cerebro.run()
-            strat = results[0]
-
-            # Extract results
-            metrics = self._extract_results(cerebro, strat, bt_record.initial_capital)
-
             # Save results
             bt_record.status = "completed"
             bt_record.final_value = metrics["final_value"]
@@ -100,9 +116,13 @@ class BacktestEngine:
             bt_record.best_trade_pct = metrics["best_trade_pct"]
             bt_record.worst_trade_pct = metrics["worst_trade_pct"]
             bt_record.avg_trade_duration = metrics["avg_trade_duration"]
-            bt_record.equity_curve = metrics["equity_curve"]
-            bt_record.trade_log = metrics["trade_log"]
-            bt_record.parameters = strategy_params
+            bt_record.artifact = BacktestArtifact(
+                equity=pack_equity(metrics["equity_curve"]),
+                trades=pack_trades(metrics["trade_log"]),
+                equity_points=len(metrics["equity_curve"].values),
+                trade_count=len(metrics["trade_log"]),
+            )
+            bt_record.parameters = {**strategy_params, "engine": engine}
             bt_record.completed_at = datetime.now(timezone.utc)
             db.commit()
 
@@ -158,8 +178,16 @@ class BacktestEngine:
     # Feed Construction
     # ─────────────────────────────────────────────────────────────────────
 
-    def _build_feed(self, df: pd.DataFrame) -> bt.feeds.PandasData:
+    @staticmethod
+    def _feed_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Only the columns _build_feed reads (timestamps + OHLCV), for the worker."""
+        cols = [c for c in ("datetime", "open", "high", "low", "close", "volume") if c in df.columns]
+        return df[cols]
+
+    def _build_feed(self, df: pd.DataFrame) -> "bt.feeds.PandasData":
         """Convert DataFrame to Backtrader PandasData feed."""
+        import backtrader as bt
+
         # alpaca_service.get_bars() returns a 'datetime' column, not as index
         # Set it as the index for Backtrader
         if "datetime" in df.columns:
@@ -227,8 +255,11 @@ class BacktestEngine:
 
     def _configure_cerebro(
         self, strategy_name: str, params: dict, capital: float, feed
-    ) -> bt.Cerebro:
+    ) -> "bt.Cerebro":
         """Set up Cerebro engine with strategy, analyzers, and broker."""
+        import backtrader as bt
+        from app.services.backtesting.strategies import STRATEGY_MAP
+
         cerebro = bt.Cerebro()
         cerebro.adddata(feed)
 
@@ -257,88 +288,23 @@ class BacktestEngine:
 
     def _extract_results(self, cerebro, strategy, initial_capital: float) -> dict:
         """Extract performance metrics from completed backtest."""
-
-        final_value = cerebro.broker.getvalue()
-        total_return_pct = ((final_value - initial_capital) / initial_capital) * 100
-
-        # ── Sharpe Ratio ──────────────────────────────────────────────
         sharpe = strategy.analyzers.sharpe.get_analysis()
-        sharpe_ratio = sharpe.get("sharperatio")
-        if sharpe_ratio is None or (isinstance(sharpe_ratio, float) and np.isnan(sharpe_ratio)):
-            sharpe_ratio = 0.0
-        else:
-            sharpe_ratio = round(float(sharpe_ratio), 3)
-
-        # ── Drawdown ──────────────────────────────────────────────────
         dd = strategy.analyzers.drawdown.get_analysis()
-        max_drawdown_pct = round(dd.get("max", {}).get("drawdown", 0.0), 2)
-
-        # ── Trade Analyzer ────────────────────────────────────────────
         ta = strategy.analyzers.trades.get_analysis()
-        total_trades = ta.get("total", {}).get("total", 0)
-        won_trades = ta.get("won", {}).get("total", 0)
-        lost_trades = ta.get("lost", {}).get("total", 0)
-
-        win_rate = (won_trades / total_trades * 100) if total_trades > 0 else 0.0
 
-        # Profit factor
-        gross_profit = ta.get("won", {}).get("pnl", {}).get("total", 0.0)
-        gross_loss = abs(ta.get("lost", {}).get("pnl", {}).get("total", 0.0))
-        profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else (
-            float("inf") if gross_profit > 0 else 0.0
+        return build_metrics(
+            final_value=cerebro.broker.getvalue(),
+            initial_capital=initial_capital,
+            sharpe_ratio=sharpe.get("sharperatio"),
+            max_drawdown_pct=dd.get("max", {}).get("drawdown", 0.0),
+            total_trades=ta.get("total", {}).get("total", 0),
+            won_trades=ta.get("won", {}).get("total", 0),
+            lost_trades=ta.get("lost", {}).get("total", 0),
+            gross_profit=ta.get("won", {}).get("pnl", {}).get("total", 0.0),
+            gross_loss=abs(ta.get("lost", {}).get("pnl", {}).get("total", 0.0)),
+            trade_log=strategy.trade_log or [],
+            equity_curve=strategy.equity_curve or [],
         )
-        if profit_factor == float("inf"):
-            profit_factor = 99.99  # Cap for display
-
-        # Average win/loss %
-        avg_win_pct = 0.0
-        avg_loss_pct = 0.0
-        if won_trades > 0 and initial_capital > 0:
-            avg_win_pct = (gross_profit / won_trades / initial_capital) * 100
-        if lost_trades > 0 and initial_capital > 0:
-            avg_loss_pct = (gross_loss / lost_trades / initial_capital) * 100
-
-        # Best/worst trade %
-        best_trade_pct = 0.0
-        worst_trade_pct = 0.0
-        trade_log = strategy.trade_log or []
-        if trade_log:
-            pnl_pcts = [t.get("pnl_pct", 0) for t in trade_log]
-            best_trade_pct = max(pnl_pcts) if pnl_pcts else 0.0
-            worst_trade_pct = min(pnl_pcts) if pnl_pcts else 0.0
-
-        # Average trade duration
-        avg_bars = 0
-        if trade_log:
-            bars_list = [t.get("bars_held", 0) for t in trade_log]
-            avg_bars = sum(bars_list) / len(bars_list) if bars_list else 0
-        avg_trade_duration = f"{int(avg_bars)} bars" if avg_bars > 0 else "N/A"
-
-        # ── Equity Curve ──────────────────────────────────────────────
-        equity_curve = strategy.equity_curve or []
-        # Downsample if too many points (keep max 500 for frontend)
-        if len(equity_curve) > 500:
-            step = len(equity_curve) // 500
-            equity_curve = equity_curve[::step]
-
-        return {
-            "final_value": round(final_value, 2),
-            "total_return_pct": round(total_return_pct, 2),
-            "sharpe_ratio": sharpe_ratio,
-            "max_drawdown_pct": max_drawdown_pct,
-            "win_rate": round(win_rate, 1),
-            "profit_factor": round(profit_factor, 2),
-            "total_trades": total_trades,
-            "winning_trades": won_trades,
-            "losing_trades": lost_trades,
-            "avg_win_pct": round(avg_win_pct, 2),
-            "avg_loss_pct": round(avg_loss_pct, 2),
-            "best_trade_pct": round(best_trade_pct, 2),
-            "worst_trade_pct": round(worst_trade_pct, 2),
-            "avg_trade_duration": avg_trade_duration,
-            "equity_curve": equity_curve,
-            "trade_log": trade_log,
-        }
 
 
 # Singleton instance
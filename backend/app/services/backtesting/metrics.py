@@ -0,0 +1,123 @@
+"""
+Backtest metrics shared by both engines.
+
+BacktestEngine._extract_results feeds Backtrader's analyzer output into
+build_metrics(); the vectorized engine computes the same inputs from its
+equity array (annual_sharpe / max_drawdown_pct mirror the SharpeRatio and
+DrawDown analyzers), so both engines return identical dict shapes.
+
+The equity curve is returned at full resolution as an EquitySeries; it is
+stored as a binary artifact and downsampled per request (artifacts.py).
+"""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.backtesting.artifacts import EquityInput, as_series
+
+# Scalar metrics kept per run when full results aren't stored (sweeps)
+SUMMARY_METRICS = (
+    "total_return_pct", "sharpe_ratio", "max_drawdown_pct",
+    "win_rate", "profit_factor", "total_trades",
+)
+
+
+def annual_sharpe(years: np.ndarray, values: np.ndarray, initial_capital: float,
+                  riskfree: float = 0.05) -> Optional[float]:
+    """
+    Backtrader SharpeRatio defaults: yearly returns (the first year measured
+    from the initial capital), risk-free rate subtracted, population std.
+    None when the std is zero — always the case for a single-year run.
+    """
+    if len(values) == 0:
+        return None
+    last_of_year = np.flatnonzero(np.append(years[1:] != years[:-1], True))
+    closes = np.concatenate(([initial_capital], values[last_of_year]))
+    excess = closes[1:] / closes[:-1] - 1.0 - riskfree
+    std = excess.std()
+    if std == 0 or np.isnan(std):
+        return None
+    return float(excess.mean() / std)
+
+
+def max_drawdown_pct(values: np.ndarray) -> float:
+    """Largest peak-to-trough decline of the equity series, in percent."""
+    if len(values) == 0:
+        return 0.0
+    peaks = np.maximum.accumulate(values)
+    return float(((peaks - values) / peaks).max() * 100)
+
+
+def build_metrics(
+    final_value: float,
+    initial_capital: float,
+    sharpe_ratio: Optional[float],
+    max_drawdown_pct: float,
+    total_trades: int,
+    won_trades: int,
+    lost_trades: int,
+    gross_profit: float,
+    gross_loss: float,
+    trade_log: List[Dict[str, Any]],
+    equity_curve: EquityInput,
+) -> Dict[str, Any]:
+    """Performance metrics dict stored on BacktestResult."""
+    total_return_pct = ((final_value - initial_capital) / initial_capital) * 100
+
+    # ── Sharpe Ratio ──────────────────────────────────────────────
+    if sharpe_ratio is None or (isinstance(sharpe_ratio, float) and np.isnan(sharpe_ratio)):
+        sharpe_ratio = 0.0
+    else:
+        sharpe_ratio = round(float(sharpe_ratio), 3)
+
+    win_rate = (won_trades / total_trades * 100) if total_trades > 0 else 0.0
+
+    # Profit factor
+    profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else (
+        float("inf") if gross_profit > 0 else 0.0
+    )
+    if profit_factor == float("inf"):
+        profit_factor = 99.99  # Cap for display
+
+    # Average win/loss %
+    avg_win_pct = 0.0
+    avg_loss_pct = 0.0
+    if won_trades > 0 and initial_capital > 0:
+        avg_win_pct = (gross_profit / won_trades / initial_capital) * 100
+    if lost_trades > 0 and initial_capital > 0:
+        avg_loss_pct = (gross_loss / lost_trades / initial_capital) * 100
+
+    # Best/worst trade %
+    best_trade_pct = 0.0
+    worst_trade_pct = 0.0
+    trade_log = trade_log or []
+    if trade_log:
+        pnl_pcts = [t.get("pnl_pct", 0) for t in trade_log]
+        best_trade_pct = max(pnl_pcts) if pnl_pcts else 0.0
+        worst_trade_pct = min(pnl_pcts) if pnl_pcts else 0.0
+
+    # Average trade duration
+    avg_bars = 0
+    if trade_log:
+        bars_list = [t.get("bars_held", 0) for t in trade_log]
+        avg_bars = sum(bars_list) / len(bars_list) if bars_list else 0
+    avg_trade_duration = f"{int(avg_bars)} bars" if avg_bars > 0 else "N/A"
+
+    return {
+        "final_value": round(final_value, 2),
+        "total_return_pct": round(total_return_pct, 2),
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown_pct": round(max_drawdown_pct, 2),
+        "win_rate": round(win_rate, 1),
+        "profit_factor": round(profit_factor, 2),
+        "total_trades": total_trades,
+        "winning_trades": won_trades,
+        "losing_trades": lost_trades,
+        "avg_win_pct": round(avg_win_pct, 2),
+        "avg_loss_pct": round(avg_loss_pct, 2),
+        "best_trade_pct": round(best_trade_pct, 2),
+        "worst_trade_pct": round(worst_trade_pct, 2),
+        "avg_trade_duration": avg_trade_duration,
+        "equity_curve": as_series(equity_curve),
+        "trade_log": trade_log,
+    }
@@ -0,0 +1,293 @@
+"""
+Parameter sweeps and walk-forward optimization on the vectorized engine.
+
+A sweep backtests every combination of a parameter grid (e.g. stop_atr_mult
+× min_rvol) on every requested symbol:
+
+1. Each symbol's bars are fetched (with indicators) once
+2. Runs (symbol × combination) go to the compute pool via imap_shared —
+   each symbol's frame is put in shared memory once and read by every
+   worker — and come back as compact metric rows as they finish
+3. Rows are published to SweepProgress for the SSE stream
+4. On completion, combinations are ranked (mean of rank_by across symbols)
+   and everything is stored on one BacktestSweep row
+
+Walk-forward: the bar range is split into rolling in-sample/out-of-sample
+folds. Each run reports metrics for every window; per symbol and fold the
+combination with the best in-sample metric is "selected" and judged on the
+following out-of-sample window. Ranking then uses out-of-sample metrics.
+"""
+import itertools
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.models.backtest_sweep import BacktestSweep
+from app.services.backtesting.engine import BacktestEngine
+from app.services.backtesting.metrics import SUMMARY_METRICS
+from app.services.compute import compute_pool
+from app.services.compute.tasks import sweep_run
+from app.services.signals.signal_engine import SignalEngine
+
+# Hard limits (validated on request)
+MAX_COMBINATIONS = 500
+MAX_RUNS = 5000            # symbols × combinations
+MAX_SYMBOLS = 25
+MAX_RANKED = 50            # combinations kept in `ranking`
+
+# Metrics kept per run window (the compact row), in column order
+ROW_METRICS = SUMMARY_METRICS
+RANK_METRICS = ("total_return_pct", "sharpe_ratio", "profit_factor", "win_rate")
+RESULT_COLUMNS = ("symbol", "combo", "fold", "sample", *ROW_METRICS)
+
+# Params a grid may vary: anything SignalEngine.PARAMS defines, plus the
+# confidence floor and sizing
+SWEEPABLE_PARAMS = frozenset(
+    key
+    for by_tf in SignalEngine.PARAMS.values()
+    for params in by_tf.values()
+    for key in params
+) | {"min_confidence", "position_size_pct"}
+
+# Sweepable params that are bar counts or whole-number thresholds (window
+# lengths go straight into rolling(), which rejects floats)
+INTEGER_PARAMS = frozenset(
+    key
+    for by_tf in SignalEngine.PARAMS.values()
+    for params in by_tf.values()
+    for key, default in params.items()
+    if isinstance(default, int)
+)
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of the grid values (keys in sorted order)."""
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def walk_forward_windows(
+    n_bars: int, folds: int, train_ratio: float,
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Rolling (in-sample, out-of-sample) bar windows covering n_bars: each
+    fold trains on `train` bars and tests on the next `test` bars, then
+    rolls forward by `test` (train = test × ratio / (1 - ratio)).
+    """
+    test = int(n_bars * (1 - train_ratio) / (train_ratio + folds * (1 - train_ratio)))
+    train = int(test * train_ratio / (1 - train_ratio))
+    if test < 1 or train < 1:
+        return []
+    return [
+        ((k * test, k * test + train), (k * test + train, k * test + train + test))
+        for k in range(folds)
+    ]
+
+
+@dataclass
+class SweepProgress:
+    """Live state of a running sweep, read by the SSE stream."""
+    total: int = 0
+    processed: int = 0
+    rows: List[Dict[str, Any]] = field(default_factory=list)   # append-only, one per finished run
+    done: bool = False
+
+
+_progress: Dict[int, SweepProgress] = {}
+_progress_lock = threading.Lock()
+
+
+def get_progress(sweep_id: int) -> Optional[SweepProgress]:
+    with _progress_lock:
+        return _progress.get(sweep_id)
+
+
+def _metric_mean(rows: List[List[float]], metric: str) -> float:
+    column = ROW_METRICS.index(metric)
+    return float(np.mean([r[column] for r in rows])) if rows else 0.0
+
+
+class SweepEngine:
+    """Runs BacktestSweep records on the compute pool."""
+
+    def run_sweep(self, sweep_id: int, db: Session):
+        """
+        Main entry point — runs a sweep synchronously.
+        Designed to be called from a background thread.
+        """
+        record = db.query(BacktestSweep).filter(BacktestSweep.id == sweep_id).first()
+        if not record:
+            logger.error(f"Sweep {sweep_id} not found")
+            return
+
+        progress = SweepProgress()
+        with _progress_lock:
+            _progress[sweep_id] = progress
+
+        try:
+            record.status = "running"
+            db.commit()
+
+            backtest = BacktestEngine()
+            base = backtest._get_strategy_params(record.strategy, record.cap_size, record.timeframe)
+            base["position_size_pct"] = record.position_size_pct
+            combos = expand_grid(record.grid)
+            wf = record.walk_forward
+
+            # Fetch each symbol's bars once
+            frames, windows, skipped = {}, {}, []
+            for symbol in record.symbols:
+                df = backtest._fetch_data(symbol, record.timeframe, record.start_date, record.end_date)
+                if df is None or len(df) < 50:
+                    skipped.append({"symbol": symbol, "reason": f"{0 if df is None else len(df)} bars (need 50+)"})
+                    continue
+                if wf:
+                    folds = walk_forward_windows(len(df), wf["folds"], wf["train_ratio"])
+                    if not folds:
+                        skipped.append({"symbol": symbol, "reason": "too few bars for walk-forward folds"})
+                        continue
+                    windows[symbol] = [w for fold in folds for w in fold]
+                else:
+                    windows[symbol] = [(0, len(df))]
+                frames[symbol] = df
+            if not frames:
+                raise ValueError("No symbol had enough data: " + ", ".join(s["symbol"] for s in skipped))
+
+            runs = [(symbol, c) for symbol in frames for c in range(len(combos))]
+            calls = [
+                (symbol, (record.strategy, {**base, **combos[c]}, record.initial_capital, windows[symbol]))
+                for symbol, c in runs
+            ]
+            record.total_runs = progress.total = len(calls)
+            record.skipped_symbols = skipped
+            db.commit()
+            logger.info(
+                f"Sweep {sweep_id}: {record.strategy} {record.timeframe} — "
+                f"{len(frames)} symbols × {len(combos)} combinations"
+            )
+
+            # Run across the pool; rows arrive in completion order
+            window_rows: Dict[Tuple[str, int], List[List[float]]] = {}
+            for index, rows in compute_pool.imap_shared(sweep_run, frames, calls):
+                symbol, c = runs[index]
+                window_rows[(symbol, c)] = rows
+                scored = rows[1::2] if wf else rows  # out-of-sample windows rank a walk-forward run
+                with _progress_lock:
+                    progress.processed += 1
+                    progress.rows.append({
+                        "id": f"{symbol}#{c}",
+                        "symbol": symbol,
+                        "combo": c,
+                        "params": combos[c],
+                        "score": _metric_mean(scored, record.rank_by),
+                        **{m: _metric_mean(scored, m) for m in ROW_METRICS},
+                    })
+
+            record.combinations = combos
+            record.results = self._result_table(window_rows, bool(wf))
+            record.ranking = self._rank(window_rows, combos, record.rank_by, bool(wf))
+            record.walk_forward_summary = (
+                self._walk_forward_summary(window_rows, combos, windows, record.rank_by) if wf else None
+            )
+            record.completed_runs = len(window_rows)
+            record.status = "completed"
+            record.completed_at = datetime.now(timezone.utc)
+            db.commit()
+
+            best = record.ranking[0] if record.ranking else None
+            logger.info(
+                f"Sweep {sweep_id} completed: {len(window_rows)} runs, "
+                f"best {record.rank_by}={best['score'] if best else 'n/a'}"
+            )
+
+        except Exception as e:
+            logger.error(f"Sweep {sweep_id} failed: {e}")
+            record.status = "failed"
+            record.error_message = str(e)
+            record.completed_runs = progress.processed
+            record.completed_at = datetime.now(timezone.utc)
+            db.commit()
+
+        finally:
+            with _progress_lock:
+                progress.done = True
+                _progress.pop(sweep_id, None)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Aggregation
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _result_table(window_rows: Dict[Tuple[str, int], List[List[float]]], walk_forward: bool) -> Dict:
+        """Columnar per-window table: fold is null and sample "full" without walk-forward."""
+        table = []
+        for (symbol, c), rows in sorted(window_rows.items()):
+            for w, metrics in enumerate(rows):
+                if walk_forward:
+                    fold, sample = w // 2, ("in" if w % 2 == 0 else "out")
+                else:
+                    fold, sample = None, "full"
+                table.append([symbol, c, fold, sample, *metrics])
+        return {"columns": list(RESULT_COLUMNS), "rows": table}
+
+    @staticmethod
+    def _rank(
+        window_rows: Dict[Tuple[str, int], List[List[float]]], combos: List[Dict],
+        rank_by: str, walk_forward: bool,
+    ) -> List[Dict[str, Any]]:
+        """Combinations by mean rank_by across symbols (out-of-sample windows for walk-forward)."""
+        by_combo: Dict[int, List[List[float]]] = {}
+        for (_, c), rows in window_rows.items():
+            by_combo.setdefault(c, []).extend(rows[1::2] if walk_forward else rows)
+
+        ranked = []
+        for c, rows in by_combo.items():
+            entry = {"combo": c, "params": combos[c], "runs": len(rows)}
+            entry.update({m: round(_metric_mean(rows, m), 3) for m in ROW_METRICS})
+            entry["total_trades"] = int(sum(r[ROW_METRICS.index("total_trades")] for r in rows))
+            entry["score"] = entry[rank_by]
+            ranked.append(entry)
+        ranked.sort(key=lambda e: (e["score"], -e["combo"]), reverse=True)
+        return ranked[:MAX_RANKED]
+
+    @staticmethod
+    def _walk_forward_summary(
+        window_rows: Dict[Tuple[str, int], List[List[float]]], combos: List[Dict],
+        windows: Dict[str, List[Tuple[int, int]]], rank_by: str,
+    ) -> Dict[str, Any]:
+        """Per symbol and fold: the in-sample winner and how it did out of sample."""
+        column = ROW_METRICS.index(rank_by)
+        summary = {}
+        for symbol, symbol_windows in windows.items():
+            folds = []
+            for k in range(len(symbol_windows) // 2):
+                runs = [(c, rows) for (s, c), rows in window_rows.items() if s == symbol]
+                c, rows = max(runs, key=lambda run: (run[1][2 * k][column], -run[0]))
+                folds.append({
+                    "fold": k,
+                    "in_sample_bars": list(symbol_windows[2 * k]),
+                    "out_of_sample_bars": list(symbol_windows[2 * k + 1]),
+                    "combo": c,
+                    "params": combos[c],
+                    "in_sample": dict(zip(ROW_METRICS, rows[2 * k])),
+                    "out_of_sample": dict(zip(ROW_METRICS, rows[2 * k + 1])),
+                })
+            in_score = np.mean([f["in_sample"][rank_by] for f in folds])
+            out_score = np.mean([f["out_of_sample"][rank_by] for f in folds])
+            summary[symbol] = {
+                "folds": folds,
+                "in_sample_mean": round(float(in_score), 3),
+                "out_of_sample_mean": round(float(out_score), 3),
+                # Out-of-sample / in-sample: near 1 = the selection generalizes
+                "efficiency": round(float(out_score / in_score), 3) if in_score else None,
+            }
+        return summary
+
+
+# Singleton instance
+sweep_engine = SweepEngine()
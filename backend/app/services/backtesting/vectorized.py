@@ -0,0 +1,343 @@
+"""
+Vectorized backtest engine — evaluates the live SignalEngine rules over
+whole columns instead of stepping Backtrader bar by bar.
+
+Entry conditions, stops, targets, gate scores and confidence come from
+app.services.signals.strategy_rules, the same functions SignalEngine._check_*
+calls on the latest bar, so a backtest trades exactly what the live engine
+would have signalled. Inputs the live engine fetches from Alpaca at signal
+time are rebuilt from the bars themselves: the opening range from each
+session's first skip_bars bars and VWAP as the running session VWAP.
+IV and earnings adjustments have no history and are left out of confidence.
+
+Fills follow Backtrader's defaults so results stay comparable with the
+"backtrader" engine: one position at a time, market orders fill at the next
+bar's open, and stops/targets are checked on closes. Python only loops over
+trades, never over bars.
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.backtesting.artifacts import EquitySeries
+from app.services.backtesting.metrics import annual_sharpe, build_metrics, max_drawdown_pct
+from app.services.signals import strategy_rules
+from app.services.signals.signal_engine import SignalEngine
+
+ET = "America/New_York"
+
+# Which of the live (target_1, target_2) pair closes the position — matches
+# the Backtrader strategies (2R for breakouts, 1.5R for VWAP/trend, SMA20 for MR)
+EXIT_TARGET = {
+    "orb_breakout": 1,
+    "vwap_pullback": 1,
+    "range_breakout": 1,
+    "trend_following": 0,
+    "mean_reversion": 0,
+}
+
+# Bars a live check needs before it can fire (len(df) thresholds in _check_*)
+MIN_BARS = 30  # _score_quality_gates
+
+# Bars scanned per step when looking for a trade's exit (grows geometrically)
+_EXIT_SCAN_CHUNK = 64
+
+
+def _column(df: pd.DataFrame, name: str, default: float = np.nan) -> np.ndarray:
+    if name in df.columns:
+        return df[name].to_numpy(dtype=float)
+    return np.full(len(df), default)
+
+
+def _timestamps(df: pd.DataFrame) -> pd.DatetimeIndex:
+    """Bar times in US/Eastern (naive timestamps are taken as already local)."""
+    stamps = pd.DatetimeIndex(df["datetime"] if "datetime" in df.columns else df.index)
+    return stamps.tz_convert(ET) if stamps.tz is not None else stamps
+
+
+def _session_days(stamps: pd.DatetimeIndex) -> np.ndarray:
+    """Calendar day of each bar in local time (day-resolution datetime64)."""
+    local = stamps.tz_localize(None) if stamps.tz is not None else stamps
+    return local.to_numpy().astype("datetime64[D]")
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    """Previous bar's value (NaN for the first bar)."""
+    return np.concatenate(([np.nan], values[:-1]))
+
+
+def strategy_setup(df: pd.DataFrame, strategy_name: str, params: Dict) -> strategy_rules.Setup:
+    """
+    strategy_rules Setup evaluated for every bar of an indicator frame
+    (alpaca_service.calculate_indicators output). Bars where the live check
+    would not have enough history are never flagged.
+    """
+    n = len(df)
+    close = _column(df, "close")
+    prev_close = _shift(close)
+    prev_low = _shift(_column(df, "low"))
+    prev_high = _shift(_column(df, "high"))
+    ema8 = _column(df, "ema8")
+    ema21 = _column(df, "ema21")
+    rsi = _column(df, "rsi")
+    atr = _column(df, "atr")
+    rvol = _column(df, "rvol", 1.0)
+    spike = df["volume_spike"].to_numpy(dtype=bool) if "volume_spike" in df.columns else False
+    bar = np.arange(n)
+    ready = bar >= 1
+
+    if strategy_name == "orb_breakout":
+        skip_bars = params.get("skip_bars", 3)
+        day = pd.Series(_session_days(_timestamps(df)), index=df.index)
+        in_day = day.groupby(day).cumcount().to_numpy()
+        opening = in_day < skip_bars
+        orb_high = df["high"].where(opening).groupby(day).transform("max").to_numpy(dtype=float)
+        orb_low = df["low"].where(opening).groupby(day).transform("min").to_numpy(dtype=float)
+        setup = strategy_rules.orb_breakout(
+            close, prev_close, orb_high, orb_low, ema8, ema21, rsi, spike, rvol, atr, params,
+        )
+        ready &= (~opening) & (bar >= skip_bars)
+
+    elif strategy_name == "vwap_pullback":
+        day = _session_days(_timestamps(df))
+        volume = _column(df, "volume", 0.0)
+        if "vwap" in df.columns:
+            price = _column(df, "vwap")
+        else:
+            price = (_column(df, "high") + _column(df, "low") + close) / 3.0
+        cum = pd.DataFrame({"pv": price * volume, "v": volume}).groupby(day).cumsum()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = (cum["pv"] / cum["v"]).to_numpy()
+        vwap = np.where(vwap > 0, vwap, np.nan)  # live check skips a missing VWAP
+        setup = strategy_rules.vwap_pullback(
+            close, prev_close, prev_low, prev_high, ema8, ema21, rsi, atr,
+            volume, _column(df, "volume_ma20", np.nan), vwap, params,
+        )
+
+    elif strategy_name == "range_breakout":
+        lookback = params.get("range_lookback", 30)
+        window = max(lookback - 1, 1)
+        range_high = df["high"].rolling(window).max().shift(1).to_numpy(dtype=float)
+        range_low = df["low"].rolling(window).min().shift(1).to_numpy(dtype=float)
+        setup = strategy_rules.range_breakout(
+            close, prev_close, range_high, range_low, ema8, ema21, rsi, spike, rvol, atr, params,
+        )
+        ready &= bar >= lookback - 1
+
+    elif strategy_name == "trend_following":
+        sma200 = _column(df, "sma200") if "sma200" in df.columns else None
+        setup = strategy_rules.trend_following(
+            close, prev_close, prev_low, prev_high,
+            _column(df, "sma20"), _column(df, "sma50"), sma200,
+            _column(df, "adx", 0.0), rsi, atr, params,
+        )
+        ready &= bar >= 54
+
+    elif strategy_name == "mean_reversion":
+        bb_period = params.get("bb_period", 20)
+        bb_std = params.get("bb_std", 2.0)
+        rolling = df["close"].rolling(bb_period)
+        bb_mid = rolling.mean().to_numpy(dtype=float)
+        bb_dev = rolling.std(ddof=0).to_numpy(dtype=float)
+        sma20 = _column(df, "sma20")
+        sma20 = np.where(np.isnan(sma20), bb_mid, sma20)
+        volume = _column(df, "volume", 0.0)
+        setup = strategy_rules.mean_reversion(
+            close, prev_close, prev_low, prev_high, rsi, atr,
+            strategy_rules.volume_spike(volume, _column(df, "volume_ma20", np.nan),
+                                        params.get("volume_spike_mult", 1.2)),
+            bb_mid + bb_std * bb_dev, bb_mid - bb_std * bb_dev, sma20, params,
+        )
+        ready &= bar >= bb_period + 4
+
+    else:
+        raise ValueError(f"Unknown strategy: {strategy_name}")
+
+    return setup._replace(long=setup.long & ready, short=setup.short & ready)
+
+
+def entry_signals(
+    df: pd.DataFrame, strategy_name: str, params: Dict,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-bar (direction, stop, target) for bars where the live pipeline would
+    emit a signal: strategy setup, structural gates and MIN_CONFIDENCE.
+    direction is +1 long / -1 short / 0 none; long wins when both fire,
+    as in _check_*.
+    """
+    setup = strategy_setup(df, strategy_name, params)
+    n = len(df)
+    close = _column(df, "close")
+    volume = _column(df, "volume", 0.0)
+    atr_percent = _column(df, "atr_percent")
+
+    # Structural gates (staleness and TOD liquidity don't apply to history)
+    with np.errstate(invalid="ignore"):
+        structural = (
+            ~np.isnan(close) & (volume > 0) & (atr_percent > 0) & (np.arange(n) >= MIN_BARS - 1)
+        )
+
+    rvol = _column(df, "rvol", 1.0)
+    if "rvol_tod" in df.columns:
+        rvol_tod = _column(df, "rvol_tod")
+        rvol = np.where(np.isnan(rvol_tod), rvol, rvol_tod)
+    gate_atr = strategy_rules.atr_gate_score(atr_percent, params)
+    gate_rvol = strategy_rules.rvol_gate_score(rvol, params)
+    spike = df["volume_spike"].to_numpy(dtype=bool) if "volume_spike" in df.columns else False
+
+    def confidence(direction: str) -> np.ndarray:
+        base = strategy_rules.base_confidence(
+            direction, close, _column(df, "ema8", 0.0), _column(df, "ema21", 0.0),
+            _column(df, "rsi", 50.0), spike, rvol, atr_percent, params,
+        )
+        return strategy_rules.gated_confidence(base, gate_atr, gate_rvol)
+
+    min_confidence = params.get("min_confidence", SignalEngine.MIN_CONFIDENCE)
+    long = np.asarray(setup.long, dtype=bool) & structural
+    short = np.asarray(setup.short, dtype=bool) & structural & ~long
+    long &= confidence("long") >= min_confidence
+    short &= confidence("short") >= min_confidence
+
+    which = EXIT_TARGET[strategy_name]
+    direction = np.where(long, 1, np.where(short, -1, 0)).astype(np.int8)
+    stop = np.where(long, setup.long_stop, setup.short_stop)
+    target = np.where(long, setup.long_targets[which], setup.short_targets[which])
+    return direction, np.broadcast_to(stop, n), np.broadcast_to(target, n)
+
+
+def _first_exit(close: np.ndarray, start: int, end: int, side: int, stop: float, target: float) -> int:
+    """First bar in [start, end) whose close hits the stop or target; `end` if none."""
+    chunk = _EXIT_SCAN_CHUNK
+    while start < end:
+        stop_at = min(start + chunk, end)
+        window = close[start:stop_at]
+        if side > 0:
+            hit = (window <= stop) | (window >= target)
+        else:
+            hit = (window >= stop) | (window <= target)
+        found = np.flatnonzero(hit)
+        if len(found):
+            return start + int(found[0])
+        start, chunk = stop_at, chunk * 2
+    return end
+
+
+def simulate(
+    df: pd.DataFrame, direction: np.ndarray, stop: np.ndarray, target: np.ndarray,
+    capital: float, position_size_pct: float,
+) -> Dict[str, Any]:
+    """Fill signals one position at a time; returns the metrics dict."""
+    n = len(df)
+    open_ = _column(df, "open")
+    close = _column(df, "close")
+    stamps = _timestamps(df)
+
+    candidates = np.flatnonzero(direction[: max(n - 1, 0)])  # the last bar has no next open
+    realized = np.zeros(n)    # cash change booked at each exit fill
+    marked = np.zeros(n)      # open-position P&L at each close
+    trades: List[Tuple[int, int, int, float, float, int, float]] = []
+    cash = capital
+    open_trades = 0
+    won = lost = 0
+    gross_profit = gross_loss = 0.0
+
+    t = 0
+    while True:
+        k = np.searchsorted(candidates, t)
+        if k >= len(candidates):
+            break
+        i = int(candidates[k])
+        side = int(direction[i])
+        size = max(int(cash * position_size_pct / 100.0 / close[i]), 1) if close[i] > 0 else 0
+        fill = i + 1
+        entry_price = open_[fill]
+        if size == 0 or size * entry_price > cash:  # rejected for margin
+            t = i + 1
+            continue
+
+        exit_bar = _first_exit(close, fill, n - 1, side, float(stop[i]), float(target[i]))
+        if exit_bar >= n - 1:
+            # Never closed: marked to market through the last bar
+            marked[fill:] = side * size * (close[fill:] - entry_price)
+            open_trades = 1
+            break
+
+        exit_fill = exit_bar + 1
+        exit_price = open_[exit_fill]
+        pnl = side * size * (exit_price - entry_price)
+        marked[fill:exit_fill] = side * size * (close[fill:exit_fill] - entry_price)
+        realized[exit_fill] += pnl
+        cash += pnl
+        if pnl >= 0:
+            won += 1
+            gross_profit += pnl
+        else:
+            lost += 1
+            gross_loss += -pnl
+
+        trades.append((fill, exit_fill, side, entry_price, exit_price, size, pnl))
+        t = exit_fill
+
+    values = capital + np.cumsum(realized) + marked
+
+    # Full-resolution curve as arrays (wall-clock minutes); labels only for trade fills
+    local = stamps.tz_localize(None) if stamps.tz is not None else stamps
+    equity_curve = EquitySeries(
+        local.to_numpy().astype("datetime64[m]").astype(np.int64), np.round(values, 2),
+    )
+    fills = np.array([(tr[0], tr[1]) for tr in trades], dtype=np.int64).reshape(-1, 2)
+    trade_labels = stamps[fills.ravel()].strftime("%Y-%m-%d %H:%M")
+    trade_log = [
+        {
+            "entry_date": trade_labels[2 * k],
+            "exit_date": trade_labels[2 * k + 1],
+            "direction": "buy" if side > 0 else "sell",
+            "entry_price": round(float(entry_price), 2),
+            "exit_price": round(float(exit_price), 2),
+            "size": size,
+            "pnl": round(float(pnl), 2),
+            "pnl_pct": round(float(pnl / (entry_price * size) * 100), 2) if entry_price else 0,
+            "bars_held": exit_fill - fill,
+        }
+        for k, (fill, exit_fill, side, entry_price, exit_price, size, pnl) in enumerate(trades)
+    ]
+
+    return build_metrics(
+        final_value=float(values[-1]) if n else capital,
+        initial_capital=capital,
+        sharpe_ratio=annual_sharpe(_session_days(stamps).astype("datetime64[Y]"), values, capital),
+        max_drawdown_pct=max_drawdown_pct(values),
+        total_trades=len(trades) + open_trades,
+        won_trades=won,
+        lost_trades=lost,
+        gross_profit=gross_profit,
+        gross_loss=gross_loss,
+        trade_log=trade_log,
+        equity_curve=equity_curve,
+    )
+
+
+def run_windows(
+    df: pd.DataFrame, strategy_name: str, params: Dict, capital: float,
+    windows: List[Tuple[int, int]],
+) -> List[Dict[str, Any]]:
+    """
+    Metrics for each [start, stop) bar window of one parameter set. Signals
+    are evaluated once over the whole frame, so every window starts with
+    warm indicators and ranges; each window then trades from `capital`.
+    """
+    direction, stop, target = entry_signals(df, strategy_name, params)
+    size_pct = params.get("position_size_pct", 10.0)
+    return [
+        simulate(df.iloc[a:b], direction[a:b], stop[a:b], target[a:b], capital, size_pct)
+        for a, b in windows
+    ]
+
+
+def run_vectorized(
+    df: pd.DataFrame, strategy_name: str, params: Dict, capital: float,
+) -> Dict[str, Any]:
+    """Backtest one strategy over an indicator frame; same metrics as the Backtrader engine."""
+    direction, stop, target = entry_signals(df, strategy_name, params)
+    return simulate(df, direction, stop, target, capital, params.get("position_size_pct", 10.0))
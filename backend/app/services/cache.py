@@ -1,10 +1,10 @@
 """
 Redis caching service
 """
-import json
 import redis
 from typing import Any, Optional
 from app.config import get_settings
+from app.utils.serialization import dumps, loads
 from loguru import logger
 
 settings = get_settings()
@@ -36,7 +36,7 @@ class CacheService:
         try:
             value = self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return loads(value)
             return None
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
@@ -45,8 +45,7 @@ class CacheService:
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Set value in cache with TTL"""
         try:
-            serialized = json.dumps(value, default=str)
-            self.redis_client.setex(key, ttl, serialized)
+            self.redis_client.setex(key, ttl, dumps(value))
             return True
         except Exception as e:
             logger.warning(f"Cache set error for key {key}: {e}")
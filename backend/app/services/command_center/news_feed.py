@@ -13,6 +13,7 @@ from loguru import logger
 
 from app.config import get_settings
 from app.services.cache import cache
+from app.utils.keyword_matcher import KeywordHits, KeywordMatcher
 
 
 class NewsImpact(str, Enum):
@@ -87,6 +88,23 @@ class NewsFeedService:
         'dividend', 'buyback',
     ]
 
+    # Category keywords, in priority order (first category hit wins)
+    CATEGORY_KEYWORDS = {
+        NewsCategory.FED.value: ['fed', 'fomc', 'powell', 'rate decision', 'federal reserve'],
+        NewsCategory.EARNINGS.value: ['earnings', 'eps', 'revenue report', 'quarterly results'],
+        NewsCategory.ECONOMIC.value: ['cpi', 'gdp', 'jobs', 'employment', 'inflation', 'economic'],
+        NewsCategory.CRYPTO.value: ['bitcoin', 'crypto', 'ethereum', 'btc'],
+        NewsCategory.POLITICAL.value: ['trump', 'biden', 'election', 'congress', 'tariff'],
+        NewsCategory.MARKET.value: ['market', 's&p', 'dow', 'nasdaq', 'stocks'],
+    }
+
+    # Impact + category groups compiled into one matcher (one scan per item)
+    _MATCHER = KeywordMatcher({
+        'impact:high': HIGH_IMPACT_KEYWORDS,
+        'impact:medium': MEDIUM_IMPACT_KEYWORDS,
+        **{f'category:{name}': kws for name, kws in CATEGORY_KEYWORDS.items()},
+    })
+
     def __init__(self):
         self.settings = get_settings()
         self._session: Optional[aiohttp.ClientSession] = None
@@ -263,50 +281,56 @@ class NewsFeedService:
     # NEWS PROCESSING
     # -------------------------------------------------------------------------
 
-    def _determine_impact(self, headline: str, summary: str = '') -> str:
+    def _determine_impact(self, headline: str, summary: str = '', hits: Optional[KeywordHits] = None) -> str:
         """
         Determine the impact level of a news item.
         """
-        text = f"{headline} {summary}".lower()
-
-        for keyword in self.HIGH_IMPACT_KEYWORDS:
-            if keyword in text:
-                return NewsImpact.HIGH.value
-
-        for keyword in self.MEDIUM_IMPACT_KEYWORDS:
-            if keyword in text:
-                return NewsImpact.MEDIUM.value
+        if hits is None:
+            hits = self._MATCHER.match(f"{headline} {summary}")
 
+        if hits.get('impact:high'):
+            return NewsImpact.HIGH.value
+        if hits.get('impact:medium'):
+            return NewsImpact.MEDIUM.value
         return NewsImpact.LOW.value
 
-    def _categorize_news(self, headline: str, summary: str = '', source: str = '') -> str:
+    def _categorize_news(
+        self, headline: str, summary: str = '', source: str = '', hits: Optional[KeywordHits] = None,
+    ) -> str:
         """
         Categorize news item.
         """
-        text = f"{headline} {summary}".lower()
-
-        if any(kw in text for kw in ['fed', 'fomc', 'powell', 'rate decision', 'federal reserve']):
-            return NewsCategory.FED.value
-        elif any(kw in text for kw in ['earnings', 'eps', 'revenue report', 'quarterly results']):
-            return NewsCategory.EARNINGS.value
-        elif any(kw in text for kw in ['cpi', 'gdp', 'jobs', 'employment', 'inflation', 'economic']):
-            return NewsCategory.ECONOMIC.value
-        elif any(kw in text for kw in ['bitcoin', 'crypto', 'ethereum', 'btc']):
-            return NewsCategory.CRYPTO.value
-        elif any(kw in text for kw in ['trump', 'biden', 'election', 'congress', 'tariff']):
-            return NewsCategory.POLITICAL.value
-        elif any(kw in text for kw in ['market', 's&p', 'dow', 'nasdaq', 'stocks']):
-            return NewsCategory.MARKET.value
-        else:
+        if hits is None:
+            hits = self._MATCHER.match(f"{headline} {summary}")
+
+        category = KeywordMatcher.first_group(
+            hits, (f'category:{name}' for name in self.CATEGORY_KEYWORDS),
+        )
+        if category is None:
             return NewsCategory.COMPANY.value
+        return category.split(':', 1)[1]
+
+    def _classify_batch(self, items: List[tuple]) -> List[tuple]:
+        """
+        (category, impact) for a batch of (headline, summary) pairs,
+        matched in a single pass.
+        """
+        all_hits = self._MATCHER.match_batch([f"{h} {s}" for h, s in items])
+        return [
+            (self._categorize_news(h, s, hits=hits), self._determine_impact(h, s, hits=hits))
+            for (h, s), hits in zip(items, all_hits)
+        ]
 
     def _format_finnhub_news(self, news_list: List[Dict]) -> List[Dict]:
         """
         Format Finnhub news into standardized format.
         """
         formatted = []
+        classes = self._classify_batch(
+            [(item.get('headline', ''), item.get('summary', '')) for item in news_list]
+        )
 
-        for item in news_list:
+        for item, (category, impact) in zip(news_list, classes):
             headline = item.get('headline', '')
             summary = item.get('summary', '')
 
@@ -317,8 +341,8 @@ class NewsFeedService:
                 'source': item.get('source', 'Unknown'),
                 'url': item.get('url', ''),
                 'published_at': datetime.fromtimestamp(item.get('datetime', 0)).isoformat() if item.get('datetime') else None,
-                'category': self._categorize_news(headline, summary),
-                'impact': self._determine_impact(headline, summary),
+                'category': category,
+                'impact': impact,
                 'related_symbols': [item.get('related', '')] if item.get('related') else [],
                 'image': item.get('image'),
                 'sentiment': None,
@@ -331,8 +355,11 @@ class NewsFeedService:
         Format Alpha Vantage news into standardized format.
         """
         formatted = []
+        classes = self._classify_batch(
+            [(item.get('title', ''), item.get('summary', '')) for item in news_list]
+        )
 
-        for item in news_list:
+        for item, (category, impact) in zip(news_list, classes):
             headline = item.get('title', '')
             summary = item.get('summary', '')
 
@@ -349,8 +376,8 @@ class NewsFeedService:
                 'source': item.get('source', 'Unknown'),
                 'url': item.get('url', ''),
                 'published_at': item.get('time_published'),
-                'category': self._categorize_news(headline, summary),
-                'impact': self._determine_impact(headline, summary),
+                'category': category,
+                'impact': impact,
                 'related_symbols': tickers[:5],  # Limit to 5 symbols
                 'image': item.get('banner_image'),
                 'sentiment': sentiment,
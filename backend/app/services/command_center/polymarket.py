@@ -14,6 +14,7 @@ from loguru import logger
 
 from app.config import get_settings
 from app.services.cache import cache
+from app.utils.keyword_matcher import KeywordHits, KeywordMatcher
 
 
 # =============================================================================
@@ -112,6 +113,22 @@ class PolymarketService:
         'ai', 'nvidia', 'tech', 'earnings',
     ]
 
+    # Display categories, in priority order (first category hit wins)
+    CATEGORY_KEYWORDS = {
+        'fed_policy': ['fed', 'rate cut', 'rate hike', 'federal reserve', 'fomc', 'interest rate'],
+        'elections': ['trump', 'biden', 'election', 'president', 'congress', 'senate', 'governor', 'midterm'],
+        'recession': ['recession', 'gdp', 'inflation', 'cpi', 'unemployment', 'jobs report', 'employment'],
+        'crypto': ['bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'solana', 'sol'],
+        'trade': ['tariff', 'china', 'trade deal', 'trade war'],
+        'markets': ['ai', 'nvidia', 'tech', 'earnings', 's&p', 'nasdaq', 'stock'],
+    }
+
+    # Relevance + category groups compiled into one matcher (one scan per market)
+    _MATCHER = KeywordMatcher({
+        'relevant': TRADING_KEYWORDS,
+        **CATEGORY_KEYWORDS,
+    })
+
     # Key markets to always track (by slug or ID) - updated for 2025/2026
     KEY_MARKET_SLUGS = [
         'federal-reserve',
@@ -251,49 +268,37 @@ class PolymarketService:
     # TRADING-RELEVANT MARKETS
     # -------------------------------------------------------------------------
 
-    def _is_trading_relevant(self, market: Dict) -> bool:
+    @staticmethod
+    def _market_text(market: Dict) -> str:
+        return f"{market.get('question', '')} {market.get('description', '')}"
+
+    def _is_trading_relevant(self, market: Dict, hits: Optional[KeywordHits] = None) -> bool:
         """
         Check if a market is relevant for trading decisions.
         """
-        title = market.get('question', '').lower()
-        description = market.get('description', '').lower()
-        tags = [t.lower() for t in market.get('tags', [])]
+        if hits is None:
+            hits = self._MATCHER.match(self._market_text(market))
 
         # Check keywords in title/description
-        text = f"{title} {description}"
-        for keyword in self.TRADING_KEYWORDS:
-            if keyword in text:
-                return True
+        if hits.get('relevant'):
+            return True
 
         # Check tags
-        for tag in tags:
-            if tag in self.TRADING_CATEGORIES:
+        for tag in market.get('tags', []):
+            if tag.lower() in self.TRADING_CATEGORIES:
                 return True
 
         return False
 
-    def _categorize_market(self, market: Dict) -> str:
+    def _categorize_market(self, market: Dict, hits: Optional[KeywordHits] = None) -> str:
         """
         Categorize a market for display grouping.
         """
-        title = market.get('question', '').lower()
-        description = market.get('description', '').lower()
-        text = f"{title} {description}"
-
-        if any(kw in text for kw in ['fed', 'rate cut', 'rate hike', 'federal reserve', 'fomc', 'interest rate']):
-            return 'fed_policy'
-        elif any(kw in text for kw in ['trump', 'biden', 'election', 'president', 'congress', 'senate', 'governor', 'midterm']):
-            return 'elections'
-        elif any(kw in text for kw in ['recession', 'gdp', 'inflation', 'cpi', 'unemployment', 'jobs report', 'employment']):
-            return 'recession'  # Use 'recession' for MRI compatibility
-        elif any(kw in text for kw in ['bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'solana', 'sol']):
-            return 'crypto'
-        elif any(kw in text for kw in ['tariff', 'china', 'trade deal', 'trade war']):
-            return 'trade'
-        elif any(kw in text for kw in ['ai', 'nvidia', 'tech', 'earnings', 's&p', 'nasdaq', 'stock']):
-            return 'markets'
-        else:
-            return 'other'
+        if hits is None:
+            hits = self._MATCHER.match(self._market_text(market))
+
+        # 'recession' doubles as the economic bucket for MRI compatibility
+        return KeywordMatcher.first_group(hits, self.CATEGORY_KEYWORDS, default='other')
 
     async def get_trading_markets(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -309,8 +314,9 @@ class PolymarketService:
             all_markets = await self._fetch_markets(limit=200)
 
             trading_markets = []
-            for market in all_markets:
-                if not self._is_trading_relevant(market):
+            all_hits = self._MATCHER.match_batch([self._market_text(m) for m in all_markets])
+            for market, hits in zip(all_markets, all_hits):
+                if not self._is_trading_relevant(market, hits):
                     continue
 
                 # Parse outcomes and odds
@@ -352,7 +358,7 @@ class PolymarketService:
                     'id': market_id,
                     'title': market.get('question', 'Unknown Market'),
                     'slug': market.get('slug', ''),
-                    'category': self._categorize_market(market),
+                    'category': self._categorize_market(market, hits),
                     'outcomes': outcomes,
                     'primary_odds': primary_odds,
                     'change_24h': change_24h,
@@ -0,0 +1,7 @@
+"""
+CPU offload — managed process pool with shared-memory bar transfer
+"""
+from app.services.compute.pool import ComputePool, compute_pool
+from app.services.compute.shared_frame import SharedFrame, as_frame, share_frame
+
+__all__ = ["ComputePool", "compute_pool", "SharedFrame", "as_frame", "share_frame"]
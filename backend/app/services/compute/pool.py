@@ -0,0 +1,231 @@
+"""
+Managed process pool for CPU-bound analytics (indicator math, technical
+scoring, backtest runs).
+
+Callers use compute_pool.run(fn, *args) from a worker thread: it blocks
+until the task finishes, so thread-pool and asyncio callers keep their
+existing shape while the math runs outside the GIL. DataFrame arguments
+travel through shared memory (shared_frame.py) rather than pickles.
+
+imap_shared() runs a batch of tasks over a few frames (parameter sweeps):
+each frame is copied into shared memory once for the whole batch and
+results are yielded as tasks complete.
+
+Tasks run inline in the calling thread when the pool is disabled
+(COMPUTE_POOL_WORKERS=0), when more than COMPUTE_POOL_MAX_QUEUE tasks are
+already waiting, or when a frame can't be shared. A crashed worker breaks
+the executor; it is replaced on the next call and that task runs inline.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+
+from app.services.compute.shared_frame import share_frame
+
+# Imported once in the fork server, so workers start with them loaded
+_PRELOAD = ["numpy", "pandas", "ta", "app.services.analysis.technical"]
+
+
+class ComputePool:
+    """Lazily started ProcessPoolExecutor with load counters for the health dashboard."""
+
+    def __init__(self, workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self._workers = workers
+        self._max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._inline = 0
+        self._restarts = 0
+
+    @property
+    def workers(self) -> int:
+        if self._workers is None:
+            from app.config import get_settings
+            self._workers = max(0, get_settings().COMPUTE_POOL_WORKERS)
+        return self._workers
+
+    @property
+    def max_queue(self) -> int:
+        if self._max_queue is None:
+            from app.config import get_settings
+            self._max_queue = max(0, get_settings().COMPUTE_POOL_MAX_QUEUE)
+        return self._max_queue
+
+    @property
+    def queue_depth(self) -> int:
+        """Submitted tasks waiting for a free worker."""
+        return max(0, self._in_flight - self.workers)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                try:
+                    ctx = multiprocessing.get_context("forkserver")
+                    ctx.set_forkserver_preload(_PRELOAD)
+                except ValueError:  # platforms without fork server
+                    ctx = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx)
+                logger.info(f"Compute pool started ({self.workers} workers, {ctx.get_start_method()})")
+            return self._executor
+
+    def _reset(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self._restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_inline(self, fn: Callable, args: tuple) -> Any:
+        with self._lock:
+            self._inline += 1
+        return fn(*args)
+
+    def run(self, fn: Callable, *args) -> Any:
+        """
+        Run fn(*args) in a worker process and return its result (blocking).
+        `fn` must be a module-level function; DataFrame arguments arrive in
+        the worker as SharedFrame handles (see shared_frame.as_frame).
+        """
+        if self.workers <= 0 or self.queue_depth >= self.max_queue:
+            return self._run_inline(fn, args)
+
+        with ExitStack() as stack:
+            try:
+                shared = tuple(
+                    stack.enter_context(share_frame(arg)) if isinstance(arg, pd.DataFrame) else arg
+                    for arg in args
+                )
+            except TypeError as e:
+                logger.debug(f"Compute pool: running {fn.__name__} inline ({e})")
+                return self._run_inline(fn, args)
+
+            executor = self._get_executor()
+            with self._lock:
+                self._in_flight += 1
+            try:
+                result = executor.submit(fn, *shared).result()
+            except BrokenProcessPool:
+                logger.warning(f"Compute pool: worker died during {fn.__name__} — restarting pool")
+                self._reset(executor)
+                with self._lock:
+                    self._failed += 1
+                return self._run_inline(fn, args)
+            except Exception:
+                with self._lock:
+                    self._failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+            with self._lock:
+                self._completed += 1
+            return result
+
+    def imap_shared(
+        self, fn: Callable, frames: Dict[str, pd.DataFrame], calls: Iterable[Tuple[str, tuple]],
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Run fn(frames[key], *args) for each (key, args) in `calls`, yielding
+        (call index, result) in completion order. Frames are shared once for
+        the batch; at most 2 × workers calls are queued in the executor at a
+        time, so a large batch doesn't starve other callers. Task exceptions
+        propagate (outstanding calls are cancelled).
+        """
+        calls = list(calls)
+        if self.workers <= 0:
+            for index, (key, args) in enumerate(calls):
+                yield index, self._run_inline(fn, (frames[key], *args))
+            return
+
+        with ExitStack() as stack:
+            try:
+                shared = {key: stack.enter_context(share_frame(df)) for key, df in frames.items()}
+            except TypeError as e:
+                logger.debug(f"Compute pool: running {fn.__name__} batch inline ({e})")
+                for index, (key, args) in enumerate(calls):
+                    yield index, self._run_inline(fn, (frames[key], *args))
+                return
+
+            executor = self._get_executor()
+            pending: Dict[Any, int] = {}
+            next_call = 0
+            try:
+                while next_call < len(calls) or pending:
+                    while next_call < len(calls) and len(pending) < self.workers * 2:
+                        key, args = calls[next_call]
+                        pending[executor.submit(fn, shared[key], *args)] = next_call
+                        next_call += 1
+                        with self._lock:
+                            self._in_flight += 1
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = pending.pop(future)
+                        with self._lock:
+                            self._in_flight -= 1
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            logger.warning(f"Compute pool: worker died during {fn.__name__} batch — restarting pool")
+                            self._reset(executor)
+                            with self._lock:
+                                self._failed += 1
+                            # The rest of the batch (including calls lost with the pool) runs inline
+                            remaining = sorted([index, *pending.values()]) + list(range(next_call, len(calls)))
+                            with self._lock:
+                                self._in_flight -= len(pending)
+                            pending.clear()
+                            next_call = len(calls)
+                            for i in remaining:
+                                key, args = calls[i]
+                                yield i, self._run_inline(fn, (frames[key], *args))
+                            break
+                        except Exception:
+                            with self._lock:
+                                self._failed += 1
+                            raise
+                        with self._lock:
+                            self._completed += 1
+                        yield index, result
+            finally:
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+                with self._lock:
+                    self._in_flight -= len(pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and load for the health dashboard."""
+        with self._lock:
+            return {
+                "mode": "process" if self.workers > 0 else "inline",
+                "workers": self.workers,
+                "started": self._executor is not None,
+                "in_flight": self._in_flight,
+                "queue_depth": self.queue_depth,
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "failed": self._failed,
+                "inline_runs": self._inline,
+                "restarts": self._restarts,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.info("Compute pool stopped")
+
+
+# Singleton instance
+compute_pool = ComputePool()
@@ -0,0 +1,104 @@
+"""
+Shared-memory transfer of bar DataFrames to compute workers.
+
+A frame's numeric and datetime columns (plus a DatetimeIndex, if any) are
+copied once into a single SharedMemory block; the worker receives only a
+small SharedFrame descriptor and rebuilds the frame from the block instead
+of unpickling it. The parent owns the block and unlinks it once the task
+is done (see share_frame()).
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Sentinel column name for the DatetimeIndex
+_INDEX = "__index__"
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    name: str
+    dtype: str            # NumPy dtype of the stored values (datetimes as int64 epochs)
+    offset: int           # byte offset into the block
+    tz: Optional[str] = None
+    unit: Optional[str] = None  # datetime resolution; None for plain columns
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Picklable handle to a DataFrame stored in shared memory."""
+    block: str
+    length: int
+    columns: Tuple[SharedColumn, ...]
+
+    def load(self) -> pd.DataFrame:
+        """Rebuild the DataFrame (copies out of the block, then detaches)."""
+        shm = shared_memory.SharedMemory(name=self.block)
+        try:
+            data, index = {}, None
+            for col in self.columns:
+                values = np.ndarray(self.length, dtype=col.dtype, buffer=shm.buf, offset=col.offset).copy()
+                if col.unit is not None:
+                    values = pd.DatetimeIndex(values.view(f"datetime64[{col.unit}]"))
+                    if col.tz is not None:
+                        values = values.tz_localize("UTC").tz_convert(col.tz)
+                if col.name == _INDEX:
+                    index = pd.DatetimeIndex(values)
+                else:
+                    data[col.name] = values
+            return pd.DataFrame(data, index=index)
+        finally:
+            shm.close()
+
+
+def _column_values(series: Union[pd.Series, pd.Index]) -> Tuple[np.ndarray, Optional[str], Optional[str]]:
+    """(values, tz, datetime unit) for one column; TypeError if not shareable."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype) or (isinstance(dtype, np.dtype) and dtype.kind == "M"):
+        stamps = pd.DatetimeIndex(series)
+        tz = str(stamps.tz) if stamps.tz is not None else None
+        if tz is not None:
+            stamps = stamps.tz_convert("UTC").tz_localize(None)
+        return stamps.asi8, tz, stamps.unit
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return np.ascontiguousarray(series.to_numpy()), None, None
+    raise TypeError(f"column {series.name!r} ({dtype}) cannot be shared")
+
+
+@contextmanager
+def share_frame(df: pd.DataFrame) -> Iterator[SharedFrame]:
+    """
+    Copy `df` into shared memory for the duration of the block. Raises
+    TypeError for frames with non-numeric columns or a non-datetime,
+    non-default index.
+    """
+    arrays = []
+    if isinstance(df.index, pd.DatetimeIndex):
+        arrays.append((_INDEX, *_column_values(df.index)))
+    elif not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+        raise TypeError(f"index {type(df.index).__name__} cannot be shared")
+    for name in df.columns:
+        arrays.append((str(name), *_column_values(df[name])))
+
+    columns, offset = [], 0
+    for name, values, tz, unit in arrays:
+        columns.append(SharedColumn(name, values.dtype.str, offset, tz, unit))
+        offset += -(-values.nbytes // 8) * 8  # keep every column 8-byte aligned
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for col, (_, values, _, _) in zip(columns, arrays):
+            np.ndarray(len(values), dtype=values.dtype, buffer=shm.buf, offset=col.offset)[:] = values
+        yield SharedFrame(block=shm.name, length=len(df), columns=tuple(columns))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def as_frame(frame: Union[pd.DataFrame, SharedFrame]) -> pd.DataFrame:
+    """Task-side: accept a DataFrame (inline runs) or a SharedFrame handle."""
+    return frame.load() if isinstance(frame, SharedFrame) else frame
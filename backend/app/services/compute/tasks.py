@@ -0,0 +1,62 @@
+"""
+Task functions executed in compute-pool workers (or inline).
+
+Each takes bar frames as DataFrame-or-SharedFrame (see as_frame) and
+returns small picklable results — indicator dicts, StageResults, metric
+dicts — never the indicator-laden frame itself. Service modules are
+imported inside the tasks so the fork server only preloads the math.
+"""
+from typing import Any, Dict, List, Tuple
+
+from app.services.compute.shared_frame import as_frame
+
+
+def technical_evaluation(prices) -> Tuple[Dict[str, Any], Any]:
+    """
+    Indicators + v1 technical StageResult for a daily bar frame.
+    Returns (latest indicators, tech_stage).
+    """
+    from app.services.analysis.technical import TechnicalAnalysis
+    from app.services.screening.engine import ScreeningEngine
+
+    price_data = TechnicalAnalysis.calculate_all_indicators(as_frame(prices))
+    indicators = TechnicalAnalysis.get_latest_indicators(price_data)
+    avg_volume = TechnicalAnalysis.calculate_avg_volume(price_data, 50)
+    is_breakout = TechnicalAnalysis.detect_breakout(price_data, 60)
+    tech_stage = ScreeningEngine._evaluate_technical(
+        indicators, price_data,
+        avg_volume=avg_volume or 0, is_breakout=is_breakout,
+    )
+    return indicators, tech_stage
+
+
+def backtrader_run(bars, strategy_name: str, params: dict, capital: float) -> Dict[str, Any]:
+    """Build the feed, run Cerebro and return the extracted metrics dict."""
+    from app.services.backtesting.engine import BacktestEngine
+
+    engine = BacktestEngine()
+    cerebro = engine._configure_cerebro(
+        strategy_name=strategy_name,
+        params=params,
+        capital=capital,
+        feed=engine._build_feed(as_frame(bars)),
+    )
+    strat = cerebro.run()[0]
+    return engine._extract_results(cerebro, strat, capital)
+
+
+def vectorized_run(bars, strategy_name: str, params: dict, capital: float) -> Dict[str, Any]:
+    """Run the vectorized engine over an indicator frame and return its metrics dict."""
+    from app.services.backtesting.vectorized import run_vectorized
+
+    return run_vectorized(as_frame(bars), strategy_name, params, capital)
+
+
+def sweep_run(bars, strategy_name: str, params: dict, capital: float,
+              windows: List[Tuple[int, int]]) -> List[List[float]]:
+    """One sweep run: SUMMARY_METRICS values for each [start, stop) bar window."""
+    from app.services.backtesting.metrics import SUMMARY_METRICS
+    from app.services.backtesting.vectorized import run_windows
+
+    results = run_windows(as_frame(bars), strategy_name, params, capital, windows)
+    return [[metrics[m] for m in SUMMARY_METRICS] for metrics in results]
@@ -0,0 +1,175 @@
+"""
+Async Alpaca Market Data client
+Native aiohttp access to the Alpaca market-data REST API (the endpoints
+alpaca-py's StockHistoricalDataClient calls), for callers on the event loop.
+
+Returns the same raw payloads alpaca-py parses ({SYMBOL: [bar, ...]} for
+bars, {SYMBOL: snapshot} for snapshots), so AlpacaService formats both
+through one code path. Connections are pooled and kept alive per event
+loop; 429 and 5xx responses are retried with jittered exponential backoff.
+"""
+import asyncio
+import random
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from loguru import logger
+
+ALPACA_DATA_URL = "https://data.alpaca.markets/v2"
+
+# Max bars per page (Alpaca's cap, same as alpaca-py)
+PAGE_LIMIT = 10_000
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _rfc3339(value: Optional[datetime]) -> Optional[str]:
+    """Request timestamp; naive datetimes are UTC (as in alpaca-py)."""
+    if value is None:
+        return None
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+class AlpacaAPIError(Exception):
+    """Non-retryable (or retries exhausted) market-data response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Alpaca returned {status}: {message}")
+        self.status = status
+
+
+class AsyncAlpacaDataClient:
+    """Keep-alive aiohttp client for the Alpaca stock market-data API."""
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        base_url: str = ALPACA_DATA_URL,
+        max_connections: int = 32,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._headers = {
+            "APCA-API-KEY-ID": api_key,
+            "APCA-API-SECRET-KEY": secret_key,
+        }
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        # One pooled session per event loop (aiohttp sessions are loop-bound)
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, keepalive_timeout=60, ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        current = asyncio.get_running_loop()
+        for loop, session in list(self._sessions.items()):
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+        self._sessions.clear()
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Server-requested delay if given, else full-jitter exponential backoff."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_cap)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Any:
+        """GET with retries on rate limiting, server errors and dropped connections."""
+        url = f"{self.base_url}{path}"
+        params = {k: v for k, v in params.items() if v is not None}
+        session = await self._get_session()
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with session.get(url, params=params) as resp:
+                    if resp.status == 200:
+                        return await resp.json()
+                    body = await resp.text()
+                    if resp.status not in RETRY_STATUSES or attempt == self.max_retries:
+                        raise AlpacaAPIError(resp.status, body[:200])
+                    retry_after = resp.headers.get("Retry-After")
+                    logger.debug(f"Alpaca {resp.status} on {path}, retry {attempt + 1}/{self.max_retries}")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.debug(f"Alpaca request error on {path} ({e}), retry {attempt + 1}/{self.max_retries}")
+
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    async def get_stock_bars(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        feed: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bars for one or more symbols, following next_page_token until
+        `limit` bars in total (alpaca-py semantics) or the range is exhausted.
+        """
+        params = {
+            "symbols": ",".join(symbols),
+            "timeframe": timeframe,
+            "start": _rfc3339(start),
+            "end": _rfc3339(end),
+            "feed": feed,
+        }
+        bars: Dict[str, List[Dict[str, Any]]] = {}
+        total = 0
+        page_token = None
+
+        while True:
+            page_limit = PAGE_LIMIT if limit is None else min(limit - total, PAGE_LIMIT)
+            if page_limit < 1:
+                break
+            page = await self._get("/stocks/bars", {**params, "limit": page_limit, "page_token": page_token})
+
+            for symbol, rows in (page.get("bars") or {}).items():
+                bars.setdefault(symbol, []).extend(rows or [])
+            total = sum(len(rows) for rows in bars.values())
+
+            page_token = page.get("next_page_token")
+            if not page_token:
+                break
+
+        return bars
+
+    async def get_stock_snapshots(
+        self, symbols: List[str], feed: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Latest trade/quote/minute/daily/previous-daily bar per symbol."""
+        return await self._get("/stocks/snapshots", {"symbols": ",".join(symbols), "feed": feed}) or {}
@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 
 from app.config import get_settings
+from app.services.data_fetcher.alpaca_async import AsyncAlpacaDataClient
 
 ET = ZoneInfo("America/New_York")
 
@@ -20,7 +21,9 @@ try:
     from alpaca.data import StockHistoricalDataClient
     from alpaca.data.historical.crypto import CryptoHistoricalDataClient
     from alpaca.data.historical.option import OptionHistoricalDataClient
+    from alpaca.data.historical.utils import parse_obj_as_symbol_dict
     from alpaca.data.live import StockDataStream
+    from alpaca.data.models import BarSet, Snapshot
     from alpaca.data.requests import (
         StockBarsRequest,
         StockQuotesRequest,
@@ -53,6 +56,7 @@ class AlpacaService:
         self._crypto_client = None
         self._option_client = None
         self._trading_client = None  # For option contract lookups (reused)
+        self._async_client: Optional[AsyncAlpacaDataClient] = None  # Event-loop callers
         self._stream = None
 
         self._try_init()
@@ -95,6 +99,8 @@ class AlpacaService:
             self._trading_client = TradingClient(
                 self.api_key, self.secret_key, paper=True
             )
+            # Async REST client (pooled keep-alive) for the *_async methods
+            self._async_client = AsyncAlpacaDataClient(self.api_key, self.secret_key)
             logger.info(f"Alpaca data client initialized (feed: {self.data_feed})")
         except Exception as e:
             logger.error(f"Failed to initialize Alpaca client: {e}")
@@ -114,6 +120,7 @@ class AlpacaService:
         self._crypto_client = None
         self._option_client = None
         self._trading_client = None
+        self._async_client = None  # Old pools close with their sessions
 
         self._try_init()
         return self.is_available
@@ -161,29 +168,23 @@ class AlpacaService:
 
         Returns:
             DataFrame with columns: open, high, low, close, volume, vwap, trade_count
+
+        Open-ended requests for symbols on the live price stream are served
+        from streamed bars; REST is only hit to seed them (startup / gaps).
         """
+        live_eligible = start is None and end is None
+        if live_eligible:
+            live = self._get_live_bars(symbol, timeframe, limit)
+            if live is not None:
+                return live
+
         if not self.is_available:
             logger.warning("Alpaca service not available")
             return None
 
         try:
             tf = self._get_timeframe(timeframe)
-
-            # Default to last trading day if no dates specified
-            if not end:
-                end = datetime.now(timezone.utc)
-            if not start:
-                # Go back enough time to get requested bars (account for weekends/holidays)
-                # Use at least 7 days to ensure we capture trading day data
-                if "m" in timeframe:
-                    minutes = int(timeframe.replace("m", ""))
-                    # At least 7 days back for intraday data
-                    start = end - timedelta(days=max(7, (minutes * limit * 2) // 1440 + 1))
-                elif "h" in timeframe:
-                    hours = int(timeframe.replace("h", ""))
-                    start = end - timedelta(days=max(7, (hours * limit * 2) // 24 + 1))
-                else:
-                    start = end - timedelta(days=limit * 2)
+            start, end = self._bars_window(timeframe, limit, start, end)
 
             request = StockBarsRequest(
                 symbol_or_symbols=symbol.upper(),
@@ -195,48 +196,102 @@ class AlpacaService:
             )
 
             bars = self._data_client.get_stock_bars(request)
+            df = self._format_bars(symbol, bars, limit)
+
+            if df is not None and live_eligible:
+                self._backfill_live_bars(symbol, timeframe, df, limit)
+
+            return df
+
+        except Exception as e:
+            logger.error(f"Error fetching bars for {symbol}: {e}")
+            return None
 
-            # Check if data exists (handle both old and new API formats)
-            symbol_upper = symbol.upper()
-            if hasattr(bars, 'data') and symbol_upper in bars.data:
-                bar_list = bars.data[symbol_upper]
-            elif symbol_upper in bars:
-                bar_list = bars[symbol_upper]
+    @staticmethod
+    def _bars_window(
+        timeframe: str, limit: int, start: Optional[datetime], end: Optional[datetime],
+    ) -> Tuple[datetime, datetime]:
+        """Default start/end for a bars request (last trading days if not given)."""
+        if not end:
+            end = datetime.now(timezone.utc)
+        if not start:
+            # Go back enough time to get requested bars (account for weekends/holidays)
+            # Use at least 7 days to ensure we capture trading day data
+            if "m" in timeframe:
+                minutes = int(timeframe.replace("m", ""))
+                # At least 7 days back for intraday data
+                start = end - timedelta(days=max(7, (minutes * limit * 2) // 1440 + 1))
+            elif "h" in timeframe:
+                hours = int(timeframe.replace("h", ""))
+                start = end - timedelta(days=max(7, (hours * limit * 2) // 24 + 1))
             else:
-                logger.warning(f"No bars returned for {symbol}")
-                return None
+                start = end - timedelta(days=limit * 2)
+        return start, end
+
+    @staticmethod
+    def _bar_list(symbol: str, bars: Any) -> Optional[list]:
+        """Bars for one symbol from a BarSet (handles both old and new API formats)."""
+        symbol_upper = symbol.upper()
+        if hasattr(bars, 'data') and symbol_upper in bars.data:
+            return bars.data[symbol_upper]
+        if symbol_upper in bars:
+            return bars[symbol_upper]
+        return None
 
-            if not bar_list:
-                logger.warning(f"Empty bars list for {symbol}")
-                return None
+    def _format_bars(self, symbol: str, bars: Any, limit: int) -> Optional[pd.DataFrame]:
+        """get_bars DataFrame from a BarSet."""
+        bar_list = self._bar_list(symbol, bars)
+        if bar_list is None:
+            logger.warning(f"No bars returned for {symbol}")
+            return None
 
-            # Convert list of bar objects to DataFrame
-            df = pd.DataFrame([{
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume,
-                'vwap': bar.vwap,
-                'trade_count': bar.trade_count,
-                'timestamp': bar.timestamp
-            } for bar in bar_list])
-
-            # Rename columns for consistency
-            df = df.rename(columns={
-                'timestamp': 'datetime',
-                'trade_count': 'trades'
-            })
-
-            # Sort by datetime
-            df = df.sort_values('datetime')
-
-            return df.tail(limit)
+        if not bar_list:
+            logger.warning(f"Empty bars list for {symbol}")
+            return None
 
+        # Convert list of bar objects to DataFrame
+        df = pd.DataFrame([{
+            'open': bar.open,
+            'high': bar.high,
+            'low': bar.low,
+            'close': bar.close,
+            'volume': bar.volume,
+            'vwap': bar.vwap,
+            'trade_count': bar.trade_count,
+            'timestamp': bar.timestamp
+        } for bar in bar_list])
+
+        # Rename columns for consistency
+        df = df.rename(columns={
+            'timestamp': 'datetime',
+            'trade_count': 'trades'
+        })
+
+        # Sort by datetime
+        df = df.sort_values('datetime')
+        return df.tail(limit)
+
+    @staticmethod
+    def _get_live_bars(symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
+        """Streamed bars from PriceStreamService, or None to fall back to REST."""
+        try:
+            from app.services.data_fetcher.price_stream_service import get_price_stream_service
+            return get_price_stream_service().get_live_bars(symbol.upper(), timeframe.lower(), limit)
         except Exception as e:
-            logger.error(f"Error fetching bars for {symbol}: {e}")
+            logger.debug(f"Live bars unavailable for {symbol}: {e}")
             return None
 
+    @staticmethod
+    def _backfill_live_bars(symbol: str, timeframe: str, df: pd.DataFrame, limit: int) -> None:
+        """Seed the live bar store from a REST response (no-op if not streaming)."""
+        try:
+            from app.services.data_fetcher.price_stream_service import get_price_stream_service
+            get_price_stream_service().backfill_bars(
+                symbol.upper(), timeframe.lower(), df.reset_index(drop=True), limit,
+            )
+        except Exception as e:
+            logger.debug(f"Live bar backfill skipped for {symbol}: {e}")
+
     def get_snapshot(self, symbol: str) -> Optional[Dict]:
         """
         Get current snapshot (quote + daily bar) for a symbol.
@@ -262,71 +317,74 @@ class AlpacaService:
             snapshots = self._data_client.get_stock_snapshot(request)
 
             # get_stock_snapshot returns a dict of {symbol: snapshot}
-            snapshot = snapshots.get(symbol.upper())
+            return self._format_snapshot(symbol, snapshots.get(symbol.upper()))
 
-            if not snapshot:
-                logger.warning(f"Empty snapshot returned for {symbol}")
-                return None
-
-            logger.debug(f"Snapshot received for {symbol}: {type(snapshot)}")
+        except Exception as e:
+            logger.error(f"Error fetching snapshot for {symbol}: {e}")
+            return None
 
-            result = {
-                "symbol": symbol.upper(),
-                "timestamp": datetime.now().isoformat(),
-            }
+    @staticmethod
+    def _format_snapshot(symbol: str, snapshot: Any) -> Optional[Dict]:
+        """get_snapshot dict from an SDK Snapshot."""
+        if not snapshot:
+            logger.warning(f"Empty snapshot returned for {symbol}")
+            return None
 
-            # Latest trade
-            if snapshot.latest_trade:
-                result["latest_trade"] = {
-                    "price": float(snapshot.latest_trade.price),
-                    "size": snapshot.latest_trade.size,
-                    "timestamp": snapshot.latest_trade.timestamp.isoformat()
-                }
-                result["current_price"] = float(snapshot.latest_trade.price)
+        logger.debug(f"Snapshot received for {symbol}: {type(snapshot)}")
 
-            # Latest quote
-            if snapshot.latest_quote:
-                result["latest_quote"] = {
-                    "bid": float(snapshot.latest_quote.bid_price),
-                    "ask": float(snapshot.latest_quote.ask_price),
-                    "bid_size": snapshot.latest_quote.bid_size,
-                    "ask_size": snapshot.latest_quote.ask_size,
-                    "spread": float(snapshot.latest_quote.ask_price - snapshot.latest_quote.bid_price)
-                }
+        result = {
+            "symbol": symbol.upper(),
+            "timestamp": datetime.now().isoformat(),
+        }
 
-            # Daily bar
-            if snapshot.daily_bar:
-                result["daily_bar"] = {
-                    "open": float(snapshot.daily_bar.open),
-                    "high": float(snapshot.daily_bar.high),
-                    "low": float(snapshot.daily_bar.low),
-                    "close": float(snapshot.daily_bar.close),
-                    "volume": snapshot.daily_bar.volume,
-                    "vwap": float(snapshot.daily_bar.vwap) if snapshot.daily_bar.vwap else None,
-                }
+        # Latest trade
+        if snapshot.latest_trade:
+            result["latest_trade"] = {
+                "price": float(snapshot.latest_trade.price),
+                "size": snapshot.latest_trade.size,
+                "timestamp": snapshot.latest_trade.timestamp.isoformat()
+            }
+            result["current_price"] = float(snapshot.latest_trade.price)
+
+        # Latest quote
+        if snapshot.latest_quote:
+            result["latest_quote"] = {
+                "bid": float(snapshot.latest_quote.bid_price),
+                "ask": float(snapshot.latest_quote.ask_price),
+                "bid_size": snapshot.latest_quote.bid_size,
+                "ask_size": snapshot.latest_quote.ask_size,
+                "spread": float(snapshot.latest_quote.ask_price - snapshot.latest_quote.bid_price)
+            }
 
-            # Previous day bar
-            if snapshot.previous_daily_bar:
-                result["prev_daily_bar"] = {
-                    "open": float(snapshot.previous_daily_bar.open),
-                    "high": float(snapshot.previous_daily_bar.high),
-                    "low": float(snapshot.previous_daily_bar.low),
-                    "close": float(snapshot.previous_daily_bar.close),
-                    "volume": snapshot.previous_daily_bar.volume,
-                    "vwap": float(snapshot.previous_daily_bar.vwap) if snapshot.previous_daily_bar.vwap else None,
-                }
+        # Daily bar
+        if snapshot.daily_bar:
+            result["daily_bar"] = {
+                "open": float(snapshot.daily_bar.open),
+                "high": float(snapshot.daily_bar.high),
+                "low": float(snapshot.daily_bar.low),
+                "close": float(snapshot.daily_bar.close),
+                "volume": snapshot.daily_bar.volume,
+                "vwap": float(snapshot.daily_bar.vwap) if snapshot.daily_bar.vwap else None,
+            }
 
-                # Calculate change
-                prev_close = float(snapshot.previous_daily_bar.close)
-                if result.get("current_price") and prev_close > 0:
-                    result["change"] = result["current_price"] - prev_close
-                    result["change_percent"] = ((result["current_price"] - prev_close) / prev_close) * 100
+        # Previous day bar
+        if snapshot.previous_daily_bar:
+            result["prev_daily_bar"] = {
+                "open": float(snapshot.previous_daily_bar.open),
+                "high": float(snapshot.previous_daily_bar.high),
+                "low": float(snapshot.previous_daily_bar.low),
+                "close": float(snapshot.previous_daily_bar.close),
+                "volume": snapshot.previous_daily_bar.volume,
+                "vwap": float(snapshot.previous_daily_bar.vwap) if snapshot.previous_daily_bar.vwap else None,
+            }
 
-            return result
+            # Calculate change
+            prev_close = float(snapshot.previous_daily_bar.close)
+            if result.get("current_price") and prev_close > 0:
+                result["change"] = result["current_price"] - prev_close
+                result["change_percent"] = ((result["current_price"] - prev_close) / prev_close) * 100
 
-        except Exception as e:
-            logger.error(f"Error fetching snapshot for {symbol}: {e}")
-            return None
+        return result
 
     def get_multi_snapshots(self, symbols: List[str]) -> Dict[str, Dict]:
         """Get snapshots for multiple symbols at once"""
@@ -340,32 +398,36 @@ class AlpacaService:
                 feed=self.data_feed
             )
             snapshots = self._data_client.get_stock_snapshot(request)
+            return self._format_multi_snapshots(snapshots)
 
-            results = {}
-            for symbol, snapshot in snapshots.items():
-                result = {"symbol": symbol}
+        except Exception as e:
+            logger.error(f"Error fetching multi snapshots: {e}")
+            return {}
 
-                if snapshot.latest_trade:
-                    result["current_price"] = float(snapshot.latest_trade.price)
+    @staticmethod
+    def _format_multi_snapshots(snapshots: Dict[str, Any]) -> Dict[str, Dict]:
+        """get_multi_snapshots dicts from {symbol: SDK Snapshot}."""
+        results = {}
+        for symbol, snapshot in snapshots.items():
+            result = {"symbol": symbol}
 
-                if snapshot.daily_bar:
-                    result["vwap"] = float(snapshot.daily_bar.vwap) if snapshot.daily_bar.vwap else None
-                    result["volume"] = snapshot.daily_bar.volume
-                    result["high"] = float(snapshot.daily_bar.high)
-                    result["low"] = float(snapshot.daily_bar.low)
+            if snapshot.latest_trade:
+                result["current_price"] = float(snapshot.latest_trade.price)
 
-                if snapshot.previous_daily_bar:
-                    prev_close = float(snapshot.previous_daily_bar.close)
-                    if result.get("current_price") and prev_close > 0:
-                        result["change_percent"] = ((result["current_price"] - prev_close) / prev_close) * 100
+            if snapshot.daily_bar:
+                result["vwap"] = float(snapshot.daily_bar.vwap) if snapshot.daily_bar.vwap else None
+                result["volume"] = snapshot.daily_bar.volume
+                result["high"] = float(snapshot.daily_bar.high)
+                result["low"] = float(snapshot.daily_bar.low)
 
-                results[symbol] = result
+            if snapshot.previous_daily_bar:
+                prev_close = float(snapshot.previous_daily_bar.close)
+                if result.get("current_price") and prev_close > 0:
+                    result["change_percent"] = ((result["current_price"] - prev_close) / prev_close) * 100
 
-            return results
+            results[symbol] = result
 
-        except Exception as e:
-            logger.error(f"Error fetching multi snapshots: {e}")
-            return {}
+        return results
 
     def get_crypto_snapshots(self, symbols: List[str]) -> Dict[str, Dict]:
         """
@@ -680,23 +742,7 @@ class AlpacaService:
             return None
 
         try:
-            # Convert period string to timedelta
-            period_map = {
-                "1d": 1, "5d": 5, "1mo": 30, "3mo": 90, "6mo": 180,
-                "1y": 365, "2y": 730, "5y": 1825, "10y": 3650,
-                "ytd": (datetime.now() - datetime(datetime.now().year, 1, 1)).days,
-                "max": 7300,
-            }
-
-            end_dt = datetime.now(timezone.utc)
-            if end_date:
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-
-            if start_date:
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            else:
-                days_back = period_map.get(period, 365)
-                start_dt = end_dt - timedelta(days=days_back)
+            start_dt, end_dt = self._history_window(start_date, end_date, period)
 
             request = StockBarsRequest(
                 symbol_or_symbols=symbol.upper(),
@@ -707,35 +753,209 @@ class AlpacaService:
             )
 
             bars = self._data_client.get_stock_bars(request)
+            return self._format_daily(symbol, bars)
 
-            symbol_upper = symbol.upper()
-            if hasattr(bars, "data") and symbol_upper in bars.data:
-                bar_list = bars.data[symbol_upper]
-            elif symbol_upper in bars:
-                bar_list = bars[symbol_upper]
-            else:
-                logger.warning(f"No historical bars for {symbol}")
-                return None
+        except Exception as e:
+            logger.error(f"Error fetching historical prices for {symbol}: {e}")
+            return None
 
-            if not bar_list:
-                return None
+    @staticmethod
+    def _history_window(
+        start_date: Optional[str], end_date: Optional[str], period: str,
+    ) -> Tuple[datetime, datetime]:
+        """Start/end datetimes for a daily-history request."""
+        # Convert period string to timedelta
+        period_map = {
+            "1d": 1, "5d": 5, "1mo": 30, "3mo": 90, "6mo": 180,
+            "1y": 365, "2y": 730, "5y": 1825, "10y": 3650,
+            "ytd": (datetime.now() - datetime(datetime.now().year, 1, 1)).days,
+            "max": 7300,
+        }
+
+        end_dt = datetime.now(timezone.utc)
+        if end_date:
+            end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+        if start_date:
+            start_dt = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        else:
+            days_back = period_map.get(period, 365)
+            start_dt = end_dt - timedelta(days=days_back)
+
+        return start_dt, end_dt
+
+    def _format_daily(self, symbol: str, bars: Any) -> Optional[pd.DataFrame]:
+        """get_historical_prices DataFrame from a BarSet."""
+        bar_list = self._bar_list(symbol, bars)
+        if bar_list is None:
+            logger.warning(f"No historical bars for {symbol}")
+            return None
+
+        if not bar_list:
+            return None
+
+        df = pd.DataFrame([{
+            "date": bar.timestamp,
+            "open": float(bar.open),
+            "high": float(bar.high),
+            "low": float(bar.low),
+            "close": float(bar.close),
+            "volume": int(bar.volume),
+        } for bar in bar_list])
+
+        return df.sort_values("date").reset_index(drop=True)
+
+    # Symbols per multi-symbol bars request (Alpaca paginates beyond this)
+    MULTI_BARS_CHUNK = 100
+
+    def get_multi_historical_prices(
+        self, symbols: List[str], period: str = "1y",
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Batched get_historical_prices: one bars request per chunk of symbols
+        instead of one per symbol. Returns {SYMBOL: DataFrame} in the same
+        format; symbols with no data are omitted.
+        """
+        if not self.is_available or not symbols:
+            return {}
+
+        start_dt, end_dt = self._history_window(None, None, period)
+
+        unique = list(dict.fromkeys(s.upper() for s in symbols))
+        results: Dict[str, pd.DataFrame] = {}
+        for i in range(0, len(unique), self.MULTI_BARS_CHUNK):
+            chunk = unique[i:i + self.MULTI_BARS_CHUNK]
+            try:
+                request = StockBarsRequest(
+                    symbol_or_symbols=chunk,
+                    timeframe=TimeFrame(1, TimeFrameUnit.Day),
+                    start=start_dt,
+                    end=end_dt,
+                    feed=self.data_feed,
+                )
+                bars = self._data_client.get_stock_bars(request)
+
+                for symbol in chunk:
+                    df = self._format_daily(symbol, bars)
+                    if df is not None:
+                        results[symbol] = df
+
+            except Exception as e:
+                logger.error(f"Error fetching batched historical prices ({len(chunk)} symbols): {e}")
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Async market data (native HTTP for event-loop callers)
+    # ------------------------------------------------------------------
+    # Same outputs as the sync methods: raw REST payloads are parsed by the
+    # SDK models and formatted by the same helpers.
+
+    def _async_ready(self, what: str) -> bool:
+        if not self.is_available or self._async_client is None:
+            logger.warning(f"Alpaca service not available for {what}")
+            return False
+        return True
+
+    async def get_bars_async(
+        self,
+        symbol: str,
+        timeframe: str = "5m",
+        limit: int = 100,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Optional[pd.DataFrame]:
+        """Async get_bars (live stream bars first, then REST)."""
+        live_eligible = start is None and end is None
+        if live_eligible:
+            live = self._get_live_bars(symbol, timeframe, limit)
+            if live is not None:
+                return live
+
+        if not self._async_ready(f"bars request: {symbol}"):
+            return None
+
+        try:
+            start, end = self._bars_window(timeframe, limit, start, end)
+            raw = await self._async_client.get_stock_bars(
+                [symbol.upper()],
+                timeframe=self._get_timeframe(timeframe).value,
+                start=start,
+                end=end,
+                limit=limit,
+                feed=self.data_feed,
+            )
+            df = self._format_bars(symbol, BarSet(raw), limit)
 
-            df = pd.DataFrame([{
-                "date": bar.timestamp,
-                "open": float(bar.open),
-                "high": float(bar.high),
-                "low": float(bar.low),
-                "close": float(bar.close),
-                "volume": int(bar.volume),
-            } for bar in bar_list])
+            if df is not None and live_eligible:
+                self._backfill_live_bars(symbol, timeframe, df, limit)
 
-            df = df.sort_values("date").reset_index(drop=True)
             return df
 
+        except Exception as e:
+            logger.error(f"Error fetching bars for {symbol}: {e}")
+            return None
+
+    async def get_snapshot_async(self, symbol: str) -> Optional[Dict]:
+        """Async get_snapshot."""
+        if not self._async_ready(f"snapshot request: {symbol}"):
+            return None
+
+        try:
+            raw = await self._async_client.get_stock_snapshots([symbol.upper()], feed=self.data_feed)
+            snapshots = parse_obj_as_symbol_dict(Snapshot, raw)
+            return self._format_snapshot(symbol, snapshots.get(symbol.upper()))
+
+        except Exception as e:
+            logger.error(f"Error fetching snapshot for {symbol}: {e}")
+            return None
+
+    async def get_multi_snapshots_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Async get_multi_snapshots."""
+        if not symbols or not self._async_ready("multi snapshots"):
+            return {}
+
+        try:
+            raw = await self._async_client.get_stock_snapshots(
+                [s.upper() for s in symbols], feed=self.data_feed,
+            )
+            return self._format_multi_snapshots(parse_obj_as_symbol_dict(Snapshot, raw))
+
+        except Exception as e:
+            logger.error(f"Error fetching multi snapshots: {e}")
+            return {}
+
+    async def get_historical_prices_async(
+        self,
+        symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        period: str = "1y",
+    ) -> Optional[pd.DataFrame]:
+        """Async get_historical_prices."""
+        if not self._async_ready(f"historical prices: {symbol}"):
+            return None
+
+        try:
+            start_dt, end_dt = self._history_window(start_date, end_date, period)
+            raw = await self._async_client.get_stock_bars(
+                [symbol.upper()],
+                timeframe=TimeFrame(1, TimeFrameUnit.Day).value,
+                start=start_dt,
+                end=end_dt,
+                feed=self.data_feed,
+            )
+            return self._format_daily(symbol, BarSet(raw))
+
         except Exception as e:
             logger.error(f"Error fetching historical prices for {symbol}: {e}")
             return None
 
+    async def close(self):
+        """Close the async client's connection pools (app shutdown)."""
+        if self._async_client is not None:
+            await self._async_client.close()
+
     # ------------------------------------------------------------------
     # Options chain methods (replaces Yahoo get_options_chain)
     # ------------------------------------------------------------------
@@ -0,0 +1,243 @@
+"""
+Live Bar Aggregator
+Rolls streamed trades into 1m/5m/15m/1h OHLCV bars held in fixed-size
+NumPy ring buffers, one per (symbol, timeframe).
+
+Bars are bucketed on UTC epoch boundaries, matching Alpaca's REST bars, and
+the newest bar is the in-progress one (REST returns it the same way). A
+ring must be seeded from REST before it is served, so history always comes
+from the REST backfill and the stream only extends it.
+
+Gaps: any stream (re)connect invalidates every ring — trades during the
+outage are lost, so the next read falls back to REST and re-seeds.
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Timeframes aggregated from the stream → bucket width in nanoseconds
+LIVE_TIMEFRAMES: Dict[str, int] = {
+    "1m": 60 * 10**9,
+    "5m": 5 * 60 * 10**9,
+    "15m": 15 * 60 * 10**9,
+    "1h": 60 * 60 * 10**9,
+}
+
+# Ring capacity per timeframe — covers AlpacaService.TOD_BAR_LIMITS
+RING_CAPACITY: Dict[str, int] = {
+    "1m": 1024,
+    "5m": 1024,
+    "15m": 512,
+    "1h": 512,
+}
+
+BAR_DTYPE = np.dtype([
+    ("ts", "i8"),        # bucket start, ns since epoch (UTC)
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("pv", "f8"),        # sum(price * size) — vwap = pv / volume
+    ("trades", "i4"),
+])
+
+
+class BarRing:
+    """Fixed-capacity circular buffer of bars, oldest → newest."""
+
+    __slots__ = ("_data", "_start", "_count", "exhausted")
+
+    def __init__(self, capacity: int):
+        self._data = np.zeros(capacity, dtype=BAR_DTYPE)
+        self._start = 0
+        self._count = 0
+        # True when REST had fewer bars than requested (short history)
+        self.exhausted = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def _pos(self, i: int) -> int:
+        return (self._start + i) % len(self._data)
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        if not self._count:
+            return None
+        return int(self._data["ts"][self._pos(self._count - 1)])
+
+    def append(self, bar: Tuple) -> None:
+        cap = len(self._data)
+        if self._count < cap:
+            self._data[self._pos(self._count)] = bar
+            self._count += 1
+        else:
+            self._data[self._start] = bar
+            self._start = (self._start + 1) % cap
+
+    def add_trade(self, bucket: int, price: float, size: float) -> bool:
+        """
+        Merge one trade. Returns False for trades older than the newest bar
+        (out-of-order prints are dropped rather than rewriting history).
+        """
+        last = self.last_ts
+        if last is None or bucket > last:
+            self.append((bucket, price, price, price, price, size, price * size, 1))
+            return True
+        if bucket < last:
+            return False
+        row = self._data[self._pos(self._count - 1)]
+        if price > row["high"]:
+            row["high"] = price
+        if price < row["low"]:
+            row["low"] = price
+        row["close"] = price
+        row["volume"] += size
+        row["pv"] += price * size
+        row["trades"] += 1
+        return True
+
+    def ordered(self, limit: Optional[int] = None) -> np.ndarray:
+        """Chronological copy of the newest `limit` bars."""
+        n = self._count if limit is None else min(limit, self._count)
+        if not n:
+            return self._data[:0].copy()
+        first = self._start + self._count - n
+        idx = np.arange(first, first + n) % len(self._data)
+        return self._data[idx]
+
+    def reset(self, bars: np.ndarray, exhausted: bool = False) -> None:
+        bars = bars[-len(self._data):]
+        self._data[:len(bars)] = bars
+        self._start = 0
+        self._count = len(bars)
+        self.exhausted = exhausted
+
+
+def _frame_to_bars(df: pd.DataFrame) -> np.ndarray:
+    """Convert an AlpacaService.get_bars DataFrame into BAR_DTYPE rows."""
+    out = np.zeros(len(df), dtype=BAR_DTYPE)
+    ts = pd.to_datetime(df["datetime"], utc=True)
+    out["ts"] = ts.dt.as_unit("ns").astype("int64").to_numpy()
+    for col in ("open", "high", "low", "close", "volume"):
+        out[col] = df[col].to_numpy(dtype="f8")
+    vwap = df["vwap"].to_numpy(dtype="f8") if "vwap" in df.columns else out["close"]
+    out["pv"] = np.nan_to_num(vwap, nan=0.0) * out["volume"]
+    if "trades" in df.columns:
+        out["trades"] = df["trades"].fillna(0).to_numpy(dtype="i4")
+    return out
+
+
+def _bars_to_frame(bars: np.ndarray) -> pd.DataFrame:
+    """Convert BAR_DTYPE rows into the AlpacaService.get_bars DataFrame shape."""
+    volume = bars["volume"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = np.where(volume > 0, bars["pv"] / volume, bars["close"])
+    return pd.DataFrame({
+        "open": bars["open"],
+        "high": bars["high"],
+        "low": bars["low"],
+        "close": bars["close"],
+        "volume": volume,
+        "vwap": vwap,
+        "trades": bars["trades"].astype("int64"),
+        "datetime": pd.to_datetime(bars["ts"], utc=True),
+    })
+
+
+class LiveBarStore:
+    """
+    Thread-safe collection of BarRings keyed by (symbol, timeframe).
+
+    Written from the stream thread (add_trade), read from request/job
+    threads (get_frame). Rings only become readable after seed().
+    """
+
+    def __init__(self):
+        self._rings: Dict[Tuple[str, str], BarRing] = {}
+        self._lock = threading.Lock()
+        self.trades_aggregated = 0
+        self.trades_dropped = 0
+
+    def add_trade(self, symbol: str, timestamp: datetime, price: float, size: float) -> None:
+        ts_ns = int(timestamp.timestamp() * 10**9)
+        merged = dropped = False
+        with self._lock:
+            for tf, width in LIVE_TIMEFRAMES.items():
+                ring = self._rings.get((symbol, tf))
+                if ring is None:
+                    continue  # not seeded yet — REST backfill owns history
+                if ring.add_trade(ts_ns - ts_ns % width, price, size):
+                    merged = True
+                else:
+                    dropped = True
+            self.trades_aggregated += merged
+            self.trades_dropped += dropped
+
+    def seed(self, symbol: str, timeframe: str, df: pd.DataFrame, requested: int) -> bool:
+        """
+        Load REST bars into the ring, keeping any streamed bars newer than
+        the REST snapshot. Returns False for unsupported timeframes.
+        """
+        if timeframe not in LIVE_TIMEFRAMES or df is None or df.empty:
+            return False
+        rest = _frame_to_bars(df)
+        with self._lock:
+            ring = self._rings.get((symbol, timeframe))
+            if ring is None:
+                ring = BarRing(RING_CAPACITY[timeframe])
+                self._rings[(symbol, timeframe)] = ring
+            elif len(ring):
+                live = ring.ordered()
+                newer = live[live["ts"] > rest["ts"][-1]]
+                if len(newer):
+                    rest = np.concatenate([rest, newer])
+            ring.reset(rest, exhausted=len(df) < requested)
+        return True
+
+    def get_frame(self, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
+        """Newest `limit` bars as a DataFrame, or None if the ring can't satisfy it."""
+        with self._lock:
+            ring = self._rings.get((symbol, timeframe))
+            if ring is None or not len(ring):
+                return None
+            if len(ring) < limit and not ring.exhausted:
+                return None
+            bars = ring.ordered(limit)
+        return _bars_to_frame(bars)
+
+    def get_latest_bar(self, symbol: str, timeframe: str = "1m") -> Optional[Dict]:
+        with self._lock:
+            ring = self._rings.get((symbol, timeframe))
+            if ring is None or not len(ring):
+                return None
+            row = ring.ordered(1)
+        return _bars_to_frame(row).iloc[0].to_dict()
+
+    def drop(self, symbols: Iterable[str]) -> None:
+        symbols = set(symbols)
+        with self._lock:
+            for key in [k for k in self._rings if k[0] in symbols]:
+                del self._rings[key]
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._rings.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "rings": len(self._rings),
+                "symbols": len({k[0] for k in self._rings}),
+                "bars": sum(len(r) for r in self._rings.values()),
+                "trades_aggregated": self.trades_aggregated,
+                "trades_dropped": self.trades_dropped,
+            }
@@ -39,7 +39,9 @@ class FMPService:
         self.api_key = settings.FMP_API_KEY
         # FMP Ultimate: 3000 calls/min → 50/sec
         self.rate_limiter = RateLimiter(max_requests=50, time_window=1)
-        self._session: Optional[aiohttp.ClientSession] = None
+        # One aiohttp session per event loop: the sync wrappers run on the
+        # background loop, async callers (screening pipeline) on the app loop
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
         # Dedicated event loop for sync wrappers (avoids "event loop closed" errors)
         self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
         self._bg_thread: Optional[threading.Thread] = None
@@ -64,15 +66,25 @@ class FMPService:
         return future.result(timeout=60)
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30)
             )
-        return self._session
+            self._sessions[loop] = session
+        return session
 
     async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
+        current = asyncio.get_running_loop()
+        for loop, session in list(self._sessions.items()):
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+        self._sessions.clear()
 
     def _cache_key(self, prefix: str, symbol: str, **kwargs) -> str:
         parts = [f"fmp:{prefix}", symbol.upper()]
@@ -86,9 +98,8 @@ class FMPService:
             logger.warning("FMP API key not configured")
             return None
 
-        # Use non-blocking rate limit check — run blocking wait_if_needed in thread
-        # to avoid blocking the event loop
-        await asyncio.to_thread(self.rate_limiter.wait_if_needed)
+        # Rate limit without blocking the event loop (or parking a thread)
+        await self.rate_limiter.wait_async()
 
         if params is None:
             params = {}
@@ -152,6 +163,10 @@ class FMPService:
         """
         return self._run_sync(self._get_stock_info_async(symbol))
 
+    async def get_stock_info_async(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """get_stock_info for callers already on an event loop."""
+        return await self._get_stock_info_async(symbol)
+
     async def _get_stock_info_async(self, symbol: str) -> Optional[Dict[str, Any]]:
         ck = self._cache_key("stock_info", symbol)
         cached = cache.get(ck)
@@ -195,6 +210,10 @@ class FMPService:
         """
         return self._run_sync(self._get_fundamentals_async(symbol))
 
+    async def get_fundamentals_async(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """get_fundamentals for callers already on an event loop."""
+        return await self._get_fundamentals_async(symbol)
+
     async def _get_fundamentals_async(self, symbol: str) -> Optional[Dict[str, Any]]:
         ck = self._cache_key("fundamentals", symbol)
         cached = cache.get(ck)
@@ -627,7 +646,7 @@ class FMPService:
     # Stock Screener (Dynamic Universe)
     # ------------------------------------------------------------------
 
-    async def _get_screener_universe_async(
+    async def _get_screener_rows_async(
         self,
         market_cap_min: int = 500_000_000,
         market_cap_max: int = 100_000_000_000,
@@ -636,19 +655,20 @@ class FMPService:
         volume_min: int = 100_000,
         sector: Optional[str] = None,
         limit: int = 1000,
-    ) -> List[str]:
+    ) -> List[Dict[str, Any]]:
         """
         Fetch a dynamic stock universe from FMP's company screener.
 
-        Returns a list of ticker symbols matching the given criteria.
-        Results are cached in Redis for 4 hours.
+        Returns one row per symbol: {symbol, price, market_cap, volume, sector},
+        which the screening engine's universe gate checks before any
+        per-symbol fetch. Results are cached in Redis for 4 hours.
         """
         import hashlib
 
         # Build a stable cache key from params
         param_str = f"{market_cap_min}:{market_cap_max}:{price_min}:{price_max}:{volume_min}:{sector}:{limit}"
         param_hash = hashlib.md5(param_str.encode()).hexdigest()[:12]
-        ck = f"fmp:screener_universe:{param_hash}"
+        ck = f"fmp:screener_rows:{param_hash}"
 
         cached = cache.get(ck)
         if cached is not None:
@@ -680,18 +700,24 @@ class FMPService:
             logger.warning("FMP screener returned no data, falling back to hardcoded universe")
             return []
 
-        symbols = []
+        rows = []
         for item in data:
             symbol = item.get("symbol")
             if symbol and isinstance(symbol, str) and "." not in symbol and "-" not in symbol:
-                symbols.append(symbol.upper())
+                rows.append({
+                    "symbol": symbol.upper(),
+                    "price": item.get("price"),
+                    "market_cap": item.get("marketCap"),
+                    "volume": item.get("volume"),
+                    "sector": item.get("sector"),
+                })
 
         # Cache for 4 hours
-        cache.set(ck, symbols, ttl=14400)
-        logger.info(f"FMP screener universe: {len(symbols)} symbols (cached 4h)")
-        return symbols
+        cache.set(ck, rows, ttl=14400)
+        logger.info(f"FMP screener universe: {len(rows)} symbols (cached 4h)")
+        return rows
 
-    def get_screener_universe(
+    def get_screener_rows(
         self,
         market_cap_min: int = 500_000_000,
         market_cap_max: int = 100_000_000_000,
@@ -700,10 +726,10 @@ class FMPService:
         volume_min: int = 100_000,
         sector: Optional[str] = None,
         limit: int = 1000,
-    ) -> List[str]:
-        """Synchronous wrapper for get_screener_universe."""
+    ) -> List[Dict[str, Any]]:
+        """Synchronous wrapper for _get_screener_rows_async."""
         return self._run_sync(
-            self._get_screener_universe_async(
+            self._get_screener_rows_async(
                 market_cap_min=market_cap_min,
                 market_cap_max=market_cap_max,
                 price_min=price_min,
@@ -714,6 +740,10 @@ class FMPService:
             )
         )
 
+    def get_screener_universe(self, **kwargs) -> List[str]:
+        """Symbols only from get_screener_rows (same arguments)."""
+        return [row["symbol"] for row in self.get_screener_rows(**kwargs)]
+
     def get_bulk_strategy_metrics(self, symbols: list) -> Dict[str, Dict[str, Any]]:
         """
         Fetch strategy metrics for multiple symbols.
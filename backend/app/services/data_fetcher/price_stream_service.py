@@ -1,6 +1,10 @@
 """
 Real-time Price Stream Service
 WebSocket streaming via Alpaca StockDataStream
+
+Besides fanning out ticks, trades are rolled into live 1m/5m/15m/1h bars
+(see bar_aggregator.py) so AlpacaService.get_bars can serve subscribed
+symbols without a REST round-trip.
 """
 import asyncio
 import threading
@@ -9,6 +13,7 @@ from datetime import datetime, timezone
 from loguru import logger
 
 from app.config import get_settings
+from app.services.data_fetcher.bar_aggregator import LiveBarStore, LIVE_TIMEFRAMES
 
 settings = get_settings()
 
@@ -47,6 +52,13 @@ class PriceStreamService:
 
         self._stream: Optional[StockDataStream] = None
         self._subscribed_symbols: Set[str] = set()
+        # Symbols held by server-side consumers (owner -> symbols), e.g. the
+        # streaming exit watcher and the signal queue. Client-driven
+        # unsubscribes never drop a pinned symbol.
+        self._pins: Dict[str, Set[str]] = {}
+        # Symbols WebSocket clients hold (subscribe/unsubscribe); a symbol is
+        # dropped from the stream once it is neither pinned nor client-held
+        self._client_symbols: Set[str] = set()
         self._callbacks: Set[Callable] = set()
         self._running = False
         self._stream_thread: Optional[threading.Thread] = None
@@ -56,6 +68,9 @@ class PriceStreamService:
         # Latest prices cache (for new subscribers)
         self._latest_prices: Dict[str, Dict[str, Any]] = {}
 
+        # Live intraday bars aggregated from trades
+        self._bars = LiveBarStore()
+
         # Event loop reference for async callbacks
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
@@ -95,12 +110,14 @@ class PriceStreamService:
         """Handle incoming trade data from Alpaca (sync handler)"""
         try:
             symbol = trade.symbol
+            trade_ts = trade.timestamp or datetime.now(timezone.utc)
+            self._bars.add_trade(symbol, trade_ts, float(trade.price), float(trade.size))
             price_data = {
                 "type": "trade",
                 "symbol": symbol,
                 "price": float(trade.price),
                 "size": int(trade.size),
-                "timestamp": trade.timestamp.isoformat() if trade.timestamp else datetime.now(timezone.utc).isoformat(),
+                "timestamp": trade_ts.isoformat(),
                 "conditions": list(getattr(trade, 'conditions', []) or []),
             }
 
@@ -168,6 +185,8 @@ class PriceStreamService:
                 logger.info(f"Subscribed to {len(symbols)} symbols: {symbols[:5]}{'...' if len(symbols) > 5 else ''}")
 
             logger.info(f"Starting Alpaca price stream (feed: {self.data_feed})")
+            # Trades missed while disconnected can't be recovered — force REST re-seed
+            self._bars.invalidate_all()
             self._running = True
 
             # Run stream (this blocks until stopped)
@@ -177,6 +196,7 @@ class PriceStreamService:
             logger.error(f"Price stream error: {e}")
         finally:
             self._running = False
+            self._bars.invalidate_all()
             logger.info("Price stream thread exited")
 
     async def start(self) -> None:
@@ -219,7 +239,18 @@ class PriceStreamService:
         logger.info("Price stream stopped")
 
     async def subscribe(self, symbols: Set[str]) -> None:
-        """Subscribe to symbols for price updates"""
+        """Subscribe to symbols for price updates (on behalf of WebSocket clients)"""
+        with self._lock:
+            self._client_symbols.update(symbols)
+        await self._add_stream_symbols(symbols)
+
+    async def unsubscribe(self, symbols: Set[str]) -> None:
+        """Unsubscribe from symbols no WebSocket client holds any more (pinned ones stay)"""
+        with self._lock:
+            self._client_symbols -= symbols
+        await self._drop_unused(symbols)
+
+    async def _add_stream_symbols(self, symbols: Set[str]) -> None:
         async with self._async_lock:
             new_symbols = symbols - self._subscribed_symbols
 
@@ -238,17 +269,19 @@ class PriceStreamService:
                 except Exception as e:
                     logger.error(f"Error subscribing to symbols: {e}")
 
-    async def unsubscribe(self, symbols: Set[str]) -> None:
-        """Unsubscribe from symbols"""
+    async def _drop_unused(self, symbols: Set[str]) -> None:
+        """Unsubscribe those of `symbols` that no owner pins and no client holds."""
         async with self._async_lock:
             with self._lock:
-                symbols_to_remove = symbols & self._subscribed_symbols
+                pinned = set().union(*self._pins.values()) if self._pins else set()
+                symbols_to_remove = (symbols & self._subscribed_symbols) - pinned - self._client_symbols
 
             if not symbols_to_remove:
                 return
 
             with self._lock:
                 self._subscribed_symbols -= symbols_to_remove
+            self._bars.drop(symbols_to_remove)
 
             logger.info(f"Unsubscribing from symbols: {symbols_to_remove}")
 
@@ -259,6 +292,79 @@ class PriceStreamService:
                 except Exception as e:
                     logger.error(f"Error unsubscribing from symbols: {e}")
 
+    async def track_symbols(self, owner: str, symbols: Set[str]) -> None:
+        """
+        Make `symbols` the full pinned set for `owner`: subscribe and pin new
+        ones, unpin ones the owner no longer needs, and start the stream if
+        there is anything to watch. Dropped symbols are unsubscribed unless
+        another owner pins them or a WebSocket client holds them.
+        """
+        symbols = set(symbols)
+        with self._lock:
+            previous = self._pins.get(owner, set())
+        added = symbols - previous
+
+        if added:
+            await self._add_stream_symbols(added)
+        with self._lock:
+            if symbols:
+                self._pins[owner] = symbols
+            else:
+                self._pins.pop(owner, None)
+        if previous - symbols:
+            await self._drop_unused(previous - symbols)
+
+        if symbols and not self._running and self.is_available:
+            await self.start()
+
+    def release_symbols(self, owner: str) -> None:
+        """Drop all pins held by `owner` (shutdown path; symbols stay subscribed)"""
+        with self._lock:
+            self._pins.pop(owner, None)
+
+    def pinned_symbols(self, owner: Optional[str] = None) -> Set[str]:
+        """Symbols pinned by `owner` (or by anyone)"""
+        with self._lock:
+            if owner is not None:
+                return set(self._pins.get(owner, set()))
+            return set().union(*self._pins.values()) if self._pins else set()
+
+    # ------------------------------------------------------------------
+    # Live bars
+    # ------------------------------------------------------------------
+
+    def get_live_bars(self, symbol: str, timeframe: str, limit: int):
+        """
+        Streamed bars for a subscribed symbol in AlpacaService.get_bars format,
+        or None when the stream can't serve them (not running, not subscribed,
+        not yet seeded, or not enough history) — callers fall back to REST.
+        """
+        if timeframe not in LIVE_TIMEFRAMES or not self._running:
+            return None
+        with self._lock:
+            if symbol not in self._subscribed_symbols:
+                return None
+        return self._bars.get_frame(symbol, timeframe, limit)
+
+    def backfill_bars(self, symbol: str, timeframe: str, df, requested: int) -> bool:
+        """Seed a symbol's live bars from a REST response (startup / after a gap)"""
+        if timeframe not in LIVE_TIMEFRAMES or not self._running:
+            return False
+        with self._lock:
+            if symbol not in self._subscribed_symbols:
+                return False
+        return self._bars.seed(symbol, timeframe, df, requested)
+
+    def get_latest_bar(self, symbol: str, timeframe: str = "1m") -> Optional[Dict[str, Any]]:
+        """Newest (in-progress) live bar for a symbol, if seeded"""
+        if not self._running:
+            return None
+        return self._bars.get_latest_bar(symbol, timeframe)
+
+    def get_bar_stats(self) -> Dict[str, Any]:
+        """Live bar store counters (for health/debug)"""
+        return self._bars.stats()
+
     def get_latest_price(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get the latest cached price for a symbol"""
         with self._lock:
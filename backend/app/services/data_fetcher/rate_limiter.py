@@ -1,6 +1,7 @@
 """
 Rate limiter for API requests
 """
+import asyncio
 import time
 from collections import deque
 from threading import Lock
@@ -44,6 +45,21 @@ class RateLimiter:
             # Record this request
             self.requests.append(time.time())
 
+    async def wait_async(self):
+        """wait_if_needed for coroutines: sleeps on the event loop, not a thread"""
+        while True:
+            with self.lock:
+                now = time.time()
+                while self.requests and self.requests[0] < now - self.time_window:
+                    self.requests.popleft()
+
+                if len(self.requests) < self.max_requests:
+                    self.requests.append(now)
+                    return
+                sleep_time = self.time_window - (now - self.requests[0])
+
+            await asyncio.sleep(max(sleep_time, 0.001))
+
     def can_make_request(self) -> bool:
         """Check if we can make a request without waiting"""
         with self.lock:
@@ -16,6 +16,39 @@ import aiohttp
 
 from app.config import get_settings
 from app.services.cache import cache_service
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+# Headline sentiment keywords and their weights (negative weights are already negative)
+_POSITIVE_KEYWORDS = {
+    'surge': 0.8, 'soar': 0.8, 'jump': 0.6, 'rally': 0.7,
+    'beat': 0.6, 'beats': 0.6, 'exceed': 0.6, 'exceeds': 0.6,
+    'upgrade': 0.7, 'upgrades': 0.7, 'bullish': 0.7,
+    'strong': 0.4, 'growth': 0.3, 'profit': 0.3, 'gains': 0.5,
+    'breakthrough': 0.7, 'launch': 0.3, 'partnership': 0.4,
+    'acquisition': 0.3, 'record': 0.5, 'outperform': 0.6,
+    'buy': 0.5, 'positive': 0.4, 'success': 0.5, 'winner': 0.5,
+    'rise': 0.4, 'rises': 0.4, 'raised': 0.4, 'raises': 0.4,
+    'higher': 0.3, 'boost': 0.5, 'boosts': 0.5
+}
+
+_NEGATIVE_KEYWORDS = {
+    'crash': -0.9, 'plunge': -0.8, 'tank': -0.7, 'tumble': -0.7,
+    'miss': -0.6, 'misses': -0.6, 'disappoints': -0.6,
+    'downgrade': -0.7, 'downgrades': -0.7, 'bearish': -0.7,
+    'weak': -0.4, 'loss': -0.5, 'losses': -0.5, 'decline': -0.4,
+    'declines': -0.4, 'drops': -0.5, 'drop': -0.5,
+    'fall': -0.4, 'falls': -0.4, 'fell': -0.5,
+    'lawsuit': -0.5, 'investigation': -0.5, 'fraud': -0.8,
+    'recall': -0.6, 'warning': -0.5, 'concern': -0.3,
+    'sell': -0.4, 'negative': -0.4, 'failure': -0.6,
+    'lower': -0.3, 'cuts': -0.4, 'cut': -0.4, 'layoffs': -0.6
+}
+
+_SENTIMENT_MATCHER = KeywordMatcher({
+    'positive': _POSITIVE_KEYWORDS,
+    'negative': _NEGATIVE_KEYWORDS,
+})
 
 
 @dataclass
@@ -267,54 +300,21 @@ class SentimentFetcher:
         - OpenAI/Claude API for more nuanced analysis
         - VADER (general purpose)
         """
-        headline_lower = headline.lower()
-
-        # Positive keywords and their weights
-        positive_keywords = {
-            'surge': 0.8, 'soar': 0.8, 'jump': 0.6, 'rally': 0.7,
-            'beat': 0.6, 'beats': 0.6, 'exceed': 0.6, 'exceeds': 0.6,
-            'upgrade': 0.7, 'upgrades': 0.7, 'bullish': 0.7,
-            'strong': 0.4, 'growth': 0.3, 'profit': 0.3, 'gains': 0.5,
-            'breakthrough': 0.7, 'launch': 0.3, 'partnership': 0.4,
-            'acquisition': 0.3, 'record': 0.5, 'outperform': 0.6,
-            'buy': 0.5, 'positive': 0.4, 'success': 0.5, 'winner': 0.5,
-            'rise': 0.4, 'rises': 0.4, 'raised': 0.4, 'raises': 0.4,
-            'higher': 0.3, 'boost': 0.5, 'boosts': 0.5
-        }
-
-        # Negative keywords and their weights
-        negative_keywords = {
-            'crash': -0.9, 'plunge': -0.8, 'tank': -0.7, 'tumble': -0.7,
-            'miss': -0.6, 'misses': -0.6, 'disappoints': -0.6,
-            'downgrade': -0.7, 'downgrades': -0.7, 'bearish': -0.7,
-            'weak': -0.4, 'loss': -0.5, 'losses': -0.5, 'decline': -0.4,
-            'decline': -0.4, 'declines': -0.4, 'drops': -0.5, 'drop': -0.5,
-            'fall': -0.4, 'falls': -0.4, 'fell': -0.5,
-            'lawsuit': -0.5, 'investigation': -0.5, 'fraud': -0.8,
-            'recall': -0.6, 'warning': -0.5, 'concern': -0.3,
-            'sell': -0.4, 'negative': -0.4, 'failure': -0.6,
-            'lower': -0.3, 'cuts': -0.4, 'cut': -0.4, 'layoffs': -0.6
-        }
-
-        # Calculate score
-        score = 0.0
-        word_count = 0
-
-        for word, weight in positive_keywords.items():
-            if word in headline_lower:
-                score += weight
-                word_count += 1
+        return self.score_headlines_sentiment([headline])[0]
 
-        for word, weight in negative_keywords.items():
-            if word in headline_lower:
-                score += weight  # weight is already negative
-                word_count += 1
-
-        # Normalize to -1 to 1
-        if word_count > 0:
-            score = max(-1.0, min(1.0, score / max(word_count, 1)))
-
-        return score
+    def score_headlines_sentiment(self, headlines: List[str]) -> List[float]:
+        """
+        score_headline_sentiment for a batch of headlines, matched in one pass.
+        """
+        scores = []
+        for hits in _SENTIMENT_MATCHER.match_batch(headlines):
+            weights = KeywordMatcher.weights(hits, ('positive', 'negative'))
+            score = 0.0
+            # Normalize to -1 to 1
+            if weights:
+                score = max(-1.0, min(1.0, sum(weights) / len(weights)))
+            scores.append(score)
+        return scores
 
     # -------------------------------------------------------------------------
     # Analyst Ratings (from FMP)
@@ -499,8 +499,9 @@ class SentimentFetcher:
         all_news = list(fmp_news) + list(newsapi_news or [])
 
         # Score news sentiment
-        for news_item in all_news:
-            news_item.sentiment_score = self.score_headline_sentiment(news_item.title)
+        scores = self.score_headlines_sentiment([n.title for n in all_news])
+        for news_item, score in zip(all_news, scores):
+            news_item.sentiment_score = score
 
         # Calculate aggregate scores
         sentiment_data = SentimentData(
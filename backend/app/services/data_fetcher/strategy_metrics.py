@@ -0,0 +1,167 @@
+"""
+Local Strategy Metrics
+Derives the StrategySelector metrics dict ({rsi, sma20, sma50, sma200, atr,
+ema12, ema26, adx}) from Alpaca daily bars instead of eight FMP
+technical-indicator requests per symbol.
+
+All requested symbols are computed in one vectorized pass: each symbol's
+bars become one column of a right-aligned matrix (newest bar in the last
+row, shorter histories padded with NaN at the top), so every rolling/EWM
+window runs over that symbol's own consecutive bars.
+
+RSI, ATR and ADX use Wilder smoothing — the definitions FMP serves — so the
+selector's thresholds keep their meaning. An indicator without enough
+history is None, as it would be from FMP. Symbols with no bars fall back
+to FMPService.get_bulk_strategy_metrics.
+"""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.config import get_settings
+from app.services.cache import cache
+
+settings = get_settings()
+
+# Bars kept per symbol — SMA200 plus warm-up for the EMAs/Wilder averages
+LOOKBACK_ROWS = 260
+
+METRIC_KEYS = ("rsi", "sma20", "sma50", "sma200", "atr", "ema12", "ema26", "adx")
+
+
+def _stack(bars: List[pd.DataFrame], column: str, rows: int) -> pd.DataFrame:
+    """Right-aligned (rows × symbols) matrix of one OHLC column."""
+    out = np.full((rows, len(bars)), np.nan)
+    for j, df in enumerate(bars):
+        values = df[column].to_numpy(dtype="f8")[-rows:]
+        out[rows - len(values):, j] = values
+    return pd.DataFrame(out)
+
+
+def _wilder(df: pd.DataFrame, period: int) -> pd.DataFrame:
+    return df.ewm(alpha=1.0 / period, min_periods=period, adjust=False).mean()
+
+
+def compute_strategy_metrics(bars: Dict[str, pd.DataFrame]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Metrics for every symbol in `bars` ({SYMBOL: daily OHLCV DataFrame,
+    oldest first}). Returns {SYMBOL: metrics dict or None}.
+    """
+    symbols = [s for s, df in bars.items() if df is not None and not df.empty]
+    if not symbols:
+        return {}
+
+    frames = [bars[s] for s in symbols]
+    rows = min(LOOKBACK_ROWS, max(len(df) for df in frames))
+    close = _stack(frames, "close", rows)
+    high = _stack(frames, "high", rows)
+    low = _stack(frames, "low", rows)
+
+    # Trend
+    sma20 = close.rolling(20).mean()
+    sma50 = close.rolling(50).mean()
+    sma200 = close.rolling(200).mean()
+    ema12 = close.ewm(span=12, min_periods=12, adjust=False).mean()
+    ema26 = close.ewm(span=26, min_periods=26, adjust=False).mean()
+
+    # RSI (Wilder)
+    delta = close.diff()
+    avg_gain = _wilder(delta.clip(lower=0), 14)
+    avg_loss = _wilder(-delta.clip(upper=0), 14)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    # ATR (Wilder) — fmax skips the missing previous close on the first bar
+    prev_close = close.shift()
+    tr = pd.DataFrame(np.fmax(
+        np.fmax(high - low, (high - prev_close).abs()),
+        (low - prev_close).abs(),
+    ))
+    atr = _wilder(tr, 14)
+
+    # ADX (Wilder)
+    up = high.diff()
+    down = -low.diff()
+    plus_dm = up.where((up > down) & (up > 0), 0.0).where(up.notna())
+    minus_dm = down.where((down > up) & (down > 0), 0.0).where(down.notna())
+    atr_dm = _wilder(tr.where(up.notna()), 14).replace(0, np.nan)
+    plus_di = 100 * _wilder(plus_dm, 14) / atr_dm
+    minus_di = 100 * _wilder(minus_dm, 14) / atr_dm
+    dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan)
+    adx = _wilder(dx, 14)
+
+    latest = pd.DataFrame({
+        "rsi": rsi.iloc[-1],
+        "sma20": sma20.iloc[-1],
+        "sma50": sma50.iloc[-1],
+        "sma200": sma200.iloc[-1],
+        "atr": atr.iloc[-1],
+        "ema12": ema12.iloc[-1],
+        "ema26": ema26.iloc[-1],
+        "adx": adx.iloc[-1],
+    }).replace([np.inf, -np.inf], np.nan)
+
+    result: Dict[str, Optional[Dict[str, Any]]] = {}
+    for j, symbol in enumerate(symbols):
+        row = latest.iloc[j]
+        metrics = {k: (None if pd.isna(row[k]) else float(row[k])) for k in METRIC_KEYS}
+        result[symbol] = metrics if any(v is not None for v in metrics.values()) else None
+    return result
+
+
+class LocalStrategyMetrics:
+    """
+    Bulk strategy metrics from batched Alpaca daily bars, FMP as fallback.
+    Same output schema as FMPService.get_bulk_strategy_metrics.
+    """
+
+    def _cache_key(self, symbol: str) -> str:
+        return f"local:strategy_metrics:{symbol.upper()}"
+
+    def get_strategy_metrics(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self.get_bulk_strategy_metrics([symbol]).get(symbol)
+
+    def get_bulk_strategy_metrics(self, symbols: list) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns: {symbol: {rsi, sma20, sma50, ...} or None, ...}
+        """
+        bulk: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        for symbol in symbols:
+            cached = cache.get(self._cache_key(symbol))
+            if cached is not None:
+                bulk[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if missing:
+            from app.services.data_fetcher.alpaca_service import alpaca_service
+
+            try:
+                bars = alpaca_service.get_multi_historical_prices(missing, period="1y")
+                computed = compute_strategy_metrics(bars)
+            except Exception as e:
+                logger.warning(f"Local strategy metrics failed, falling back to FMP: {e}")
+                computed = {}
+
+            fallback = []
+            for symbol in missing:
+                metrics = computed.get(symbol.upper())
+                if metrics is None:
+                    fallback.append(symbol)
+                    continue
+                cache.set(self._cache_key(symbol), metrics, ttl=settings.CACHE_TTL_TECHNICAL_INDICATORS)
+                bulk[symbol] = metrics
+
+            if fallback:
+                logger.info(f"Strategy metrics: {len(fallback)}/{len(symbols)} symbols via FMP fallback")
+                from app.services.data_fetcher.fmp_service import fmp_service
+                bulk.update(fmp_service.get_bulk_strategy_metrics(fallback))
+
+        return {symbol: bulk.get(symbol) for symbol in symbols}
+
+
+# Singleton instance
+local_strategy_metrics = LocalStrategyMetrics()
@@ -6,35 +6,40 @@ This service provides:
 - Market metrics (IV rank, IV percentile, beta)
 - Real-time streaming quotes (optional)
 """
+import importlib.util
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from loguru import logger
 
 from app.config import get_settings
+from app.services.data_fetcher.tastytrade_metrics import MetricsLoader
 
-# TastyTrade SDK imports
-try:
-    from tastytrade import Session
-    from tastytrade.instruments import NestedOptionChain, Option, get_option_chain
-    from tastytrade.metrics import get_market_metrics, MarketMetricInfo
-    TASTYTRADE_AVAILABLE = True
-except ImportError:
-    TASTYTRADE_AVAILABLE = False
+# TastyTrade SDK (imported where used: it pulls in pandas_market_calendars
+# and takes ~0.5s, which every importer of data_fetcher would otherwise pay)
+TASTYTRADE_AVAILABLE = importlib.util.find_spec("tastytrade") is not None
+if not TASTYTRADE_AVAILABLE:
     logger.warning("TastyTrade SDK not installed. Run: pip install tastytrade")
 
+if TYPE_CHECKING:
+    from tastytrade import Session
+    from tastytrade.metrics import MarketMetricInfo
+
 
 class TastyTradeService:
     """
     Service for fetching enhanced options data from TastyTrade API.
 
     Provides IV rank, Greeks, and detailed options chain information.
+    Per-symbol metric lookups (IV rank, IV percentile, beta) go through a
+    batching cache (self.metrics) — see tastytrade_metrics.py.
     """
 
     def __init__(self):
-        self.session: Optional[Session] = None
+        self.session: Optional["Session"] = None
         self.session_expiration: Optional[datetime] = None
         self._initialized = False
+        self.metrics = MetricsLoader(self.get_market_metrics)
 
     def initialize(self, provider_secret: str, refresh_token: str) -> bool:
         """
@@ -56,6 +61,8 @@ class TastyTradeService:
             return False
 
         try:
+            from tastytrade import Session
+
             self.session = Session(
                 provider_secret=provider_secret,
                 refresh_token=refresh_token
@@ -88,7 +95,7 @@ class TastyTradeService:
                     return False
         return True
 
-    def get_market_metrics(self, symbols: list[str]) -> dict[str, MarketMetricInfo]:
+    def get_market_metrics(self, symbols: list[str]) -> dict[str, "MarketMetricInfo"]:
         """
         Get market metrics for symbols including IV rank, beta, etc.
 
@@ -102,12 +109,29 @@ class TastyTradeService:
             return {}
 
         try:
+            from tastytrade.metrics import get_market_metrics
+
             metrics = get_market_metrics(self.session, symbols)
             return {m.symbol: m for m in metrics}
         except Exception as e:
             logger.error(f"Failed to get market metrics: {e}")
             return {}
 
+    def get_metric_info(self, symbol: str) -> Optional["MarketMetricInfo"]:
+        """Cached MarketMetricInfo for one symbol (concurrent misses share one call)."""
+        if not self.is_available():
+            return None
+        return self.metrics.get(symbol)
+
+    def prefetch_metrics(self, symbols: list[str]) -> int:
+        """
+        Load metrics for all of a cycle's symbols in one call so the
+        per-symbol getters below are cache hits. Returns API calls made.
+        """
+        if not self.is_available():
+            return 0
+        return self.metrics.prime(symbols)
+
     def get_iv_rank(self, symbol: str) -> Optional[float]:
         """
         Get IV rank for a symbol (0-100 scale).
@@ -118,9 +142,8 @@ class TastyTradeService:
         Returns:
             IV rank as float, or None if unavailable
         """
-        metrics = self.get_market_metrics([symbol])
-        if symbol in metrics:
-            m = metrics[symbol]
+        m = self.get_metric_info(symbol)
+        if m is not None:
             # Use TW IV rank if available, otherwise TOS
             if m.tw_implied_volatility_index_rank is not None:
                 return float(m.tw_implied_volatility_index_rank)
@@ -138,10 +161,10 @@ class TastyTradeService:
         Returns:
             IV percentile as float, or None if unavailable
         """
-        metrics = self.get_market_metrics([symbol])
-        if symbol in metrics and metrics[symbol].implied_volatility_percentile:
+        m = self.get_metric_info(symbol)
+        if m is not None and m.implied_volatility_percentile:
             try:
-                return float(metrics[symbol].implied_volatility_percentile)
+                return float(m.implied_volatility_percentile)
             except (ValueError, TypeError):
                 pass
         return None
@@ -160,6 +183,8 @@ class TastyTradeService:
             return {}
 
         try:
+            from tastytrade.instruments import get_option_chain
+
             return get_option_chain(self.session, symbol)
         except Exception as e:
             logger.error(f"Failed to get option chain for {symbol}: {e}")
@@ -181,6 +206,8 @@ class TastyTradeService:
             return []
 
         try:
+            from tastytrade.instruments import NestedOptionChain
+
             chains = NestedOptionChain.get(self.session, symbol)
             leaps_dates = []
             today = date.today()
@@ -267,9 +294,8 @@ class TastyTradeService:
             return result
 
         # Get market metrics
-        metrics = self.get_market_metrics([symbol])
-        if symbol in metrics:
-            m = metrics[symbol]
+        m = self.get_metric_info(symbol)
+        if m is not None:
             result["iv_rank"] = float(m.tw_implied_volatility_index_rank) if m.tw_implied_volatility_index_rank else None
             result["iv_percentile"] = m.implied_volatility_percentile
             result["iv_30_day"] = float(m.implied_volatility_30_day) if m.implied_volatility_30_day else None
@@ -0,0 +1,164 @@
+"""
+Batched, cached Tastytrade market-metrics lookups.
+
+get_market_metrics takes any number of symbols, but IV rank / percentile /
+beta are read one symbol at a time (signal cycles, strategy selection,
+options scoring). MetricsLoader sits in between (the dataloader pattern):
+
+- Cached MarketMetricInfo per symbol is served without a call. The TTL is
+  market-hours aware: a few minutes while the market is open, otherwise
+  until the next session opens (metrics don't move overnight).
+- Misses from concurrent callers within a short window (BATCH_WINDOW) are
+  collected and fetched with one multi-symbol call; every waiter is woken
+  when its symbol lands.
+- prime(symbols) fetches all of a cycle's misses up front in one call, so
+  the per-symbol reads that follow are cache hits.
+
+Symbols Tastytrade returns nothing for are cached as misses for MISS_TTL,
+so an unknown ticker or an outage costs one call per MISS_TTL, not one per
+lookup.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from loguru import logger
+
+ET = ZoneInfo("America/New_York")
+
+MARKET_HOURS_TTL = 5 * 60     # metrics refresh intraday
+MISS_TTL = 60                 # symbols with no data / failed fetches
+BATCH_WINDOW = 0.02           # seconds a lone miss waits for others to join its batch
+MAX_BATCH_SYMBOLS = 200       # symbols per request
+FETCH_TIMEOUT = 30.0          # waiter gives up (and reports a miss) after this
+
+
+def metrics_ttl(now: datetime) -> float:
+    """Seconds a fetched MarketMetricInfo stays fresh at `now` (tz-aware)."""
+    et = now.astimezone(ET)
+    open_today = et.replace(hour=9, minute=30, second=0, microsecond=0)
+    close_today = et.replace(hour=16, minute=0, second=0, microsecond=0)
+    if et.weekday() < 5 and open_today <= et < close_today:
+        return MARKET_HOURS_TTL
+
+    next_open = open_today if et < open_today else open_today + timedelta(days=1)
+    while next_open.weekday() >= 5:
+        next_open += timedelta(days=1)
+    return max(MARKET_HOURS_TTL, (next_open - et).total_seconds())
+
+
+class MetricsLoader:
+    """Per-symbol cache in front of a multi-symbol fetch (thread-safe)."""
+
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Dict[str, Any]],
+        window: float = BATCH_WINDOW,
+        max_batch: int = MAX_BATCH_SYMBOLS,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self._fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self._clock = clock
+        self._cache: Dict[str, Tuple[float, Optional[Any]]] = {}   # symbol → (expires_at, info | None)
+        self._pending: Dict[str, threading.Event] = {}               # queued for the next batch
+        self._inflight: Dict[str, threading.Event] = {}              # being fetched
+        self._collecting = False                                     # a leader is gathering a batch
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, symbol: str) -> Optional[Any]:
+        """MarketMetricInfo for one symbol (batched with concurrent misses), or None."""
+        return self.get_many([symbol]).get(symbol.upper())
+
+    def prime(self, symbols: Iterable[str]) -> int:
+        """Fetch every uncached symbol now, in as few calls as possible. Returns the calls made."""
+        before = self.calls
+        self.get_many(symbols, wait_for_batch=False)
+        return self.calls - before
+
+    def get_many(self, symbols: Iterable[str], wait_for_batch: bool = True) -> Dict[str, Any]:
+        """{symbol: MarketMetricInfo} for the symbols that have metrics."""
+        symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+        result: Dict[str, Any] = {}
+        waits: List[Tuple[str, threading.Event]] = []
+        lead = False
+
+        with self._lock:
+            now = self._clock().timestamp()
+            for symbol in symbols:
+                entry = self._cache.get(symbol)
+                if entry is not None and entry[0] > now:
+                    self.hits += 1
+                    if entry[1] is not None:
+                        result[symbol] = entry[1]
+                    continue
+                self.misses += 1
+                event = self._inflight.get(symbol) or self._pending.get(symbol)
+                if event is None:
+                    event = self._pending[symbol] = threading.Event()
+                waits.append((symbol, event))
+            if self._pending and not self._collecting:
+                self._collecting = lead = True
+
+        if lead:
+            if wait_for_batch and self.window > 0 and len(self._pending) < self.max_batch:
+                time.sleep(self.window)   # let concurrent lookups join this batch
+            self._flush()
+
+        for symbol, event in waits:
+            event.wait(FETCH_TIMEOUT)
+            with self._lock:
+                entry = self._cache.get(symbol)
+            if entry is not None and entry[1] is not None:
+                result[symbol] = entry[1]
+        return result
+
+    def _flush(self):
+        """Fetch everything pending (leader thread)."""
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+            self._inflight.update(batch)
+            self._collecting = False
+
+        symbols = list(batch)
+        for i in range(0, len(symbols), self.max_batch):
+            chunk = symbols[i:i + self.max_batch]
+            try:
+                fetched = self._fetch(chunk) or {}
+            except Exception as e:
+                logger.warning(f"Tastytrade metrics fetch failed for {len(chunk)} symbols: {e}")
+                fetched = {}
+
+            now = self._clock()
+            fresh_until = now.timestamp() + metrics_ttl(now)
+            with self._lock:
+                self.calls += 1
+                for symbol in chunk:
+                    info = fetched.get(symbol)
+                    expires_at = fresh_until if info is not None else now.timestamp() + MISS_TTL
+                    self._cache[symbol] = (expires_at, info)
+                    self._inflight.pop(symbol, None)
+                    batch[symbol].set()
+
+    def invalidate(self, symbol: Optional[str] = None):
+        with self._lock:
+            if symbol is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(symbol.upper(), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "cached_symbols": len(self._cache),
+                "calls": self.calls,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -11,7 +11,6 @@ Derived:
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from loguru import logger
@@ -29,22 +28,22 @@ VIX3M_TICKERS = ["^VIX3M", "^VXV"]  # VXV as fallback
 VVIX_TICKER = "^VVIX"
 
 
-def _fetch_ticker_price(symbol: str) -> Optional[Dict[str, Any]]:
+async def _fetch_ticker_price(symbol: str) -> Optional[Dict[str, Any]]:
     """
-    Fetch latest price for a ticker using Alpaca historical bars (blocking).
+    Fetch latest price for a ticker using Alpaca historical bars.
 
     Returns:
         {"value": float, "date": str, "is_stale": bool} or None
     """
     try:
-        hist = alpaca_service.get_historical_prices(symbol, period="5d")
+        hist = await alpaca_service.get_historical_prices_async(symbol, period="5d")
 
         if hist is None or hist.empty:
             return None
 
         close_col = 'Close' if 'Close' in hist.columns else 'close'
         value = float(hist[close_col].iloc[-1])
-        latest_date = hist.index[-1]
+        latest_date = hist['date'].iloc[-1] if 'date' in hist.columns else hist.index[-1]
 
         # Check staleness
         if hasattr(latest_date, 'to_pydatetime'):
@@ -75,9 +74,6 @@ class VolatilityDataProviderImpl:
     VVIX is optional — reduces completeness if missing.
     """
 
-    def __init__(self):
-        self._executor = ThreadPoolExecutor(max_workers=3)
-
     async def get_current(self) -> Dict[str, Any]:
         """
         Get current volatility structure metrics.
@@ -92,15 +88,11 @@ class VolatilityDataProviderImpl:
                 }
             }
         """
-        loop = asyncio.get_event_loop()
-
-        # Fetch VIX, VIX3M, and VVIX concurrently via thread pool
-        vix_future = loop.run_in_executor(self._executor, _fetch_ticker_price, VIX_TICKER)
-        vix3m_future = loop.run_in_executor(self._executor, self._fetch_vix3m)
-        vvix_future = loop.run_in_executor(self._executor, _fetch_ticker_price, VVIX_TICKER)
-
+        # Fetch VIX, VIX3M, and VVIX concurrently
         vix_data, vix3m_data, vvix_data = await asyncio.gather(
-            vix_future, vix3m_future, vvix_future
+            _fetch_ticker_price(VIX_TICKER),
+            self._fetch_vix3m(),
+            _fetch_ticker_price(VVIX_TICKER),
         )
 
         metrics = {}
@@ -185,10 +177,10 @@ class VolatilityDataProviderImpl:
             "metrics": metrics,
         }
 
-    def _fetch_vix3m(self) -> Optional[Dict[str, Any]]:
+    async def _fetch_vix3m(self) -> Optional[Dict[str, Any]]:
         """Fetch VIX3M with fallback to VXV."""
         for ticker in VIX3M_TICKERS:
-            result = _fetch_ticker_price(ticker)
+            result = await _fetch_ticker_price(ticker)
             if result is not None:
                 return result
         return None
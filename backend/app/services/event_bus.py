@@ -0,0 +1,236 @@
+"""
+App event bus — pushes what the dashboard used to poll for (new signals,
+unread count, trade entries/exits, bot state, scan progress, health
+transitions) to WebSocket clients as it happens.
+
+Publishers call publish(topic, data) from anywhere: async endpoints,
+scheduler jobs, or worker threads (asyncio.to_thread). Delivery hops onto
+the event loop with call_soon_threadsafe, so publish never blocks and never
+raises. /ws/events subscribers each get a bounded queue; a slow client
+drops its oldest events instead of growing memory.
+
+Topics are dotted names; a subscription to "signals" receives
+"signals.new" and "signals.unread". State topics (bot.status,
+signals.unread, scan.progress, health.status) are published with
+retain=True: the latest one is kept and sent to new subscribers first, so
+a freshly opened tab has current state without a REST call.
+
+EVENT_BUS_BACKEND=redis fans events out over Redis pub/sub (channel
+app:events) so every uvicorn worker's clients see events published by any
+worker. If Redis fails, publishing falls back to local delivery for 60s
+(same circuit breaker as log_sink).
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+from app.config import get_settings
+from app.utils.serialization import dumps, loads
+
+CHANNEL = "app:events"
+QUEUE_SIZE = 256            # per subscriber; oldest events dropped beyond this
+CIRCUIT_OPEN_SECONDS = 60   # Redis failure → local-only delivery for this long
+
+# Topics
+SIGNALS_NEW = "signals.new"
+SIGNALS_UNREAD = "signals.unread"
+TRADES_ENTRY = "trades.entry"
+TRADES_EXIT = "trades.exit"
+BOT_STATUS = "bot.status"
+SCAN_PROGRESS = "scan.progress"
+HEALTH_STATUS = "health.status"
+HEALTH_JOB = "health.job"
+
+
+def _matches(topic: str, prefixes: Set[str]) -> bool:
+    if not prefixes:
+        return True
+    return any(topic == p or topic.startswith(p + ".") for p in prefixes)
+
+
+class Subscription:
+    """One client's bounded event queue. Only touched on the event loop."""
+
+    def __init__(self, topics: Optional[Iterable[str]] = None, maxsize: int = QUEUE_SIZE):
+        self.topics: Set[str] = set(topics or ())
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def matches(self, topic: str) -> bool:
+        return _matches(topic, self.topics)
+
+    def put(self, event: Dict[str, Any]):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+
+class EventBus:
+    """In-process pub/sub with an optional Redis fan-out (thread-safe publish)."""
+
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = (backend or get_settings().EVENT_BUS_BACKEND or "memory").lower()
+        self._subscribers: List[Subscription] = []
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._redis = None
+        self._listener: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._circuit_open_until = 0.0
+        self.published = 0
+        self.delivered = 0
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Bind delivery to the server's event loop; start the Redis listener if configured."""
+        self._loop = loop or asyncio.get_running_loop()
+        if self.backend != "redis" or self._listener is not None:
+            return
+        try:
+            from app.services.cache import cache_service
+            self._redis = cache_service.redis_client
+        except Exception as e:
+            logger.warning(f"Event bus: Redis unavailable, using in-process delivery ({e})")
+            return
+        self._stopping.clear()
+        self._listener = threading.Thread(target=self._listen, name="event-bus-redis", daemon=True)
+        self._listener.start()
+        logger.info("Event bus started (redis)")
+
+    def stop(self):
+        self._stopping.set()
+        if self._listener is not None:
+            self._listener.join(timeout=3)
+            self._listener = None
+        self._redis = None
+
+    # ── Publishing ───────────────────────────────────────────────────────────
+
+    def publish(self, topic: str, data: Optional[Dict[str, Any]] = None, retain: bool = False) -> Dict[str, Any]:
+        """Send an event to every matching subscriber (on every worker with Redis). Never raises."""
+        event = {
+            "type": "event",
+            "topic": topic,
+            "data": data or {},
+            "ts": datetime.now(timezone.utc).isoformat(),
+        }
+        self.published += 1
+        try:
+            if self._redis is not None and self._listener is not None and time.monotonic() >= self._circuit_open_until:
+                try:
+                    self._redis.publish(CHANNEL, dumps({"event": event, "retain": retain}))
+                    return event   # delivered locally by the listener
+                except Exception as e:
+                    self._circuit_open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+                    logger.warning(f"Event bus: Redis publish failed, delivering locally ({e})")
+            self._dispatch(event, retain)
+        except Exception as e:
+            logger.debug(f"Event bus: could not publish {topic}: {e}")
+        return event
+
+    def _dispatch(self, event: Dict[str, Any], retain: bool):
+        with self._lock:
+            if retain:
+                self._latest[event["topic"]] = event
+            targets = [s for s in self._subscribers if s.matches(event["topic"])]
+            loop = self._loop
+        if not targets or loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._deliver(targets, event)
+        else:
+            loop.call_soon_threadsafe(self._deliver, targets, event)
+
+    def _deliver(self, targets: List[Subscription], event: Dict[str, Any]):
+        for sub in targets:
+            sub.put(event)
+        self.delivered += len(targets)
+
+    def _listen(self):
+        """Redis pub/sub → local delivery (background thread, reconnects after errors)."""
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CHANNEL)
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        payload = loads(message["data"])
+                        self._dispatch(payload["event"], payload.get("retain", False))
+            except Exception as e:
+                # Publishers deliver locally while the listener is down
+                self._circuit_open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+                logger.warning(f"Event bus: Redis listener error, retrying ({e})")
+                self._stopping.wait(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    # ── Subscribing ──────────────────────────────────────────────────────────
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None, maxsize: int = QUEUE_SIZE) -> Subscription:
+        """New subscription (call on the event loop). Empty topics = everything."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        sub = Subscription(topics, maxsize)
+        with self._lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    def retained(self, topics: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Latest retained event of each matching topic (the state a new client starts from)."""
+        prefixes = set(topics or ())
+        with self._lock:
+            return [e for t, e in sorted(self._latest.items()) if _matches(t, prefixes)]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "backend": "redis" if self._listener is not None else "memory",
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": sum(s.dropped for s in subscribers),
+            "retained_topics": sorted(self._latest),
+        }
+
+
+# Global event bus instance
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the global event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+def publish(topic: str, data: Optional[Dict[str, Any]] = None, retain: bool = False) -> Dict[str, Any]:
+    """Publish on the global event bus."""
+    return get_event_bus().publish(topic, data, retain)
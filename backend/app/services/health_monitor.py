@@ -3,7 +3,9 @@ Health Monitor — centralized system health tracking.
 
 Tracks scheduler job execution via Redis, checks dependency health
 (DB, Redis, Alpaca, Scheduler), aggregates everything into a dashboard,
-and sends Telegram alerts on status transitions.
+and sends Telegram alerts on status transitions. Transitions (overall
+status, a job flipping between ok and error) are also published on the
+event bus (health.status, health.job) for /ws/events clients.
 
 All state is stored in Redis with short TTLs — no DB migrations needed.
 """
@@ -13,6 +15,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 from loguru import logger
 
+from app.services import event_bus
+
 
 # ── Job expectations for overdue detection ────────────────────────────────────
 
@@ -46,6 +50,8 @@ class HealthMonitor:
         self._redis = None
         self._dep_cache = {}
         self._dep_cache_time = 0
+        self._last_status: Optional[str] = None   # last overall status published
+        self._job_status: dict = {}                # job_id → last run status published
 
     @property
     def redis(self):
@@ -119,6 +125,10 @@ class HealthMonitor:
             # Never let health tracking crash a job
             logger.debug(f"Health monitor: failed to record job {job_id}: {e}")
 
+        if self._job_status.get(job_id, "ok") != status:
+            event_bus.publish(event_bus.HEALTH_JOB, {"job_id": job_id, "status": status, "error": error})
+        self._job_status[job_id] = status
+
     def get_job_health(self, job_id: str) -> Optional[dict]:
         """Get health status for a single scheduler job."""
         if job_id not in JOB_EXPECTATIONS:
@@ -296,8 +306,12 @@ class HealthMonitor:
         # Telegram status
         telegram_info = self._get_telegram_info()
 
+        # CPU offload pool load
+        compute_info = self._get_compute_pool_info()
+
         # Overall status
         overall = self._compute_overall_status(deps, jobs, bot_info)
+        self.publish_status(overall)
 
         return {
             "overall_status": overall,
@@ -308,6 +322,7 @@ class HealthMonitor:
             "auto_scan": auto_scan_info,
             "trading_bot": bot_info,
             "telegram": telegram_info,
+            "compute_pool": compute_info,
         }
 
     def _get_auto_scan_info(self, job_health: dict) -> dict:
@@ -391,6 +406,14 @@ class HealthMonitor:
         except Exception:
             return {"configured": False, "running": False, "allowed_users": 0}
 
+    def _get_compute_pool_info(self) -> dict:
+        """Compute pool size and queue depth."""
+        try:
+            from app.services.compute import compute_pool
+            return compute_pool.stats()
+        except Exception:
+            return {"mode": "unknown", "workers": 0, "in_flight": 0, "queue_depth": 0}
+
     def _compute_overall_status(self, deps: dict, jobs: dict, bot_info: dict) -> str:
         """
         Compute overall system health.
@@ -426,6 +449,15 @@ class HealthMonitor:
 
         return "healthy"
 
+    def publish_status(self, overall: str):
+        """Publish health.status (retained) when the overall status changes."""
+        if overall == self._last_status:
+            return
+        event_bus.publish(event_bus.HEALTH_STATUS, {
+            "status": overall, "previous": self._last_status,
+        }, retain=True)
+        self._last_status = overall
+
     # ── Alerting ──────────────────────────────────────────────────────────
 
     def should_alert(self, current_status: str) -> bool:
@@ -6,9 +6,12 @@ Enhanced with Phase 2:
 - Catalyst timing integration
 """
 import asyncio
+import copy
+import os
+import weakref
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Generator, List, Dict, Any, Optional, Tuple
 from loguru import logger
 
 from app.services.data_fetcher.fmp_service import fmp_service
@@ -18,6 +21,10 @@ from app.services.analysis.fundamental import FundamentalAnalysis
 from app.services.analysis.options import OptionsAnalysis
 from app.services.analysis.sentiment import SentimentAnalyzer, get_sentiment_analyzer
 from app.services.analysis.catalyst import CatalystService, get_catalyst_service
+from app.services.compute import compute_pool
+from app.services.compute.tasks import technical_evaluation
+from app.services.screening.planner import SCREENING_PLAN, ScreeningStats, universe_rejection
+from app.services.screening.stage_cache import StageCache, criteria_hash, data_version
 from app.services.scoring.types import (
     CriterionResult,
     CoverageInfo,
@@ -27,6 +34,23 @@ from app.services.scoring.types import (
     build_coverage_from_criteria,
 )
 
+# Composite score a candidate must reach to pass screening
+MIN_COMPOSITE_SCORE = 30
+
+# Async pipeline: concurrent calls per provider, symbols in flight per scan
+ASYNC_PROVIDER_LIMITS = {
+    "fmp": 40,         # 50 req/s rate limiter does the real pacing
+    "alpaca": 16,      # native bars client + offloaded options-chain calls
+    "tastytrade": 4,   # single shared session
+}
+ASYNC_MAX_IN_FLIGHT = 200
+
+# Stage work for the async pipeline — kept small so scans don't starve
+# request handling. Indicator math itself runs in the compute pool.
+_CPU_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="screen-cpu",
+)
+
 
 class ScreeningEngine:
     """
@@ -45,6 +69,10 @@ class ScreeningEngine:
         self.opt_analysis = OptionsAnalysis()
         self.sentiment_analyzer = get_sentiment_analyzer()
         self.catalyst_service = get_catalyst_service()
+        self.stage_cache = StageCache()
+        self._async_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     @staticmethod
     def _check_valuation_filters(
@@ -138,20 +166,15 @@ class ScreeningEngine:
 
         return None  # All checks passed
 
-    def screen_single_stock(
-        self,
-        symbol: str,
-        custom_criteria: Optional[Dict[str, Any]] = None
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Screen a single stock through all filters (v1).
+    # ------------------------------------------------------------------
+    # Stage helpers — shared by the sync and async pipelines. Each takes
+    # already-fetched data, records its outputs on `result` and returns
+    # None (with result['failed_at'] set) when the symbol is rejected.
+    # ------------------------------------------------------------------
 
-        Uses tri-state criteria, coverage-adjusted sub-scores,
-        momentum drawdown penalties, and composite rescaling.
-        """
-        logger.info(f"Screening {symbol}...")
-
-        result: Dict[str, Any] = {
+    @staticmethod
+    def _new_result(symbol: str) -> Dict[str, Any]:
+        return {
             'symbol': symbol,
             'screened_at': datetime.now().isoformat(),
             'passed_stages': [],
@@ -162,247 +185,485 @@ class ScreeningEngine:
             'component_availability': {},
         }
 
-        # Track StageResults for composite calculation
-        fund_stage: Optional[StageResult] = None
-        tech_stage: Optional[StageResult] = None
-        opt_stage: Optional[StageResult] = None
-        mom_stage: Optional[StageResult] = None
-
-        try:
-            # Get stock info
-            stock_info = fmp_service.get_stock_info(symbol)
-            if not stock_info:
-                logger.warning(f"{symbol}: Failed to get stock info")
-                result['failed_at'] = 'data_fetch'
-                return result
+    @staticmethod
+    def _apply_stock_info(result: Dict[str, Any], symbol: str, stock_info: Optional[Dict[str, Any]]) -> bool:
+        if not stock_info:
+            logger.warning(f"{symbol}: Failed to get stock info")
+            result['failed_at'] = 'data_fetch'
+            return False
+
+        result['name'] = stock_info.get('name')
+        result['sector'] = stock_info.get('sector')
+        result['market_cap'] = stock_info.get('market_cap')
+        result['exchange'] = stock_info.get('exchange')
+        return True
+
+    def _stage_fundamental(
+        self,
+        result: Dict[str, Any],
+        symbol: str,
+        stock_info: Dict[str, Any],
+        fundamentals: Optional[Dict[str, Any]],
+        custom_criteria: Optional[Dict[str, Any]],
+    ) -> Optional[StageResult]:
+        """STAGE 1: Fundamental Filter (v1)"""
+        if not fundamentals:
+            logger.warning(f"{symbol}: No fundamental data")
+            result['failed_at'] = 'fundamentals'
+            return None
 
-            result['name'] = stock_info.get('name')
-            result['sector'] = stock_info.get('sector')
-            result['market_cap'] = stock_info.get('market_cap')
-            result['exchange'] = stock_info.get('exchange')
+        # Propagate valuation metrics for _matches_preset() and frontend
+        result['trailing_pe'] = fundamentals.get('trailing_pe')
+        result['peg_ratio'] = fundamentals.get('peg_ratio')
+        result['price_to_book'] = fundamentals.get('price_to_book')
+        result['dividend_yield'] = fundamentals.get('dividend_yield')
+        result['beta'] = fundamentals.get('beta')
+        result['roe'] = fundamentals.get('roe')
+        result['profit_margins'] = fundamentals.get('profit_margins')
+
+        fund_stage = self.fund_analysis.evaluate(
+            fundamentals, stock_info, custom_criteria
+        )
+        result['fundamental_score'] = fund_stage.score_pct
+        result['fundamental_criteria'] = {
+            k: v.value for k, v in fund_stage.criteria.items()
+        }
+        result['criteria']['fundamental'] = result['fundamental_criteria']
+        result['coverage']['fundamental'] = fund_stage.coverage.to_dict()
+
+        # Check mandatory pre-gates
+        pre_gate_fail = fund_stage.reason
+        if pre_gate_fail:
+            logger.info(f"{symbol}: Failed fundamental pre-gate: {pre_gate_fail}")
+            result['failed_at'] = 'fundamentals_gate'
+            return None
 
-            # STAGE 1: Fundamental Filter (v1)
-            fundamentals = fmp_service.get_fundamentals(symbol)
-            if not fundamentals:
-                logger.warning(f"{symbol}: No fundamental data")
-                result['failed_at'] = 'fundamentals'
-                return result
+        # Check gate: ≥4 PASS of 5, ≥4 KNOWN of 5
+        if not fund_stage.passes_gate(GATE_CONFIGS["fundamental"]):
+            logger.info(f"{symbol}: Failed fundamental gate")
+            result['failed_at'] = 'fundamentals_gate'
+            return None
 
-            # Propagate valuation metrics for _matches_preset() and frontend
-            result['trailing_pe'] = fundamentals.get('trailing_pe')
-            result['peg_ratio'] = fundamentals.get('peg_ratio')
-            result['price_to_book'] = fundamentals.get('price_to_book')
-            result['dividend_yield'] = fundamentals.get('dividend_yield')
-            result['beta'] = fundamentals.get('beta')
-            result['roe'] = fundamentals.get('roe')
-            result['profit_margins'] = fundamentals.get('profit_margins')
-
-            fund_stage = self.fund_analysis.evaluate(
-                fundamentals, stock_info, custom_criteria
-            )
-            result['fundamental_score'] = fund_stage.score_pct
-            result['fundamental_criteria'] = {
-                k: v.value for k, v in fund_stage.criteria.items()
-            }
-            result['criteria']['fundamental'] = result['fundamental_criteria']
-            result['coverage']['fundamental'] = fund_stage.coverage.to_dict()
-
-            # Check mandatory pre-gates
-            pre_gate_fail = fund_stage.reason
-            if pre_gate_fail:
-                logger.info(f"{symbol}: Failed fundamental pre-gate: {pre_gate_fail}")
-                result['failed_at'] = 'fundamentals_gate'
-                return result
+        result['passed_stages'].append('fundamental')
 
-            # Check gate: ≥4 PASS of 5, ≥4 KNOWN of 5
-            if not fund_stage.passes_gate(GATE_CONFIGS["fundamental"]):
-                logger.info(f"{symbol}: Failed fundamental gate")
-                result['failed_at'] = 'fundamentals_gate'
-                return result
+        # Post-gate valuation filters (new P/E, PEG, dividend, etc.)
+        valuation_fail = self._check_valuation_filters(fundamentals, custom_criteria)
+        if valuation_fail:
+            logger.info(f"{symbol}: Failed post-gate valuation: {valuation_fail}")
+            result['failed_at'] = 'valuation_filter'
+            return None
 
-            result['passed_stages'].append('fundamental')
+        return fund_stage
 
-            # Post-gate valuation filters (new P/E, PEG, dividend, etc.)
-            valuation_fail = self._check_valuation_filters(fundamentals, custom_criteria)
-            if valuation_fail:
-                logger.info(f"{symbol}: Failed post-gate valuation: {valuation_fail}")
-                result['failed_at'] = 'valuation_filter'
-                return result
+    def _stage_technical(
+        self,
+        result: Dict[str, Any],
+        symbol: str,
+        price_data,
+    ) -> Optional[StageResult]:
+        """
+        STAGE 2: Technical Filter (v1). The indicator math runs in the
+        compute pool (bars go over shared memory). Returns tech_stage or None.
+        """
+        if price_data is None or price_data.empty:
+            logger.warning(f"{symbol}: No price data")
+            result['failed_at'] = 'price_data'
+            return None
 
-            # STAGE 2: Technical Filter (v1)
-            price_data = alpaca_service.get_historical_prices(symbol, period="2y")
-            if price_data is None or price_data.empty:
-                logger.warning(f"{symbol}: No price data")
-                result['failed_at'] = 'price_data'
-                return result
+        tech_indicators, tech_stage = compute_pool.run(technical_evaluation, price_data)
 
-            # Calculate technical indicators
-            price_data = self.tech_analysis.calculate_all_indicators(price_data)
-            tech_indicators = self.tech_analysis.get_latest_indicators(price_data)
+        result['technical_indicators'] = tech_indicators
+        result['current_price'] = tech_indicators.get('current_price')
+        result['price_change_percent'] = tech_indicators.get('price_change_percent')
 
-            result['technical_indicators'] = tech_indicators
-            result['current_price'] = tech_indicators.get('current_price')
-            result['price_change_percent'] = tech_indicators.get('price_change_percent')
+        # D3: technical_score stays 0-100 (pct), add technical_score_points (0-90)
+        result['technical_score'] = tech_stage.score_pct
+        result['technical_score_points'] = tech_stage.score_points
+        result['technical_criteria'] = {
+            k: v.value for k, v in tech_stage.criteria.items()
+        }
+        result['criteria']['technical'] = result['technical_criteria']
+        result['coverage']['technical'] = tech_stage.coverage.to_dict()
 
-            # Pre-compute expensive values
-            avg_volume = self.tech_analysis.calculate_avg_volume(price_data, 50)
-            is_breakout = self.tech_analysis.detect_breakout(price_data, 60)
+        # Check data sufficiency
+        if tech_stage.reason == "insufficient_price_history":
+            logger.info(f"{symbol}: Insufficient price history for technical gate")
+            result['failed_at'] = 'technical_gate'
+            return None
 
-            tech_stage = self._evaluate_technical(
-                tech_indicators, price_data,
-                avg_volume=avg_volume or 0, is_breakout=is_breakout
-            )
+        # Check gate: ≥3 PASS of 7, ≥5 KNOWN of 7
+        if not tech_stage.passes_gate(GATE_CONFIGS["technical"]):
+            logger.info(f"{symbol}: Failed technical gate")
+            result['failed_at'] = 'technical_gate'
+            return None
 
-            # D3: technical_score stays 0-100 (pct), add technical_score_points (0-90)
-            result['technical_score'] = tech_stage.score_pct
-            result['technical_score_points'] = tech_stage.score_points
-            result['technical_criteria'] = {
-                k: v.value for k, v in tech_stage.criteria.items()
-            }
-            result['criteria']['technical'] = result['technical_criteria']
-            result['coverage']['technical'] = tech_stage.coverage.to_dict()
+        result['passed_stages'].append('technical')
 
-            # Check data sufficiency
-            if tech_stage.reason == "insufficient_price_history":
-                logger.info(f"{symbol}: Insufficient price history for technical gate")
-                result['failed_at'] = 'technical_gate'
-                return result
+        current_price = tech_indicators.get('current_price', 0)
+        if current_price <= 0:
+            logger.warning(f"{symbol}: Invalid current price")
+            result['failed_at'] = 'price_validation'
+            return None
 
-            # Check gate: ≥3 PASS of 7, ≥5 KNOWN of 7
-            if not tech_stage.passes_gate(GATE_CONFIGS["technical"]):
-                logger.info(f"{symbol}: Failed technical gate")
-                result['failed_at'] = 'technical_gate'
-                return result
+        return tech_stage
 
-            result['passed_stages'].append('technical')
+    def _leaps_summary(self, symbol: str, options_data: Optional[Dict[str, Any]], current_price: float) -> Dict[str, Any]:
+        """LEAPS summary for the options stage (fetches TastyTrade IV data)."""
+        if not (options_data and 'calls' in options_data):
+            return {}
+        return self.opt_analysis.get_leaps_summary_enhanced(
+            options_data['calls'],
+            current_price,
+            datetime.now(),
+            symbol
+        )
 
-            # STAGE 3: Options Filter (v1)
-            current_price = tech_indicators.get('current_price', 0)
-            if current_price <= 0:
-                logger.warning(f"{symbol}: Invalid current price")
-                result['failed_at'] = 'price_validation'
-                return result
+    def _stage_options(
+        self,
+        result: Dict[str, Any],
+        symbol: str,
+        current_price: float,
+        options_data: Optional[Dict[str, Any]],
+        leaps_summary: Dict[str, Any],
+    ) -> Optional[StageResult]:
+        """STAGE 3: Options Filter (v1)"""
+        has_options_data = bool(options_data and 'calls' in options_data)
+        leaps_available = leaps_summary.get('available', False) if has_options_data else False
+        atm_option = leaps_summary.get('atm_option') if has_options_data else None
+
+        result['leaps_available'] = leaps_available
+        result['leaps_summary'] = leaps_summary
+
+        # Promote IV rank to top-level for easy frontend access
+        tt = leaps_summary.get('tastytrade', {})
+        result['iv_rank'] = tt.get('iv_rank')
+        result['iv_percentile'] = tt.get('iv_percentile')
+
+        # v1 options evaluation
+        opt_stage = self.opt_analysis.evaluate(
+            option_data=atm_option,
+            current_price=current_price,
+            symbol=symbol,
+            leaps_available=leaps_available,
+            has_options_data=has_options_data,
+        )
 
-            # Get options data and LEAPS summary (for backward compat fields)
-            options_data = alpaca_service.get_options_chain(symbol)
-            has_options_data = bool(options_data and 'calls' in options_data)
+        result['options_score'] = opt_stage.score_pct
+        result['options_criteria'] = {
+            k: v.value for k, v in opt_stage.criteria.items()
+        }
+        result['criteria']['options'] = result['options_criteria']
+        result['coverage']['options'] = opt_stage.coverage.to_dict()
 
-            leaps_summary = {}
-            leaps_available = False
-            atm_option = None
+        # D2: Hard fail for no options data / no LEAPS
+        if opt_stage.reason in ("no_options_data", "no_leaps"):
+            logger.info(f"{symbol}: Failed options gate: {opt_stage.reason}")
+            result['failed_at'] = 'options_gate'
+            return None
 
-            if has_options_data:
-                leaps_summary = self.opt_analysis.get_leaps_summary_enhanced(
-                    options_data['calls'],
-                    current_price,
-                    datetime.now(),
-                    symbol
+        # Check gate: ≥2 PASS of 4, ≥2 KNOWN of 4
+        # Soft-pass: if LEAPS exist but we have insufficient market data
+        # (Alpaca snapshots unavailable — common off-hours / rate limits),
+        # allow through with a penalty.  The downstream signal engine and
+        # AI validator will re-evaluate options quality with fresh data.
+        if not opt_stage.passes_gate(GATE_CONFIGS["options"]):
+            cov = opt_stage.coverage
+            if cov.known_count == 0 and leaps_available:
+                # LEAPS exist but zero options market data — soft pass
+                logger.info(
+                    f"{symbol}: Options gate soft-pass (LEAPS available, no market data)"
                 )
-                leaps_available = leaps_summary.get('available', False)
-                atm_option = leaps_summary.get('atm_option')
-
-            result['leaps_available'] = leaps_available
-            result['leaps_summary'] = leaps_summary
-
-            # Promote IV rank to top-level for easy frontend access
-            tt = leaps_summary.get('tastytrade', {})
-            result['iv_rank'] = tt.get('iv_rank')
-            result['iv_percentile'] = tt.get('iv_percentile')
-
-            # v1 options evaluation
-            opt_stage = self.opt_analysis.evaluate(
-                option_data=atm_option,
-                current_price=current_price,
-                symbol=symbol,
-                leaps_available=leaps_available,
-                has_options_data=has_options_data,
-            )
+                result['options_soft_pass'] = True
+            else:
+                logger.info(f"{symbol}: Failed options gate (known={cov.known_count}, pass={cov.pass_count})")
+                result['failed_at'] = 'options_gate'
+                return None
 
-            result['options_score'] = opt_stage.score_pct
-            result['options_criteria'] = {
-                k: v.value for k, v in opt_stage.criteria.items()
-            }
-            result['criteria']['options'] = result['options_criteria']
-            result['coverage']['options'] = opt_stage.coverage.to_dict()
+        result['passed_stages'].append('options')
+        return opt_stage
 
-            # D2: Hard fail for no options data / no LEAPS
-            if opt_stage.reason in ("no_options_data", "no_leaps"):
-                logger.info(f"{symbol}: Failed options gate: {opt_stage.reason}")
-                result['failed_at'] = 'options_gate'
-                return result
+    def _stage_momentum(self, result: Dict[str, Any], price_data) -> StageResult:
+        """STAGE 4: Momentum (no gate). Needs only the price history."""
+        returns = self.tech_analysis.calculate_returns(price_data)
+        mom_stage = self._evaluate_momentum(returns)
 
-            # Check gate: ≥2 PASS of 4, ≥2 KNOWN of 4
-            # Soft-pass: if LEAPS exist but we have insufficient market data
-            # (Alpaca snapshots unavailable — common off-hours / rate limits),
-            # allow through with a penalty.  The downstream signal engine and
-            # AI validator will re-evaluate options quality with fresh data.
-            if not opt_stage.passes_gate(GATE_CONFIGS["options"]):
-                cov = opt_stage.coverage
-                if cov.known_count == 0 and leaps_available:
-                    # LEAPS exist but zero options market data — soft pass
-                    logger.info(
-                        f"{symbol}: Options gate soft-pass (LEAPS available, no market data)"
-                    )
-                    result['options_soft_pass'] = True
-                else:
-                    logger.info(f"{symbol}: Failed options gate (known={cov.known_count}, pass={cov.pass_count})")
-                    result['failed_at'] = 'options_gate'
-                    return result
+        result['returns'] = returns
+        result['momentum_score'] = mom_stage.score_pct
+        result['criteria']['momentum'] = {
+            k: v.value for k, v in mom_stage.criteria.items()
+        }
+        result['coverage']['momentum'] = mom_stage.coverage.to_dict()
+        return mom_stage
 
-            result['passed_stages'].append('options')
+    def _composite_ceiling(
+        self,
+        fund_stage: StageResult,
+        tech_stage: StageResult,
+        mom_stage: StageResult,
+    ) -> float:
+        """Best composite reachable with full options marks (options points max = 100)."""
+        best_options = StageResult(
+            stage_id="options",
+            criteria={},
+            coverage=CoverageInfo(known_count=4, pass_count=4, total_count=4),
+            score_points=100.0,
+            points_total_max=100.0,
+        )
+        return self._calculate_composite_score_v1(
+            fund_stage, tech_stage, best_options, mom_stage
+        )['score']
 
-            # STAGE 4: Momentum (v1, no gate)
-            returns = self.tech_analysis.calculate_returns(price_data)
-            mom_stage = self._evaluate_momentum(returns)
+    def _stage_scoring(
+        self,
+        result: Dict[str, Any],
+        symbol: str,
+        fund_stage: StageResult,
+        tech_stage: StageResult,
+        opt_stage: StageResult,
+        mom_stage: StageResult,
+    ) -> Dict[str, Any]:
+        """STAGE 5: Composite score."""
+        composite = self._calculate_composite_score_v1(
+            fund_stage, tech_stage, opt_stage, mom_stage
+        )
 
-            result['returns'] = returns
-            result['momentum_score'] = mom_stage.score_pct
-            result['criteria']['momentum'] = {
-                k: v.value for k, v in mom_stage.criteria.items()
-            }
-            result['coverage']['momentum'] = mom_stage.coverage.to_dict()
+        result['score'] = composite['score']
+        result['component_availability'] = composite['component_availability']
 
-            # STAGE 5: Composite Score (v1)
-            composite = self._calculate_composite_score_v1(
-                fund_stage, tech_stage, opt_stage, mom_stage
+        if composite['score'] < MIN_COMPOSITE_SCORE:
+            logger.info(
+                f"{symbol}: Composite score {composite['score']:.1f} < {MIN_COMPOSITE_SCORE} minimum — filtered out"
             )
+            result['failed_at'] = 'composite_score_minimum'
+            return result
 
-            result['score'] = composite['score']
-            result['component_availability'] = composite['component_availability']
+        result['passed_stages'].append('scoring')
+        result['passed_all'] = True
+
+        logger.success(f"{symbol}: Passed all filters with score {composite['score']:.2f}")
+        return result
 
-            # Minimum composite score cutoff — stocks that pass all 3 quality gates
-            # (fundamental, technical, options) already demonstrate merit.
-            # The composite score is a coverage-adjusted weighted average that
-            # naturally produces lower values (25-60 range for passing stocks).
-            # Raised from 20 → 30: stocks scoring 20-29 were barely passing gates
-            # with weak momentum, creating noise downstream. 30 filters out the
-            # bottom ~20% of gate-passers while keeping genuinely qualified stocks.
-            MIN_COMPOSITE_SCORE = 30
-            if composite['score'] < MIN_COMPOSITE_SCORE:
+    # ------------------------------------------------------------------
+    # Staged plan — gates run in SCREENING_PLAN order (cheapest
+    # disqualifier first). The sync and async pipelines differ only in
+    # how they fetch the data each gate yields for.
+    # ------------------------------------------------------------------
+
+    def _memo_stage(
+        self,
+        stage: str,
+        key: tuple,
+        result: Dict[str, Any],
+        stats: Optional[ScreeningStats],
+        compute,
+    ):
+        """
+        Run a stage helper via the stage cache. compute(out) records onto a
+        blank result; its record and return value are memoized under `key`
+        and merged onto `result` (a copy, so later edits to one scan's
+        result never leak into the cache).
+        """
+        cached = self.stage_cache.get(key)
+        if stats:
+            stats.cache_lookup(stage, cached is not None)
+        if cached is None:
+            out = {'passed_stages': [], 'criteria': {}, 'coverage': {}, 'failed_at': None}
+            cached = (out, compute(out))
+            self.stage_cache.set(key, cached)
+
+        out, value = cached
+        out = copy.deepcopy(out)
+        result['passed_stages'].extend(out.pop('passed_stages'))
+        result['criteria'].update(out.pop('criteria'))
+        result['coverage'].update(out.pop('coverage'))
+        failed_at = out.pop('failed_at')
+        if failed_at:
+            result['failed_at'] = failed_at
+        result.update(out)
+        return value
+
+    def _run_gate(
+        self,
+        gate: str,
+        result: Dict[str, Any],
+        symbol: str,
+        data: Dict[str, Any],
+        stages: Dict[str, Any],
+        custom_criteria: Optional[Dict[str, Any]],
+        universe_row: Optional[Dict[str, Any]],
+        stats: Optional[ScreeningStats] = None,
+    ) -> bool:
+        """Run one gate on already-fetched data. False = symbol rejected."""
+        cache = self.stage_cache
+        if gate == "universe":
+            reason = universe_rejection(universe_row, custom_criteria)
+            if reason:
+                logger.info(f"{symbol}: Rejected from screener data: {reason}")
+                result['failed_at'] = 'universe_prefilter'
+                return False
+            return True
+
+        if gate == "stock_info":
+            return self._apply_stock_info(result, symbol, data['stock_info'])
+
+        if gate == "fundamental":
+            key = cache.key(
+                gate, symbol, data_version(data['stock_info']), data_version(data['fundamentals']),
+                criteria=criteria_hash(custom_criteria),
+            )
+            stages['fundamental'] = self._memo_stage(gate, key, result, stats, lambda out: self._stage_fundamental(
+                out, symbol, data['stock_info'], data['fundamentals'], custom_criteria
+            ))
+            return stages['fundamental'] is not None
+
+        if gate == "technical":
+            prices_version = data_version(data['price_history'])
+            stages['technical'] = self._memo_stage(
+                gate, cache.key(gate, symbol, prices_version), result, stats,
+                lambda out: self._stage_technical(out, symbol, data['price_history']),
+            )
+            return stages['technical'] is not None
+
+        if gate == "composite_ceiling":
+            stages['momentum'] = self._memo_stage(
+                "momentum", cache.key("momentum", symbol, data_version(data['price_history'])), result, stats,
+                lambda out: self._stage_momentum(out, data['price_history']),
+            )
+            ceiling = self._composite_ceiling(stages['fundamental'], stages['technical'], stages['momentum'])
+            if ceiling < MIN_COMPOSITE_SCORE:
                 logger.info(
-                    f"{symbol}: Composite score {composite['score']:.1f} < {MIN_COMPOSITE_SCORE} minimum — filtered out"
+                    f"{symbol}: Composite ceiling {ceiling:.1f} < {MIN_COMPOSITE_SCORE} — options not fetched"
                 )
                 result['failed_at'] = 'composite_score_minimum'
-                return result
+                return False
+            return True
+
+        if gate == "options":
+            # The stage reads only the chain's presence and the LEAPS summary
+            chain = data['options_chain']
+            key = cache.key(
+                gate, symbol, str(bool(chain and 'calls' in chain)),
+                data_version(data['leaps_summary']), str(result['current_price']),
+            )
+            stages['options'] = self._memo_stage(gate, key, result, stats, lambda out: self._stage_options(
+                out, symbol, result['current_price'], chain, data['leaps_summary'],
+            ))
+            return stages['options'] is not None
+
+        if gate == "scoring":
+            self._stage_scoring(
+                result, symbol, stages['fundamental'], stages['technical'],
+                stages['options'], stages['momentum'],
+            )
+            return result.get('passed_all', False)
 
-            result['passed_stages'].append('scoring')
-            result['passed_all'] = True
+        raise ValueError(f"Unknown screening gate: {gate}")
 
-            logger.success(f"{symbol}: Passed all filters with score {composite['score']:.2f}")
+    @staticmethod
+    def _fetch_args(source: str, symbol: str, data: Dict[str, Any], result: Dict[str, Any]) -> tuple:
+        if source == "leaps_summary":
+            return (symbol, data['options_chain'], result['current_price'])
+        return (symbol,)
 
-            return result
+    def _screen_steps(
+        self,
+        symbol: str,
+        custom_criteria: Optional[Dict[str, Any]] = None,
+        universe_row: Optional[Dict[str, Any]] = None,
+        stats: Optional[ScreeningStats] = None,
+    ) -> Generator[Tuple[str, tuple], Any, Dict[str, Any]]:
+        """
+        One symbol through SCREENING_PLAN. Yields (source, args) for each
+        data source the next gate needs and expects the fetched value (or
+        a thrown fetch error) back. Returns the result dict.
+        """
+        result = self._new_result(symbol)
+        data: Dict[str, Any] = {}
+        stages: Dict[str, Any] = {}
+
+        try:
+            for gate in SCREENING_PLAN:
+                for source in gate.needs:
+                    if source not in data:
+                        if stats:
+                            stats.fetch(source)
+                        data[source] = yield source, self._fetch_args(source, symbol, data, result)
+
+                if stats:
+                    stats.enter(gate.name)
+                if not self._run_gate(gate.name, result, symbol, data, stages, custom_criteria, universe_row, stats):
+                    if stats:
+                        stats.reject(gate.name)
+                    return result
 
         except Exception as e:
             logger.error(f"Error screening {symbol}: {e}")
             result['failed_at'] = 'error'
             result['error'] = str(e)
-            return result
+
+        return result
+
+    @staticmethod
+    def _advance(steps: Generator, value: Any = None, error: Optional[BaseException] = None):
+        """Resume _screen_steps. Returns (next fetch request, None) or (None, result)."""
+        try:
+            request = steps.throw(error) if error is not None else steps.send(value)
+        except StopIteration as done:
+            return None, done.value
+        return request, None
+
+    # ------------------------------------------------------------------
+    # Sync pipeline
+    # ------------------------------------------------------------------
+
+    def _fetch_sync(self, source: str, *args):
+        if source == "stock_info":
+            return fmp_service.get_stock_info(*args)
+        if source == "fundamentals":
+            return fmp_service.get_fundamentals(*args)
+        if source == "price_history":
+            return alpaca_service.get_historical_prices(*args, period="2y")
+        if source == "options_chain":
+            return alpaca_service.get_options_chain(*args)
+        if source == "leaps_summary":
+            return self._leaps_summary(*args)
+        raise ValueError(f"Unknown screening data source: {source}")
+
+    def screen_single_stock(
+        self,
+        symbol: str,
+        custom_criteria: Optional[Dict[str, Any]] = None,
+        universe_row: Optional[Dict[str, Any]] = None,
+        stats: Optional[ScreeningStats] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Screen a single stock through all filters (v1).
+
+        Uses tri-state criteria, coverage-adjusted sub-scores,
+        momentum drawdown penalties, and composite rescaling.
+        Gates run in cost order; `universe_row` is the symbol's FMP
+        screener row (price, market cap) when the caller has it.
+        """
+        logger.info(f"Screening {symbol}...")
+        steps = self._screen_steps(symbol, custom_criteria, universe_row, stats)
+
+        request, result = self._advance(steps)
+        while request is not None:
+            source, args = request
+            try:
+                value, error = self._fetch_sync(source, *args), None
+            except Exception as e:
+                value, error = None, e
+            request, result = self._advance(steps, value, error)
+        return result
 
     def screen_multiple_stocks(
         self,
         symbols: List[str],
         custom_criteria: Optional[Dict[str, Any]] = None,
-        max_workers: int = 4
+        max_workers: int = 4,
+        universe_rows: Optional[Dict[str, Dict[str, Any]]] = None,
+        stats: Optional[ScreeningStats] = None,
     ) -> List[Dict[str, Any]]:
         """
         Screen multiple stocks using bounded concurrency.
@@ -411,15 +672,20 @@ class ScreeningEngine:
             symbols: List of stock ticker symbols
             custom_criteria: Optional dict with custom screening thresholds
             max_workers: Max concurrent screening threads (respects rate limits)
+            universe_rows: Optional {symbol: FMP screener row} for the universe gate
+            stats: Optional ScreeningStats collecting per-stage counts
 
         Returns:
             List of screening results, sorted by score
         """
         results = []
+        universe_rows = universe_rows or {}
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(self.screen_single_stock, symbol, custom_criteria): symbol
+                executor.submit(
+                    self.screen_single_stock, symbol, custom_criteria, universe_rows.get(symbol), stats
+                ): symbol
                 for symbol in symbols
             }
             for future in as_completed(futures):
@@ -436,6 +702,123 @@ class ScreeningEngine:
 
         return results
 
+    # ------------------------------------------------------------------
+    # Async pipeline
+    # ------------------------------------------------------------------
+
+    def _provider_limits(self) -> Dict[str, asyncio.Semaphore]:
+        """Per-provider semaphores for the running loop (shared by all scans on it)."""
+        loop = asyncio.get_running_loop()
+        limits = self._async_limits.get(loop)
+        if limits is None:
+            limits = {name: asyncio.Semaphore(n) for name, n in ASYNC_PROVIDER_LIMITS.items()}
+            self._async_limits[loop] = limits
+        return limits
+
+    async def _fetch_async(self, source: str, limits: Dict[str, asyncio.Semaphore], *args):
+        if source == "stock_info":
+            async with limits["fmp"]:
+                return await fmp_service.get_stock_info_async(*args)
+        if source == "fundamentals":
+            async with limits["fmp"]:
+                return await fmp_service.get_fundamentals_async(*args)
+        if source == "price_history":
+            async with limits["alpaca"]:
+                return await alpaca_service.get_historical_prices_async(*args, period="2y")
+        if source == "options_chain":
+            async with limits["alpaca"]:
+                return await asyncio.to_thread(alpaca_service.get_options_chain, *args)
+        if source == "leaps_summary":
+            async with limits["tastytrade"]:
+                return await asyncio.to_thread(self._leaps_summary, *args)
+        raise ValueError(f"Unknown screening data source: {source}")
+
+    async def screen_single_stock_async(
+        self,
+        symbol: str,
+        custom_criteria: Optional[Dict[str, Any]] = None,
+        universe_row: Optional[Dict[str, Any]] = None,
+        stats: Optional[ScreeningStats] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        screen_single_stock for the event loop: FMP and Alpaca bars are
+        awaited natively, the options chain and TastyTrade calls are
+        offloaded, each provider bounded by its own semaphore. Gate logic
+        (indicator math, scoring) runs on the CPU executor. Same result dict.
+        """
+        logger.info(f"Screening {symbol}...")
+        limits = self._provider_limits()
+        loop = asyncio.get_running_loop()
+        steps = self._screen_steps(symbol, custom_criteria, universe_row, stats)
+
+        request, result = await loop.run_in_executor(_CPU_EXECUTOR, self._advance, steps)
+        while request is not None:
+            source, args = request
+            try:
+                value, error = await self._fetch_async(source, limits, *args), None
+            except Exception as e:
+                value, error = None, e
+            request, result = await loop.run_in_executor(
+                _CPU_EXECUTOR, self._advance, steps, value, error
+            )
+        return result
+
+    async def screen_multiple_stocks_async(
+        self,
+        symbols: List[str],
+        custom_criteria: Optional[Dict[str, Any]] = None,
+        max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+        universe_rows: Optional[Dict[str, Dict[str, Any]]] = None,
+        stats: Optional[ScreeningStats] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async screen_multiple_stocks: up to `max_in_flight` symbols at once,
+        throttled per provider rather than by a fixed thread count.
+
+        Returns:
+            List of screening results, sorted by score
+        """
+        results = []
+        async for result in self.iter_screen_async(
+            symbols, custom_criteria, max_in_flight, universe_rows, stats
+        ):
+            results.append(result)
+
+        results.sort(key=lambda x: x.get('score', 0), reverse=True)
+        return results
+
+    async def iter_screen_async(
+        self,
+        symbols: List[str],
+        custom_criteria: Optional[Dict[str, Any]] = None,
+        max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+        universe_rows: Optional[Dict[str, Dict[str, Any]]] = None,
+        stats: Optional[ScreeningStats] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield screening results in completion order (for streaming callers)."""
+        gate = asyncio.Semaphore(max_in_flight)
+        universe_rows = universe_rows or {}
+
+        async def run(symbol: str):
+            async with gate:
+                return await self.screen_single_stock_async(
+                    symbol, custom_criteria, universe_rows.get(symbol), stats
+                )
+
+        tasks = [asyncio.create_task(run(s)) for s in symbols]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                try:
+                    result = await finished
+                except Exception as e:
+                    logger.error(f"Error in async screening task: {e}")
+                    continue
+                if result:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def get_top_candidates(
         self,
         symbols: List[str],
@@ -659,8 +1042,8 @@ class ScreeningEngine:
 
     # --- v1 scoring methods ---
 
+    @staticmethod
     def _evaluate_technical(
-        self,
         indicators: Dict[str, Any],
         price_data,
         avg_volume: float = 0,
@@ -1351,17 +1734,10 @@ class ScreeningEngine:
             try:
                 price_data = alpaca_service.get_historical_prices(symbol, period="2y")
                 if price_data is not None and not price_data.empty:
-                    price_data = self.tech_analysis.calculate_all_indicators(price_data)
-                    tech_indicators = self.tech_analysis.get_latest_indicators(price_data)
+                    tech_indicators, tech_stage = compute_pool.run(technical_evaluation, price_data)
                     result['technical_indicators'] = tech_indicators
                     result['current_price'] = tech_indicators.get('current_price', result['current_price'])
 
-                    avg_volume = self.tech_analysis.calculate_avg_volume(price_data, 50)
-                    is_breakout = self.tech_analysis.detect_breakout(price_data, 60)
-                    tech_stage = self._evaluate_technical(
-                        tech_indicators, price_data,
-                        avg_volume=avg_volume or 0, is_breakout=is_breakout
-                    )
                     result['technical_score'] = tech_stage.score_pct
                     result['technical_score_points'] = tech_stage.score_points
                     result['criteria']['technical'] = {
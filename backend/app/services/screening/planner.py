@@ -0,0 +1,148 @@
+"""
+Cost-ordered screening plan.
+
+Each gate declares the per-symbol data it needs and the gates whose
+outputs it reads; each data source has a relative fetch cost. plan_gates()
+orders the gates so the cheapest disqualifiers run first: at every step
+the ready gate that adds the least fetch cost goes next (declaration order
+breaks ties). The options chain — expirations, chain, snapshots and
+TastyTrade IV — is the most expensive source, so it is only fetched once
+every cheaper gate, including the composite-score ceiling, has passed.
+
+The "universe" gate needs no fetch at all: it applies the fundamental
+pre-gates (price, market cap) to the FMP company-screener row the symbol
+came from.
+"""
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+# Relative cost of fetching each per-symbol data source (≈ API calls)
+FETCH_COSTS: Dict[str, float] = {
+    "stock_info": 1,       # FMP profile (cached, shared with fundamentals)
+    "price_history": 1,    # one Alpaca daily-bars request
+    "fundamentals": 3,     # FMP ratios-ttm + key-metrics-ttm + income statements
+    "options_chain": 5,    # Alpaca expirations + chain + option snapshots
+    "leaps_summary": 3,    # TastyTrade IV metrics
+}
+
+
+@dataclass(frozen=True)
+class Gate:
+    name: str
+    needs: Tuple[str, ...] = ()   # data sources fetched before the gate runs
+    after: Tuple[str, ...] = ()   # gates whose outputs it reads
+
+
+# Declaration order is the tie-break order
+GATES: Tuple[Gate, ...] = (
+    Gate("universe"),
+    Gate("stock_info", needs=("stock_info",)),
+    Gate("fundamental", needs=("stock_info", "fundamentals"), after=("stock_info",)),
+    Gate("technical", needs=("price_history",)),
+    # Best-case composite (options at full marks) must reach the minimum
+    Gate("composite_ceiling", after=("fundamental", "technical")),
+    Gate("options", needs=("options_chain", "leaps_summary"), after=("technical", "composite_ceiling")),
+    Gate("scoring", after=("fundamental", "technical", "options")),
+)
+
+
+def plan_gates(gates: Tuple[Gate, ...] = GATES, costs: Dict[str, float] = FETCH_COSTS) -> Tuple[Gate, ...]:
+    """Greedy cheapest-ready-first ordering of `gates`."""
+    remaining = list(gates)
+    done: set = set()
+    fetched: set = set()
+    order: List[Gate] = []
+
+    while remaining:
+        ready = [g for g in remaining if all(a in done for a in g.after)]
+        if not ready:
+            raise ValueError(f"Unsatisfiable gate dependencies: {[g.name for g in remaining]}")
+        gate = min(ready, key=lambda g: sum(costs[n] for n in set(g.needs) - fetched))
+        remaining.remove(gate)
+        order.append(gate)
+        done.add(gate.name)
+        fetched.update(gate.needs)
+
+    return tuple(order)
+
+
+SCREENING_PLAN: Tuple[Gate, ...] = plan_gates()
+
+
+def universe_rejection(row: Optional[Dict[str, Any]], criteria: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Fundamental pre-gates (FundamentalAnalysis.evaluate) applied to a
+    screener row: {price, market_cap, ...}. Missing values pass, so the
+    per-symbol data decides as before.
+    """
+    if not row:
+        return None
+    criteria = criteria or {}
+
+    market_cap = row.get("market_cap")
+    if market_cap is not None:
+        cap_min = criteria.get("market_cap_min", 500_000_000)
+        cap_max = criteria.get("market_cap_max")
+        if market_cap < cap_min or (cap_max is not None and market_cap > cap_max):
+            return "market_cap_ok_failed"
+
+    price = row.get("price")
+    if price is not None:
+        if not criteria.get("price_min", 5.0) <= price <= criteria.get("price_max", 500.0):
+            return "price_ok_failed"
+
+    return None
+
+
+class ScreeningStats:
+    """
+    Per-gate entered/rejected counts, per-source fetch counts and per-stage
+    memo hits/misses (stage_cache.py) for one scan (thread-safe).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.entered: Dict[str, int] = {g.name: 0 for g in SCREENING_PLAN}
+        self.rejected: Dict[str, int] = {g.name: 0 for g in SCREENING_PLAN}
+        self.fetches: Dict[str, int] = {source: 0 for source in FETCH_COSTS}
+        self.cache_hits: Dict[str, int] = {}
+        self.cache_misses: Dict[str, int] = {}
+
+    def enter(self, gate: str):
+        with self._lock:
+            self.entered[gate] += 1
+
+    def reject(self, gate: str):
+        with self._lock:
+            self.rejected[gate] += 1
+
+    def fetch(self, source: str):
+        with self._lock:
+            self.fetches[source] += 1
+
+    def cache_lookup(self, stage: str, hit: bool):
+        counts = self.cache_hits if hit else self.cache_misses
+        with self._lock:
+            counts[stage] = counts.get(stage, 0) + 1
+
+    def _cache_summary(self) -> Dict[str, Any]:
+        stages = {}
+        for stage in sorted(set(self.cache_hits) | set(self.cache_misses)):
+            hits, misses = self.cache_hits.get(stage, 0), self.cache_misses.get(stage, 0)
+            stages[stage] = {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 3)}
+        hits = sum(self.cache_hits.values())
+        lookups = hits + sum(self.cache_misses.values())
+        return {"stages": stages, "hit_ratio": round(hits / lookups, 3) if lookups else None}
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "stages": [
+                    {"stage": g.name, "entered": self.entered[g.name], "rejected": self.rejected[g.name]}
+                    for g in SCREENING_PLAN
+                ],
+                "fetches": dict(self.fetches),
+                "fetch_cost": sum(FETCH_COSTS[s] * n for s, n in self.fetches.items()),
+                "cache": self._cache_summary(),
+            }
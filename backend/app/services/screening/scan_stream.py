@@ -0,0 +1,74 @@
+"""
+Incremental SSE protocol for streaming scans.
+
+Progress events carry only what changed in the running top-N since the
+previous event: rows that entered it (full result dicts), symbols that
+dropped out, and new ranks. The final results are sent as `results`
+chunks ahead of the `complete` event, so no single message holds the
+whole scan. Events are encoded once with the shared orjson encoder
+(app.utils.serialization), which handles NumPy types natively.
+
+    start     {total, preset, top_n}
+    progress  {processed, total, passed, rows, removed, ranks}
+    results   {chunk, chunks, results}
+    complete  {processed, total, passed, chunks, ...}
+"""
+import heapq
+from itertools import count
+from typing import Any, Dict, List
+
+from app.utils.serialization import dumps
+
+TOP_N = 20
+RESULT_CHUNK_SIZE = 100
+
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    """One SSE `data:` message (NaN/inf serialize as null)."""
+    return b"data: " + dumps(payload) + b"\n\n"
+
+
+def result_chunks(results: List[Dict[str, Any]], size: int = RESULT_CHUNK_SIZE) -> List[bytes]:
+    """`results` events for the final payload, `size` rows each."""
+    chunks = [results[i:i + size] for i in range(0, len(results), size)]
+    return [
+        sse_event({"type": "results", "chunk": i, "chunks": len(chunks), "results": chunk})
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+class RunningTopN:
+    """
+    Top-N passing results by score, kept in a bounded min-heap. Ties keep
+    the earlier result. diff() reports the changes since the last call.
+    Rows are identified by their `key` field (the symbol for scans).
+    """
+
+    def __init__(self, n: int = TOP_N, key: str = "symbol"):
+        self.n = n
+        self.key = key
+        self._heap: List[tuple] = []  # (score, -seq, key, result)
+        self._seq = count()
+        self._sent: Dict[str, int] = {}  # key -> rank at the last diff()
+
+    def push(self, result: Dict[str, Any]):
+        entry = (result.get("score") or 0, -next(self._seq), result[self.key], result)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        return [entry[3] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def diff(self) -> Dict[str, Any]:
+        ranked = self.ranked()
+        ranks = {r[self.key]: rank for rank, r in enumerate(ranked)}
+
+        delta = {
+            "rows": [r for r in ranked if r[self.key] not in self._sent],
+            "removed": [s for s in self._sent if s not in ranks],
+            "ranks": {s: rank for s, rank in ranks.items() if self._sent.get(s) != rank},
+        }
+        self._sent = ranks
+        return delta
@@ -0,0 +1,93 @@
+"""
+Per-symbol stage memo for the screening engine.
+
+A stage's output is a pure function of its fetched inputs and (for the
+fundamental stage) the screening criteria, so repeated scans inside the
+TTL — a stream scan, then auto-scan, then /screen/top — replay it instead
+of recomputing indicators and scores. Keys are (stage, symbol, input data
+version, criteria hash, preset catalog hash); a stage is recomputed only
+when one of those changes.
+
+Input versions come from the data itself: the price history's bar range
+(its first and last dates) and last close, and a content hash for the FMP
+and options dicts (which carry no timestamps of their own).
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from app.data.presets_catalog import get_catalog_hash
+
+# Same window as back-to-back scans of one preset
+STAGE_CACHE_TTL = 15 * 60
+STAGE_CACHE_MAX_ENTRIES = 20_000
+
+
+def data_version(value: Any) -> str:
+    """Version tag for one fetched input."""
+    if value is None:
+        return "none"
+    if isinstance(value, pd.DataFrame):
+        if value.empty:
+            return "empty"
+        last_close = value['close'].iloc[-1] if 'close' in value.columns else None
+        # Provider frames carry bar times in a date column over a RangeIndex
+        column = next((c for c in ('date', 'datetime') if c in value.columns), None)
+        dates = value[column].array if column else value.index
+        return f"{len(value)}:{dates[0]}:{dates[-1]}:{last_close}"
+    return _digest(value)
+
+
+def criteria_hash(criteria: Optional[Dict[str, Any]]) -> str:
+    return _digest(criteria or {})
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.md5(encoded).hexdigest()[:16]
+
+
+class StageCache:
+    """Bounded LRU of stage outputs with a TTL (thread-safe: the sync pipeline runs on a pool)."""
+
+    def __init__(self, ttl_seconds: int = STAGE_CACHE_TTL, max_entries: int = STAGE_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._store: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def key(stage: str, symbol: str, *inputs: str, criteria: str = "") -> Tuple:
+        return (stage, symbol, *inputs, criteria, get_catalog_hash())
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._store[key]
+                return None
+            self._store.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple, value: Any):
+        with self._lock:
+            self._store[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+    @property
+    def size(self) -> int:
+        return len(self._store)
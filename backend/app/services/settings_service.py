@@ -174,6 +174,18 @@ DEFAULT_SETTINGS = {
         "category": "automation",
         "description": "Use market intelligence to auto-select scanning presets based on MRI, regime, and Fear & Greed"
     },
+    "automation.streaming_exits_enabled": {
+        "value": "true",
+        "value_type": "bool",
+        "category": "automation",
+        "description": "Evaluate stop-loss/take-profit/trailing exits on live price ticks (1-min poll stays as fallback)"
+    },
+    "automation.live_bars_enabled": {
+        "value": "true",
+        "value_type": "bool",
+        "category": "automation",
+        "description": "Stream signal-queue symbols and build intraday bars from ticks (REST only for backfill)"
+    },
 
     # UI preferences
     "ui.default_preset": {
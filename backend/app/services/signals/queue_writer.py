@@ -0,0 +1,74 @@
+"""
+Bulk writes to the signal queue.
+
+Every path that queues stocks (scan processing, AI-reviewed stocks, the
+auto-scan job, the queue/add endpoint) must skip a (symbol, timeframe) that
+is already active. Instead of one existence query per symbol × timeframe,
+active_queue_keys loads the active keys for the whole batch in one query
+and insert_queue_items writes the new rows in one INSERT.
+
+The partial unique index uq_queue_active_symbol_tf (symbol, timeframe
+WHERE status = 'active') backs this up: on PostgreSQL and SQLite the insert
+is INSERT ... ON CONFLICT DO NOTHING, so a concurrent writer that wins the
+race just makes our row a no-op. Existing databases get the index from
+scripts/add_signal_queue_active_unique_index.py.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.signal_queue import SignalQueue
+
+QueueKey = Tuple[str, str]   # (symbol, timeframe)
+
+
+def active_queue_keys(db: Session, symbols: Optional[Iterable[str]] = None) -> Set[QueueKey]:
+    """(symbol, timeframe) of every active queue item, optionally limited to `symbols`."""
+    stmt = select(SignalQueue.symbol, SignalQueue.timeframe).where(SignalQueue.status == "active")
+    if symbols is not None:
+        symbols = list({s for s in symbols if s})
+        if not symbols:
+            return set()
+        stmt = stmt.where(SignalQueue.symbol.in_(symbols))
+    return {(symbol, timeframe) for symbol, timeframe in db.execute(stmt)}
+
+
+def _insert_ignore(dialect: str):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING the keys actually written."""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return (
+        dialect_insert(SignalQueue)
+        .on_conflict_do_nothing()
+        .returning(SignalQueue.symbol, SignalQueue.timeframe)
+    )
+
+
+def insert_queue_items(db: Session, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insert active queue items in one statement, skipping keys that are
+    already active (or repeated in `rows`). Each row needs symbol and
+    timeframe plus any other SignalQueue columns. Returns the rows actually
+    written (a row a concurrent writer beat us to is left out); the caller
+    commits.
+    """
+    active = active_queue_keys(db, (r["symbol"] for r in rows))
+    new_rows = []
+    for row in rows:
+        key = (row["symbol"], row["timeframe"])
+        if key in active:
+            continue
+        active.add(key)
+        new_rows.append({"status": "active", **row})
+
+    if not new_rows:
+        return []
+    dialect = db.get_bind().dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        db.execute(insert(SignalQueue), new_rows)
+        return new_rows
+    written = {(symbol, timeframe) for symbol, timeframe in db.execute(_insert_ignore(dialect), new_rows)}
+    return [r for r in new_rows if (r["symbol"], r["timeframe"]) in written]
@@ -8,14 +8,16 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from loguru import logger
-import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
 from app.models.signal_queue import SignalQueue
 from app.models.trading_signal import TradingSignal
 from app.models.user_alert import AlertNotification
+from app.services import event_bus
 from app.services.data_fetcher.alpaca_service import alpaca_service
+from app.services.signals import strategy_rules
+from app.utils.serialization import to_native
 
 ET = ZoneInfo("America/New_York")
 
@@ -362,9 +364,8 @@ class SignalEngine:
             if gate_scores.get('rvol_score', 0) <= -15:
                 stats['heavy_rvol_penalty'] = stats.get('heavy_rvol_penalty', 0) + 1
 
-            # 4. Fetch iv_rank ONCE, pass to both scorers
+            # 4. Fetch iv_rank ONCE, pass to both scorers (cached — the cycle prefetched it)
             iv_rank = self._fetch_iv_rank(symbol)
-            stats['tastytrade'] = stats.get('tastytrade', 0) + 1
             iv_score = self._score_iv_quality(iv_rank, cap_size)
             earnings_score = self._score_earnings_risk(symbol, iv_rank)
             stats['catalyst'] = stats.get('catalyst', 0) + 1
@@ -550,44 +551,15 @@ class SignalEngine:
                     )
                     return (False, {})
 
-            # --- Soft scoring ---
-            atr_pivot = params.get('atr_pivot', params.get('min_atr_percent', 0.15))
-            max_atr = params.get('max_atr_percent', 1.0)
-
-            # ATR% score
-            if atr_percent >= atr_pivot * 1.5:
-                atr_score = 5.0
-            elif atr_percent >= atr_pivot:
-                atr_score = 0.0
-            elif atr_percent >= atr_pivot * 0.5:
-                # Linear -15 to 0 between 50% and 100% of pivot
-                ratio = (atr_percent - atr_pivot * 0.5) / (atr_pivot * 0.5)
-                atr_score = -15.0 * (1.0 - ratio)
-            else:
-                atr_score = -20.0
-
-            # Choppy penalty
-            if atr_percent > max_atr:
-                atr_score -= 10.0
+            # --- Soft scoring (strategy_rules, shared with the vectorized backtester) ---
+            atr_score = float(strategy_rules.atr_gate_score(atr_percent, params))
 
             # RVOL score (uses effective_rvol = rvol_tod if available, else classic rvol)
             rvol_tod = bar.get('rvol_tod')
             classic_rvol = bar.get('rvol', 1.0)
             effective_rvol = rvol_tod if (rvol_tod is not None and not pd.isna(rvol_tod)) else classic_rvol
 
-            rvol_pivot = params.get('rvol_pivot', params.get('min_rvol', 0.80))
-
-            if effective_rvol >= rvol_pivot * 2.0:
-                rvol_score = 10.0
-            elif effective_rvol >= rvol_pivot * 1.5:
-                rvol_score = 5.0
-            elif effective_rvol >= rvol_pivot:
-                rvol_score = 0.0
-            elif effective_rvol >= rvol_pivot * 0.5:
-                ratio = (effective_rvol - rvol_pivot * 0.5) / (rvol_pivot * 0.5)
-                rvol_score = -15.0 * (1.0 - ratio)
-            else:
-                rvol_score = -20.0
+            rvol_score = float(strategy_rules.rvol_gate_score(effective_rvol, params))
 
             logger.debug(
                 f"{symbol} gates PASSED: ATR%={atr_percent:.3f}(score={atr_score:+.0f}) "
@@ -605,14 +577,35 @@ class SignalEngine:
     # IV, Earnings, and Options Overlays
     # ==========================================================================
 
+    def _prefetch_iv_metrics(self, symbols: List[str]) -> int:
+        """
+        Load TastyTrade metrics for every symbol due this cycle in one batched
+        call; _fetch_iv_rank then reads them from the cache. Returns API calls made.
+        """
+        try:
+            from app.services.data_fetcher.tastytrade import get_tastytrade_service
+            return get_tastytrade_service().prefetch_metrics(symbols)
+        except Exception as e:
+            logger.debug(f"Could not prefetch TastyTrade metrics: {e}")
+            return 0
+
     def _fetch_iv_rank(self, symbol: str) -> Optional[float]:
-        """Fetch IV rank from TastyTrade (single call, shared by IV and earnings scoring)"""
+        """
+        Fetch IV rank from TastyTrade (single call, shared by IV and earnings
+        scoring), falling back to the local ATM IV history.
+        """
         try:
             from app.services.data_fetcher.tastytrade import get_tastytrade_service
-            service = get_tastytrade_service()
-            return service.get_iv_rank(symbol)
+            iv_rank = get_tastytrade_service().get_iv_rank(symbol)
+            if iv_rank is not None:
+                return iv_rank
         except Exception as e:
             logger.debug(f"Could not fetch IV rank for {symbol}: {e}")
+        try:
+            from app.services.analysis.iv_history import get_iv_history_store
+            return get_iv_history_store().iv_rank(symbol)
+        except Exception as e:
+            logger.debug(f"No local IV rank for {symbol}: {e}")
             return None
 
     def _score_iv_quality(self, iv_rank: Optional[float], cap_size: str) -> float:
@@ -828,6 +821,8 @@ class SignalEngine:
         - Close crosses below ORB Low
         - Same volume/RVOL filters
         - EMA8 < EMA21 or close < EMA21
+
+        Conditions, stop and targets: strategy_rules.orb_breakout.
         """
         try:
             skip_bars = params.get('skip_bars', 3)
@@ -846,64 +841,48 @@ class SignalEngine:
 
             latest = df.iloc[-1]
             prev = df.iloc[-2]
-
             close = latest['close']
-            prev_close = prev['close']
-            ema8 = latest.get('ema8', close)
-            ema21 = latest.get('ema21', close)
-            rsi = latest.get('rsi', 50)
-            volume_spike = latest.get('volume_spike', False)
-            rvol = latest.get('rvol', 1.0)
-            atr = latest.get('atr', 0)
-
-            # Check for LONG breakout
-            if close > orb_high and prev_close <= orb_high:
-                # Confirm with trend and momentum
-                trend_ok = ema8 > ema21 or close > ema21
-                momentum_ok = rsi >= params.get('rsi_long_min', 50)
-
-                if trend_ok and momentum_ok and (volume_spike or rvol >= params.get('min_rvol', 1.2)):
-                    stop_loss = orb_high - (atr * params.get('stop_atr_mult', 0.5))
-                    target_1 = close + (close - stop_loss)  # 1R target
-                    target_2 = close + (close - stop_loss) * 2  # 2R target
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "buy",
-                        "strategy": "orb_breakout_long",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "long", params),
-                        "orb_high": orb_high,
-                        "orb_low": orb_low,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
 
-            # Check for SHORT breakdown
-            if close < orb_low and prev_close >= orb_low:
-                trend_ok = ema8 < ema21 or close < ema21
-                momentum_ok = rsi <= params.get('rsi_short_max', 50)
-
-                if trend_ok and momentum_ok and (volume_spike or rvol >= params.get('min_rvol', 1.2)):
-                    stop_loss = orb_low + (atr * params.get('stop_atr_mult', 0.5))
-                    target_1 = close - (stop_loss - close)
-                    target_2 = close - (stop_loss - close) * 2
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "sell",
-                        "strategy": "orb_breakout_short",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "short", params),
-                        "orb_high": orb_high,
-                        "orb_low": orb_low,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            setup = strategy_rules.orb_breakout(
+                close, prev['close'], orb_high, orb_low,
+                latest.get('ema8', close), latest.get('ema21', close), latest.get('rsi', 50),
+                latest.get('volume_spike', False), latest.get('rvol', 1.0), latest.get('atr', 0),
+                params,
+            )
+
+            # LONG breakout (1R / 2R targets)
+            if setup.long:
+                target_1, target_2 = setup.long_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "buy",
+                    "strategy": "orb_breakout_long",
+                    "entry_price": close,
+                    "stop_loss": setup.long_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "long", params),
+                    "orb_high": orb_high,
+                    "orb_low": orb_low,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
+
+            # SHORT breakdown
+            if setup.short:
+                target_1, target_2 = setup.short_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "sell",
+                    "strategy": "orb_breakout_short",
+                    "entry_price": close,
+                    "stop_loss": setup.short_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "short", params),
+                    "orb_high": orb_high,
+                    "orb_low": orb_low,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
 
             return None
 
@@ -923,19 +902,14 @@ class SignalEngine:
         - Pullback volume < VolMA20 (contraction)
         - Close reclaims VWAP
         - RSI > 50 or MACD > 0
+
+        Conditions, stop and targets: strategy_rules.vwap_pullback.
         """
         try:
             latest = df.iloc[-1]
             prev = df.iloc[-2]
-
             close = latest['close']
-            prev_close = prev['close']
-            ema8 = latest.get('ema8', close)
-            ema21 = latest.get('ema21', close)
-            rsi = latest.get('rsi', 50)
-            atr = latest.get('atr', 0)
             volume = latest.get('volume', 0)
-            volume_ma = latest.get('volume_ma20', volume)
 
             # Get VWAP from snapshot
             snapshot = alpaca_service.get_snapshot(symbol)
@@ -946,59 +920,44 @@ class SignalEngine:
             if not vwap:
                 return None
 
-            # Check for LONG pullback reclaim
-            if ema8 > ema21 and close > ema21:
-                # Price touched or dipped below VWAP, now reclaiming
-                touched_vwap = prev_close <= vwap
-                reclaiming = close > vwap
-
-                # Volume contraction during pullback
-                volume_contracting = volume < volume_ma
-
-                momentum_ok = rsi >= params.get('rsi_long_min', 50)
-
-                if touched_vwap and reclaiming and volume_contracting and momentum_ok:
-                    stop_loss = min(prev['low'], vwap) - (atr * 0.3)
-                    target_1 = close + (close - stop_loss)
-                    target_2 = close + (close - stop_loss) * 1.5
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "buy",
-                        "strategy": "vwap_pullback_long",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "long", params),
-                        "vwap": vwap,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            setup = strategy_rules.vwap_pullback(
+                close, prev['close'], prev['low'], prev['high'],
+                latest.get('ema8', close), latest.get('ema21', close), latest.get('rsi', 50),
+                latest.get('atr', 0), volume, latest.get('volume_ma20', volume), vwap,
+                params,
+            )
 
-            # Check for SHORT pullback
-            if ema8 < ema21 and close < ema21:
-                touched_vwap = prev_close >= vwap
-                reclaiming_down = close < vwap
-                volume_contracting = volume < volume_ma
-                momentum_ok = rsi <= params.get('rsi_short_max', 50)
-
-                if touched_vwap and reclaiming_down and volume_contracting and momentum_ok:
-                    stop_loss = max(prev['high'], vwap) + (atr * 0.3)
-                    target_1 = close - (stop_loss - close)
-                    target_2 = close - (stop_loss - close) * 1.5
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "sell",
-                        "strategy": "vwap_pullback_short",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "short", params),
-                        "vwap": vwap,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            # LONG pullback reclaim (1R / 1.5R targets)
+            if setup.long:
+                target_1, target_2 = setup.long_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "buy",
+                    "strategy": "vwap_pullback_long",
+                    "entry_price": close,
+                    "stop_loss": setup.long_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "long", params),
+                    "vwap": vwap,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
+
+            # SHORT pullback rejection
+            if setup.short:
+                target_1, target_2 = setup.short_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "sell",
+                    "strategy": "vwap_pullback_short",
+                    "entry_price": close,
+                    "stop_loss": setup.short_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "short", params),
+                    "vwap": vwap,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
 
             return None
 
@@ -1018,6 +977,8 @@ class SignalEngine:
         - RVOL >= threshold
         - EMA8 > EMA21
         - RSI >= 55
+
+        Conditions, stop and targets: strategy_rules.range_breakout.
         """
         try:
             lookback = params.get('range_lookback', 30)
@@ -1032,63 +993,48 @@ class SignalEngine:
 
             latest = df.iloc[-1]
             prev = df.iloc[-2]
-
             close = latest['close']
-            prev_close = prev['close']
-            ema8 = latest.get('ema8', close)
-            ema21 = latest.get('ema21', close)
-            rsi = latest.get('rsi', 50)
-            volume_spike = latest.get('volume_spike', False)
-            rvol = latest.get('rvol', 1.0)
-            atr = latest.get('atr', 0)
-
-            # Check for LONG breakout
-            if close > range_high and prev_close <= range_high:
-                trend_ok = ema8 > ema21
-                momentum_ok = rsi >= params.get('rsi_long_min', 55)
-
-                if trend_ok and momentum_ok and (volume_spike or rvol >= params.get('min_rvol', 1.15)):
-                    stop_loss = range_high - (atr * params.get('stop_atr_mult', 0.6))
-                    target_1 = close + (close - stop_loss)
-                    target_2 = close + (close - stop_loss) * 2
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "buy",
-                        "strategy": "range_breakout_long",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "long", params),
-                        "range_high": range_high,
-                        "range_low": range_low,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
 
-            # Check for SHORT breakdown
-            if close < range_low and prev_close >= range_low:
-                trend_ok = ema8 < ema21
-                momentum_ok = rsi <= params.get('rsi_short_max', 45)
-
-                if trend_ok and momentum_ok and (volume_spike or rvol >= params.get('min_rvol', 1.15)):
-                    stop_loss = range_low + (atr * params.get('stop_atr_mult', 0.6))
-                    target_1 = close - (stop_loss - close)
-                    target_2 = close - (stop_loss - close) * 2
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "sell",
-                        "strategy": "range_breakout_short",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "short", params),
-                        "range_high": range_high,
-                        "range_low": range_low,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            setup = strategy_rules.range_breakout(
+                close, prev['close'], range_high, range_low,
+                latest.get('ema8', close), latest.get('ema21', close), latest.get('rsi', 50),
+                latest.get('volume_spike', False), latest.get('rvol', 1.0), latest.get('atr', 0),
+                params,
+            )
+
+            # LONG breakout (1R / 2R targets)
+            if setup.long:
+                target_1, target_2 = setup.long_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "buy",
+                    "strategy": "range_breakout_long",
+                    "entry_price": close,
+                    "stop_loss": setup.long_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "long", params),
+                    "range_high": range_high,
+                    "range_low": range_low,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
+
+            # SHORT breakdown
+            if setup.short:
+                target_1, target_2 = setup.short_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "sell",
+                    "strategy": "range_breakout_short",
+                    "entry_price": close,
+                    "stop_loss": setup.short_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "short", params),
+                    "range_high": range_high,
+                    "range_low": range_low,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
 
             return None
 
@@ -1113,6 +1059,8 @@ class SignalEngine:
         - ADX > 25
         - Price rallies to SMA20/50 zone, then rejects below SMA20
         - RSI 30-60
+
+        Conditions, stop and targets: strategy_rules.trend_following.
         """
         try:
             if len(df) < 55:
@@ -1120,9 +1068,7 @@ class SignalEngine:
 
             latest = df.iloc[-1]
             prev = df.iloc[-2]
-
             close = latest['close']
-            prev_close = prev['close']
 
             # Get SMAs — use pre-calculated from alpaca_service if available, else compute
             sma20 = latest.get('sma_20') or latest.get('sma20')
@@ -1140,73 +1086,48 @@ class SignalEngine:
             if sma20 is None or sma50 is None:
                 return None
 
-            min_adx = params.get('min_adx', 25)
-
-            # Check for LONG trend following
-            uptrend = sma20 > sma50
-            if sma200 is not None:
-                uptrend = uptrend and sma50 > sma200
-
-            if uptrend and adx >= min_adx:
-                # Pullback to SMA20/50 zone: prev was at/below SMA20, now reclaiming
-                pullback_zone = prev_close <= sma20 * 1.005  # within 0.5% of SMA20
-                reclaiming = close > sma20
-                rsi_ok = 40 <= rsi <= 70
-
-                if pullback_zone and reclaiming and rsi_ok:
-                    stop_loss = min(sma50, prev['low']) - (atr * params.get('stop_atr_mult', 1.5))
-                    risk = close - stop_loss
-                    target_1 = close + risk * 1.5  # 1.5R
-                    target_2 = close + risk * 2.5  # 2.5R
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "buy",
-                        "strategy": "trend_following_long",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "long", params),
-                        "sma20": sma20,
-                        "sma50": sma50,
-                        "sma200": sma200,
-                        "adx": adx,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            setup = strategy_rules.trend_following(
+                close, prev['close'], prev['low'], prev['high'],
+                sma20, sma50, sma200, adx, rsi, atr, params,
+            )
 
-            # Check for SHORT trend following
-            downtrend = sma20 < sma50
-            if sma200 is not None:
-                downtrend = downtrend and sma50 < sma200
-
-            if downtrend and adx >= min_adx:
-                # Rally to SMA20/50 zone: prev was at/above SMA20, now rejecting
-                rally_zone = prev_close >= sma20 * 0.995  # within 0.5% of SMA20
-                rejecting = close < sma20
-                rsi_ok = 30 <= rsi <= 60
-
-                if rally_zone and rejecting and rsi_ok:
-                    stop_loss = max(sma50, prev['high']) + (atr * params.get('stop_atr_mult', 1.5))
-                    risk = stop_loss - close
-                    target_1 = close - risk * 1.5
-                    target_2 = close - risk * 2.5
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "sell",
-                        "strategy": "trend_following_short",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "short", params),
-                        "sma20": sma20,
-                        "sma50": sma50,
-                        "sma200": sma200,
-                        "adx": adx,
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            # LONG pullback reclaim (1.5R / 2.5R targets)
+            if setup.long:
+                target_1, target_2 = setup.long_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "buy",
+                    "strategy": "trend_following_long",
+                    "entry_price": close,
+                    "stop_loss": setup.long_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "long", params),
+                    "sma20": sma20,
+                    "sma50": sma50,
+                    "sma200": sma200,
+                    "adx": adx,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
+
+            # SHORT rally rejection
+            if setup.short:
+                target_1, target_2 = setup.short_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "sell",
+                    "strategy": "trend_following_short",
+                    "entry_price": close,
+                    "stop_loss": setup.short_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "short", params),
+                    "sma20": sma20,
+                    "sma50": sma50,
+                    "sma200": sma200,
+                    "adx": adx,
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
 
             return None
 
@@ -1231,6 +1152,8 @@ class SignalEngine:
         - Price at or above upper Bollinger Band
         - Volume spike confirming buying exhaustion
         - Close rejects below upper BB
+
+        Conditions, stop and targets: strategy_rules.mean_reversion.
         """
         try:
             bb_period = params.get('bb_period', 20)
@@ -1239,14 +1162,9 @@ class SignalEngine:
 
             latest = df.iloc[-1]
             prev = df.iloc[-2]
-
             close = latest['close']
-            prev_close = prev['close']
-            rsi = latest.get('rsi', latest.get('rsi_14', 50))
-            atr = latest.get('atr', latest.get('atr_14', 0))
             volume = latest.get('volume', 0)
             volume_ma = latest.get('volume_ma20', volume)
-            volume_spike = volume > volume_ma * params.get('volume_spike_mult', 1.2) if volume_ma > 0 else False
 
             # Calculate Bollinger Bands from df
             bb_std = params.get('bb_std', 2.0)
@@ -1259,56 +1177,48 @@ class SignalEngine:
             # Get SMA20 for target (mean reversion target)
             sma20 = latest.get('sma_20') or latest.get('sma20') or bb_mid
 
-            # Check for LONG mean reversion (oversold bounce)
-            if rsi < 30:
-                # Price was at/below lower BB, now reclaiming
-                touched_lower = prev_close <= bb_lower * 1.005
-                reclaiming = close > bb_lower
-
-                if touched_lower and reclaiming and volume_spike:
-                    stop_loss = min(prev['low'], bb_lower) - (atr * params.get('stop_atr_mult', 1.5))
-                    target_1 = sma20  # revert to mean (SMA20)
-                    target_2 = bb_upper  # overshoot to upper band
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "buy",
-                        "strategy": "mean_reversion_long",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "long", params),
-                        "bb_upper": round(bb_upper, 2),
-                        "bb_mid": round(bb_mid, 2),
-                        "bb_lower": round(bb_lower, 2),
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            setup = strategy_rules.mean_reversion(
+                close, prev['close'], prev['low'], prev['high'],
+                latest.get('rsi', latest.get('rsi_14', 50)), latest.get('atr', latest.get('atr_14', 0)),
+                strategy_rules.volume_spike(volume, volume_ma, params.get('volume_spike_mult', 1.2)),
+                bb_upper, bb_lower, sma20, params,
+            )
 
-            # Check for SHORT mean reversion (overbought rejection)
-            if rsi > 70:
-                touched_upper = prev_close >= bb_upper * 0.995
-                rejecting = close < bb_upper
-
-                if touched_upper and rejecting and volume_spike:
-                    stop_loss = max(prev['high'], bb_upper) + (atr * params.get('stop_atr_mult', 1.5))
-                    target_1 = sma20  # revert to mean
-                    target_2 = bb_lower  # overshoot to lower band
-
-                    return {
-                        "symbol": symbol,
-                        "direction": "sell",
-                        "strategy": "mean_reversion_short",
-                        "entry_price": close,
-                        "stop_loss": stop_loss,
-                        "target_1": target_1,
-                        "target_2": target_2,
-                        "confidence": self._calculate_confidence(df, "short", params),
-                        "bb_upper": round(bb_upper, 2),
-                        "bb_mid": round(bb_mid, 2),
-                        "bb_lower": round(bb_lower, 2),
-                        "technical_snapshot": self._get_technical_snapshot(df),
-                    }
+            # LONG oversold bounce (targets: SMA20, then upper band)
+            if setup.long:
+                target_1, target_2 = setup.long_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "buy",
+                    "strategy": "mean_reversion_long",
+                    "entry_price": close,
+                    "stop_loss": setup.long_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "long", params),
+                    "bb_upper": round(bb_upper, 2),
+                    "bb_mid": round(bb_mid, 2),
+                    "bb_lower": round(bb_lower, 2),
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
+
+            # SHORT overbought rejection (targets: SMA20, then lower band)
+            if setup.short:
+                target_1, target_2 = setup.short_targets
+                return {
+                    "symbol": symbol,
+                    "direction": "sell",
+                    "strategy": "mean_reversion_short",
+                    "entry_price": close,
+                    "stop_loss": setup.short_stop,
+                    "target_1": target_1,
+                    "target_2": target_2,
+                    "confidence": self._calculate_confidence(df, "short", params),
+                    "bb_upper": round(bb_upper, 2),
+                    "bb_mid": round(bb_mid, 2),
+                    "bb_lower": round(bb_lower, 2),
+                    "technical_snapshot": self._get_technical_snapshot(df),
+                }
 
             return None
 
@@ -1336,75 +1246,34 @@ class SignalEngine:
         - Gate: RVOL score: -20 to +10
         - IV quality: -20 to +5
         - Earnings risk: -10 to 0
+
+        Scoring lives in strategy_rules (base_confidence / gated_confidence).
         """
         try:
             bar = df.iloc[eval_idx]
-            score = 50.0  # Base score
-
-            ema8 = bar.get('ema8', 0)
-            ema21 = bar.get('ema21', 0)
-            rsi = bar.get('rsi', 50)
-            volume_spike = bar.get('volume_spike', False)
-            atr_percent = bar.get('atr_percent', 0)
 
             # Use effective_rvol (TOD if available, else classic)
             rvol_tod = bar.get('rvol_tod')
             classic_rvol = bar.get('rvol', 1.0)
             effective_rvol = rvol_tod if (rvol_tod is not None and not pd.isna(rvol_tod)) else classic_rvol
 
-            # Trend alignment (0 to +20)
-            if direction == "long":
-                if ema8 > ema21:
-                    score += 15
-                if bar['close'] > ema21:
-                    score += 5
-            else:
-                if ema8 < ema21:
-                    score += 15
-                if bar['close'] < ema21:
-                    score += 5
-
-            # Momentum (0 to +15)
-            if direction == "long" and rsi > 55:
-                score += 10
-            elif direction == "short" and rsi < 45:
-                score += 10
-            if direction == "long" and rsi > 60:
-                score += 5
-            elif direction == "short" and rsi < 40:
-                score += 5
-
-            # Volume confirmation (0 to +20) — uses effective_rvol
-            if volume_spike:
-                score += 10
-            if effective_rvol > 2.0:
-                score += 10
-            elif effective_rvol > 1.5:
-                score += 5
-
-            # ATR quality (0 to +5)
-            min_atr = params.get('min_atr_percent', 0.15)
-            if atr_percent > min_atr * 1.5:
-                score += 5
-
-            # Gate scores — cap total negative penalty at -25.
+            score = strategy_rules.base_confidence(
+                direction, bar['close'], bar.get('ema8', 0), bar.get('ema21', 0), bar.get('rsi', 50),
+                bar.get('volume_spike', False), effective_rvol, bar.get('atr_percent', 0), params,
+            )
+
+            # Gate scores — combined penalty capped at -25 (gated_confidence).
             # Previously capped at -15 which was too generous: a stock with
             # raw gate penalty of -40 was getting 25 free points. At -25 cap,
             # stocks with poor ATR/RVOL are penalized meaningfully but not
             # completely killed. MIN_CONFIDENCE (62) catches truly weak stocks.
-            if gate_scores:
-                atr_s = gate_scores.get('atr_score', 0)
-                rvol_s = gate_scores.get('rvol_score', 0)
-                combined_gate = atr_s + rvol_s
-                score += max(combined_gate, -25.0)
-
-            # IV quality (-20 to +5)
-            score += iv_score
-
-            # Earnings risk (-10 to 0)
-            score += earnings_score
-
-            return min(max(score, 0), 100)
+            gate_scores = gate_scores or {}
+            return float(strategy_rules.gated_confidence(
+                score,
+                gate_scores.get('atr_score', 0),
+                gate_scores.get('rvol_score', 0),
+                iv_score + earnings_score,  # IV quality (-20 to +5), earnings risk (-10 to 0)
+            ))
 
         except Exception as e:
             logger.error(f"Error calculating confidence: {e}")
@@ -1474,16 +1343,8 @@ class SignalEngine:
 
     @staticmethod
     def _to_native(val):
-        """Convert numpy scalars to Python native types for database storage."""
-        if isinstance(val, (np.integer,)):
-            return int(val)
-        if isinstance(val, (np.floating,)):
-            return float(val)
-        if isinstance(val, dict):
-            return {k: SignalEngine._to_native(v) for k, v in val.items()}
-        if isinstance(val, (list, tuple)):
-            return [SignalEngine._to_native(v) for v in val]
-        return val
+        """Convert numpy scalars to Python native types for database storage (JSON-safe: NaN → None)."""
+        return to_native(val)
 
     def _create_signal_record(self, signal: Dict, queue_item: SignalQueue, db: Session) -> TradingSignal:
         """Create TradingSignal database record and send notifications"""
@@ -1656,6 +1517,24 @@ class SignalEngine:
             logger.error(f"Error in _send_telegram_for_signal: {e}")
             return False
 
+    def get_streamable_symbols(self, db: Session) -> set:
+        """
+        Symbols of active queue items on intraday timeframes the price stream
+        aggregates — keeping these subscribed lets get_bars serve live bars.
+        """
+        from app.services.data_fetcher.bar_aggregator import LIVE_TIMEFRAMES
+
+        rows = (
+            db.query(SignalQueue.symbol)
+            .filter(
+                SignalQueue.status == "active",
+                SignalQueue.timeframe.in_(list(LIVE_TIMEFRAMES)),
+            )
+            .distinct()
+            .all()
+        )
+        return {r[0].upper() for r in rows if r[0]}
+
     def process_all_queue_items(self, db: Session) -> List[TradingSignal]:
         """
         Process all active queue items and return generated signals.
@@ -1690,11 +1569,19 @@ class SignalEngine:
                 'rejected_low_conf': 0,
             }
 
+            # One TastyTrade call for the whole cycle (IV rank per item is then cached)
+            cycle_stats['tastytrade'] = self._prefetch_iv_metrics(
+                sorted({i.symbol.upper() for i in items_due if i.symbol})
+            )
+
             for item in items_due:
                 signal = self.process_queue_item(item, db, cycle_stats)
                 if signal:
                     signals.append(signal)
 
+            if signals:
+                self.publish_new_signals(signals, db)
+
             # Count items that actually ran (not same-bar skipped)
             evaluated = len(items_due) - cycle_stats.get('same_bar_skip', 0)
             tod_avail = cycle_stats.get('tod_rvol_available', 0)
@@ -1721,6 +1608,37 @@ class SignalEngine:
             logger.error(f"Error processing queue: {e}")
             return signals
 
+    @staticmethod
+    def count_unread(db: Session) -> int:
+        """Active signals not yet read (the bell badge)."""
+        return db.query(TradingSignal).filter(
+            TradingSignal.is_read == False,  # noqa: E712
+            TradingSignal.status == "active",
+        ).count()
+
+    def publish_unread_count(self, db: Session):
+        """Push the unread count to /ws/events clients (signals.unread, retained)."""
+        try:
+            count = self.count_unread(db)
+        except Exception as e:
+            logger.debug(f"Unread count not published: {e}")
+            return
+        event_bus.publish(event_bus.SIGNALS_UNREAD, {"unread_count": count}, retain=True)
+
+    def publish_new_signals(self, signals: List[TradingSignal], db: Session):
+        """One signals.new event per signal created this cycle, then the new unread count."""
+        for signal in signals:
+            event_bus.publish(event_bus.SIGNALS_NEW, {
+                "id": signal.id,
+                "symbol": signal.symbol,
+                "timeframe": signal.timeframe,
+                "strategy": signal.strategy,
+                "direction": signal.direction,
+                "confidence_score": signal.confidence_score,
+                "entry_price": signal.entry_price,
+            })
+        self.publish_unread_count(db)
+
 
 # Singleton instance
 signal_engine = SignalEngine()
@@ -13,7 +13,6 @@ Before any signal reaches the trading bot, this service:
 The critical safety gate between signal generation and real money.
 """
 
-import asyncio
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
@@ -160,7 +159,7 @@ class SignalValidator:
     async def _fetch_fresh_data(self, symbol: str) -> Dict[str, Any]:
         """Fetch current market snapshot from Alpaca."""
         try:
-            snapshot = await asyncio.to_thread(alpaca_service.get_snapshot, symbol)
+            snapshot = await alpaca_service.get_snapshot_async(symbol)
             return snapshot or {}
         except Exception as e:
             logger.warning(f"[SignalValidator] Failed to fetch snapshot for {symbol}: {e}")
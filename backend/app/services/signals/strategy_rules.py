@@ -0,0 +1,213 @@
+"""
+Strategy rules shared by the live SignalEngine and the vectorized backtester.
+
+Every function here is written with NumPy operators only (&, |, np.where,
+np.minimum...), so the same code evaluates one bar — scalars, as
+SignalEngine._check_* passes for the latest bar — or every bar of a
+backtest at once when given whole columns. Keeping one copy of the entry
+conditions, stops, targets, gate scores and confidence means a backtest
+tests exactly what the live engine trades.
+"""
+from typing import Any, Dict, NamedTuple, Tuple
+
+import numpy as np
+
+
+class Setup(NamedTuple):
+    """Entry conditions, stops and (target_1, target_2) for both directions."""
+    long: Any
+    short: Any
+    long_stop: Any
+    short_stop: Any
+    long_targets: Tuple[Any, Any]
+    short_targets: Tuple[Any, Any]
+
+
+def _flag(value: Any) -> Any:
+    """Truthiness of a flag column/value (None → False, NaN → True, as `if value:`)."""
+    return np.asarray(value, dtype=bool) if value is not None else False
+
+
+def _r_targets(close: Any, stop: Any, r1: float, r2: float) -> Tuple[Any, Any]:
+    """Targets at r1/r2 multiples of the entry-to-stop risk (either direction)."""
+    risk = close - stop
+    return close + risk * r1, close + risk * r2
+
+
+def volume_spike(volume: Any, volume_ma: Any, mult: float) -> Any:
+    """Volume above mult × its moving average (False when the average is 0)."""
+    return (volume_ma > 0) & (volume > volume_ma * mult)
+
+
+# ---------------------------------------------------------------------------
+# Entry rules
+# ---------------------------------------------------------------------------
+
+def orb_breakout(
+    close, prev_close, orb_high, orb_low, ema8, ema21, rsi, spike, rvol, atr, params: Dict,
+) -> Setup:
+    """Close crosses the opening range with trend, RSI and volume confirmation."""
+    volume_ok = _flag(spike) | (rvol >= params.get('min_rvol', 1.2))
+    long = (
+        (close > orb_high) & (prev_close <= orb_high)
+        & ((ema8 > ema21) | (close > ema21))
+        & (rsi >= params.get('rsi_long_min', 50)) & volume_ok
+    )
+    short = (
+        (close < orb_low) & (prev_close >= orb_low)
+        & ((ema8 < ema21) | (close < ema21))
+        & (rsi <= params.get('rsi_short_max', 50)) & volume_ok
+    )
+    mult = params.get('stop_atr_mult', 0.5)
+    long_stop = orb_high - atr * mult
+    short_stop = orb_low + atr * mult
+    return Setup(long, short, long_stop, short_stop,
+                 _r_targets(close, long_stop, 1, 2), _r_targets(close, short_stop, 1, 2))
+
+
+def vwap_pullback(
+    close, prev_close, prev_low, prev_high, ema8, ema21, rsi, atr, volume, volume_ma, vwap, params: Dict,
+) -> Setup:
+    """Trend pullback that tags VWAP on contracting volume and reclaims it."""
+    volume_contracting = volume < volume_ma
+    long = (
+        (ema8 > ema21) & (close > ema21)
+        & (prev_close <= vwap) & (close > vwap)
+        & volume_contracting & (rsi >= params.get('rsi_long_min', 50))
+    )
+    short = (
+        (ema8 < ema21) & (close < ema21)
+        & (prev_close >= vwap) & (close < vwap)
+        & volume_contracting & (rsi <= params.get('rsi_short_max', 50))
+    )
+    long_stop = np.minimum(prev_low, vwap) - atr * 0.3
+    short_stop = np.maximum(prev_high, vwap) + atr * 0.3
+    return Setup(long, short, long_stop, short_stop,
+                 _r_targets(close, long_stop, 1, 1.5), _r_targets(close, short_stop, 1, 1.5))
+
+
+def range_breakout(
+    close, prev_close, range_high, range_low, ema8, ema21, rsi, spike, rvol, atr, params: Dict,
+) -> Setup:
+    """Close crosses the prior range's high/low with trend, RSI and volume confirmation."""
+    volume_ok = _flag(spike) | (rvol >= params.get('min_rvol', 1.15))
+    long = (
+        (close > range_high) & (prev_close <= range_high) & (ema8 > ema21)
+        & (rsi >= params.get('rsi_long_min', 55)) & volume_ok
+    )
+    short = (
+        (close < range_low) & (prev_close >= range_low) & (ema8 < ema21)
+        & (rsi <= params.get('rsi_short_max', 45)) & volume_ok
+    )
+    mult = params.get('stop_atr_mult', 0.6)
+    long_stop = range_high - atr * mult
+    short_stop = range_low + atr * mult
+    return Setup(long, short, long_stop, short_stop,
+                 _r_targets(close, long_stop, 1, 2), _r_targets(close, short_stop, 1, 2))
+
+
+def trend_following(
+    close, prev_close, prev_low, prev_high, sma20, sma50, sma200, adx, rsi, atr, params: Dict,
+) -> Setup:
+    """
+    SMA-stacked trend with ADX strength; enters when price reclaims (or
+    rejects) SMA20 from within 0.5% of it. sma200=None skips the long leg
+    of the stack (not enough history).
+    """
+    strong = adx >= params.get('min_adx', 25)
+    uptrend = sma20 > sma50
+    downtrend = sma20 < sma50
+    if sma200 is not None:
+        uptrend = uptrend & (sma50 > sma200)
+        downtrend = downtrend & (sma50 < sma200)
+
+    long = (
+        uptrend & strong
+        & (prev_close <= sma20 * 1.005) & (close > sma20)
+        & (rsi >= 40) & (rsi <= 70)
+    )
+    short = (
+        downtrend & strong
+        & (prev_close >= sma20 * 0.995) & (close < sma20)
+        & (rsi >= 30) & (rsi <= 60)
+    )
+    mult = params.get('stop_atr_mult', 1.5)
+    long_stop = np.minimum(sma50, prev_low) - atr * mult
+    short_stop = np.maximum(sma50, prev_high) + atr * mult
+    return Setup(long, short, long_stop, short_stop,
+                 _r_targets(close, long_stop, 1.5, 2.5), _r_targets(close, short_stop, 1.5, 2.5))
+
+
+def mean_reversion(
+    close, prev_close, prev_low, prev_high, rsi, atr, spike, bb_upper, bb_lower, sma20, params: Dict,
+) -> Setup:
+    """RSI extreme at a Bollinger Band, reversing back inside it on a volume spike."""
+    spike = _flag(spike)
+    long = (rsi < 30) & (prev_close <= bb_lower * 1.005) & (close > bb_lower) & spike
+    short = (rsi > 70) & (prev_close >= bb_upper * 0.995) & (close < bb_upper) & spike
+    mult = params.get('stop_atr_mult', 1.5)
+    long_stop = np.minimum(prev_low, bb_lower) - atr * mult
+    short_stop = np.maximum(prev_high, bb_upper) + atr * mult
+    return Setup(long, short, long_stop, short_stop, (sma20, bb_upper), (sma20, bb_lower))
+
+
+# ---------------------------------------------------------------------------
+# Quality gates and confidence
+# ---------------------------------------------------------------------------
+
+def atr_gate_score(atr_percent: Any, params: Dict) -> Any:
+    """ATR% relative to its pivot: -20 to +5, minus 10 when choppy (above max)."""
+    pivot = params.get('atr_pivot', params.get('min_atr_percent', 0.15))
+    max_atr = params.get('max_atr_percent', 1.0)
+    # Linear -15 to 0 between 50% and 100% of pivot
+    ratio = (atr_percent - pivot * 0.5) / (pivot * 0.5)
+    score = np.select(
+        [atr_percent >= pivot * 1.5, atr_percent >= pivot, atr_percent >= pivot * 0.5],
+        [5.0, 0.0, -15.0 * (1.0 - ratio)],
+        default=-20.0,
+    )
+    return score - np.where(atr_percent > max_atr, 10.0, 0.0)
+
+
+def rvol_gate_score(effective_rvol: Any, params: Dict) -> Any:
+    """Effective RVOL relative to its pivot: -20 to +10."""
+    pivot = params.get('rvol_pivot', params.get('min_rvol', 0.80))
+    ratio = (effective_rvol - pivot * 0.5) / (pivot * 0.5)
+    return np.select(
+        [effective_rvol >= pivot * 2.0, effective_rvol >= pivot * 1.5,
+         effective_rvol >= pivot, effective_rvol >= pivot * 0.5],
+        [10.0, 5.0, 0.0, -15.0 * (1.0 - ratio)],
+        default=-20.0,
+    )
+
+
+def base_confidence(
+    direction: str, close, ema8, ema21, rsi, spike, effective_rvol, atr_percent, params: Dict,
+) -> Any:
+    """
+    Bar-level confidence before gate/IV/earnings adjustments (50 to 110,
+    clamped by the caller): trend alignment 0..+20, RSI momentum 0..+15,
+    volume 0..+20, ATR quality 0..+5.
+    """
+    if direction == "long":
+        trend = np.where(ema8 > ema21, 15.0, 0.0) + np.where(close > ema21, 5.0, 0.0)
+        momentum = np.where(rsi > 55, 10.0, 0.0) + np.where(rsi > 60, 5.0, 0.0)
+    else:
+        trend = np.where(ema8 < ema21, 15.0, 0.0) + np.where(close < ema21, 5.0, 0.0)
+        momentum = np.where(rsi < 45, 10.0, 0.0) + np.where(rsi < 40, 5.0, 0.0)
+
+    volume = (
+        np.where(_flag(spike), 10.0, 0.0)
+        + np.select([effective_rvol > 2.0, effective_rvol > 1.5], [10.0, 5.0], default=0.0)
+    )
+    atr_quality = np.where(atr_percent > params.get('min_atr_percent', 0.15) * 1.5, 5.0, 0.0)
+    return 50.0 + trend + momentum + volume + atr_quality
+
+
+def gated_confidence(base: Any, atr_score: Any, rvol_score: Any, adjustments: Any = 0.0) -> Any:
+    """
+    Final confidence 0-100: the combined gate penalty is capped at -25, so
+    poor ATR/RVOL hurts without zeroing a setup (MIN_CONFIDENCE catches the
+    truly weak ones). `adjustments` carries the IV and earnings scores.
+    """
+    return np.clip(base + np.maximum(atr_score + rvol_score, -25.0) + adjustments, 0, 100)
@@ -78,8 +78,8 @@ class StrategySelector:
 
         Args:
             stock_data: SavedScanResult.stock_data JSON (scores, fundamentals, etc.)
-            fresh_metrics: Fresh FMP technical indicators (RSI, SMA, ATR, ADX, etc.)
-                           from fmp_service.get_strategy_metrics(symbol)
+            fresh_metrics: Fresh technical indicators (RSI, SMA, ATR, ADX, etc.)
+                           from local_strategy_metrics.get_strategy_metrics(symbol)
             snapshot: Fresh Alpaca snapshot (current_price, volume, bid/ask, etc.)
                       from alpaca_service.get_snapshot(symbol)
 
@@ -0,0 +1,204 @@
+"""
+API startup — cold-start profiling and the background warm-up.
+
+main.py imports each endpoint module through startup_profile.import_module,
+which records how long that module took to import (including any
+dependencies it was first to load). Heavy SDKs (anthropic, tastytrade,
+backtrader, python-telegram-bot) are imported where they are first used,
+so these numbers stay small.
+
+The startup event awaits prepare_database() (init_db, the settings seeders,
+the orphaned-scan cleanup) because the settings it reads right after must
+exist on a fresh database. The slow optional API clients (Finviz,
+TastyTrade, Claude, Telegram) run in warm_start(), a background task;
+/health answers while it runs and reports the whole profile under "startup".
+"""
+import asyncio
+import importlib
+import time
+from contextlib import contextmanager
+from threading import Lock
+from types import ModuleType
+from typing import Dict
+
+from loguru import logger
+
+# Slowest imports listed in the report
+REPORT_TOP_IMPORTS = 15
+
+
+class StartupProfile:
+    """Per-module import times and per-phase durations of this process's startup."""
+
+    def __init__(self):
+        self.imports: Dict[str, float] = {}   # module → ms
+        self.phases: Dict[str, float] = {}    # phase → ms
+        self.warmup = "pending"               # pending | running | done | failed
+        self._lock = Lock()
+
+    def import_module(self, name: str) -> ModuleType:
+        """importlib.import_module, timed."""
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        with self._lock:
+            self.imports.setdefault(name, (time.perf_counter() - start) * 1000)
+        return module
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup phase (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases[name] = (time.perf_counter() - start) * 1000
+
+    def report(self, top: int = REPORT_TOP_IMPORTS) -> dict:
+        with self._lock:
+            slowest = sorted(self.imports.items(), key=lambda kv: kv[1], reverse=True)[:top]
+            return {
+                "warmup": self.warmup,
+                "import_total_ms": round(sum(self.imports.values()), 1),
+                "imports_ms": {name: round(ms, 1) for name, ms in slowest},
+                "phases_ms": {name: round(ms, 1) for name, ms in self.phases.items()},
+            }
+
+
+startup_profile = StartupProfile()
+
+
+# ── Database preparation ─────────────────────────────────────────────────
+
+def interrupt_orphaned_scans(db) -> int:
+    """
+    Mark scan_started events with no later scan_complete / scan_failed as
+    scan_interrupted (the deploy killed the process mid-scan). One UPDATE.
+    """
+    from sqlalchemy import exists, update
+    from sqlalchemy.orm import aliased
+    from app.models.autopilot_log import AutopilotLog
+
+    finished = aliased(AutopilotLog)
+    result = db.execute(
+        update(AutopilotLog)
+        .where(
+            AutopilotLog.event_type == "scan_started",
+            ~exists().where(
+                finished.event_type.in_(["scan_complete", "scan_failed"]),
+                finished.timestamp > AutopilotLog.timestamp,
+            ),
+        )
+        .values(
+            event_type="scan_interrupted",
+            details={"reason": "Process restarted before scan completed"},
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def prepare_database():
+    """Create tables, seed settings and clean up orphaned scans (blocking)."""
+    from app.database import SessionLocal, init_db
+    from app.services.settings_service import settings_service
+
+    try:
+        with startup_profile.phase("init_db"):
+            init_db()
+        with startup_profile.phase("seed_settings"):
+            settings_service.seed_defaults()
+            settings_service.seed_api_status()
+            settings_service.seed_sector_mappings()
+        logger.info("Database and settings initialized")
+
+        # Clean up orphaned scan_started events from deploys that killed mid-scan
+        try:
+            with startup_profile.phase("scan_cleanup"):
+                db = SessionLocal()
+                try:
+                    cleaned = interrupt_orphaned_scans(db)
+                finally:
+                    db.close()
+            if cleaned:
+                logger.info(f"Cleaned up {cleaned} orphaned scan_started events")
+        except Exception as e:
+            logger.warning(f"Scan cleanup skipped: {e}")
+    except Exception as e:
+        logger.warning(f"Settings initialization skipped: {e}")
+
+
+# ── Optional API clients ─────────────────────────────────────────────────
+
+def initialize_optional_services(app_settings):
+    """Finviz, TastyTrade and Claude clients, when configured (blocking)."""
+    # Initialize Finviz service if token is configured
+    if app_settings.FINVIZ_API_TOKEN:
+        from app.services.data_fetcher.finviz import initialize_finviz_service
+        with startup_profile.phase("finviz"):
+            initialize_finviz_service(app_settings.FINVIZ_API_TOKEN)
+        logger.info("Finviz Elite API enabled")
+    else:
+        logger.info("Finviz Elite API not configured (optional)")
+
+    # Initialize TastyTrade service if credentials are configured
+    if app_settings.TASTYTRADE_PROVIDER_SECRET and app_settings.TASTYTRADE_REFRESH_TOKEN:
+        from app.services.data_fetcher.tastytrade import initialize_tastytrade_service
+        with startup_profile.phase("tastytrade"):
+            ok = initialize_tastytrade_service(
+                app_settings.TASTYTRADE_PROVIDER_SECRET,
+                app_settings.TASTYTRADE_REFRESH_TOKEN
+            )
+        if ok:
+            logger.info("TastyTrade API enabled (enhanced options data)")
+        else:
+            logger.warning("TastyTrade API initialization failed")
+    else:
+        logger.info("TastyTrade API not configured (optional - for enhanced Greeks/IV data)")
+
+    # Initialize Claude AI service if API key is configured
+    if app_settings.ANTHROPIC_API_KEY:
+        from app.services.ai.claude_service import initialize_claude_service
+        with startup_profile.phase("claude"):
+            ok = initialize_claude_service(app_settings.ANTHROPIC_API_KEY)
+        if ok:
+            logger.info(f"Claude AI enabled (model: {app_settings.CLAUDE_MODEL_PRIMARY})")
+        else:
+            logger.warning("Claude AI initialization failed")
+    else:
+        logger.info("Claude AI not configured (optional - for AI-powered analysis)")
+
+
+async def start_telegram_bot(app_settings):
+    """Initialize and start the Telegram bot if a token is configured."""
+    if not app_settings.TELEGRAM_BOT_TOKEN:
+        logger.info("Telegram bot not configured (optional - for remote commands)")
+        return
+
+    from app.services.telegram_bot import initialize_telegram_bot, get_telegram_bot
+    with startup_profile.phase("telegram"):
+        if initialize_telegram_bot(
+            app_settings.TELEGRAM_BOT_TOKEN,
+            app_settings.TELEGRAM_ALLOWED_USERS
+        ):
+            # Start the bot
+            bot = get_telegram_bot()
+            await bot.start()
+            logger.info("Telegram bot started")
+        else:
+            logger.warning("Telegram bot initialization failed")
+
+
+async def warm_start(app_settings):
+    """Background startup work; the app serves requests meanwhile."""
+    startup_profile.warmup = "running"
+    try:
+        with startup_profile.phase("warmup"):
+            await asyncio.to_thread(initialize_optional_services, app_settings)
+            await start_telegram_bot(app_settings)
+        startup_profile.warmup = "done"
+        logger.info(f"Warm-up complete in {startup_profile.phases['warmup']:.0f}ms")
+    except Exception as e:
+        startup_profile.warmup = "failed"
+        logger.error(f"Warm-up failed: {e}")
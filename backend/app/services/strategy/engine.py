@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 from loguru import logger
 
 from app.services.ai.market_regime import get_regime_detector
+from app.services.analysis.iv_history import get_iv_history_store
 from app.services.data_fetcher.tastytrade import get_tastytrade_service
 
 
@@ -242,7 +243,8 @@ class StrategyEngine:
         1. TastyTrade IV rank (most accurate, real-time)
         2. LEAPS summary IV rank
         3. Options data IV rank
-        4. Default to 50 (neutral)
+        4. Local ATM IV history (when TastyTrade is unavailable)
+        5. Default to 50 (neutral)
         """
         # Prefer TastyTrade IV rank (most accurate)
         if iv := stock_data.get('iv_rank_tastytrade'):
@@ -263,6 +265,12 @@ class StrategyEngine:
             if iv := options.get('iv_rank'):
                 return float(iv)
 
+        # Fallback to IV rank computed from the local IV history
+        if symbol := stock_data.get('symbol'):
+            iv = get_iv_history_store().iv_rank(symbol)
+            if iv is not None:
+                return iv
+
         return 50.0  # Default to neutral
 
     def _determine_trend(self, stock_data: Dict[str, Any]) -> str:
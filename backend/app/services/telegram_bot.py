@@ -491,7 +491,7 @@ class TelegramBotService:
 
             service = get_tastytrade_service()
             if service.is_available():
-                metrics = service.get_market_metrics(symbols)
+                metrics = service.metrics.get_many(symbols, wait_for_batch=False)
 
                 msg = f"*{name.upper()} Watchlist*\n\n"
                 for symbol in symbols:
@@ -7,10 +7,15 @@ Connects: Signal Engine → Risk Gateway → Position Sizer → Order Executor 
 Called from:
   - check_signals_job():  process_new_signals() — route new signals through the pipeline
   - monitor_positions_job(): run_position_monitor() — check open positions every 1 min
+  - StreamingExitWatcher:  execute_stream_exits() — SL/TP/trailing exits fired on price ticks
   - daily_reset_job():    daily_reset() — reset daily counters at market open
   - health_check_job():   run_health_check() — verify consistency every 5 min
   - API endpoints:        start/stop/emergency_stop/approve_signal
+
+State changes, entries and exits are published on the event bus (bot.status,
+trades.entry, trades.exit) for /ws/events clients.
 """
+import threading
 from datetime import datetime, timezone
 from typing import List, Optional
 
@@ -22,10 +27,12 @@ from app.models.bot_state import BotState, BotStatus, CircuitBreakerLevel
 from app.models.executed_trade import ExecutedTrade, TradeStatus, ExitReason
 from app.models.trading_signal import TradingSignal
 
+from app.services import event_bus
 from app.services.trading.risk_gateway import RiskGateway
 from app.services.trading.position_sizer import PositionSizer
 from app.services.trading.order_executor import OrderExecutor
-from app.services.trading.position_monitor import PositionMonitor
+from app.services.trading.position_monitor import PositionMonitor, ExitSignal
+from app.services.trading.exit_watcher import exit_watcher
 from app.services.trading.trade_journal import TradeJournal
 
 
@@ -37,6 +44,8 @@ class AutoTrader:
 
     def __init__(self):
         self._initialized = False
+        # Serializes exit execution between the poll and the streaming exit worker
+        self._exit_lock = threading.Lock()
 
     # =====================================================================
     # DB Helpers — config & state
@@ -164,6 +173,7 @@ class AutoTrader:
 
         if executed:
             logger.info(f"AutoTrader: executed {len(executed)} trades from {len(signals)} signals")
+            self.publish_state(state)
 
         return executed
 
@@ -191,29 +201,110 @@ class AutoTrader:
         # Run the monitor (pass bot_state for counter reconciliation)
         monitor_result = monitor.check_all_positions(config, bot_state=state)
 
-        exits_executed = 0
-        for exit_signal in monitor_result.exit_signals:
-            try:
-                trade = db.query(ExecutedTrade).get(exit_signal.trade_id)
-                if not trade or trade.status != TradeStatus.OPEN.value:
-                    continue
+        exits_executed = self._execute_exit_signals(
+            monitor_result.exit_signals, config, state,
+            risk, executor, journal, trading_svc, db,
+        )
 
-                exit_result = executor.execute_exit(
-                    trade,
-                    exit_signal.reason,
-                    current_price=exit_signal.current_price,
-                    bot_state=state,
-                )
+        # Reconcile the streaming exit book with the DB (polling is the fallback)
+        if exit_watcher.is_active:
+            for exit_signal in monitor_result.exit_signals:
+                exit_watcher.forget(exit_signal.trade_id)
+            open_trades = (
+                db.query(ExecutedTrade)
+                .filter(ExecutedTrade.status == TradeStatus.OPEN.value)
+                .all()
+            )
+            if exit_watcher.sync(open_trades):
+                db.commit()
 
-                if exit_result.success:
-                    exits_executed += 1
-                    # Send exit notification
-                    self._send_exit_notification(trade, exit_signal)
+        # Fills and broker-side bracket exits change positions without an exit signal
+        if not exits_executed and (
+            monitor_result.bracket_exits_reconciled or monitor_result.pending_fills_updated
+        ):
+            if monitor_result.bracket_exits_reconciled:
+                journal.update_daily_stats()
+            self.publish_state(state)
 
-            except Exception as e:
-                logger.error(
-                    f"AutoTrader: error executing exit for trade #{exit_signal.trade_id}: {e}"
-                )
+        return {
+            "positions_checked": monitor_result.positions_checked,
+            "exits": exits_executed,
+            "bracket_exits_reconciled": monitor_result.bracket_exits_reconciled,
+            "pending_fills_updated": monitor_result.pending_fills_updated,
+            "roll_alerts": monitor_result.roll_alerts_sent,
+            "errors": len(monitor_result.errors),
+        }
+
+    def execute_stream_exits(self, exit_signals: List[ExitSignal], db: Session) -> int:
+        """
+        Execute exits fired by the StreamingExitWatcher between monitor polls.
+        Returns the number of exits executed.
+        """
+        config = self._get_config(db)
+        state = self._get_or_create_state(db)
+
+        if state.status not in (BotStatus.RUNNING.value, BotStatus.PAUSED.value):
+            return 0
+
+        (
+            risk, sizer, executor, monitor, journal,
+            trading_svc, data_svc,
+        ) = self._build_services(db)
+
+        # Ticks can arrive in extended hours — only act while the market is open
+        clock = trading_svc.get_clock()
+        if not clock or not clock.get("is_open"):
+            logger.info(
+                f"AutoTrader: market closed — deferring {len(exit_signals)} "
+                f"streamed exit(s) to the position monitor"
+            )
+            return 0
+
+        return self._execute_exit_signals(
+            exit_signals, config, state,
+            risk, executor, journal, trading_svc, db,
+        )
+
+    def _execute_exit_signals(
+        self,
+        exit_signals: List[ExitSignal],
+        config: BotConfiguration,
+        state: BotState,
+        risk: RiskGateway,
+        executor: OrderExecutor,
+        journal: TradeJournal,
+        trading_svc,
+        db: Session,
+    ) -> int:
+        """Send exit orders for detected exit signals. Returns exits executed."""
+        exits_executed = 0
+        with self._exit_lock:
+            for exit_signal in exit_signals:
+                try:
+                    trade = db.query(ExecutedTrade).get(exit_signal.trade_id)
+                    if not trade:
+                        continue
+                    # The other exit path may have closed it since this session loaded it
+                    db.refresh(trade)
+                    if trade.status != TradeStatus.OPEN.value:
+                        continue
+
+                    exit_result = executor.execute_exit(
+                        trade,
+                        exit_signal.reason,
+                        current_price=exit_signal.current_price,
+                        bot_state=state,
+                    )
+
+                    if exit_result.success:
+                        exits_executed += 1
+                        # Send exit notification
+                        self._send_exit_notification(trade, exit_signal)
+
+                except Exception as e:
+                    logger.error(
+                        f"AutoTrader: error executing exit for trade #{exit_signal.trade_id}: {e}"
+                    )
 
         # Update daily stats if we had exits
         if exits_executed:
@@ -228,15 +319,9 @@ class AutoTrader:
             account = trading_svc.get_account()
             if account:
                 risk.update_circuit_breaker(config, state, account)
+            self.publish_state(state)
 
-        return {
-            "positions_checked": monitor_result.positions_checked,
-            "exits": exits_executed,
-            "bracket_exits_reconciled": monitor_result.bracket_exits_reconciled,
-            "pending_fills_updated": monitor_result.pending_fills_updated,
-            "roll_alerts": monitor_result.roll_alerts_sent,
-            "errors": len(monitor_result.errors),
-        }
+        return exits_executed
 
     # =====================================================================
     # Approve Signal (Semi-Auto mode)
@@ -275,6 +360,7 @@ class AutoTrader:
         if trade:
             # Refresh circuit breaker
             risk.update_circuit_breaker(config, state, account)
+            self.publish_state(state)
 
         return trade
 
@@ -311,6 +397,7 @@ class AutoTrader:
         state.consecutive_errors = 0
         state.last_error = None
         db.commit()
+        self.publish_state(state)
 
         mode_str = "PAPER" if config.paper_mode else "LIVE"
         exec_str = config.execution_mode
@@ -339,6 +426,7 @@ class AutoTrader:
         prev_status = state.status
         state.status = BotStatus.STOPPED.value
         db.commit()
+        self.publish_state(state)
 
         logger.info(f"AutoTrader: STOPPED (was {prev_status})")
         self._send_telegram("🔴 Trading bot stopped (graceful)")
@@ -365,6 +453,7 @@ class AutoTrader:
         state.status = BotStatus.STOPPED.value
         state.circuit_breaker_level = CircuitBreakerLevel.NONE.value
         db.commit()
+        self.publish_state(state)
 
         # Update daily stats after emergency
         journal.update_daily_stats()
@@ -398,6 +487,7 @@ class AutoTrader:
 
         state.reset_daily(equity)
         db.commit()
+        self.publish_state(state)
 
         logger.info(f"AutoTrader: daily reset — equity=${equity:,.2f}")
 
@@ -424,6 +514,7 @@ class AutoTrader:
             state.status = BotStatus.PAUSED.value
             state.last_error = f"Auto-paused: {state.consecutive_errors} consecutive errors"
             db.commit()
+            self.publish_state(state)
             self._send_telegram(
                 f"⚠️ Bot auto-paused: {state.consecutive_errors} consecutive errors\n"
                 f"Last error: {state.last_error}"
@@ -447,6 +538,21 @@ class AutoTrader:
         account = alpaca_trading_service.get_account()
 
         current_equity = account.get("equity", 0) if account else 0
+
+        return {
+            **self.state_summary(state),
+            "execution_mode": config.execution_mode,
+            "paper_mode": config.paper_mode,
+            # Account
+            "equity": round(current_equity, 2) if current_equity else 0,
+            "buying_power": round(account.get("buying_power", 0), 2) if account else 0,
+            # Event-driven exits
+            "streaming_exits": exit_watcher.get_status(),
+        }
+
+    @staticmethod
+    def state_summary(state: BotState) -> dict:
+        """The get_status fields that come from BotState alone (no broker calls)."""
         daily_pl = state.daily_pl or 0
         daily_pl_pct = 0
         if state.daily_start_equity and state.daily_start_equity > 0:
@@ -455,8 +561,6 @@ class AutoTrader:
         return {
             # Bot state
             "status": state.status,
-            "execution_mode": config.execution_mode,
-            "paper_mode": config.paper_mode,
             "started_at": state.started_at.isoformat() if state.started_at else None,
             # Daily stats
             "daily_pl": round(daily_pl, 2),
@@ -468,9 +572,6 @@ class AutoTrader:
             "open_positions": state.open_positions_count,
             "open_stocks": state.open_stock_positions,
             "open_options": state.open_option_positions,
-            # Account
-            "equity": round(current_equity, 2) if current_equity else 0,
-            "buying_power": round(account.get("buying_power", 0), 2) if account else 0,
             # Circuit breaker
             "circuit_breaker": state.circuit_breaker_level,
             # Health
@@ -481,6 +582,10 @@ class AutoTrader:
             "consecutive_errors": state.consecutive_errors,
         }
 
+    def publish_state(self, state: BotState):
+        """Push the bot's state to /ws/events clients (bot.status, retained)."""
+        event_bus.publish(event_bus.BOT_STATUS, self.state_summary(state), retain=True)
+
     # =====================================================================
     # Manual Signal Execution (from "Trade" button in UI)
     # =====================================================================
@@ -611,6 +716,7 @@ class AutoTrader:
             # Record as manual execution
             trade.execution_mode = "manual"
             db.commit()
+            self.publish_state(state)
 
             logger.info(
                 f"AutoTrader: MANUAL execution — {signal.symbol} "
@@ -779,6 +885,16 @@ class AutoTrader:
             f"SL: ${trade.stop_loss_price or 'N/A'}\n"
             f"Confidence: {signal.confidence_score or 'N/A'}%"
         )
+        event_bus.publish(event_bus.TRADES_ENTRY, {
+            "trade_id": trade.id,
+            "signal_id": signal.id,
+            "symbol": trade.symbol,
+            "asset_type": trade.asset_type,
+            "direction": trade.direction,
+            "quantity": trade.quantity,
+            "entry_price": trade.entry_price,
+            "status": trade.status,
+        })
 
     def _send_exit_notification(self, trade: ExecutedTrade, exit_signal):
         """Send position exit notification."""
@@ -791,6 +907,14 @@ class AutoTrader:
             f"Exit: ${exit_signal.current_price}\n"
             f"P&L: ${trade.realized_pl or 0:.2f} ({trade.realized_pl_pct or 0:.1f}%)"
         )
+        event_bus.publish(event_bus.TRADES_EXIT, {
+            "trade_id": trade.id,
+            "symbol": trade.symbol,
+            "reason": exit_signal.reason.value,
+            "exit_price": trade.exit_price or exit_signal.current_price,
+            "realized_pl": trade.realized_pl,
+            "realized_pl_pct": trade.realized_pl_pct,
+        })
 
 
 # Singleton
@@ -0,0 +1,461 @@
+"""
+Streaming Exit Watcher — event-driven stop-loss / take-profit / trailing-stop exits.
+
+The one-minute Position Monitor poll lets a fast move run far through a stop
+before the next cycle. This module evaluates exits on every trade tick from
+PriceStreamService instead:
+
+  - ExitTriggerBook keeps per-symbol trigger levels in sorted lists, so each
+    tick costs O(log n) bisects plus the number of triggers that actually fire.
+  - StreamingExitWatcher subscribes open-position symbols on the price stream,
+    evaluates ticks in the stream thread and hands fired exits to a single
+    worker thread that runs the normal AutoTrader exit path.
+
+The Position Monitor poll remains the reconciliation fallback: every cycle it
+re-syncs the book from the DB (open trades in, closed trades out) and persists
+high-water marks the stream advanced between polls.
+
+Only stock positions are streamed — option positions are priced from the
+Alpaca position (not the underlying's trades) and stay on the poll.
+"""
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from app.models.executed_trade import ExecutedTrade, ExitReason, TradeStatus
+from app.services.trading.position_monitor import ExitSignal
+
+
+# Exit priority when several triggers fire on the same tick — mirrors the
+# check order in PositionMonitor._check_single_position.
+_RANK_STOP_LOSS = 0
+_RANK_TAKE_PROFIT = 1
+_RANK_TRAILING = 2
+
+_RANK_REASON = {
+    _RANK_STOP_LOSS: ExitReason.STOP_LOSS,
+    _RANK_TAKE_PROFIT: ExitReason.TAKE_PROFIT,
+    _RANK_TRAILING: ExitReason.TRAILING_STOP,
+}
+
+# (level, trade_id, rank) — tuples sort by level first
+_Trigger = Tuple[float, int, int]
+
+
+@dataclass
+class WatchedPosition:
+    """In-memory exit parameters for one open trade."""
+    trade_id: int
+    symbol: str
+    is_long: bool
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+    trailing_pct: Optional[float] = None
+    high_water: Optional[float] = None
+
+    @property
+    def trailing_level(self) -> Optional[float]:
+        if not self.trailing_pct or not self.high_water:
+            return None
+        if self.is_long:
+            return self.high_water * (1 - self.trailing_pct / 100)
+        return self.high_water * (1 + self.trailing_pct / 100)
+
+    def triggers(self) -> Tuple[List[_Trigger], List[_Trigger]]:
+        """Return (below, above) triggers: fire when price <= / >= level."""
+        below: List[_Trigger] = []
+        above: List[_Trigger] = []
+        if self.stop_loss and self.stop_loss > 0:
+            (below if self.is_long else above).append(
+                (self.stop_loss, self.trade_id, _RANK_STOP_LOSS)
+            )
+        if self.take_profit and self.take_profit > 0:
+            (above if self.is_long else below).append(
+                (self.take_profit, self.trade_id, _RANK_TAKE_PROFIT)
+            )
+        trail = self.trailing_level
+        if trail is not None:
+            (below if self.is_long else above).append(
+                (trail, self.trade_id, _RANK_TRAILING)
+            )
+        return below, above
+
+
+def _remove_sorted(items: list, item) -> None:
+    """Remove one exact element from a sorted list in O(log n) search."""
+    idx = bisect_left(items, item)
+    if idx < len(items) and items[idx] == item:
+        del items[idx]
+
+
+class ExitTriggerBook:
+    """
+    Sorted per-symbol exit trigger levels.
+
+    For each symbol two sorted lists are kept:
+      _below — triggers that fire when price <= level (long SL/trail, short TP)
+      _above — triggers that fire when price >= level (long TP, short SL/trail)
+
+    Trailing positions are additionally indexed by high-water mark so a tick
+    only touches the trailing stops whose anchor it actually moves.
+
+    Not thread-safe on its own; StreamingExitWatcher serializes access.
+    """
+
+    def __init__(self):
+        self._positions: Dict[int, WatchedPosition] = {}
+        self._below: Dict[str, List[_Trigger]] = {}
+        self._above: Dict[str, List[_Trigger]] = {}
+        # (high_water, trade_id) — longs ratchet up, shorts ratchet down
+        self._trail_long: Dict[str, List[Tuple[float, int]]] = {}
+        self._trail_short: Dict[str, List[Tuple[float, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, trade_id: int) -> bool:
+        return trade_id in self._positions
+
+    @property
+    def symbols(self) -> Set[str]:
+        return {p.symbol for p in self._positions.values()}
+
+    @property
+    def trade_ids(self) -> Set[int]:
+        return set(self._positions)
+
+    def get(self, trade_id: int) -> Optional[WatchedPosition]:
+        return self._positions.get(trade_id)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, position: WatchedPosition) -> None:
+        """Insert (or replace) a position's triggers."""
+        if position.trade_id in self._positions:
+            self.remove(position.trade_id)
+
+        below, above = position.triggers()
+        if not below and not above:
+            return
+
+        self._positions[position.trade_id] = position
+        symbol = position.symbol
+        for trig in below:
+            insort(self._below.setdefault(symbol, []), trig)
+        for trig in above:
+            insort(self._above.setdefault(symbol, []), trig)
+        if position.trailing_level is not None:
+            index = self._trail_long if position.is_long else self._trail_short
+            insort(index.setdefault(symbol, []), (position.high_water, position.trade_id))
+
+    def remove(self, trade_id: int) -> Optional[WatchedPosition]:
+        """Drop all triggers for a trade. Returns the removed position."""
+        position = self._positions.pop(trade_id, None)
+        if position is None:
+            return None
+
+        symbol = position.symbol
+        below, above = position.triggers()
+        for trig in below:
+            _remove_sorted(self._below.get(symbol, []), trig)
+        for trig in above:
+            _remove_sorted(self._above.get(symbol, []), trig)
+        if position.trailing_level is not None:
+            index = self._trail_long if position.is_long else self._trail_short
+            _remove_sorted(index.get(symbol, []), (position.high_water, trade_id))
+
+        for index in (self._below, self._above, self._trail_long, self._trail_short):
+            if symbol in index and not index[symbol]:
+                del index[symbol]
+        return position
+
+    # ------------------------------------------------------------------
+    # Tick evaluation
+    # ------------------------------------------------------------------
+
+    def _ratchet_trailing(self, symbol: str, price: float) -> None:
+        """Move trailing anchors the tick improved, re-pricing their triggers."""
+        longs = self._trail_long.get(symbol)
+        if longs and longs[0][0] < price:
+            # Every anchor below the tick becomes the tick price
+            idx = bisect_left(longs, (price,))
+            moved = longs[:idx]
+            below = self._below[symbol]
+            for _hw, trade_id in moved:
+                pos = self._positions[trade_id]
+                _remove_sorted(below, (pos.trailing_level, trade_id, _RANK_TRAILING))
+                pos.high_water = price
+                insort(below, (pos.trailing_level, trade_id, _RANK_TRAILING))
+            self._trail_long[symbol] = sorted((price, tid) for _hw, tid in moved) + longs[idx:]
+
+        shorts = self._trail_short.get(symbol)
+        if shorts and shorts[-1][0] > price:
+            idx = bisect_right(shorts, (price, float("inf")))
+            moved = shorts[idx:]
+            above = self._above[symbol]
+            for _hw, trade_id in moved:
+                pos = self._positions[trade_id]
+                _remove_sorted(above, (pos.trailing_level, trade_id, _RANK_TRAILING))
+                pos.high_water = price
+                insort(above, (pos.trailing_level, trade_id, _RANK_TRAILING))
+            self._trail_short[symbol] = shorts[:idx] + sorted((price, tid) for _hw, tid in moved)
+
+    def evaluate(self, symbol: str, price: float) -> List[ExitSignal]:
+        """
+        Apply one trade tick. Returns exit signals for every position whose
+        trigger was crossed; fired positions are removed (one-shot).
+        """
+        if price is None or price <= 0:
+            return []
+
+        self._ratchet_trailing(symbol, price)
+
+        fired: Dict[int, _Trigger] = {}
+        below = self._below.get(symbol)
+        if below:
+            for trig in below[bisect_left(below, (price,)):]:
+                if trig[1] not in fired or trig[2] < fired[trig[1]][2]:
+                    fired[trig[1]] = trig
+        above = self._above.get(symbol)
+        if above:
+            for trig in above[:bisect_right(above, (price, float("inf")))]:
+                if trig[1] not in fired or trig[2] < fired[trig[1]][2]:
+                    fired[trig[1]] = trig
+
+        signals = []
+        for trade_id, (level, _tid, rank) in fired.items():
+            self.remove(trade_id)
+            trigger_price = round(level, 2) if rank == _RANK_TRAILING else level
+            signals.append(ExitSignal(
+                trade_id, symbol, _RANK_REASON[rank], price, trigger_price,
+            ))
+        return signals
+
+
+class StreamingExitWatcher:
+    """
+    Evaluates exit triggers on every streamed trade tick.
+
+    Wiring:
+      start()                  — register on PriceStreamService
+      sync(open_trades)        — called by the position-monitor poll (reconciliation)
+      refresh_subscriptions()  — subscribe/pin open-position symbols on the stream
+      on_price_update(data)    — stream callback (also the synthetic-tick entry point)
+
+    Fired exits go to `exit_handler(signals)` on a dedicated worker thread so
+    order placement never blocks the stream. The default handler routes them
+    through AutoTrader.execute_stream_exits().
+    """
+
+    # Pin owner name on PriceStreamService
+    STREAM_OWNER = "exit_watcher"
+
+    def __init__(
+        self,
+        price_stream=None,
+        exit_handler: Optional[Callable[[List[ExitSignal]], None]] = None,
+    ):
+        self._price_stream = price_stream
+        self._exit_handler = exit_handler or self._default_exit_handler
+        self._book = ExitTriggerBook()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._active = False
+
+        # Stats
+        self._ticks = 0
+        self._exits_fired = 0
+        self._last_eval_us = 0.0
+        self._last_exit_at: Optional[datetime] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def is_active(self) -> bool:
+        return self._active
+
+    def _get_price_stream(self):
+        if self._price_stream is None:
+            from app.services.data_fetcher.price_stream_service import get_price_stream_service
+            self._price_stream = get_price_stream_service()
+        return self._price_stream
+
+    def start(self) -> bool:
+        """Register on the price stream. Returns False if streaming is unavailable."""
+        if self._active:
+            return True
+        stream = self._get_price_stream()
+        if not stream.is_available:
+            logger.info("StreamingExitWatcher: price stream unavailable — polling only")
+            return False
+        stream.register_callback(self.on_price_update)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stream-exit")
+        self._active = True
+        logger.info("StreamingExitWatcher: started (poll remains as fallback)")
+        return True
+
+    def stop(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        stream = self._get_price_stream()
+        stream.unregister_callback(self.on_price_update)
+        stream.release_symbols(self.STREAM_OWNER)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        logger.info("StreamingExitWatcher: stopped")
+
+    # ------------------------------------------------------------------
+    # Reconciliation (poll path)
+    # ------------------------------------------------------------------
+
+    def sync(self, open_trades: Iterable[ExecutedTrade]) -> int:
+        """
+        Rebuild the trigger book from the DB's open trades.
+
+        High-water marks the stream advanced since the last poll are written
+        back onto the trade rows (caller commits). Returns the number of
+        trades whose high-water mark was updated.
+        """
+        hw_updated = 0
+        with self._lock:
+            seen: Set[int] = set()
+            for trade in open_trades:
+                if trade.status != TradeStatus.OPEN.value or trade.asset_type == "option":
+                    continue
+                seen.add(trade.id)
+                is_long = trade.direction == "buy"
+
+                high_water = trade.trailing_stop_high_water or trade.entry_price
+                existing = self._book.get(trade.id)
+                if existing and existing.high_water and high_water:
+                    streamed = existing.high_water
+                    better = streamed > high_water if is_long else streamed < high_water
+                    if better:
+                        high_water = streamed
+                        trade.trailing_stop_high_water = streamed
+                        hw_updated += 1
+
+                self._book.add(WatchedPosition(
+                    trade_id=trade.id,
+                    symbol=trade.symbol,
+                    is_long=is_long,
+                    stop_loss=trade.stop_loss_price,
+                    take_profit=trade.take_profit_price,
+                    trailing_pct=trade.trailing_stop_pct,
+                    high_water=high_water,
+                ))
+
+            for trade_id in self._book.trade_ids - seen:
+                self._book.remove(trade_id)
+
+        return hw_updated
+
+    def forget(self, trade_id: int) -> None:
+        """Drop a trade (e.g. after the poll path exited it)."""
+        with self._lock:
+            self._book.remove(trade_id)
+
+    async def refresh_subscriptions(self) -> None:
+        """
+        Subscribe and pin the symbols of watched positions on the price
+        stream; symbols of closed positions are unpinned and unsubscribed
+        unless something else still uses them.
+        """
+        if not self._active:
+            return
+        with self._lock:
+            wanted = self._book.symbols
+        await self._get_price_stream().track_symbols(self.STREAM_OWNER, wanted)
+
+    # ------------------------------------------------------------------
+    # Tick path
+    # ------------------------------------------------------------------
+
+    def on_price_update(self, data: dict) -> List[ExitSignal]:
+        """
+        Stream callback. Evaluates trade ticks only — quote mids on wide
+        spreads would cause false exits. Returns the signals it dispatched.
+        """
+        if data.get("type") != "trade":
+            return []
+        symbol = data.get("symbol")
+        price = data.get("price")
+        if not symbol or not price:
+            return []
+
+        t0 = time.perf_counter()
+        with self._lock:
+            signals = self._book.evaluate(symbol, float(price))
+            self._ticks += 1
+        self._last_eval_us = (time.perf_counter() - t0) * 1e6
+
+        if signals:
+            self._exits_fired += len(signals)
+            self._last_exit_at = datetime.now(timezone.utc)
+            for sig in signals:
+                logger.info(
+                    f"StreamingExitWatcher: {sig.reason.value} fired for {sig.symbol} "
+                    f"@ ${sig.current_price} (trigger ${sig.trigger_price}, trade #{sig.trade_id})"
+                )
+            self._dispatch(signals)
+        return signals
+
+    def _dispatch(self, signals: List[ExitSignal]) -> None:
+        if self._executor is None:
+            self._run_handler(signals)
+        else:
+            self._executor.submit(self._run_handler, signals)
+
+    def _run_handler(self, signals: List[ExitSignal]) -> None:
+        try:
+            self._exit_handler(signals)
+        except Exception as e:
+            logger.error(f"StreamingExitWatcher: exit handler failed: {e}")
+
+    @staticmethod
+    def _default_exit_handler(signals: List[ExitSignal]) -> None:
+        from app.database import SessionLocal
+        from app.services.trading.auto_trader import auto_trader
+
+        db = SessionLocal()
+        try:
+            auto_trader.execute_stream_exits(signals, db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def get_status(self) -> dict:
+        with self._lock:
+            watched = len(self._book)
+            symbols = len(self._book.symbols)
+        return {
+            "active": self._active,
+            "positions_watched": watched,
+            "symbols_subscribed": symbols,
+            "ticks_evaluated": self._ticks,
+            "exits_fired": self._exits_fired,
+            "last_eval_us": round(self._last_eval_us, 1),
+            "last_exit_at": self._last_exit_at.isoformat() if self._last_exit_at else None,
+        }
+
+
+# Singleton
+exit_watcher = StreamingExitWatcher()
@@ -3,19 +3,27 @@ Trade Journal — aggregation, analytics, and daily performance tracking.
 
 The OrderExecutor handles creating/updating ExecutedTrade records.
 The TradeJournal focuses on:
-  - Daily stats rollup (upsert into DailyBotPerformance)
+  - Daily stats rollup (upsert into DailyBotPerformance and DailyTradeRollup)
   - Performance summary over date ranges
   - Trade history queries
+
+Aggregates run in SQL. update_daily_stats (called whenever trades close)
+recomputes one day from that day's trades: a GROUP BY into DailyTradeRollup
+rows per strategy / asset type / exit reason, and a window function for the
+intraday drawdown. Range summaries then sum rollup rows, so they cost the
+same for ten trades or ten thousand.
 """
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Optional, List
 
 from loguru import logger
-from sqlalchemy import func as sa_func, and_, extract
+from sqlalchemy import case, delete, func as sa_func, insert, select
 from sqlalchemy.orm import Session
 
 from app.models.executed_trade import ExecutedTrade, TradeStatus
 from app.models.daily_bot_performance import DailyBotPerformance
+from app.models.daily_trade_rollup import DailyTradeRollup
+from app.models.trading_signal import TradingSignal
 
 
 class TradeJournal:
@@ -28,22 +36,86 @@ class TradeJournal:
     # Daily Stats
     # =====================================================================
 
+    @staticmethod
+    def _closed_between(start_date: date, end_date: date):
+        exit_day = sa_func.date(ExecutedTrade.exit_filled_at)
+        return (
+            ExecutedTrade.status == TradeStatus.CLOSED.value,
+            exit_day >= start_date,
+            exit_day <= end_date,
+        )
+
+    def _day_rollups(self, target_date: date) -> List[dict]:
+        """Closed trades of one day aggregated per (strategy, asset_type, exit_reason)."""
+        # Per-trade keys first, so GROUP BY works on plain columns (PostgreSQL
+        # won't match expressions with bound parameters between SELECT and GROUP BY)
+        trades = (
+            select(
+                sa_func.substr(
+                    sa_func.coalesce(
+                        TradingSignal.strategy, sa_func.nullif(ExecutedTrade.notes, ""), "unknown",
+                    ),
+                    1, 100,
+                ).label("strategy"),
+                sa_func.coalesce(sa_func.nullif(ExecutedTrade.asset_type, ""), "stock").label("asset_type"),
+                sa_func.coalesce(sa_func.nullif(ExecutedTrade.exit_reason, ""), "unknown").label("exit_reason"),
+                sa_func.coalesce(ExecutedTrade.realized_pl, 0.0).label("pl"),
+                sa_func.coalesce(ExecutedTrade.fees, 0.0).label("fees"),
+                sa_func.nullif(ExecutedTrade.hold_duration_minutes, 0).label("hold"),
+            )
+            .outerjoin(TradingSignal, TradingSignal.id == ExecutedTrade.signal_id)
+            .where(*self._closed_between(target_date, target_date))
+            .subquery()
+        )
+        pl = trades.c.pl
+        stmt = (
+            select(
+                trades.c.strategy,
+                trades.c.asset_type,
+                trades.c.exit_reason,
+                sa_func.count().label("trades_count"),
+                sa_func.sum(case((pl > 0, 1), else_=0)).label("wins"),
+                sa_func.sum(case((pl < 0, 1), else_=0)).label("losses"),
+                sa_func.sum(pl).label("gross_pl"),
+                sa_func.sum(case((pl > 0, pl), else_=0.0)).label("win_pl"),
+                sa_func.sum(case((pl < 0, pl), else_=0.0)).label("loss_pl"),
+                sa_func.sum(trades.c.fees).label("total_fees"),
+                sa_func.max(pl).label("best_trade_pl"),
+                sa_func.min(pl).label("worst_trade_pl"),
+                sa_func.coalesce(sa_func.sum(trades.c.hold), 0).label("hold_minutes_total"),
+                sa_func.count(trades.c.hold).label("hold_count"),
+            )
+            .group_by(trades.c.strategy, trades.c.asset_type, trades.c.exit_reason)
+        )
+        return [dict(row._mapping) for row in self.db.execute(stmt)]
+
+    def _day_min_running_pl(self, target_date: date) -> float:
+        """Lowest cumulative P&L through the day, in exit order (window function)."""
+        running = (
+            select(
+                sa_func.sum(sa_func.coalesce(ExecutedTrade.realized_pl, 0.0))
+                .over(order_by=(ExecutedTrade.exit_filled_at, ExecutedTrade.id))
+                .label("running_pl")
+            )
+            .where(*self._closed_between(target_date, target_date))
+            .subquery()
+        )
+        return self.db.scalar(select(sa_func.min(running.c.running_pl))) or 0.0
+
     def update_daily_stats(self, target_date: Optional[date] = None) -> DailyBotPerformance:
         """
-        Aggregate all closed trades for a date into DailyBotPerformance.
-        Creates or updates the row for that date.
+        Aggregate all closed trades for a date into DailyBotPerformance and
+        the day's DailyTradeRollup rows. Creates or updates the rows for that
+        date; safe to call repeatedly.
         """
         target_date = target_date or date.today()
 
-        # Query closed trades for the target date
-        trades = (
-            self.db.query(ExecutedTrade)
-            .filter(
-                ExecutedTrade.status == TradeStatus.CLOSED.value,
-                sa_func.date(ExecutedTrade.exit_filled_at) == target_date,
-            )
-            .all()
-        )
+        groups = self._day_rollups(target_date)
+
+        # Replace the day's rollup rows
+        self.db.execute(delete(DailyTradeRollup).where(DailyTradeRollup.date == target_date))
+        if groups:
+            self.db.execute(insert(DailyTradeRollup), [{"date": target_date, **g} for g in groups])
 
         # Get or create daily record
         daily = (
@@ -55,48 +127,39 @@ class TradeJournal:
             daily = DailyBotPerformance(date=target_date)
             self.db.add(daily)
 
-        if not trades:
+        if not groups:
             self.db.commit()
             return daily
 
-        # Aggregate
-        pls = [t.realized_pl or 0 for t in trades]
-        fees = [t.fees or 0 for t in trades]
-        hold_mins = [t.hold_duration_minutes for t in trades if t.hold_duration_minutes]
-
-        wins = [pl for pl in pls if pl > 0]
-        losses = [pl for pl in pls if pl < 0]
-
-        daily.trades_count = len(trades)
-        daily.wins = len(wins)
-        daily.losses = len(losses)
-        daily.win_rate = round((len(wins) / len(trades)) * 100, 1) if trades else 0
-        daily.gross_pl = round(sum(pls), 2)
-        daily.total_fees = round(sum(fees), 2)
+        # Day totals from the (few) rollup groups
+        trades_count = sum(g["trades_count"] for g in groups)
+        wins = sum(g["wins"] for g in groups)
+        gross_pl = sum(g["gross_pl"] for g in groups)
+        hold_count = sum(g["hold_count"] for g in groups)
+
+        daily.trades_count = trades_count
+        daily.wins = wins
+        daily.losses = sum(g["losses"] for g in groups)
+        daily.win_rate = round((wins / trades_count) * 100, 1)
+        daily.gross_pl = round(gross_pl, 2)
+        daily.total_fees = round(sum(g["total_fees"] for g in groups), 2)
         daily.net_pl = round(daily.gross_pl - daily.total_fees, 2)
-        daily.best_trade_pl = round(max(pls), 2) if pls else 0
-        daily.worst_trade_pl = round(min(pls), 2) if pls else 0
-        daily.avg_trade_pl = round(sum(pls) / len(pls), 2) if pls else 0
-        daily.avg_hold_minutes = round(sum(hold_mins) / len(hold_mins), 1) if hold_mins else None
+        daily.best_trade_pl = round(max(g["best_trade_pl"] for g in groups), 2)
+        daily.worst_trade_pl = round(min(g["worst_trade_pl"] for g in groups), 2)
+        daily.avg_trade_pl = round(gross_pl / trades_count, 2)
+        daily.avg_hold_minutes = (
+            round(sum(g["hold_minutes_total"] for g in groups) / hold_count, 1) if hold_count else None
+        )
 
         # Count by asset type
-        daily.stocks_traded = sum(1 for t in trades if t.asset_type == "stock")
-        daily.options_traded = sum(1 for t in trades if t.asset_type == "option")
+        daily.stocks_traded = sum(g["trades_count"] for g in groups if g["asset_type"] == "stock")
+        daily.options_traded = sum(g["trades_count"] for g in groups if g["asset_type"] == "option")
 
         # Circuit breaker check
-        daily.circuit_breaker_triggered = any(
-            t.exit_reason == "circuit_breaker" for t in trades
-        )
+        daily.circuit_breaker_triggered = any(g["exit_reason"] == "circuit_breaker" for g in groups)
 
-        # Max drawdown: worst running P&L through the day
-        running_pl = 0.0
-        max_dd = 0.0  # dollar drawdown (negative or zero)
-        # Sort by exit time for chronological running P&L
-        sorted_trades = sorted(trades, key=lambda t: t.exit_filled_at or datetime.min)
-        for t in sorted_trades:
-            running_pl += (t.realized_pl or 0)
-            if running_pl < max_dd:
-                max_dd = running_pl
+        # Max drawdown: worst running P&L through the day (dollar, negative or zero)
+        max_dd = min(self._day_min_running_pl(target_date), 0.0)
         # Convert dollar drawdown to percentage if start equity is available
         if max_dd < 0 and daily.start_equity and daily.start_equity > 0:
             daily.max_drawdown_pct = round((max_dd / daily.start_equity) * 100, 2)
@@ -117,10 +180,56 @@ class TradeJournal:
 
         return daily
 
+    def rebuild_daily_stats(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """
+        Recompute daily stats and rollups for every day with closed trades
+        in the range (default: all history). Returns the number of days.
+        """
+        exit_day = sa_func.date(ExecutedTrade.exit_filled_at)
+        query = self.db.query(exit_day).filter(
+            ExecutedTrade.status == TradeStatus.CLOSED.value,
+            ExecutedTrade.exit_filled_at.isnot(None),
+        )
+        if start_date:
+            query = query.filter(exit_day >= start_date)
+        if end_date:
+            query = query.filter(exit_day <= end_date)
+
+        days = sorted({
+            d if isinstance(d, date) else date.fromisoformat(str(d))
+            for (d,) in query.distinct()
+        })
+        for day in days:
+            self.update_daily_stats(day)
+        return len(days)
+
     # =====================================================================
     # Performance Summary
     # =====================================================================
 
+    def _rollup_breakdown(self, column, start_date: date, end_date: date) -> dict:
+        """Sum rollup rows in a date range, grouped by one rollup column."""
+        rows = (
+            self.db.query(
+                column,
+                sa_func.sum(DailyTradeRollup.trades_count),
+                sa_func.sum(DailyTradeRollup.gross_pl),
+                sa_func.sum(DailyTradeRollup.wins),
+                sa_func.sum(DailyTradeRollup.losses),
+            )
+            .filter(DailyTradeRollup.date >= start_date, DailyTradeRollup.date <= end_date)
+            .group_by(column)
+            .all()
+        )
+        return {
+            key: {"count": count, "pl": round(pl or 0, 2), "wins": wins, "losses": losses}
+            for key, count, pl, wins, losses in rows
+        }
+
     def get_performance_summary(
         self,
         start_date: Optional[date] = None,
@@ -146,18 +255,25 @@ class TradeJournal:
             .all()
         )
 
-        # Get individual closed trades for detailed breakdown
-        trades = (
-            self.db.query(ExecutedTrade)
-            .filter(
-                ExecutedTrade.status == TradeStatus.CLOSED.value,
-                sa_func.date(ExecutedTrade.exit_filled_at) >= start_date,
-                sa_func.date(ExecutedTrade.exit_filled_at) <= end_date,
+        # Totals across the range from the rollup
+        totals = (
+            self.db.query(
+                sa_func.sum(DailyTradeRollup.trades_count).label("trades"),
+                sa_func.sum(DailyTradeRollup.wins).label("wins"),
+                sa_func.sum(DailyTradeRollup.losses).label("losses"),
+                sa_func.sum(DailyTradeRollup.gross_pl).label("total_pl"),
+                sa_func.sum(DailyTradeRollup.win_pl).label("win_pl"),
+                sa_func.sum(DailyTradeRollup.loss_pl).label("loss_pl"),
+                sa_func.max(DailyTradeRollup.best_trade_pl).label("best"),
+                sa_func.min(DailyTradeRollup.worst_trade_pl).label("worst"),
+                sa_func.sum(DailyTradeRollup.hold_minutes_total).label("hold_total"),
+                sa_func.sum(DailyTradeRollup.hold_count).label("hold_count"),
             )
-            .all()
+            .filter(DailyTradeRollup.date >= start_date, DailyTradeRollup.date <= end_date)
+            .one()
         )
 
-        if not trades:
+        if not totals.trades:
             return {
                 "period": {"start": start_date.isoformat(), "end": end_date.isoformat()},
                 "total_trades": 0,
@@ -169,39 +285,9 @@ class TradeJournal:
                 "daily_records": [],
             }
 
-        pls = [t.realized_pl or 0 for t in trades]
-        wins = [pl for pl in pls if pl > 0]
-        losses = [pl for pl in pls if pl < 0]
-        hold_mins = [t.hold_duration_minutes for t in trades if t.hold_duration_minutes]
-
-        # Strategy breakdown
-        by_strategy = {}
-        for t in trades:
-            strategy = t.notes or "unknown"  # Could parse from signal
-            # Try getting strategy from the linked signal
-            if t.signal and hasattr(t.signal, "strategy"):
-                strategy = t.signal.strategy
-            if strategy not in by_strategy:
-                by_strategy[strategy] = {"count": 0, "pl": 0, "wins": 0, "losses": 0}
-            by_strategy[strategy]["count"] += 1
-            by_strategy[strategy]["pl"] = round(by_strategy[strategy]["pl"] + (t.realized_pl or 0), 2)
-            if (t.realized_pl or 0) > 0:
-                by_strategy[strategy]["wins"] += 1
-            elif (t.realized_pl or 0) < 0:
-                by_strategy[strategy]["losses"] += 1
-
-        # Asset type breakdown
-        by_asset_type = {}
-        for t in trades:
-            at = t.asset_type or "stock"
-            if at not in by_asset_type:
-                by_asset_type[at] = {"count": 0, "pl": 0, "wins": 0, "losses": 0}
-            by_asset_type[at]["count"] += 1
-            by_asset_type[at]["pl"] = round(by_asset_type[at]["pl"] + (t.realized_pl or 0), 2)
-            if (t.realized_pl or 0) > 0:
-                by_asset_type[at]["wins"] += 1
-            elif (t.realized_pl or 0) < 0:
-                by_asset_type[at]["losses"] += 1
+        trades, wins, losses = totals.trades, totals.wins or 0, totals.losses or 0
+        total_pl = totals.total_pl or 0
+        win_pl, loss_pl = totals.win_pl or 0, totals.loss_pl or 0
 
         # Equity curve from daily records
         equity_curve = []
@@ -228,21 +314,21 @@ class TradeJournal:
 
         return {
             "period": {"start": start_date.isoformat(), "end": end_date.isoformat()},
-            "total_trades": len(trades),
-            "wins": len(wins),
-            "losses": len(losses),
-            "win_rate": round((len(wins) / len(trades)) * 100, 1) if trades else 0,
-            "total_pl": round(sum(pls), 2),
-            "avg_pl_per_trade": round(sum(pls) / len(pls), 2) if pls else 0,
-            "best_trade": round(max(pls), 2) if pls else 0,
-            "worst_trade": round(min(pls), 2) if pls else 0,
-            "avg_hold_minutes": round(sum(hold_mins) / len(hold_mins), 1) if hold_mins else 0,
+            "total_trades": trades,
+            "wins": wins,
+            "losses": losses,
+            "win_rate": round((wins / trades) * 100, 1),
+            "total_pl": round(total_pl, 2),
+            "avg_pl_per_trade": round(total_pl / trades, 2),
+            "best_trade": round(totals.best or 0, 2),
+            "worst_trade": round(totals.worst or 0, 2),
+            "avg_hold_minutes": round(totals.hold_total / totals.hold_count, 1) if totals.hold_count else 0,
             "max_drawdown": round(max_dd, 2),
-            "avg_win": round(sum(wins) / len(wins), 2) if wins else 0,
-            "avg_loss": round(sum(losses) / len(losses), 2) if losses else 0,
-            "profit_factor": round(abs(sum(wins) / sum(losses)), 2) if losses and sum(losses) != 0 else 0,
-            "by_strategy": by_strategy,
-            "by_asset_type": by_asset_type,
+            "avg_win": round(win_pl / wins, 2) if wins else 0,
+            "avg_loss": round(loss_pl / losses, 2) if losses else 0,
+            "profit_factor": round(abs(win_pl / loss_pl), 2) if losses and loss_pl != 0 else 0,
+            "by_strategy": self._rollup_breakdown(DailyTradeRollup.strategy, start_date, end_date),
+            "by_asset_type": self._rollup_breakdown(DailyTradeRollup.asset_type, start_date, end_date),
             "equity_curve": equity_curve,
             "daily_records": [
                 {
@@ -319,24 +405,18 @@ class TradeJournal:
         if not start_date:
             start_date = end_date - timedelta(days=30)
 
-        trades = (
-            self.db.query(ExecutedTrade)
-            .filter(
-                ExecutedTrade.status == TradeStatus.CLOSED.value,
-                sa_func.date(ExecutedTrade.exit_filled_at) >= start_date,
-                sa_func.date(ExecutedTrade.exit_filled_at) <= end_date,
+        rows = (
+            self.db.query(
+                DailyTradeRollup.exit_reason,
+                sa_func.sum(DailyTradeRollup.trades_count),
+                sa_func.sum(DailyTradeRollup.gross_pl),
             )
+            .filter(DailyTradeRollup.date >= start_date, DailyTradeRollup.date <= end_date)
+            .group_by(DailyTradeRollup.exit_reason)
             .all()
         )
 
-        breakdown = {}
-        for t in trades:
-            reason = t.exit_reason or "unknown"
-            if reason not in breakdown:
-                breakdown[reason] = {"count": 0, "total_pl": 0}
-            breakdown[reason]["count"] += 1
-            breakdown[reason]["total_pl"] = round(
-                breakdown[reason]["total_pl"] + (t.realized_pl or 0), 2
-            )
-
-        return breakdown
+        return {
+            reason: {"count": count, "total_pl": round(total_pl or 0, 2)}
+            for reason, count, total_pl in rows
+        }
@@ -0,0 +1,129 @@
+"""
+Compiled multi-keyword matcher.
+
+Replaces per-item `any(kw in text for kw in [...])` scans with a single
+regex pass that reports every keyword hit, grouped and weighted.
+
+Semantics match the substring loops it replaces: text is lower-cased and a
+keyword hits wherever it occurs, including inside longer words and when it
+overlaps another keyword. The pattern is an overlapping lookahead
+alternation (longest keyword first); keywords contained in a matched
+keyword are implied, so e.g. "beats" also reports "beat".
+
+Batches are joined on a separator that no keyword contains and scanned in
+one pass, hits are mapped back to their text by offset.
+"""
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+# Keyword → weight per group
+KeywordHits = Dict[str, Dict[str, float]]
+
+_SEPARATOR = "\x00"
+
+
+class KeywordMatcher:
+    """
+    Match lower-cased text against named keyword groups in one pass.
+
+    `groups` maps a group name to either a list of keywords (weight 1.0)
+    or a {keyword: weight} mapping. A keyword may belong to several groups.
+    Group order is kept and used by `first_group()` for priority lookups.
+    """
+
+    def __init__(self, groups: Mapping[str, Union[Iterable[str], Mapping[str, float]]]):
+        self._groups: Dict[str, Dict[str, float]] = {}
+        for name, keywords in groups.items():
+            if isinstance(keywords, Mapping):
+                weighted = {kw.lower(): float(w) for kw, w in keywords.items()}
+            else:
+                weighted = {kw.lower(): 1.0 for kw in keywords}
+            self._groups[name] = weighted
+
+        # keyword → [(group, weight)]
+        self._owners: Dict[str, List[tuple]] = {}
+        for name, weighted in self._groups.items():
+            for kw, weight in weighted.items():
+                if not kw or _SEPARATOR in kw:
+                    raise ValueError(f"Invalid keyword {kw!r} in group {name!r}")
+                self._owners.setdefault(kw, []).append((name, weight))
+
+        # Longest first so the alternation reports the longest keyword at
+        # each position; shorter keywords inside it come from _implied.
+        keywords = sorted(self._owners, key=len, reverse=True)
+        self._implied: Dict[str, tuple] = {
+            kw: tuple(other for other in keywords if other != kw and other in kw)
+            for kw in keywords
+        }
+        alternation = "|".join(re.escape(kw) for kw in keywords)
+        self._pattern = re.compile(f"(?=({alternation}))") if keywords else None
+
+    @property
+    def groups(self) -> List[str]:
+        return list(self._groups)
+
+    def keywords(self, group: str) -> Dict[str, float]:
+        return dict(self._groups[group])
+
+    # -------------------------------------------------------------------------
+    # Matching
+    # -------------------------------------------------------------------------
+
+    def _collect(self, found: Iterable[str]) -> KeywordHits:
+        hits: KeywordHits = {}
+        for kw in found:
+            for name, weight in self._owners[kw]:
+                hits.setdefault(name, {})[kw] = weight
+        return hits
+
+    def _expand(self, found: set) -> set:
+        for kw in list(found):
+            found.update(self._implied[kw])
+        return found
+
+    def match(self, text: str) -> KeywordHits:
+        """All keyword hits in `text`, as {group: {keyword: weight}}."""
+        if not text or self._pattern is None:
+            return {}
+        found = {m.group(1) for m in self._pattern.finditer(text.lower())}
+        return self._collect(self._expand(found))
+
+    def match_batch(self, texts: Sequence[str]) -> List[KeywordHits]:
+        """`match()` for many texts with a single scan over the joined batch."""
+        if not texts:
+            return []
+        if self._pattern is None:
+            return [{} for _ in texts]
+
+        # Lower-case per part: lower() can change length, offsets must match
+        parts = [(t or "").lower().replace(_SEPARATOR, " ") for t in texts]
+        starts = []
+        offset = 0
+        for part in parts:
+            starts.append(offset)
+            offset += len(part) + 1
+
+        found: List[set] = [set() for _ in parts]
+        for m in self._pattern.finditer(_SEPARATOR.join(parts)):
+            found[bisect_right(starts, m.start()) - 1].add(m.group(1))
+        return [self._collect(self._expand(f)) if f else {} for f in found]
+
+    # -------------------------------------------------------------------------
+    # Hit helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def first_group(
+        hits: KeywordHits, order: Iterable[str], default: Optional[str] = None,
+    ) -> Optional[str]:
+        """First group in `order` with at least one hit (if/elif priority)."""
+        for name in order:
+            if hits.get(name):
+                return name
+        return default
+
+    @staticmethod
+    def weights(hits: KeywordHits, groups: Iterable[str]) -> List[float]:
+        """Weights of every hit in `groups`, one per (group, keyword)."""
+        return [w for name in groups for w in hits.get(name, {}).values()]
@@ -0,0 +1,65 @@
+"""
+Fast JSON serialization (orjson) shared by API responses, SSE streams and
+the Redis cache.
+
+orjson encodes NumPy scalars/arrays, datetimes, dataclasses and Enums in
+C, so results from the analysis code (full of np.float64/np.bool_) are
+serialized in one pass instead of a recursive convert-then-dump. NaN and
+infinity encode as null. Types orjson doesn't know (Decimal, pandas
+Timestamp/NaT, float16, object arrays, sets) go through _default.
+"""
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+loads = orjson.loads
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode to JSON bytes. Unknown types fall back to str() (as json.dumps(default=str))."""
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+def dumps_str(obj: Any) -> str:
+    return dumps(obj).decode()
+
+
+def to_native(obj: Any) -> Any:
+    """
+    JSON-compatible Python copy of `obj` (NumPy types → int/float/bool/list,
+    datetimes → ISO strings, NaN → None), for pydantic models and JSON
+    columns. One encode/decode in C.
+    """
+    return orjson.loads(dumps(obj))
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    App-wide default response class. Endpoints that return it directly
+    (rather than a dict) also skip FastAPI's jsonable_encoder walk.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,73 @@
+"""
+Add summary columns to saved_scan_results and backfill them from stock_data.
+
+The Saved Scans list view reads fields=summary, which never loads the
+stock_data JSON. RSI and sector were previously only inside that blob, so
+they are denormalized into their own columns.
+Base.metadata.create_all() does not ALTER existing tables.
+
+Columns added:
+  - rsi:    DECIMAL(10, 2)
+  - sector: VARCHAR(100)
+
+Usage:
+  cd backend
+  source venv/bin/activate
+  python3 scripts/add_saved_scan_summary_columns.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.database import SessionLocal
+from app.models.saved_scan import SavedScanResult
+
+
+COLUMNS = [
+    ("rsi",    "DECIMAL(10, 2)"),
+    ("sector", "VARCHAR(100)"),
+]
+
+
+def migrate():
+    db = SessionLocal()
+    added = 0
+    skipped = 0
+    try:
+        for col, col_type in COLUMNS:
+            try:
+                db.execute(text(
+                    f"ALTER TABLE saved_scan_results ADD COLUMN {col} {col_type}"
+                ))
+                db.commit()
+                print(f"  ✅ Added saved_scan_results.{col}")
+                added += 1
+            except Exception as e:
+                db.rollback()
+                if "already exists" in str(e).lower() or "duplicate column" in str(e).lower():
+                    print(f"  ⏭️  saved_scan_results.{col} already exists, skipping")
+                    skipped += 1
+                else:
+                    raise
+
+        # Backfill from the stored JSON
+        backfilled = 0
+        for row in db.query(SavedScanResult).filter(SavedScanResult.stock_data.isnot(None)):
+            filled = SavedScanResult.from_stock(row.scan_type, row.stock_data)
+            row.rsi = filled.rsi
+            row.sector = filled.sector
+            backfilled += 1
+        db.commit()
+
+        print(f"\nMigration complete. Added: {added}, Skipped (already exist): {skipped}, Backfilled rows: {backfilled}")
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,60 @@
+"""
+Add the partial unique index uq_queue_active_symbol_tf to signal_queues.
+
+Queueing paths (scan processing, AI review, auto-scan, /queue/add) insert
+new items with one INSERT ... ON CONFLICT DO NOTHING, which relies on this
+index to keep a single active item per (symbol, timeframe).
+Base.metadata.create_all() does not add indexes to existing tables.
+
+Existing duplicate active items are resolved first: the oldest (lowest id)
+stays active, the rest are set to 'removed'.
+
+Index added:
+  - uq_queue_active_symbol_tf: UNIQUE (symbol, timeframe) WHERE status = 'active'
+
+Usage:
+  cd backend
+  source venv/bin/activate
+  python3 scripts/add_signal_queue_active_unique_index.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from app.database import SessionLocal
+
+
+def migrate():
+    db = SessionLocal()
+    try:
+        result = db.execute(text("""
+            UPDATE signal_queues SET status = 'removed'
+            WHERE status = 'active'
+              AND id NOT IN (
+                  SELECT MIN(id) FROM signal_queues
+                  WHERE status = 'active'
+                  GROUP BY symbol, timeframe
+              )
+        """))
+        db.commit()
+        print(f"  ✅ Removed {result.rowcount} duplicate active queue items")
+
+        db.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_queue_active_symbol_tf "
+            "ON signal_queues (symbol, timeframe) WHERE status = 'active'"
+        ))
+        db.commit()
+        print("  ✅ Index uq_queue_active_symbol_tf ready")
+
+        print("\nMigration complete.")
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,41 @@
+"""
+Backfill daily_trade_rollups (and refresh daily_bot_performance) from closed trades.
+
+The performance summary and exit-reason breakdown read per-day rollup rows
+instead of ExecutedTrades. New closes keep the rollup current; trades closed
+before the table existed need this one-time rebuild.
+Base.metadata.create_all() creates the new table on startup; this script
+fills it.
+
+Usage:
+  cd backend
+  source venv/bin/activate
+  python3 scripts/backfill_trade_rollups.py [START_DATE] [END_DATE]
+"""
+import sys
+import os
+from datetime import date
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.database import SessionLocal, Base, engine
+from app.models.daily_trade_rollup import DailyTradeRollup
+from app.services.trading.trade_journal import TradeJournal
+
+
+def backfill(start_date=None, end_date=None):
+    Base.metadata.create_all(bind=engine, tables=[DailyTradeRollup.__table__])
+    db = SessionLocal()
+    try:
+        days = TradeJournal(db).rebuild_daily_stats(start_date, end_date)
+        print(f"\n✅ Rebuilt daily stats and rollups for {days} trading day(s)")
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Backfill failed: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    args = [date.fromisoformat(a) for a in sys.argv[1:3]]
+    backfill(*args)
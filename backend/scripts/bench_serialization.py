@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark — the old convert_numpy_types + json.dumps path vs
+the shared orjson encoder (app/utils/serialization.py) on a scan payload.
+
+The payload is real ScreeningEngine output: every symbol is screened
+through the full pipeline on synthetic provider data (no API keys needed),
+or loaded from a JSON dump of scan results with --from-file.
+
+Usage:
+  cd backend
+  python3 scripts/bench_serialization.py                 # 1,000 screened results
+  python3 scripts/bench_serialization.py --symbols 300 --repeat 20
+  python3 scripts/bench_serialization.py --from-file saved_scan.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.screening import engine as engine_module  # noqa: E402
+from app.services.screening.engine import ScreeningEngine  # noqa: E402
+from app.utils.serialization import dumps  # noqa: E402
+
+
+def legacy_convert(obj):
+    """The recursive walk formerly in api/endpoints/screener.py."""
+    if isinstance(obj, dict):
+        return {key: legacy_convert(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_convert(item) for item in obj]
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return float(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif hasattr(obj, 'item'):
+        return obj.item()
+    return obj
+
+
+def _prices(seed: int, n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0.1, 1.0, n))
+    return pd.DataFrame({
+        'open': close * 0.99,
+        'high': close * 1.02,
+        'low': close * 0.98,
+        'close': close,
+        'volume': rng.integers(500_000, 5_000_000, size=n),
+    }, index=pd.bdate_range(end=datetime(2026, 1, 2), periods=n))
+
+
+def screened_payload(count: int):
+    """Full pipeline results for `count` symbols on synthetic data."""
+    stock_info = {'name': 'Bench Corp', 'sector': 'Technology', 'market_cap': 50_000_000_000,
+                  'exchange': 'NMS', 'current_price': 150.0}
+    fundamentals = {'revenue_growth': 0.25, 'earnings_growth': 0.20, 'profit_margins': 0.15,
+                    'gross_margins': 0.40, 'return_on_equity': 0.18, 'debt_to_equity': 80,
+                    'current_ratio': 2.0, 'market_cap': 50_000_000_000, 'current_price': 150.0}
+    leaps = {'available': True, 'atm_option': {'strike': 150.0, 'implied_volatility': 0.35,
+                                               'bid': 20.0, 'ask': 22.0, 'open_interest': 500}}
+
+    fmp = MagicMock()
+    fmp.get_stock_info.return_value = stock_info
+    fmp.get_fundamentals.return_value = fundamentals
+    alpaca = MagicMock()
+    alpaca.get_historical_prices.side_effect = lambda symbol, **k: _prices(int(symbol[1:]))
+    alpaca.get_options_chain.return_value = {'calls': [], 'puts': []}
+
+    with patch('app.services.screening.engine.get_sentiment_analyzer'), \
+            patch('app.services.screening.engine.get_catalyst_service'):
+        engine = ScreeningEngine()
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca), \
+            patch.object(engine, '_leaps_summary', return_value=leaps):
+        return [engine.screen_single_stock(f"S{i}") for i in range(count)]
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=1000, help="symbols to screen for the payload")
+    parser.add_argument("--repeat", type=int, default=10, help="timing runs (best is reported)")
+    parser.add_argument("--from-file", help="JSON file with a list of scan results")
+    args = parser.parse_args()
+
+    if args.from_file:
+        with open(args.from_file) as f:
+            payload = json.load(f)
+        source = args.from_file
+    else:
+        print(f"Screening {args.symbols} symbols for the payload...")
+        logger.remove()  # per-symbol screening logs
+        payload = screened_payload(args.symbols)
+        source = f"{args.symbols} screened results"
+
+    legacy = best_of(lambda: json.dumps(legacy_convert(payload)), args.repeat)
+    fast = best_of(lambda: dumps(payload), args.repeat)
+    size = len(dumps(payload))
+
+    print(f"\nPayload: {source}, {size / 1024:.0f} KB encoded")
+    print(f"  convert_numpy_types + json.dumps : {legacy * 1000:8.1f} ms")
+    print(f"  serialization.dumps (orjson)     : {fast * 1000:8.1f} ms")
+    print(f"  speedup                          : {legacy / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Move backtest equity curves and trade logs from JSON columns into backtest_artifacts.
+
+Completed backtests now keep these as binary arrays in a side table
+(app.services.backtesting.artifacts), so the backtest list never reads them.
+Rows saved before that still hold JSON in backtest_results.equity_curve /
+trade_log; the API falls back to it, but this script converts them and
+clears the JSON. Base.metadata.create_all() creates the new table.
+
+Usage:
+  cd backend
+  source venv/bin/activate
+  python3 scripts/migrate_backtest_artifacts.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import null
+from sqlalchemy.orm import undefer
+from app.database import SessionLocal, Base, engine
+from app.models.backtest_artifact import BacktestArtifact
+from app.models.backtest_result import BacktestResult
+from app.services.backtesting.artifacts import pack_equity, pack_trades
+
+
+def migrate():
+    Base.metadata.create_all(bind=engine, tables=[BacktestArtifact.__table__])
+    db = SessionLocal()
+    moved = 0
+    try:
+        ids = [
+            bid for (bid,) in db.query(BacktestResult.id).filter(
+                (BacktestResult.equity_curve.isnot(None)) | (BacktestResult.trade_log.isnot(None))
+            )
+        ]
+        for bid in ids:
+            record = (
+                db.query(BacktestResult)
+                .options(undefer(BacktestResult.equity_curve), undefer(BacktestResult.trade_log))
+                .get(bid)
+            )
+            if record.artifact is None:
+                record.artifact = BacktestArtifact(
+                    equity=pack_equity(record.equity_curve or []),
+                    trades=pack_trades(record.trade_log or []),
+                    equity_points=len(record.equity_curve or []),
+                    trade_count=len(record.trade_log or []),
+                )
+            # SQL NULL (a Python None would be stored as JSON 'null')
+            record.equity_curve = null()
+            record.trade_log = null()
+            db.commit()
+            moved += 1
+
+        print(f"\n✅ Migration complete. Moved {moved} backtest(s) to backtest_artifacts")
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Migration failed: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
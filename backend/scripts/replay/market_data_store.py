@@ -0,0 +1,141 @@
+"""
+MarketDataStore — record-once / replay-many archive of replay market data.
+
+ReplayDataService archives every frame it fetches from Alpaca, one compressed
+columnar file per (replay date, symbol, timeframe):
+
+    <root>/2026-02-10/AAPL/5m.npz
+    <root>/2026-02-10/AAPL/1h.npz
+    <root>/2026-02-10/AAPL/1d.npz
+    <root>/2026-02-10/AAPL/daily.npz      ← get_historical_prices (2y) frame
+
+Each .npz holds one array per column plus a small JSON header (column names,
+datetime tz/resolution), written with np.savez_compressed and read without
+pickling. Later replays of the same date load these files instead of calling
+Alpaca, so replays run offline, at disk speed, and repeatably. Snapshots and
+the options-chain stub are synthesized from the archived bars on every clock
+tick (ReplayDataService._make_snapshot), so the bars are all that's stored.
+
+An offline store never falls back to Alpaca: a missing file is just a miss.
+Pre-record a date range with scripts/replay/record_market_data.py.
+"""
+import json
+import os
+import shutil
+import zipfile
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# Default archive location (override with REPLAY_DATA_DIR or --data-dir)
+DEFAULT_ROOT = Path(
+    os.environ.get("REPLAY_DATA_DIR")
+    or Path(__file__).resolve().parents[2] / "data" / "replay"
+)
+
+# Bumped when the file layout changes; older files are treated as misses
+FORMAT_VERSION = 1
+
+_HEADER = "__header__"
+
+
+def _encode(series: pd.Series) -> Tuple[np.ndarray, Dict]:
+    """(stored values, column header) for one column."""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        index = pd.DatetimeIndex(series)
+        return index.asi8, {"kind": "datetime", "unit": index.unit, "tz": str(index.tz) if index.tz else None}
+
+    values = series.to_numpy()
+    if values.dtype == object:
+        try:
+            values = pd.to_numeric(series).to_numpy()
+        except (ValueError, TypeError):
+            return series.astype(str).to_numpy(dtype=str), {"kind": "str"}
+    return values, {"kind": "values"}
+
+
+def _decode(values: np.ndarray, header: Dict) -> Union[np.ndarray, pd.DatetimeIndex]:
+    if header["kind"] == "datetime":
+        index = pd.DatetimeIndex(values.view(f"datetime64[{header['unit']}]"))
+        return index.tz_localize("UTC").tz_convert(header["tz"]) if header["tz"] else index
+    if header["kind"] == "str":
+        return values.astype(object)
+    return values
+
+
+class MarketDataStore:
+    """Archive of replay frames keyed by (date, symbol, timeframe)."""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_ROOT, offline: bool = False):
+        """
+        Args:
+            root: Archive directory (created on first save)
+            offline: Never fetch — serve only what is already recorded
+        """
+        self.root = Path(root)
+        self.offline = offline
+
+    def day_dir(self, day: date) -> Path:
+        return self.root / day.isoformat()
+
+    def path(self, day: date, symbol: str, timeframe: str) -> Path:
+        return self.day_dir(day) / symbol.upper().replace("/", "_") / f"{timeframe}.npz"
+
+    def has(self, day: date, symbol: str, timeframe: str) -> bool:
+        return self.path(day, symbol, timeframe).exists()
+
+    def save(self, day: date, symbol: str, timeframe: str, df: pd.DataFrame) -> Path:
+        """Write one frame (the index is not kept). Atomic: readers never see a partial file."""
+        path = self.path(day, symbol, timeframe)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays, columns = {}, []
+        for i, name in enumerate(df.columns):
+            values, header = _encode(df[name])
+            arrays[f"c{i}"] = values
+            columns.append({"name": str(name), **header})
+        header = {"version": FORMAT_VERSION, "rows": len(df), "columns": columns}
+        arrays[_HEADER] = np.frombuffer(json.dumps(header).encode(), dtype=np.uint8)
+
+        tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp, **arrays)
+        os.replace(tmp, path)
+        return path
+
+    def load(self, day: date, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """The recorded frame, or None if missing or unreadable."""
+        path = self.path(day, symbol, timeframe)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                header = json.loads(archive[_HEADER].tobytes())
+                if header.get("version") != FORMAT_VERSION:
+                    return None
+                return pd.DataFrame({
+                    col["name"]: _decode(archive[f"c{i}"], col)
+                    for i, col in enumerate(header["columns"])
+                })
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logger.warning(f"Unreadable replay archive {path}: {e}")
+            return None
+
+    def dates(self) -> List[date]:
+        """Recorded dates, oldest first."""
+        if not self.root.exists():
+            return []
+        days = []
+        for entry in self.root.iterdir():
+            try:
+                days.append(date.fromisoformat(entry.name))
+            except ValueError:
+                continue
+        return sorted(days)
+
+    def clear(self, day: date):
+        """Drop everything recorded for a date."""
+        shutil.rmtree(self.day_dir(day), ignore_errors=True)
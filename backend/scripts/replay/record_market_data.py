@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Record market data for replay — pre-fetch a date range into the replay archive
+(market_data_store.py) so later replays run offline.
+
+For every weekday in the range this fetches exactly what replay_trading_day.py
+would (5m/1h/1d bars + 2y daily history per symbol, plus SPY for market
+intelligence). Dates already recorded are skipped unless --force.
+
+Usage:
+  cd backend && source venv/bin/activate
+  python3 scripts/replay/record_market_data.py 2026-02-02 2026-02-13 --symbols AAPL,NVDA,SSRM
+  python3 scripts/replay/record_market_data.py 2026-02-10 --symbols AAPL --force
+  python3 scripts/replay/record_market_data.py --list
+"""
+import sys
+import os
+import argparse
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from replay_services import ReplayClock, ReplayDataService
+from market_data_store import DEFAULT_ROOT, MarketDataStore
+
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+DIM = "\033[2m"
+RESET = "\033[0m"
+
+# Always recorded alongside the requested symbols (market intelligence)
+INTEL_SYMBOLS = ["SPY"]
+TIMEFRAMES = ["5m", "1h", "1d"]
+
+
+def parse_args():
+    p = argparse.ArgumentParser(
+        description="Pre-record replay market data for a date range.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    p.add_argument("start", nargs="?", help="First date (YYYY-MM-DD)")
+    p.add_argument("end", nargs="?", help="Last date (YYYY-MM-DD, default: start)")
+    p.add_argument("--symbols", "-s", help="Comma-separated symbols")
+    p.add_argument("--data-dir", default=str(DEFAULT_ROOT),
+                   help=f"Archive directory (default: {DEFAULT_ROOT})")
+    p.add_argument("--force", action="store_true", help="Re-record dates already in the archive")
+    p.add_argument("--list", action="store_true", help="List recorded dates and exit")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    store = MarketDataStore(args.data_dir)
+
+    if args.list:
+        for day in store.dates():
+            symbols = sorted(d.name for d in store.day_dir(day).iterdir() if d.is_dir())
+            print(f"  {day}  {len(symbols):>3} symbols  {DIM}{', '.join(symbols)}{RESET}")
+        return
+
+    if not args.start or not args.symbols:
+        print("A start date and --symbols are required (or --list).")
+        sys.exit(1)
+
+    symbols = sorted({s.strip().upper() for s in args.symbols.split(",")} | set(INTEL_SYMBOLS))
+    days = pd.bdate_range(args.start, args.end or args.start).date
+    print(f"Recording {len(symbols)} symbols × {len(days)} weekdays → {store.root}\n")
+
+    for day in days:
+        if args.force:
+            store.clear(day)
+        data_svc = ReplayDataService(ReplayClock(day), symbols, timeframes=TIMEFRAMES, store=store)
+        t0 = time.time()
+        total = data_svc.prefetch_bars()
+        elapsed = time.time() - t0
+        color = GREEN if total else YELLOW
+        note = "" if total else "  (no bars — market holiday?)"
+        print(f"  {day}  {color}{total:>8,} bars{RESET}  "
+              f"{data_svc.fetched:>3} fetched  {data_svc.archive_hits:>3} already recorded  "
+              f"{DIM}{elapsed:.1f}s{RESET}{note}")
+
+
+if __name__ == "__main__":
+    main()
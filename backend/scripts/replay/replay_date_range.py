@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Multi-day Historical Replay — replay every weekday in a date range in parallel.
+
+Each day runs replay_trading_day.py in its own worker process (fresh service
+singletons and patches) against its own SQLite file, so days never share DB
+state. When all days finish, their replay_audit_logs rows are merged into the
+main database (DATABASE_URL) and a per-day summary is printed. Per-day output
+goes to <work-dir>/<date>.log.
+
+Pre-record the range first (scripts/replay/record_market_data.py) and pass
+--offline to replay it without touching Alpaca. Any other replay_trading_day.py
+option is passed through to every day.
+
+Usage:
+  cd backend && source venv/bin/activate
+  python3 scripts/replay/replay_date_range.py 2026-02-02 2026-02-27 --symbols AAPL,NVDA --offline
+  python3 scripts/replay/replay_date_range.py 2026-02-02 2026-02-06 --symbols SSRM --workers 4 --no-ai
+  python3 scripts/replay/replay_date_range.py 2026-02-02 2026-02-06 --symbols SSRM --no-merge --work-dir /tmp/replays
+"""
+import sys
+import os
+import argparse
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+ET = ZoneInfo("America/New_York")
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+BOLD = "\033[1m"
+DIM = "\033[2m"
+RESET = "\033[0m"
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """(range options, options passed through to replay_trading_day.py)."""
+    p = argparse.ArgumentParser(
+        description="Replay a date range in parallel worker processes.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Other options (--offline, --interval, --no-ai, ...) are passed to replay_trading_day.py.",
+    )
+    p.add_argument("start", help="First date (YYYY-MM-DD)")
+    p.add_argument("end", help="Last date (YYYY-MM-DD)")
+    p.add_argument("--symbols", "-s", required=True, help="Comma-separated symbols")
+    p.add_argument("--workers", "-w", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                   help="Days replayed at once (default: CPU count - 1)")
+    p.add_argument("--work-dir", help="Per-day SQLite files and logs (default: a new temp dir)")
+    p.add_argument("--no-merge", action="store_true",
+                   help="Leave audit logs in the per-day SQLite files")
+    args, passthrough = p.parse_known_args(argv)
+    return args, ["--symbols", args.symbols, *passthrough]
+
+
+def trading_days(start: str, end: str) -> List[date]:
+    """Weekdays in [start, end] (market holidays replay as no-bar days)."""
+    return list(pd.bdate_range(start, end).date)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Worker
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def replay_day(day: str, replay_argv: List[str], db_path: str, log_path: str) -> Dict:
+    """
+    Worker process: replay one day into its own SQLite DB. Must run in a
+    fresh (spawned) process — DATABASE_URL is read when app.database is
+    first imported.
+    """
+    log = open(log_path, "w")
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    t0 = time.time()
+    status = "ok"
+    try:
+        import app.models  # noqa: F401 — register every table
+        import app.models.replay_audit_log  # noqa: F401 — not exported by app.models
+        from app.database import Base, engine
+        Base.metadata.create_all(bind=engine)
+
+        import replay_trading_day
+        replay_trading_day.run_replay(replay_trading_day.parse_args([day, *replay_argv]))
+    except SystemExit as e:
+        status = "ok" if not e.code else f"exited ({e.code})"
+    except Exception as e:
+        status = f"error: {e}"
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    return {"date": day, "status": status, "seconds": round(time.time() - t0, 1)}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Audit Log Merge
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def read_audit_logs(db_path: str) -> List[Dict]:
+    """
+    All replay_audit_logs rows of a per-day SQLite DB. SQLite drops UTC
+    offsets, so simulated_time (ET wall clock) and created_at (UTC) get
+    their zones back.
+    """
+    from sqlalchemy import create_engine, select
+    from app.models.replay_audit_log import ReplayAuditLog
+
+    if not Path(db_path).exists():
+        return []
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with engine.connect() as conn:
+            rows = [dict(r) for r in conn.execute(select(ReplayAuditLog.__table__)).mappings()]
+    finally:
+        engine.dispose()
+
+    for row in rows:
+        if row["simulated_time"] is not None and row["simulated_time"].tzinfo is None:
+            row["simulated_time"] = row["simulated_time"].replace(tzinfo=ET)
+        if row["created_at"] is not None and row["created_at"].tzinfo is None:
+            row["created_at"] = row["created_at"].replace(tzinfo=timezone.utc)
+    return rows
+
+
+def merge_audit_logs(db_paths: List[str], db=None) -> Dict[str, List[Dict]]:
+    """
+    Read every per-day DB's audit rows ({replay_date: rows}) and, given a
+    session, copy them into that database (new ids, same session ids).
+    """
+    from app.models.replay_audit_log import ReplayAuditLog
+
+    by_day: Dict[str, List[Dict]] = {}
+    for path in db_paths:
+        for row in read_audit_logs(path):
+            by_day.setdefault(row["replay_date"], []).append(row)
+
+    if db is not None:
+        db.add_all(
+            ReplayAuditLog(**{k: v for k, v in row.items() if k != "id"})
+            for rows in by_day.values() for row in rows
+        )
+        db.commit()
+    return dict(sorted(by_day.items()))
+
+
+def print_range_summary(by_day: Dict[str, List[Dict]], results: Dict[str, Dict]):
+    print(f"\n{BOLD}  {'date':<12}{'outcome':<22}{'signals':>8}{'buys':>6}{'W/L':>8}{'P/L':>12}{RESET}")
+    total_pl = 0.0
+    for day in sorted(results):
+        summary = next((r["decision"] for r in by_day.get(day, []) if r["stage"] == "summary"), None)
+        if summary is None:
+            print(f"  {day:<12}{YELLOW}{results[day]['status']:<22}{RESET}")
+            continue
+        pl = summary.get("gross_pl", 0.0)
+        total_pl += pl
+        color = GREEN if pl >= 0 else RED
+        print(f"  {day:<12}{summary.get('outcome', 'completed'):<22}"
+              f"{summary.get('total_signals', 0):>8}{summary.get('total_buys', 0):>6}"
+              f"{summary.get('wins', 0):>4}/{summary.get('losses', 0):<3}{color}{pl:>+12.2f}{RESET}")
+    color = GREEN if total_pl >= 0 else RED
+    print(f"  {BOLD}{'total':<12}{'':<44}{color}{total_pl:>+12.2f}{RESET}\n")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Entry Point
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    args, replay_argv = parse_args()
+    days = trading_days(args.start, args.end)
+    if not days:
+        print(f"{RED}No weekdays between {args.start} and {args.end}.{RESET}")
+        sys.exit(1)
+
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="replay_range_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(args.workers, len(days)))
+    print(f"{BOLD}Replaying {len(days)} days with {workers} workers{RESET}  {DIM}(logs: {work_dir}){RESET}")
+
+    db_paths, results = [], {}
+    t0 = time.time()
+    # One fresh spawned process per day: replay patches module singletons and
+    # binds DATABASE_URL at import, so nothing may carry over between days
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             max_tasks_per_child=1) as pool:
+        futures = []
+        for day in days:
+            db_path = work_dir / f"{day}.db"
+            db_path.unlink(missing_ok=True)
+            db_paths.append(str(db_path))
+            futures.append(pool.submit(replay_day, day.isoformat(), replay_argv,
+                                       str(db_path), str(work_dir / f"{day}.log")))
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["date"]] = result
+            color = GREEN if result["status"] == "ok" else YELLOW
+            print(f"  {result['date']}  {color}{result['status']}{RESET}  {DIM}{result['seconds']}s{RESET}")
+
+    db = None
+    if not args.no_merge:
+        from app.database import SessionLocal
+        db = SessionLocal()
+    try:
+        by_day = merge_audit_logs(db_paths, db)
+    finally:
+        if db is not None:
+            db.close()
+
+    rows = sum(len(r) for r in by_day.values())
+    where = "per-day SQLite files" if args.no_merge else "replay_audit_logs"
+    print(f"\n  {GREEN}✅ {len(days)} days in {time.time() - t0:.0f}s — {rows} audit rows in {where}{RESET}")
+    print_range_summary(by_day, results)
+
+
+if __name__ == "__main__":
+    main()
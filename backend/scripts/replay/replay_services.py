@@ -109,22 +109,57 @@ class ReplayDataService:
     """
     Pre-fetches historical bars and patches AlpacaService methods to serve
     them filtered by simulated clock time.
+
+    With a MarketDataStore (market_data_store.py), fetched frames are recorded
+    on first use and loaded from the archive on later replays of the date.
     """
 
-    def __init__(self, clock: ReplayClock, symbols: List[str], timeframes: List[str] = None):
+    def __init__(self, clock: ReplayClock, symbols: List[str], timeframes: List[str] = None,
+                 store=None):
         self.clock = clock
         self.symbols = [s.upper() for s in symbols]
         self.timeframes = timeframes or ["5m", "1h", "1d"]
+        self.store = store
         self.bar_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
         self.daily_cache: Dict[str, pd.DataFrame] = {}
         self._originals: Dict[str, Any] = {}
+        self._iv_history_state = None   # (clock, read_only) of the IV history store while patched
+
+        # Per bar_cache key: (frame, sorted UTC epoch-ns of its bars), for
+        # clock slicing by binary search (built lazily, rebuilt if the frame changes)
+        self._bar_times: Dict[Tuple[str, str], Tuple[pd.DataFrame, np.ndarray]] = {}
+
+        # Frames served from the archive vs fetched from Alpaca
+        self.archive_hits = 0
+        self.fetched = 0
 
         # Opening range cache (computed once after bars are loaded)
         self._opening_ranges: Dict[str, Dict] = {}
 
+    def _load_or_fetch(self, symbol: str, timeframe: str, fetch) -> Optional[pd.DataFrame]:
+        """
+        The archived frame for (replay date, symbol, timeframe), else fetch()
+        — recorded for next time. Offline stores never call fetch().
+        """
+        day = self.clock.replay_date
+        if self.store is not None:
+            df = self.store.load(day, symbol, timeframe)
+            if df is not None:
+                self.archive_hits += 1
+                return df
+            if self.store.offline:
+                logger.warning(f"No recorded {timeframe} data for {symbol} on {day} (offline)")
+                return None
+
+        df = fetch()
+        self.fetched += 1
+        if self.store is not None and df is not None and len(df) > 0:
+            self.store.save(day, symbol, timeframe, df)
+        return df
+
     def prefetch_bars(self) -> int:
         """
-        Pre-fetch all bars from Alpaca Historical API.
+        Pre-fetch all bars from the archive, or the Alpaca Historical API.
         Returns total bar count.
         """
         from app.services.data_fetcher.alpaca_service import alpaca_service
@@ -143,12 +178,12 @@ class ReplayDataService:
                     lookback_days = 10   # ~5 trading days for TOD-RVOL
 
                 start = replay_eod_utc - timedelta(days=lookback_days)
-                bars = alpaca_service.get_bars(
+                bars = self._load_or_fetch(symbol, tf, lambda: alpaca_service.get_bars(
                     symbol, tf,
                     limit=10000,
                     start=start,
                     end=replay_eod_utc,
-                )
+                ))
                 if bars is not None and len(bars) > 0:
                     self.bar_cache[(symbol, tf)] = bars
                     total += len(bars)
@@ -158,11 +193,11 @@ class ReplayDataService:
 
             # Also prefetch daily bars for screening (via get_historical_prices)
             try:
-                daily = alpaca_service.get_historical_prices(
+                daily = self._load_or_fetch(symbol, "daily", lambda: alpaca_service.get_historical_prices(
                     symbol,
                     end_date=self.clock.replay_date.isoformat(),
                     period="2y",
-                )
+                ))
                 if daily is not None:
                     self.daily_cache[symbol] = daily
                     logger.debug(f"Prefetched {len(daily)} daily bars for {symbol}")
@@ -196,26 +231,43 @@ class ReplayDataService:
                     "orb_low": float(orb_bars["low"].min()),
                 }
 
-    def _get_visible_bars(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[pd.DataFrame]:
-        """Return bars up to the current simulated time."""
-        key = (symbol.upper(), timeframe)
+    def _visible_end(self, key: Tuple[str, str], until_utc: datetime) -> Tuple[Optional[pd.DataFrame], int]:
+        """
+        (cached frame, number of its bars at or before until_utc) — an
+        O(log n) searchsorted on the frame's timestamp index instead of a
+        full boolean mask per call.
+        """
         all_bars = self.bar_cache.get(key)
         if all_bars is None:
-            return None
+            return None, 0
 
-        now_utc = self.clock.current_time_utc
-        visible = all_bars[all_bars["datetime"] <= now_utc]
-        if len(visible) == 0:
-            return None
+        cached = self._bar_times.get(key)
+        if cached is None or cached[0] is not all_bars:
+            if not all_bars["datetime"].is_monotonic_increasing:
+                all_bars = all_bars.sort_values("datetime", ignore_index=True)
+                self.bar_cache[key] = all_bars
+            times = pd.DatetimeIndex(all_bars["datetime"]).as_unit("ns").asi8
+            cached = self._bar_times[key] = (all_bars, times)
 
-        return visible.tail(limit).copy()
+        return all_bars, int(np.searchsorted(cached[1], pd.Timestamp(until_utc).value, side="right"))
+
+    def _get_visible_bars(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[pd.DataFrame]:
+        """
+        Return bars up to the current simulated time. The result is a
+        positional slice of the cached frame (copy-on-write: callers that
+        add columns get their own copy, the cache is never modified).
+        """
+        all_bars, end = self._visible_end((symbol.upper(), timeframe), self.clock.current_time_utc)
+        if end == 0:
+            return None
+        return all_bars.iloc[max(0, end - limit):end]
 
     def _get_last_bar(self, symbol: str, timeframe: str = "5m") -> Optional[pd.Series]:
         """Get the last visible bar for a symbol."""
-        bars = self._get_visible_bars(symbol, timeframe, limit=1)
-        if bars is not None and len(bars) > 0:
-            return bars.iloc[-1]
-        return None
+        all_bars, end = self._visible_end((symbol.upper(), timeframe), self.clock.current_time_utc)
+        if end == 0:
+            return None
+        return all_bars.iloc[end - 1]
 
     def _make_snapshot(self, symbol: str) -> Optional[Dict]:
         """Build a synthetic snapshot from the last visible bar."""
@@ -234,32 +286,30 @@ class ReplayDataService:
         vwap = float(last_bar.get("vwap", price))
 
         # Get daily-level data from the replay day
-        daily_bars = self.bar_cache.get((symbol, "1d"))
         daily_bar_data = {}
         prev_daily = {}
-        if daily_bars is not None and len(daily_bars) >= 2:
-            # Last daily bar on or before replay date
-            replay_utc = self.clock.market_open_et.astimezone(timezone.utc)
-            daily_vis = daily_bars[daily_bars["datetime"] <= replay_utc]
-            if len(daily_vis) >= 2:
-                d = daily_vis.iloc[-1]
-                p = daily_vis.iloc[-2]
-                daily_bar_data = {
-                    "open": float(d.get("open", 0)),
-                    "high": float(d.get("high", 0)),
-                    "low": float(d.get("low", 0)),
-                    "close": float(d.get("close", 0)),
-                    "volume": int(d.get("volume", 0)),
-                    "vwap": float(d.get("vwap", 0)),
-                }
-                prev_daily = {
-                    "open": float(p.get("open", 0)),
-                    "high": float(p.get("high", 0)),
-                    "low": float(p.get("low", 0)),
-                    "close": float(p.get("close", 0)),
-                    "volume": int(p.get("volume", 0)),
-                    "vwap": float(p.get("vwap", 0)),
-                }
+        # Last daily bar on or before replay date
+        replay_utc = self.clock.market_open_et.astimezone(timezone.utc)
+        daily_bars, end = self._visible_end((symbol.upper(), "1d"), replay_utc)
+        if end >= 2:
+            d = daily_bars.iloc[end - 1]
+            p = daily_bars.iloc[end - 2]
+            daily_bar_data = {
+                "open": float(d.get("open", 0)),
+                "high": float(d.get("high", 0)),
+                "low": float(d.get("low", 0)),
+                "close": float(d.get("close", 0)),
+                "volume": int(d.get("volume", 0)),
+                "vwap": float(d.get("vwap", 0)),
+            }
+            prev_daily = {
+                "open": float(p.get("open", 0)),
+                "high": float(p.get("high", 0)),
+                "low": float(p.get("low", 0)),
+                "close": float(p.get("close", 0)),
+                "volume": int(p.get("volume", 0)),
+                "vwap": float(p.get("vwap", 0)),
+            }
 
         prev_close = prev_daily.get("close", price)
         change = price - prev_close
@@ -309,12 +359,12 @@ class ReplayDataService:
             cached = this.daily_cache.get(symbol.upper())
             if cached is not None:
                 return cached.copy()
-            # Fallback to original (capped to replay date)
-            return this._originals["get_historical_prices"](
+            # Fallback to original (capped to replay date), recorded per period
+            return this._load_or_fetch(symbol.upper(), f"daily_{period}", lambda: this._originals["get_historical_prices"](
                 symbol, start_date,
                 end_date=this.clock.replay_date.isoformat(),
                 period=period,
-            )
+            ))
 
         def replay_get_options_chain(symbol, *args, **kwargs):
             """
@@ -364,6 +414,13 @@ class ReplayDataService:
         alpaca_service.get_options_chain = replay_get_options_chain
         alpaca_service.get_opening_range = replay_get_opening_range
 
+        # Local IV history: read as of the replay date (no look-ahead), never written
+        from app.services.analysis.iv_history import get_iv_history_store
+        iv_store = get_iv_history_store()
+        self._iv_history_state = (iv_store.clock, iv_store.read_only)
+        iv_store.clock = lambda: this.clock.replay_date
+        iv_store.read_only = True
+
     def uninstall_patches(self):
         """Restore original AlpacaService methods."""
         from app.services.data_fetcher.alpaca_service import alpaca_service
@@ -371,6 +428,12 @@ class ReplayDataService:
             setattr(alpaca_service, name, original)
         self._originals.clear()
 
+        if self._iv_history_state is not None:
+            from app.services.analysis.iv_history import get_iv_history_store
+            iv_store = get_iv_history_store()
+            iv_store.clock, iv_store.read_only = self._iv_history_state
+            self._iv_history_state = None
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ReplayTradingService — virtual account + simulated fills
@@ -4,6 +4,8 @@ Historical Replay — replay a past trading day through the real pipeline.
 
 Uses Alpaca Historical API to pre-fetch bars, then advances a simulated clock
 bar-by-bar, running the REAL signal engine + risk gateway code at each tick.
+Fetched bars are recorded to the replay archive (market_data_store.py), so
+replaying the same date again loads them from disk.
 
 Usage:
   cd backend && source venv/bin/activate
@@ -14,6 +16,7 @@ Usage:
   python3 scripts/replay/replay_trading_day.py 2026-02-10 --equity 50000
   python3 scripts/replay/replay_trading_day.py 2026-02-10 --skip-screening
   python3 scripts/replay/replay_trading_day.py 2026-02-10 --no-ai --no-risk-check
+  python3 scripts/replay/replay_trading_day.py 2026-02-10 --offline   # archive only, no Alpaca
 """
 import sys
 import os
@@ -35,6 +38,7 @@ from replay_services import (
     ReplayMarketIntelligence,
     ET,
 )
+from market_data_store import DEFAULT_ROOT, MarketDataStore
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ANSI Colors (same as diagnose_pipeline.py)
@@ -70,7 +74,7 @@ def timed(fn, *args, **kwargs):
 # Argument Parsing
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def parse_args():
+def parse_args(argv: Optional[List[str]] = None):
     p = argparse.ArgumentParser(
         description="Replay a past trading day through the real signal pipeline.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -103,7 +107,13 @@ Examples:
                    help="Skip Risk Gateway checks — execute all signals")
     p.add_argument("--verbose", "-v", action="store_true",
                    help="Verbose logging (show all quality gate details)")
-    return p.parse_args()
+    p.add_argument("--data-dir", default=str(DEFAULT_ROOT),
+                   help=f"Recorded market-data archive (default: {DEFAULT_ROOT})")
+    p.add_argument("--offline", action="store_true",
+                   help="Serve bars only from the archive — never call Alpaca")
+    p.add_argument("--no-archive", action="store_true",
+                   help="Always fetch from Alpaca and don't record")
+    return p.parse_args(argv)
 
 
 def parse_date(date_str: str) -> date:
@@ -487,16 +497,23 @@ def run_replay(args):
     intel_symbols = ["SPY"]  # VIX uses get_historical_prices with ^VIX symbol
     all_prefetch_symbols = list(set(symbols + intel_symbols))
 
-    data_svc = ReplayDataService(clock, all_prefetch_symbols, timeframes=["5m", "1h", "1d"])
+    store = None if args.no_archive else MarketDataStore(args.data_dir, offline=args.offline)
+    data_svc = ReplayDataService(clock, all_prefetch_symbols, timeframes=["5m", "1h", "1d"], store=store)
     trading_svc = ReplayTradingService(clock, equity)
 
     # Pre-fetch all bars
-    print(f"  Loading historical bars from Alpaca (+ SPY for market intelligence)...")
+    source = "the archive" if args.offline else "the archive / Alpaca" if store else "Alpaca"
+    print(f"  Loading historical bars from {source} (+ SPY for market intelligence)...")
     total_bars, fetch_ms = timed(data_svc.prefetch_bars)
     print(f"  {GREEN}✅ {total_bars:,} bars loaded across {len(symbols)} symbols ({fetch_ms:.0f}ms){RESET}")
+    if store:
+        print(f"  {DIM}{data_svc.archive_hits} frames from {store.root}, {data_svc.fetched} fetched{RESET}")
 
     if total_bars == 0:
-        print(f"\n  {RED}No bars returned — is {replay_date} a trading day? Check Alpaca API keys.{RESET}")
+        if args.offline:
+            print(f"\n  {RED}Nothing recorded for {replay_date} — run scripts/replay/record_market_data.py first.{RESET}")
+        else:
+            print(f"\n  {RED}No bars returned — is {replay_date} a trading day? Check Alpaca API keys.{RESET}")
         sys.exit(1)
 
     # Install patches
@@ -0,0 +1 @@
+# API endpoint tests
@@ -0,0 +1,99 @@
+"""
+Tests for saved-scan results pagination and projection.
+
+Runs the endpoint against an in-memory SQLite database holding only the
+saved-scan tables. Covers keyset cursors (including NULL scores and ties),
+the summary projection and the single-stock detail lookup.
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.endpoints.saved_scans import get_saved_scan_results, get_saved_scan_stock
+from app.models.saved_scan import SavedScanMetadata, SavedScanResult
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    SavedScanResult.__table__.create(engine)
+    SavedScanMetadata.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+
+    session.add(SavedScanMetadata(scan_type="iv_crush", display_name="IV Crush", stock_count=0))
+    scores = [90.0, 75.5, 75.5, 75.5, 60.0, None, 40.0, None]
+    for i, score in enumerate(scores):
+        session.add(SavedScanResult.from_stock("iv_crush", {
+            "symbol": f"S{i}",
+            "composite_score": score,
+            "technical_indicators": {"rsi_14": 55.0 + i},
+            "sector": "Technology",
+            "leaps_summary": {"big": "x" * 100},
+        }))
+    session.commit()
+    yield session
+    session.close()
+
+
+async def _all_pages(db, limit, fields="summary"):
+    symbols, cursor, pages = [], None, 0
+    while True:
+        page = await get_saved_scan_results("iv_crush", fields=fields, limit=limit, cursor=cursor, db=db)
+        symbols += [s["symbol"] for s in page["stocks"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            return symbols, pages, page
+
+
+@pytest.mark.asyncio
+async def test_unpaged_full_response_is_unchanged(db):
+    page = await get_saved_scan_results("iv_crush", fields="full", limit=None, cursor=None, db=db)
+
+    assert page["stock_count"] == 8
+    assert page["next_cursor"] is None
+    assert page["stocks"][0]["symbol"] == "S0"
+    assert page["stocks"][0]["stock_data"]["leaps_summary"] == {"big": "x" * 100}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [1, 2, 3, 5, 8, 50])
+async def test_cursor_pages_cover_every_row_once_in_score_order(db, limit):
+    full = await get_saved_scan_results("iv_crush", fields="full", limit=None, cursor=None, db=db)
+    expected = [s["symbol"] for s in full["stocks"]]
+
+    symbols, pages, last = await _all_pages(db, limit)
+
+    assert symbols == expected
+    assert pages == max(1, -(-8 // limit))
+    assert last["stock_count"] == 8
+    # NULL scores sort last
+    assert expected[-2:] in (["S7", "S5"], ["S5", "S7"])
+
+
+@pytest.mark.asyncio
+async def test_summary_projection_skips_stock_data(db):
+    page = await get_saved_scan_results("iv_crush", fields="summary", limit=2, cursor=None, db=db)
+
+    stock = page["stocks"][0]
+    assert "stock_data" not in stock
+    assert stock["rsi"] == 55.0
+    assert stock["sector"] == "Technology"
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(db):
+    with pytest.raises(HTTPException) as exc:
+        await get_saved_scan_results("iv_crush", fields="summary", limit=2, cursor="not-a-cursor", db=db)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_single_stock_detail(db):
+    stock = await get_saved_scan_stock("iv_crush", "s3", db=db)
+    assert stock["stock_data"]["symbol"] == "S3"
+
+    with pytest.raises(HTTPException) as exc:
+        await get_saved_scan_stock("iv_crush", "ZZZ", db=db)
+    assert exc.value.status_code == 404
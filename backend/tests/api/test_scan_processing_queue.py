@@ -0,0 +1,112 @@
+"""
+Tests for bulk signal-queue writes (queue_writer.py) and the queueing
+endpoints that use them.
+
+Runs against an in-memory SQLite database holding only signal_queues.
+Covers dedup against active items and within a batch, the partial unique
+index on active (symbol, timeframe), and a constant statement count no
+matter how many stocks are queued.
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.api.endpoints.scan_processing import QueueReviewedRequest, QueueStock, queue_reviewed_stocks
+from app.api.endpoints.signals import resume_queue_item
+from app.models.signal_queue import SignalQueue
+from app.services.signals.queue_writer import active_queue_keys, insert_queue_items
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    SignalQueue.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        SignalQueue(symbol="AAPL", timeframe="5m", status="active"),
+        SignalQueue(symbol="MSFT", timeframe="1h", status="paused"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_insert_skips_active_and_repeated_keys(db):
+    written = insert_queue_items(db, [
+        {"symbol": "AAPL", "timeframe": "5m", "source": "auto_process"},   # already active
+        {"symbol": "AAPL", "timeframe": "1h", "source": "auto_process"},
+        {"symbol": "MSFT", "timeframe": "1h", "source": "auto_process"},   # only paused
+        {"symbol": "MSFT", "timeframe": "1h", "source": "auto_process"},   # repeated in batch
+    ])
+    db.commit()
+
+    assert [(r["symbol"], r["timeframe"]) for r in written] == [("AAPL", "1h"), ("MSFT", "1h")]
+    assert active_queue_keys(db) == {("AAPL", "5m"), ("AAPL", "1h"), ("MSFT", "1h")}
+    assert active_queue_keys(db, ["MSFT"]) == {("MSFT", "1h")}
+
+    item = db.query(SignalQueue).filter_by(symbol="AAPL", timeframe="1h").one()
+    assert (item.status, item.times_checked, item.source) == ("active", 0, "auto_process")
+    assert item.created_at is not None
+
+
+def test_unique_index_allows_one_active_item(db):
+    db.add(SignalQueue(symbol="AAPL", timeframe="5m", status="paused"))
+    db.commit()
+
+    db.add(SignalQueue(symbol="AAPL", timeframe="5m", status="active"))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+
+@pytest.mark.asyncio
+async def test_resume_conflict_returns_409(db):
+    paused = SignalQueue(symbol="AAPL", timeframe="5m", status="paused")
+    db.add(paused)
+    db.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        await resume_queue_item(paused.id, db=db)
+    assert exc.value.status_code == 409
+    assert db.get(SignalQueue, paused.id).status == "paused"
+
+
+@pytest.mark.asyncio
+async def test_queue_reviewed_stocks_reports_skips(db):
+    result = await queue_reviewed_stocks(QueueReviewedRequest(stocks=[
+        QueueStock(symbol="aapl", timeframes=["5m", "15m", "4h"], confidence_level="MEDIUM"),
+        QueueStock(symbol="TSLA", timeframes=["1d", "1d"]),
+    ]), db=db)
+
+    assert result["added"] == [{"symbol": "AAPL", "timeframe": "15m"}, {"symbol": "TSLA", "timeframe": "1d"}]
+    assert sorted((s["symbol"], s["timeframe"], s["reason"]) for s in result["skipped"]) == [
+        ("AAPL", "4h", "invalid timeframe"),
+        ("AAPL", "5m", "already active"),
+        ("TSLA", "1d", "already active"),
+    ]
+    assert db.query(SignalQueue).filter_by(source="ai_review").count() == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("n", [5, 500])
+async def test_statement_count_is_independent_of_batch_size(engine, db, n):
+    statements = []
+    listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = await queue_reviewed_stocks(QueueReviewedRequest(stocks=[
+            QueueStock(symbol=f"S{i:03d}", timeframes=["5m", "1h"]) for i in range(n)
+        ]), db=db)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert result["added_count"] == 2 * n
+    # One SELECT of active keys + one INSERT
+    assert len(statements) == 2
@@ -0,0 +1,139 @@
+"""
+Tests for the incremental SSE scan protocol (scan_stream.py) and the
+stream endpoints that use it.
+
+A client replaying the progress diffs must hold exactly the running top-N,
+and the `results` chunks must add up to every passing result, best first.
+"""
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.api.endpoints import screener
+from app.services.screening.scan_stream import RunningTopN, result_chunks, sse_event
+
+
+def _result(i, score, passed=True):
+    return {
+        'symbol': f"S{i:03d}",
+        'passed_all': passed,
+        'score': np.float64(score),
+        'technical_indicators': {'rsi_14': np.float64(50.0), 'volume': np.int64(1_000_000)},
+        'leaps_available': np.bool_(True),
+        'ratio': float('nan'),
+    }
+
+
+def _results(n=250):
+    rng = np.random.default_rng(7)
+    return [_result(i, round(float(rng.uniform(0, 100)), 2), passed=i % 3 != 0) for i in range(n)]
+
+
+class Client:
+    """Python twin of the frontend's _scanStreamState."""
+
+    def __init__(self):
+        self.rows, self.ranks, self.results, self.events = {}, {}, [], []
+
+    def apply(self, event):
+        self.events.append(event)
+        if event['type'] == 'progress':
+            for symbol in event['removed']:
+                self.rows.pop(symbol)
+                self.ranks.pop(symbol)
+            self.rows.update({r['symbol']: r for r in event['rows']})
+            self.ranks.update(event['ranks'])
+        elif event['type'] == 'results':
+            self.results += event['results']
+
+    def top(self):
+        return sorted(self.rows, key=self.ranks.get)
+
+
+async def _stream(endpoint, results):
+    async def screened(*args, **kwargs):
+        for r in results:
+            yield r
+
+    with patch.object(screener, 'get_dynamic_universe_rows', return_value=([r['symbol'] for r in results], {})), \
+            patch.object(screener.screening_engine, 'iter_screen_async', screened):
+        response = await endpoint()
+        client = Client()
+        async for message in response.body_iterator:
+            assert message.startswith(b"data: ") and message.endswith(b"\n\n")
+            client.apply(json.loads(message[6:]))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_stream_scan_diffs_rebuild_top_n():
+    results = _results()
+    passed = sorted((r for r in results if r['passed_all']), key=lambda r: -r['score'])
+
+    client = await _stream(lambda: screener.stream_scan('moderate'), results)
+
+    assert client.top() == [r['symbol'] for r in passed[:20]]
+    assert [r['symbol'] for r in client.results] == [r['symbol'] for r in passed]
+
+    complete = client.events[-1]
+    assert complete['type'] == 'complete'
+    assert complete['passed'] == len(passed)
+    assert complete['chunks'] == 2
+    assert 'results' not in complete
+
+    # Later progress events carry far fewer rows than a full top-20 each
+    progress = [e for e in client.events if e['type'] == 'progress']
+    assert sum(len(e['rows']) for e in progress) < 20 * len(progress) / 2
+
+
+@pytest.mark.asyncio
+async def test_stream_scan_all_tags_and_chunks():
+    results = _results(60)
+
+    with patch.object(screener, '_matches_preset', side_effect=lambda r, pid: pid == 'moderate'):
+        client = await _stream(screener.stream_scan_all, results)
+
+    complete = client.events[-1]
+    assert complete['preset_summary']['moderate']['count'] == complete['passed'] == len(client.results)
+    assert all(r['matched_presets'] == ['moderate'] for r in client.results)
+    assert client.top() == [r['symbol'] for r in client.results[:20]]
+
+
+def test_running_top_n_reports_only_changes():
+    top = RunningTopN(n=3)
+    for i, score in enumerate([10, 30, 20]):
+        top.push(_result(i, score))
+    first = top.diff()
+    assert [r['symbol'] for r in first['rows']] == ['S001', 'S002', 'S000']
+    assert first['removed'] == []
+
+    top.push(_result(3, 25))   # enters at rank 1, S000 drops out
+    top.push(_result(4, 5))    # below the cut
+    second = top.diff()
+    assert [r['symbol'] for r in second['rows']] == ['S003']
+    assert second['removed'] == ['S000']
+    assert second['ranks'] == {'S003': 1, 'S002': 2}
+
+    assert top.diff() == {'rows': [], 'removed': [], 'ranks': {}}
+
+
+def test_ties_keep_the_earlier_result():
+    top = RunningTopN(n=1)
+    top.push(_result(0, 50))
+    top.push(_result(1, 50))
+    assert [r['symbol'] for r in top.ranked()] == ['S000']
+
+
+def test_events_serialize_numpy_and_nan():
+    event = json.loads(sse_event({'type': 'progress', 'rows': [_result(0, 42.5)]})[6:])
+    row = event['rows'][0]
+    assert row['score'] == 42.5
+    assert row['technical_indicators']['volume'] == 1_000_000
+    assert row['leaps_available'] is True
+    assert row['ratio'] is None
+
+    assert result_chunks([]) == []
+    chunks = [json.loads(c[6:]) for c in result_chunks([{'i': i} for i in range(5)], size=2)]
+    assert [(c['chunk'], c['chunks'], len(c['results'])) for c in chunks] == [(0, 3, 2), (1, 3, 2), (2, 3, 1)]
@@ -110,14 +110,10 @@ class TestCompositeFloor:
         """Stock scoring 29 (was passing at MIN=20) should now be filtered (MIN=30)."""
         # This documents the behavior: any stock with composite < 30 is now rejected
         # at the screening stage before reaching signal engine.
-        from app.services.screening.engine import ScreeningEngine
-        # We can't easily call screen_single_stock without full mocking,
-        # but we verify the constant changed
-        # The constant is defined inline in screen_single_stock, so we check
-        # it in a different way — read the source to confirm
-        import inspect
-        source = inspect.getsource(ScreeningEngine.screen_single_stock)
-        assert "MIN_COMPOSITE_SCORE = 30" in source, \
+        # The constant is module-level in the screening engine (used by the
+        # composite-ceiling gate and the final scoring stage)
+        from app.services.screening import engine
+        assert engine.MIN_COMPOSITE_SCORE == 30, \
             "MIN_COMPOSITE_SCORE should be 30"
 
 
@@ -0,0 +1,151 @@
+"""
+Recorded market-data archive tests (scripts/replay/market_data_store.py).
+
+Covers the .npz round trip and ReplayDataService's record-once / replay-many
+flow: the first prefetch records what Alpaca returned, later (offline)
+prefetches are served from disk without touching Alpaca.
+
+Run:  python3 -m pytest tests/replay/ -v -m replay
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.analysis.iv_history import get_iv_history_store
+from app.services.data_fetcher.alpaca_service import alpaca_service
+from scripts.replay.market_data_store import MarketDataStore
+from scripts.replay.replay_services import ReplayClock, ReplayDataService
+
+DAY = date(2026, 2, 10)
+
+
+def _intraday(n=156):
+    """Two sessions of 5m bars ending on DAY (UTC timestamps, like get_bars)."""
+    stamps = [
+        pd.Timestamp(d, tz="America/New_York") + pd.Timedelta(minutes=570 + 5 * i)
+        for d in ("2026-02-09", "2026-02-10") for i in range(n // 2)
+    ]
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 0.2, n))
+    return pd.DataFrame({
+        "open": close - 0.1, "high": close + 0.3, "low": close - 0.3, "close": close,
+        "volume": rng.integers(1_000, 50_000, n), "vwap": close,
+        "trades": rng.integers(10, 500, n),
+        "datetime": pd.DatetimeIndex(stamps).tz_convert("UTC"),
+    })
+
+
+def _daily(n=300):
+    return pd.DataFrame({
+        "date": pd.bdate_range(end="2026-02-10", periods=n, tz="UTC"),
+        "open": np.linspace(90, 110, n), "high": np.linspace(91, 111, n),
+        "low": np.linspace(89, 109, n), "close": np.linspace(90, 110, n),
+        "volume": np.full(n, 1_000_000),
+    })
+
+
+@pytest.fixture
+def alpaca():
+    """Stand-in Alpaca historical endpoints (counted)."""
+    get_bars = MagicMock(side_effect=lambda symbol, tf, **kw: _intraday())
+    get_historical = MagicMock(side_effect=lambda symbol, **kw: _daily())
+    with patch.object(alpaca_service, "get_bars", get_bars), \
+            patch.object(alpaca_service, "get_historical_prices", get_historical):
+        yield get_bars, get_historical
+
+
+@pytest.mark.replay
+def test_round_trip_keeps_columns_and_dtypes(tmp_path):
+    store = MarketDataStore(tmp_path)
+    df = _intraday()
+    df["vwap"] = df["vwap"].astype(object)
+    df.loc[3, "vwap"] = None                    # object column with gaps → float NaN
+    df["volume_spike"] = df["volume"] > 25_000
+    df["note"] = "x"
+
+    store.save(DAY, "AAPL", "5m", df)
+    loaded = store.load(DAY, "AAPL", "5m")
+
+    assert list(loaded.columns) == list(df.columns)
+    assert loaded["datetime"].dtype == df["datetime"].dtype
+    assert (loaded["datetime"] == df["datetime"]).all()
+    assert loaded["volume"].dtype == df["volume"].dtype
+    assert loaded["volume_spike"].dtype == bool
+    assert np.isnan(loaded.loc[3, "vwap"]) and loaded.loc[4, "vwap"] == df.loc[4, "vwap"]
+    assert loaded["note"].tolist() == df["note"].tolist()
+
+    store.save(DAY, "SPY", "daily", _daily())
+    pd.testing.assert_frame_equal(store.load(DAY, "SPY", "daily"), _daily())
+    assert store.dates() == [DAY]
+
+
+@pytest.mark.replay
+def test_missing_or_corrupt_file_is_a_miss(tmp_path):
+    store = MarketDataStore(tmp_path)
+    assert store.load(DAY, "AAPL", "5m") is None
+
+    path = store.path(DAY, "AAPL", "5m")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not an archive")
+    assert store.load(DAY, "AAPL", "5m") is None
+
+
+@pytest.mark.replay
+def test_prefetch_records_then_replays_offline(tmp_path, alpaca):
+    get_bars, get_historical = alpaca
+    symbols, timeframes = ["AAPL", "SPY"], ["5m", "1h", "1d"]
+
+    first = ReplayDataService(ReplayClock(DAY), symbols, timeframes, store=MarketDataStore(tmp_path))
+    total = first.prefetch_bars()
+    assert (first.fetched, first.archive_hits) == (len(symbols) * 4, 0)
+    assert get_bars.call_count == len(symbols) * len(timeframes)
+    assert get_historical.call_count == len(symbols)
+
+    get_bars.reset_mock()
+    get_historical.reset_mock()
+    clock = ReplayClock(DAY, start_hour=10, start_minute=0)
+    replay = ReplayDataService(clock, symbols, timeframes, store=MarketDataStore(tmp_path, offline=True))
+    assert replay.prefetch_bars() == total
+    assert (replay.fetched, replay.archive_hits) == (0, len(symbols) * 4)
+    get_bars.assert_not_called()
+    get_historical.assert_not_called()
+
+    pd.testing.assert_frame_equal(
+        replay.bar_cache[("AAPL", "5m")], first.bar_cache[("AAPL", "5m")].reset_index(drop=True),
+    )
+    assert replay._opening_ranges == first._opening_ranges
+
+    # install_patches serves the archived bars by simulated time
+    replay.install_patches()
+    try:
+        bars = alpaca_service.get_bars("AAPL", "5m", limit=500)
+        assert bars["datetime"].iloc[-1] <= clock.current_time_utc
+        assert alpaca_service.get_snapshot("AAPL")["current_price"] == bars["close"].iloc[-1]
+    finally:
+        replay.uninstall_patches()
+
+
+@pytest.mark.replay
+def test_offline_miss_never_fetches(tmp_path, alpaca):
+    get_bars, get_historical = alpaca
+    data_svc = ReplayDataService(
+        ReplayClock(datetime(2026, 2, 11)), ["AAPL"], ["5m"],
+        store=MarketDataStore(tmp_path, offline=True),
+    )
+    assert data_svc.prefetch_bars() == 0
+    assert data_svc.bar_cache == {} and data_svc.daily_cache == {}
+
+    iv_store = get_iv_history_store()
+    data_svc.install_patches()
+    try:
+        assert alpaca_service.get_historical_prices("^VIX", period="1y") is None
+        # IV history is read as of the replay date and never written
+        assert iv_store.read_only and iv_store.clock() == date(2026, 2, 11)
+    finally:
+        data_svc.uninstall_patches()
+    assert not iv_store.read_only and iv_store.clock() == date.today()
+    get_bars.assert_not_called()
+    get_historical.assert_not_called()
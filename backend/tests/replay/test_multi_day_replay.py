@@ -0,0 +1,104 @@
+"""
+Multi-day replay tests: clock-sliced bar access (ReplayDataService) and the
+date-range runner's audit-log merge (scripts/replay/replay_date_range.py).
+
+Run:  python3 -m pytest tests/replay/ -v -m replay
+"""
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.replay_audit_log import ReplayAuditLog
+from scripts.replay.replay_date_range import merge_audit_logs, parse_args, trading_days
+from scripts.replay.replay_services import ReplayClock, ReplayDataService
+
+ET = ZoneInfo("America/New_York")
+
+
+def _bars(day="2026-02-10", n=78):
+    stamps = pd.Timestamp(day, tz=ET) + pd.to_timedelta(570 + 5 * np.arange(n), unit="min")
+    close = np.linspace(100, 110, n)
+    return pd.DataFrame({
+        "datetime": stamps.tz_convert("UTC"), "open": close, "high": close + 1,
+        "low": close - 1, "close": close, "volume": np.full(n, 1000.0),
+    })
+
+
+@pytest.mark.replay
+def test_visible_bars_match_full_mask_at_every_tick():
+    clock = ReplayClock(date(2026, 2, 10), start_hour=9, start_minute=0)
+    data_svc = ReplayDataService(clock, ["AAPL"], ["5m"])
+    all_bars = data_svc.bar_cache[("AAPL", "5m")] = _bars()
+
+    assert data_svc._get_visible_bars("AAPL", "5m") is None  # before the open
+    for _ in range(100):
+        clock.advance(5)
+        expected = all_bars[all_bars["datetime"] <= clock.current_time_utc].tail(20)
+        visible = data_svc._get_visible_bars("aapl", "5m", limit=20)
+        if expected.empty:
+            assert visible is None
+            continue
+        pd.testing.assert_frame_equal(visible, expected)
+        assert data_svc._get_last_bar("AAPL", "5m").equals(expected.iloc[-1])
+
+    # Callers may add columns without touching the cache
+    visible["rsi"] = 50.0
+    assert "rsi" not in data_svc.bar_cache[("AAPL", "5m")]
+
+    # A replaced frame gets a fresh index
+    data_svc.bar_cache[("AAPL", "5m")] = _bars().iloc[:10]
+    assert len(data_svc._get_visible_bars("AAPL", "5m", limit=100)) == 10
+
+
+@pytest.mark.replay
+def test_trading_days_and_passthrough_args():
+    assert trading_days("2026-02-06", "2026-02-10") == [date(2026, 2, 6), date(2026, 2, 9), date(2026, 2, 10)]
+
+    args, replay_argv = parse_args(["2026-02-02", "2026-02-06", "-s", "AAPL", "--workers", "3", "--offline", "--interval", "15"])
+    assert args.workers == 3
+    assert replay_argv == ["--symbols", "AAPL", "--offline", "--interval", "15"]
+
+
+def _day_db(path, day, gross_pl):
+    engine = create_engine(f"sqlite:///{path}")
+    ReplayAuditLog.__table__.create(engine)
+    with sessionmaker(bind=engine)() as db:
+        tick = datetime.fromisoformat(day).replace(hour=10, tzinfo=ET)
+        db.add_all([
+            ReplayAuditLog(replay_session_id=f"session-{day}", replay_date=day, simulated_time=tick,
+                           stage="signal_generation", symbol="AAPL", decision={"confidence": 70}),
+            ReplayAuditLog(replay_session_id=f"session-{day}", replay_date=day,
+                           simulated_time=tick + timedelta(hours=6), stage="summary",
+                           decision={"total_signals": 1, "gross_pl": gross_pl}),
+        ])
+        db.commit()
+    engine.dispose()
+    return str(path)
+
+
+@pytest.mark.replay
+def test_merge_audit_logs_into_main_db(tmp_path):
+    paths = [_day_db(tmp_path / "a.db", "2026-02-10", 12.5), _day_db(tmp_path / "b.db", "2026-02-09", -3.0)]
+    main = create_engine(f"sqlite:///{tmp_path / 'main.db'}")
+    ReplayAuditLog.__table__.create(main)
+
+    with sessionmaker(bind=main)() as db:
+        by_day = merge_audit_logs(paths + [str(tmp_path / "missing.db")], db)
+        merged = db.query(ReplayAuditLog).order_by(ReplayAuditLog.replay_date, ReplayAuditLog.id).all()
+
+    assert list(by_day) == ["2026-02-09", "2026-02-10"]
+    assert [r["decision"]["gross_pl"] for rows in by_day.values() for r in rows if r["stage"] == "summary"] == [-3.0, 12.5]
+    # Simulated times come back as the same instant (SQLite stores ET wall clock)
+    first = by_day["2026-02-10"][0]["simulated_time"]
+    assert first.astimezone(timezone.utc) == datetime(2026, 2, 10, 15, 0, tzinfo=timezone.utc)
+
+    assert len(merged) == 4
+    assert {r.replay_session_id for r in merged} == {"session-2026-02-09", "session-2026-02-10"}
+
+    # Read-only merge (--no-merge) copies nothing
+    assert len(merge_audit_logs(paths)) == 2
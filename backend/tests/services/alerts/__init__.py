@@ -0,0 +1 @@
+# Alert service tests
@@ -0,0 +1,176 @@
+"""
+Tests for batched ticker-alert evaluation in AlertService.
+
+Alerts are grouped by symbol: one multi-snapshot call for quotes, one
+batched daily-bars request for RSI/SMA symbols, RSI/SMA computed once per
+symbol. All providers are mocked — no network calls.
+"""
+import types
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.user_alert import AlertType
+from app.services.alerts.alert_service import AlertService, SymbolMarketData
+
+
+def _alert(alert_id, symbol, alert_type, threshold=None, sma_period=None):
+    return types.SimpleNamespace(
+        id=alert_id, name=f"alert-{alert_id}", symbol=symbol,
+        alert_type=alert_type.value, threshold_value=threshold, sma_period=sma_period,
+        alert_scope="ticker", is_active=True, expires_at=None,
+        frequency="continuous", notification_channels=["app"],
+        times_triggered=0, last_triggered_at=None, last_triggered_value=None,
+        last_checked_at=None,
+    )
+
+
+def _daily_closes(values):
+    dates = pd.date_range(end=datetime(2026, 2, 10), periods=len(values), freq="D", tz="UTC")
+    return pd.DataFrame({
+        "date": dates, "open": values, "high": values, "low": values,
+        "close": values, "volume": [1_000_000] * len(values),
+    })
+
+
+@pytest.fixture
+def providers():
+    """Patch data providers used by the alert service."""
+    with patch("app.services.alerts.alert_service.alpaca_service") as alpaca, \
+         patch("app.services.alerts.alert_service.fmp_service") as fmp, \
+         patch.object(AlertService, "_get_live_price", return_value=None):
+        yield alpaca, fmp
+
+
+def _db_with(alerts):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = alerts
+    return db
+
+
+def test_alerts_on_same_symbol_fetch_each_dataset_once(providers):
+    alpaca, fmp = providers
+    # Steady decline → RSI deep oversold
+    closes = list(np.linspace(200, 100, 260))
+    alpaca.get_multi_snapshots.return_value = {"AAPL": {"current_price": 99.0}}
+    alpaca.get_multi_historical_prices.return_value = {"AAPL": _daily_closes(closes)}
+
+    alerts = [_alert(i, "AAPL", AlertType.RSI_OVERSOLD, 30) for i in range(10)]
+    alerts += [_alert(20, "AAPL", AlertType.PRICE_BELOW, 100.0)]
+    alerts += [_alert(21, "aapl", AlertType.PRICE_CROSS_SMA, sma_period=50)]
+
+    triggered = AlertService().check_all_alerts(_db_with(alerts))
+
+    alpaca.get_multi_snapshots.assert_called_once_with(["AAPL"])
+    alpaca.get_multi_historical_prices.assert_called_once_with(["AAPL"], period="1y")
+    fmp.get_stock_info.assert_not_called()
+    # 10 RSI + 1 price-below (SMA cross did not cross)
+    assert len(triggered) == 11
+    assert all(a.last_checked_at is not None for a in alerts)
+
+
+def test_quote_only_alerts_skip_bar_fetch(providers):
+    alpaca, _ = providers
+    alpaca.get_multi_snapshots.return_value = {
+        "AAPL": {"current_price": 210.0}, "MSFT": {"current_price": 390.0},
+    }
+    alerts = [
+        _alert(1, "AAPL", AlertType.PRICE_ABOVE, 200.0),
+        _alert(2, "MSFT", AlertType.PRICE_ABOVE, 400.0),
+    ]
+
+    triggered = AlertService().check_all_alerts(_db_with(alerts))
+
+    alpaca.get_multi_snapshots.assert_called_once()
+    alpaca.get_multi_historical_prices.assert_not_called()
+    assert [n.symbol for n in triggered] == ["AAPL"]
+
+
+def test_missing_snapshot_falls_back_to_fmp(providers):
+    alpaca, fmp = providers
+    alpaca.get_multi_snapshots.return_value = {}
+    fmp.get_stock_info.return_value = {"current_price": 50.0}
+
+    triggered = AlertService().check_all_alerts(
+        _db_with([_alert(1, "XYZ", AlertType.PRICE_BELOW, 60.0)])
+    )
+
+    fmp.get_stock_info.assert_called_once_with("XYZ")
+    assert len(triggered) == 1
+
+
+def test_one_failed_iv_lookup_leaves_other_alerts_firing(providers):
+    alpaca, _ = providers
+    alpaca.get_multi_snapshots.return_value = {
+        "AAPL": {"current_price": 210.0}, "MSFT": {"current_price": 390.0},
+    }
+
+    def iv_data(symbol):
+        if symbol == "AAPL":
+            raise RuntimeError("TastyTrade timeout")
+        return {"iv_rank": 80.0}
+
+    service = AlertService()
+    service.opt_analysis = MagicMock()
+    service.opt_analysis.get_enhanced_iv_data.side_effect = iv_data
+    alerts = [
+        _alert(1, "AAPL", AlertType.IV_RANK_ABOVE, 50.0),
+        _alert(2, "AAPL", AlertType.PRICE_ABOVE, 200.0),
+        _alert(3, "MSFT", AlertType.IV_RANK_ABOVE, 50.0),
+    ]
+
+    triggered = service.check_all_alerts(_db_with(alerts))
+
+    assert sorted((n.symbol, n.alert_id) for n in triggered) == [("AAPL", 2), ("MSFT", 3)]
+
+
+def test_failed_batch_calls_drop_only_their_stage(providers):
+    alpaca, fmp = providers
+    alpaca.get_multi_snapshots.side_effect = RuntimeError("snapshots down")
+    alpaca.get_multi_historical_prices.side_effect = RuntimeError("bars down")
+    fmp.get_stock_info.return_value = {"current_price": 99.0}
+    alerts = [
+        _alert(1, "AAPL", AlertType.RSI_OVERSOLD, 30),
+        _alert(2, "AAPL", AlertType.PRICE_BELOW, 100.0),
+    ]
+
+    triggered = AlertService().check_all_alerts(_db_with(alerts))
+
+    assert [n.alert_id for n in triggered] == [2]
+    assert all(a.last_checked_at is not None for a in alerts)
+
+
+def test_expired_alert_is_deactivated_not_fetched(providers):
+    alpaca, _ = providers
+    alert = _alert(1, "AAPL", AlertType.PRICE_ABOVE, 1.0)
+    alert.expires_at = datetime.utcnow() - timedelta(days=1)
+
+    AlertService().check_all_alerts(_db_with([alert]))
+
+    assert alert.is_active is False
+    alpaca.get_multi_snapshots.assert_not_called()
+
+
+def test_sma_cross_detected_from_shared_closes():
+    data = SymbolMarketData("AAPL")
+    closes = [100.0] * 60 + [90.0, 95.0]  # yesterday closed below the SMA
+    data.set_daily_closes(pd.Series(closes))
+    data.current_price = 110.0
+
+    triggered, value, message = AlertService._check_sma_cross(data, 50)
+
+    assert triggered
+    assert value == 110.0
+    assert "SMA50" in message
+
+
+def test_sma_is_computed_once_per_period():
+    data = SymbolMarketData("AAPL")
+    data.set_daily_closes(pd.Series(np.arange(1, 301, dtype=float)))
+
+    first = data.sma(200)
+    assert data.sma(200) is first
+    assert first[0] == pytest.approx(np.arange(101, 301).mean())
@@ -0,0 +1,140 @@
+"""
+Tests for the local ATM IV history (iv_history.py): the maintained 52-week
+window agrees with a brute-force computation, files are append-only and
+reload to the same state, and OptionsAnalysis falls back to it when
+TastyTrade has no IV rank.
+"""
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.analysis import iv_history
+from app.services.analysis.iv_history import (
+    MIN_HISTORY_DAYS, RECORD, WINDOW_DAYS, IVHistoryStore,
+)
+from app.services.analysis.options import OptionsAnalysis
+
+START = date(2025, 1, 2)
+
+
+def _series(n=500, seed=0):
+    """n weekdays of ATM IV starting at START (float32, as stored)."""
+    days = pd.bdate_range(START, periods=n).date
+    rng = np.random.default_rng(seed)
+    ivs = np.clip(0.4 + np.cumsum(rng.normal(0, 0.01, n)), 0.05, None).astype(np.float32)
+    return list(days), [float(v) for v in ivs]
+
+
+def _brute_force(days, ivs, i):
+    """IV rank / percentile of day i over the 52 weeks ending there."""
+    cutoff = days[i].toordinal() - WINDOW_DAYS
+    prior = [v for d, v in zip(days[:i], ivs[:i]) if d.toordinal() > cutoff]
+    window = prior + [ivs[i]]
+    low, high = min(window), max(window)
+    rank = (ivs[i] - low) / (high - low) * 100 if high > low else 0.0
+    pct = sum(v < ivs[i] for v in prior) / len(prior) * 100 if prior else 0.0
+    return round(rank, 1), round(pct, 1), len(window)
+
+
+def test_running_window_matches_brute_force(tmp_path):
+    store = IVHistoryStore(tmp_path)
+    days, ivs = _series()
+
+    for i, (day, iv) in enumerate(zip(days, ivs)):
+        store.record("aapl", iv * 1.1, day)      # overwritten by the day's later capture
+        assert store.record("AAPL", iv, day)
+        if i % 7 and i < len(days) - 1:
+            continue
+        rank, pct, n = _brute_force(days, ivs, i)
+        stats = store.stats("AAPL", as_of=day)
+        if n < MIN_HISTORY_DAYS:
+            assert stats is None
+            continue
+        assert (stats["iv_rank"], stats["iv_percentile"], stats["days"]) == (rank, pct, n)
+
+    # Earlier dates (replays) come from the stored arrays and agree too
+    i = next(i for i in range(300, len(days)) if days[i].weekday() == 4)
+    assert store.stats("AAPL", as_of=days[i])["iv_rank"] == _brute_force(days, ivs, i)[0]
+    assert store.stats("AAPL", as_of=days[i] + timedelta(days=1))["as_of"] == days[i].isoformat()  # Saturday
+
+
+def test_file_is_append_only_and_reloads(tmp_path):
+    store = IVHistoryStore(tmp_path)
+    days, ivs = _series(60)
+    for day, iv in zip(days, ivs):
+        store.record("MSFT", iv, day)
+    store.record("MSFT", 0.55, days[-1])          # same day → overwrite in place
+    assert store.path("MSFT").stat().st_size == len(days) * RECORD.itemsize
+
+    assert not store.record("MSFT", 0.30, days[10])   # older than the latest day
+    assert not store.record("MSFT", 0.0, days[-1] + timedelta(days=1))   # chain had no IV
+    assert not store.record("MSFT", None)
+
+    records = store.history("MSFT")
+    assert records["day"].tolist() == [d.toordinal() for d in days]
+    assert records["iv"][-1] == np.float32(0.55)
+
+    reloaded = IVHistoryStore(tmp_path)
+    assert reloaded.stats("MSFT", days[-1]) == store.stats("MSFT", days[-1])
+    assert reloaded.symbols() == ["MSFT"]
+
+
+def test_short_or_stale_history_has_no_rank(tmp_path):
+    days, ivs = _series(40)
+    store = IVHistoryStore(tmp_path, clock=lambda: days[-1])
+    for day, iv in zip(days[:MIN_HISTORY_DAYS - 1], ivs):
+        store.record("NVDA", iv, day)
+    assert store.iv_rank("NVDA", days[MIN_HISTORY_DAYS - 2]) is None   # too few days
+
+    for day, iv in zip(days[MIN_HISTORY_DAYS - 1:], ivs[MIN_HISTORY_DAYS - 1:]):
+        store.record("NVDA", iv, day)
+    assert store.iv_rank("NVDA") is not None                 # clock → as of the last day
+    assert store.iv_rank("NVDA", days[-1] + timedelta(days=10)) is None   # stale
+    assert store.iv_percentile("ZZZZ") is None
+
+    read_only = IVHistoryStore(tmp_path, read_only=True)
+    assert not read_only.record("NVDA", 0.5, days[-1] + timedelta(days=1))
+
+
+@pytest.fixture
+def local_store(tmp_path):
+    store = IVHistoryStore(tmp_path)
+    days, ivs = _series(260)
+    for day, iv in zip(days, ivs):
+        store.record("AAPL", iv, day)
+    with patch.object(iv_history, "_iv_history_store", store):
+        yield store, days
+
+
+def test_enhanced_iv_data_falls_back_to_local_history(local_store):
+    store, days = local_store
+    unavailable = MagicMock()
+    unavailable.is_available.return_value = False
+
+    with patch("app.services.analysis.options.get_tastytrade_service", return_value=unavailable):
+        data = OptionsAnalysis.get_enhanced_iv_data("AAPL", days[-1])
+        assert data["iv_source"] == "local"
+        assert data["iv_rank"] == store.iv_rank("AAPL", days[-1])
+        assert OptionsAnalysis.get_enhanced_iv_data("ZZZZ", days[-1]) == {}
+
+        # LEAPS summary records today's ATM IV, then ranks with it
+        today = datetime.combine(days[-1] + timedelta(days=3), datetime.min.time())
+        calls = pd.DataFrame({
+            "strike": [90.0, 100.0, 110.0], "impliedVolatility": [0.9, 0.9, 0.9],
+            "expiration": [(today + timedelta(days=400)).date().isoformat()] * 3,
+            "bid": 10.0, "ask": 11.0, "lastPrice": 10.5, "volume": 50, "openInterest": 500,
+        })
+        summary = OptionsAnalysis.get_leaps_summary_enhanced(calls, 101.0, today, "AAPL")
+        assert summary["tastytrade"]["iv_source"] == "local"
+        assert summary["tastytrade"]["iv_rank"] == 100.0     # 0.9 is a new 52-week high
+        assert store.history("AAPL")[-1]["day"] == today.toordinal()
+
+    tasty = MagicMock()
+    tasty.is_available.return_value = True
+    tasty.get_enhanced_options_data.return_value = {"iv_rank": 12.0, "iv_percentile": "20"}
+    with patch("app.services.analysis.options.get_tastytrade_service", return_value=tasty):
+        data = OptionsAnalysis.get_enhanced_iv_data("AAPL", days[-1])
+    assert (data["iv_rank"], data["iv_source"]) == (12.0, "tastytrade")
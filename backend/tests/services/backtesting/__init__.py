@@ -0,0 +1 @@
+# Backtesting engine tests
@@ -0,0 +1,127 @@
+"""
+Tests for binary backtest artifacts (artifacts.py, BacktestArtifact) and
+the backtesting endpoints that read them: round trips, LTTB downsampling,
+a list endpoint that never reads curves, and the legacy JSON fallback.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.api.endpoints.backtesting import delete_backtest, get_results, list_backtests
+from app.models.backtest_artifact import BacktestArtifact
+from app.models.backtest_result import BacktestResult
+from app.services.backtesting.artifacts import (
+    EquitySeries, equity_points, lttb_indices, pack_equity, pack_trades, to_minutes, trade_records,
+)
+
+TRADES = [
+    {"entry_date": "2025-01-02 09:45", "exit_date": "2025-01-02 10:00", "direction": "buy",
+     "entry_price": 100.5, "exit_price": 111.5, "size": 50, "pnl": 550.0, "pnl_pct": 10.95, "bars_held": 3},
+    {"entry_date": "2025-01-03 13:05", "exit_date": "2025-01-06 09:35", "direction": "sell",
+     "entry_price": 2401.37, "exit_price": 2398.12, "size": 1.5, "pnl": 4.88, "pnl_pct": 0.14, "bars_held": 41},
+]
+
+
+def _curve(n=10_000):
+    rng = np.random.default_rng(5)
+    minutes = to_minutes(["2025-01-02 09:30"]) + np.arange(n) * 5
+    values = np.round(100_000 + np.cumsum(rng.normal(0, 50, n)), 2)
+    values[7_777] += 25_000   # one-bar spike
+    return EquitySeries(minutes, values)
+
+
+def test_round_trips():
+    curve = [{"date": "2025-01-02 09:30", "value": 100000.0}, {"date": "2025-01-02 09:35", "value": 100123.45}]
+    assert equity_points(pack_equity(curve), points=0) == curve
+    assert trade_records(pack_trades(TRADES)) == TRADES
+    assert trade_records(pack_trades([])) == []
+
+    series = _curve()
+    blob = pack_equity(series)
+    assert len(blob) < 8 * len(series.values) + 1_000     # 4-byte time + 4-byte value per bar
+
+
+def test_lttb_keeps_extremes_striding_skips():
+    series = _curve()
+    keep = lttb_indices(series.minutes, series.values, 500)
+
+    assert len(keep) == 500
+    assert keep[0] == 0 and keep[-1] == len(series.values) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 7_777 in keep
+    assert 7_777 not in np.arange(0, len(series.values), len(series.values) // 500)
+
+    points = equity_points(pack_equity(series), points=120)
+    assert len(points) == 120
+    assert max(p["value"] for p in points) == pytest.approx(series.values.max(), abs=0.01)
+    assert lttb_indices(series.minutes[:10], series.values[:10], 500).tolist() == list(range(10))
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    BacktestResult.__table__.create(engine)
+    BacktestArtifact.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    series = _curve()
+    for i in range(30):
+        record = BacktestResult(
+            symbol="AAPL", strategy="orb_breakout", timeframe="5m",
+            start_date=date(2025, 1, 1), end_date=date(2025, 6, 1),
+            status="completed", total_return_pct=1.0 + i,
+        )
+        record.artifact = BacktestArtifact(
+            equity=pack_equity(series), trades=pack_trades(TRADES),
+            equity_points=len(series.values), trade_count=len(TRADES),
+        )
+        session.add(record)
+    # Saved before artifacts existed
+    session.add(BacktestResult(
+        symbol="MSFT", strategy="orb_breakout", timeframe="5m",
+        start_date=date(2025, 1, 1), end_date=date(2025, 6, 1), status="completed",
+        equity_curve=[{"date": f"2025-01-02 09:{m:02d}", "value": 1e5 + m} for m in range(50)],
+        trade_log=TRADES,
+    ))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_list_never_reads_artifacts_or_json(engine, db):
+    statements = []
+    listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        page = list_backtests(db=db, limit=50, offset=0, symbol=None, strategy=None)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert page["total"] == 31 and len(page["backtests"]) == 31
+    assert "equity_curve" not in page["backtests"][0]
+    sql = " ".join(statements)
+    assert "backtest_artifacts" not in sql
+    assert "equity_curve" not in sql and "trade_log" not in sql
+
+
+def test_results_resolution_legacy_fallback_and_delete(db):
+    result = get_results(1, points=300, db=db)
+    assert len(result["equity_curve"]) == 300
+    assert result["equity_points_total"] == 10_000
+    assert result["trade_log"] == TRADES
+    assert len(get_results(1, points=0, db=db)["equity_curve"]) == 10_000
+
+    legacy = get_results(31, points=20, db=db)
+    assert len(legacy["equity_curve"]) == 20
+    assert legacy["equity_curve"][0]["date"] == "2025-01-02 09:00"
+    assert legacy["trade_log"] == TRADES
+
+    delete_backtest(1, db=db)
+    assert db.query(BacktestArtifact).count() == 29
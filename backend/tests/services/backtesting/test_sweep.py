@@ -0,0 +1,171 @@
+"""
+Tests for parameter sweeps (app/services/backtesting/sweep.py): grid and
+walk-forward window construction, batch execution over shared frames, and
+the compact ranked results stored on the sweep record.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.endpoints.backtesting import SweepRequest
+from app.services.backtesting import sweep as sweep_module
+from app.services.backtesting.engine import BacktestEngine
+from app.services.backtesting.sweep import (
+    RESULT_COLUMNS, SweepEngine, expand_grid, get_progress, walk_forward_windows,
+)
+from app.services.backtesting.vectorized import run_windows
+from app.services.compute.pool import ComputePool
+from app.services.compute.tasks import sweep_run
+
+from tests.services.backtesting.test_vectorized import _intraday_bars
+
+
+@pytest.fixture(scope="module")
+def frames():
+    return {"AAA": _intraday_bars(seed=3), "BBB": _intraday_bars(seed=4)}
+
+
+def _params(**overrides):
+    params = BacktestEngine()._get_strategy_params("range_breakout", "large_cap", "15m")
+    return {**params, "position_size_pct": 10.0, **overrides}
+
+
+def test_expand_grid():
+    combos = expand_grid({"stop_atr_mult": [0.5, 1.0], "min_rvol": [0.8, 1.2, 1.5]})
+    assert len(combos) == 6
+    assert combos[0] == {"min_rvol": 0.8, "stop_atr_mult": 0.5}
+    assert len({tuple(c.items()) for c in combos}) == 6
+
+
+@pytest.mark.parametrize("n,folds,ratio", [(1000, 4, 0.75), (937, 5, 0.7), (120, 3, 0.5)])
+def test_walk_forward_windows_roll_within_range(n, folds, ratio):
+    windows = walk_forward_windows(n, folds, ratio)
+    assert len(windows) == folds
+    for k, ((a, b), (c, d)) in enumerate(windows):
+        assert a < b == c < d <= n
+        if k:
+            assert c == windows[k - 1][1][1]  # test windows are back to back
+    assert windows[-1][1][1] > n * 0.95
+
+
+def test_walk_forward_windows_too_short():
+    assert walk_forward_windows(5, 10, 0.9) == []
+
+
+def test_run_windows_matches_whole_frame_run(frames):
+    df = frames["AAA"]
+    full, = run_windows(df, "range_breakout", _params(), 100_000, [(0, len(df))])
+    halves = run_windows(df, "range_breakout", _params(), 100_000, [(0, 400), (400, len(df))])
+    assert full["total_trades"] >= 1
+    assert sum(h["total_trades"] for h in halves) >= full["total_trades"] - 1
+
+
+def test_imap_shared_matches_inline(frames):
+    calls = [(symbol, ("range_breakout", _params(stop_atr_mult=m), 100_000, [(0, 900)]))
+             for symbol in frames for m in (0.4, 0.8, 1.2)]
+    inline = dict(ComputePool(workers=0).imap_shared(sweep_run, frames, calls))
+
+    pool = ComputePool(workers=2, max_queue=8)
+    try:
+        pooled = dict(pool.imap_shared(sweep_run, frames, calls))
+        stats = pool.stats()
+    finally:
+        pool.shutdown()
+
+    assert pooled == inline
+    assert sorted(pooled) == list(range(len(calls)))
+    assert stats["completed"] == len(calls) and stats["in_flight"] == 0
+
+
+def _record(**overrides):
+    fields = dict(
+        id=7, symbols=["AAA", "BBB", "NODATA"], strategy="range_breakout", timeframe="15m",
+        cap_size="large_cap", start_date=None, end_date=None, initial_capital=100_000.0,
+        position_size_pct=10.0, grid={"stop_atr_mult": [0.4, 0.8], "min_rvol": [0.7, 1.2]},
+        walk_forward=None, rank_by="total_return_pct", status="pending",
+        total_runs=0, completed_runs=0,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _run(record, frames):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = record
+    with patch.object(BacktestEngine, "_fetch_data", side_effect=lambda symbol, *a: frames.get(symbol)), \
+            patch.object(sweep_module, "compute_pool", ComputePool(workers=0)):
+        SweepEngine().run_sweep(record.id, db)
+    return record
+
+
+def test_sweep_ranks_and_stores_compact_rows(frames):
+    record = _run(_record(), frames)
+
+    assert record.status == "completed", record.__dict__.get("error_message")
+    assert record.total_runs == record.completed_runs == 8  # 2 symbols × 4 combinations
+    assert record.skipped_symbols == [{"symbol": "NODATA", "reason": "0 bars (need 50+)"}]
+    assert len(record.combinations) == 4
+
+    assert record.results["columns"] == list(RESULT_COLUMNS)
+    assert len(record.results["rows"]) == 8
+    assert all(row[3] == "full" for row in record.results["rows"])
+
+    scores = [entry["score"] for entry in record.ranking]
+    assert scores == sorted(scores, reverse=True)
+    assert {entry["runs"] for entry in record.ranking} == {2}
+    assert record.walk_forward_summary is None
+    assert get_progress(record.id) is None  # live state dropped once stored
+
+
+def test_walk_forward_selects_in_sample_winner(frames):
+    record = _run(_record(walk_forward={"folds": 3, "train_ratio": 0.7}), frames)
+
+    assert record.status == "completed", record.__dict__.get("error_message")
+    rows = record.results["rows"]
+    assert len(rows) == 8 * 6  # every run reports in- and out-of-sample metrics for 3 folds
+    assert {(row[2], row[3]) for row in rows} == {(k, s) for k in range(3) for s in ("in", "out")}
+
+    summary = record.walk_forward_summary["AAA"]
+    assert len(summary["folds"]) == 3
+    metric = RESULT_COLUMNS.index("total_return_pct")
+    for fold in summary["folds"]:
+        in_sample = [r[metric] for r in rows if r[0] == "AAA" and r[2] == fold["fold"] and r[3] == "in"]
+        assert fold["in_sample"]["total_return_pct"] == max(in_sample)
+
+
+def test_sweep_over_window_params(frames):
+    base = dict(symbols=["AAA"], strategy="range_breakout", start_date="2025-01-01", end_date="2025-06-01")
+    grid = SweepRequest(**base, grid={"range_lookback": [20.0, 30], "min_rvol": [1]}).grid
+    record = _run(_record(symbols=["AAA"], grid=grid), frames)
+
+    assert record.status == "completed", record.__dict__.get("error_message")
+    assert record.combinations == [{"min_rvol": 1, "range_lookback": 20}, {"min_rvol": 1, "range_lookback": 30}]
+    assert all(type(c["range_lookback"]) is int for c in record.combinations)
+
+
+def test_sweep_fails_without_data():
+    record = _run(_record(symbols=["NODATA"]), {})
+    assert record.status == "failed"
+    assert "NODATA" in record.error_message
+
+
+def test_sweep_request_validation():
+    base = dict(symbols=["aapl"], strategy="range_breakout", start_date="2025-01-01", end_date="2025-06-01")
+    req = SweepRequest(**base, grid={"stop_atr_mult": [1.0, 0.5, 0.5]})
+    assert req.symbols == ["AAPL"]
+    assert req.grid == {"stop_atr_mult": [0.5, 1.0]}
+
+    assert SweepRequest(**base, grid={"bb_period": [20.0, 15]}).grid == {"bb_period": [15, 20]}
+
+    with pytest.raises(ValidationError):
+        SweepRequest(**base, grid={"not_a_param": [1]})
+    with pytest.raises(ValidationError):
+        SweepRequest(**base, grid={"range_lookback": [20.5]})
+    with pytest.raises(ValidationError):
+        SweepRequest(**base, grid={"stop_atr_mult": [float(i) for i in range(501)]})
+    with pytest.raises(ValidationError):
+        SweepRequest(**base, grid={"stop_atr_mult": [1.0]}, rank_by="max_drawdown_pct")
+    with pytest.raises(ValidationError):
+        SweepRequest(**base, grid={"stop_atr_mult": [1.0]}, walk_forward={"folds": 1})
@@ -0,0 +1,203 @@
+"""
+Tests for the vectorized backtest engine (app/services/backtesting/vectorized.py):
+its entry masks match SignalEngine._check_* run bar by bar, fills follow
+Backtrader's next-open semantics, and Backtrader stays selectable.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from app.api.endpoints.backtesting import BacktestRequest
+from app.services.backtesting import engine as engine_module
+from app.services.backtesting.artifacts import trade_records
+from app.services.backtesting.engine import BacktestEngine
+from app.services.backtesting.vectorized import (
+    EXIT_TARGET, _session_days, _timestamps, simulate, strategy_setup,
+)
+from app.services.compute.tasks import backtrader_run, vectorized_run
+from app.services.data_fetcher.alpaca_service import alpaca_service
+from app.services.signals.signal_engine import SignalEngine
+
+
+def _intraday_bars(days=12, per_day=78, seed=7):
+    """5m session bars with alpaca_service indicators, tz-aware UTC 'datetime' column."""
+    rng = np.random.default_rng(seed)
+    stamps = [
+        pd.Timestamp(day.date()).tz_localize("America/New_York") + pd.Timedelta(minutes=570 + 5 * i)
+        for day in pd.bdate_range("2025-03-03", periods=days)
+        for i in range(per_day)
+    ]
+    n = len(stamps)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    df = pd.DataFrame({
+        "datetime": pd.DatetimeIndex(stamps).tz_convert("UTC"),
+        "open": open_,
+        "high": np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, n))),
+        "low": np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, n))),
+        "close": close,
+        "volume": rng.integers(20_000, 200_000, n).astype(float),
+    })
+    return alpaca_service.calculate_indicators(df)
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return _intraday_bars()
+
+
+def _params(strategy, timeframe):
+    params = BacktestEngine()._get_strategy_params(strategy, "large_cap", timeframe)
+    params["position_size_pct"] = 10.0
+    return params
+
+
+# ---------------------------------------------------------------------------
+# Entry masks vs the live engine
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("strategy,timeframe,check", [
+    ("orb_breakout", "5m", "_check_orb_breakout"),
+    ("vwap_pullback", "5m", "_check_vwap_pullback"),
+    ("range_breakout", "15m", "_check_range_breakout"),
+    ("trend_following", "1h", "_check_trend_following"),
+    ("mean_reversion", "1d", "_check_mean_reversion"),
+])
+def test_entry_masks_match_signal_engine(bars, strategy, timeframe, check):
+    params = _params(strategy, timeframe)
+    setup = strategy_setup(bars, strategy, params)
+    vec_long = np.asarray(setup.long, dtype=bool)
+    vec_short = np.asarray(setup.short, dtype=bool) & ~vec_long
+
+    # Historical stand-ins for what the live check fetches from Alpaca
+    day = pd.Series(_session_days(_timestamps(bars)), index=bars.index)
+    in_day = day.groupby(day).cumcount().to_numpy()
+    skip = params.get("skip_bars", 3)
+    opening = bars[in_day < skip].groupby(day[in_day < skip])
+    orb = {d: {"orb_high": g["high"].max(), "orb_low": g["low"].min()} for d, g in opening}
+    typical = (bars["high"] + bars["low"] + bars["close"]) / 3
+    cum = pd.DataFrame({"pv": typical * bars["volume"], "v": bars["volume"]}).groupby(day).cumsum()
+    vwap = (cum["pv"] / cum["v"]).to_numpy()
+
+    engine = SignalEngine()
+    live_long = np.zeros(len(bars), dtype=bool)
+    live_short = np.zeros(len(bars), dtype=bool)
+    alpaca = MagicMock()
+    with patch("app.services.signals.signal_engine.alpaca_service", alpaca):
+        for i in range(1, len(bars)):
+            alpaca.get_opening_range.return_value = orb.get(day.iloc[i]) if in_day[i] >= skip else None
+            alpaca.get_snapshot.return_value = {"daily_bar": {"vwap": vwap[i]}}
+            signal = getattr(engine, check)("TEST", bars.iloc[:i + 1], params, "large_cap", timeframe)
+            if signal:
+                live_long[i] = signal["direction"] == "buy"
+                live_short[i] = signal["direction"] == "sell"
+                stop = setup.long_stop if signal["direction"] == "buy" else setup.short_stop
+                assert signal["stop_loss"] == pytest.approx(np.broadcast_to(stop, len(bars))[i])
+
+    assert live_long.any() or live_short.any()
+    np.testing.assert_array_equal(vec_long, live_long)
+    np.testing.assert_array_equal(vec_short, live_short)
+
+
+# ---------------------------------------------------------------------------
+# Fill simulation
+# ---------------------------------------------------------------------------
+
+def _flat_frame(closes):
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        "datetime": pd.date_range("2025-01-02 14:30", periods=len(closes), freq="5min", tz="UTC"),
+        "open": closes - 0.5,
+        "close": closes,
+    })
+
+
+def test_simulate_fills_at_next_open_and_exits_on_close():
+    df = _flat_frame([100, 100, 100, 101, 103, 111, 112, 112])
+    direction = np.zeros(len(df), dtype=np.int8)
+    direction[2] = 1
+    stop = np.full(len(df), 90.0)
+    target = np.full(len(df), 110.0)
+
+    metrics = simulate(df, direction, stop, target, capital=10_000, position_size_pct=50)
+
+    trade = metrics["trade_log"][0]
+    assert trade["entry_price"] == 100.5      # open of bar 3
+    assert trade["exit_price"] == 111.5       # target hit on bar 5's close, filled at bar 6 open
+    assert trade["size"] == 50
+    assert trade["bars_held"] == 3
+    assert trade["entry_date"] == "2025-01-02 09:45"
+    assert metrics["total_trades"] == metrics["winning_trades"] == 1
+    assert metrics["final_value"] == 10_000 + trade["pnl"]
+
+
+def test_simulate_counts_open_trade_and_marks_to_market():
+    df = _flat_frame([100, 100, 100, 99, 98, 97])
+    direction = np.zeros(len(df), dtype=np.int8)
+    direction[1] = -1
+    metrics = simulate(df, direction, np.full(len(df), 120.0), np.full(len(df), 50.0),
+                       capital=10_000, position_size_pct=10)
+
+    assert metrics["trade_log"] == []
+    assert metrics["total_trades"] == 1
+    assert metrics["winning_trades"] == metrics["losing_trades"] == 0
+    assert metrics["final_value"] == 10_000 + 10 * (99.5 - 97)  # short 10 from bar 2's open
+
+
+def test_metrics_have_backtrader_shape(bars):
+    params = _params("range_breakout", "15m")
+    vec = vectorized_run(bars, "range_breakout", params, 100_000)
+    bt = backtrader_run(BacktestEngine._feed_frame(bars), "range_breakout", params, 100_000)
+
+    assert vec.keys() == bt.keys()
+    assert vec["total_trades"] > 0
+    assert set(vec["trade_log"][0]) == set(bt["trade_log"][0])
+    assert len(vec["equity_curve"].values) == len(bars)
+    assert len(bt["equity_curve"].values) <= len(bars)
+
+
+# ---------------------------------------------------------------------------
+# Engine selection
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("engine,task", [("vectorized", vectorized_run), ("backtrader", backtrader_run)])
+def test_run_backtest_dispatches_on_engine(bars, engine, task):
+    record = SimpleNamespace(
+        id=1, symbol="TEST", strategy="orb_breakout", timeframe="5m", cap_size="large_cap",
+        start_date=None, end_date=None, initial_capital=100_000.0, position_size_pct=10.0,
+        parameters={"engine": engine}, status="pending",
+    )
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = record
+    pool = MagicMock()
+    pool.run.side_effect = lambda fn, *args: fn(*args)
+
+    with patch.object(BacktestEngine, "_fetch_data", return_value=bars), \
+            patch.object(engine_module, "compute_pool", pool):
+        BacktestEngine().run_backtest(1, db)
+
+    assert pool.run.call_args.args[0] is task
+    assert record.status == "completed"
+    assert record.parameters["engine"] == engine
+    assert len(trade_records(record.artifact.trades)) == record.artifact.trade_count
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValidationError):
+        BacktestRequest(symbol="AAPL", strategy="orb_breakout", start_date="2025-01-01",
+                        end_date="2025-06-01", engine="zipline")
+    assert BacktestRequest(symbol="AAPL", strategy="orb_breakout", start_date="2025-01-01",
+                           end_date="2025-06-01").engine == "vectorized"
+
+
+def test_strategy_names_match_both_engines():
+    from app.services.backtesting.strategies import STRATEGY_MAP
+
+    assert set(engine_module.STRATEGY_NAMES) == set(STRATEGY_MAP) == set(EXIT_TARGET)
+    with pytest.raises(ValidationError):
+        BacktestRequest(symbol="AAPL", strategy="buy_and_hold", start_date="2025-01-01",
+                        end_date="2025-06-01")
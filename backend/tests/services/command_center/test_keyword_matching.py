@@ -0,0 +1,152 @@
+"""
+Tests for the compiled KeywordMatcher and the services that classify with it.
+
+The matcher must reproduce the substring loops it replaced exactly — hits
+inside longer words, overlapping keywords, first-category-wins priority.
+Reference implementations of the old loops are kept here for comparison.
+"""
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.command_center.news_feed import NewsFeedService
+from app.services.command_center.polymarket import PolymarketService
+from app.services.data_fetcher.sentiment import (
+    SentimentFetcher, _NEGATIVE_KEYWORDS, _POSITIVE_KEYWORDS,
+)
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def news_service():
+    with patch("app.services.command_center.news_feed.get_settings", return_value=MagicMock()):
+        return NewsFeedService()
+
+
+@pytest.fixture
+def polymarket_service():
+    with patch("app.services.command_center.polymarket.get_settings", return_value=MagicMock()):
+        return PolymarketService()
+
+
+@pytest.fixture
+def sentiment_fetcher():
+    with patch("app.services.data_fetcher.sentiment.get_settings", return_value=MagicMock()):
+        return SentimentFetcher()
+
+
+def _random_texts(vocabulary, n=300, seed=7):
+    rng = random.Random(seed)
+    filler = ["the", "stock", "Shares", "said", "whether", "today", "Q3", "—", "ÉTÉ", "İstanbul"]
+    words = list(vocabulary) + filler
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(0, 14))) for _ in range(n)]
+
+
+# =============================================================================
+# MATCHER SEMANTICS
+# =============================================================================
+
+def test_overlapping_and_contained_keywords_all_hit():
+    matcher = KeywordMatcher({"a": ["rate cut", "cuts", "cut"], "b": ["fed", "federal reserve"]})
+
+    hits = matcher.match("Federal Reserve rate cuts")
+
+    assert set(hits["a"]) == {"rate cut", "cuts", "cut"}
+    assert set(hits["b"]) == {"fed", "federal reserve"}
+
+
+def test_weights_and_shared_keywords():
+    matcher = KeywordMatcher({"pos": {"beat": 0.6, "beats": 0.6}, "any": ["beat"]})
+
+    hits = matcher.match("AAPL BEATS estimates")
+
+    assert hits == {"pos": {"beat": 0.6, "beats": 0.6}, "any": {"beat": 1.0}}
+    assert sorted(KeywordMatcher.weights(hits, ["pos"])) == [0.6, 0.6]
+
+
+def test_batch_matches_single_and_keeps_texts_apart():
+    matcher = KeywordMatcher({"g": ["ab", "bc"]})
+    texts = ["xa", "bc", "", "a", "b", "ab"]
+
+    assert matcher.match_batch(texts) == [matcher.match(t) for t in texts]
+    # "a" + separator + "b" must not produce "ab"
+    assert matcher.match_batch(["a", "b"]) == [{}, {}]
+
+
+def test_first_group_respects_order():
+    hits = {"x": {}, "y": {"k": 1.0}, "z": {"k": 1.0}}
+    assert KeywordMatcher.first_group(hits, ["x", "z", "y"]) == "z"
+    assert KeywordMatcher.first_group({}, ["x"], default="none") == "none"
+
+
+# =============================================================================
+# SERVICE EQUIVALENCE WITH THE OLD LOOPS
+# =============================================================================
+
+def _old_news_impact(svc, text):
+    text = text.lower()
+    if any(k in text for k in svc.HIGH_IMPACT_KEYWORDS):
+        return "high"
+    if any(k in text for k in svc.MEDIUM_IMPACT_KEYWORDS):
+        return "medium"
+    return "low"
+
+
+def _old_category(categories, text, default):
+    text = text.lower()
+    for name, kws in categories.items():
+        if any(kw in text for kw in kws):
+            return name
+    return default
+
+
+def test_news_feed_matches_old_loops(news_service):
+    vocab = [kw for kws in news_service.CATEGORY_KEYWORDS.values() for kw in kws]
+    vocab += news_service.HIGH_IMPACT_KEYWORDS + news_service.MEDIUM_IMPACT_KEYWORDS
+    texts = _random_texts(vocab)
+
+    batch = news_service._classify_batch([(t, "") for t in texts])
+
+    for text, (category, impact) in zip(texts, batch):
+        assert category == _old_category(news_service.CATEGORY_KEYWORDS, text, "company")
+        assert impact == _old_news_impact(news_service, text)
+        assert news_service._categorize_news(text) == category
+        assert news_service._determine_impact(text) == impact
+
+
+def test_polymarket_matches_old_loops(polymarket_service):
+    vocab = polymarket_service.TRADING_KEYWORDS + [
+        kw for kws in polymarket_service.CATEGORY_KEYWORDS.values() for kw in kws
+    ]
+    for text in _random_texts(vocab):
+        market = {"question": text, "description": "", "tags": []}
+        relevant = any(kw in text.lower() for kw in polymarket_service.TRADING_KEYWORDS)
+        assert polymarket_service._is_trading_relevant(market) == relevant
+        assert polymarket_service._categorize_market(market) == _old_category(
+            polymarket_service.CATEGORY_KEYWORDS, text, "other",
+        )
+
+
+def test_polymarket_tags_still_make_market_relevant(polymarket_service):
+    market = {"question": "Will it snow?", "description": "", "tags": ["Politics"]}
+    assert polymarket_service._is_trading_relevant(market)
+
+
+def test_headline_sentiment_matches_old_loop(sentiment_fetcher):
+    vocab = list(_POSITIVE_KEYWORDS) + list(_NEGATIVE_KEYWORDS)
+    texts = _random_texts(vocab)
+
+    def old_score(headline):
+        lower = headline.lower()
+        weights = [w for kw, w in {**_POSITIVE_KEYWORDS, **_NEGATIVE_KEYWORDS}.items() if kw in lower]
+        return max(-1.0, min(1.0, sum(weights) / len(weights))) if weights else 0.0
+
+    scores = sentiment_fetcher.score_headlines_sentiment(texts)
+
+    assert scores == pytest.approx([old_score(t) for t in texts])
+    assert sentiment_fetcher.score_headline_sentiment(texts[0]) == pytest.approx(scores[0])
@@ -0,0 +1 @@
+# Compute pool tests
@@ -0,0 +1,94 @@
+"""
+Tests for the CPU offload pool (app/services/compute): bar frames survive
+the shared-memory round trip, worker results match inline runs, and the
+pool degrades to inline execution instead of failing a scan.
+"""
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import pandas as pd
+import pytest
+
+from app.services.compute.pool import ComputePool
+from app.services.compute.shared_frame import share_frame
+from app.services.compute.tasks import technical_evaluation
+
+from tests.services.scoring.test_async_screening import _price_df
+
+
+def _die_in_worker():
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return "inline"
+
+
+def _alpaca_frame(n=300):
+    """get_historical_prices layout: tz-aware 'date' column on a RangeIndex."""
+    df = _price_df(n).reset_index(names='date')
+    df['date'] = df['date'].dt.tz_localize('America/New_York')
+    return df
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ComputePool(workers=1, max_queue=8)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize("frame", [_price_df(), _alpaca_frame()], ids=["datetime_index", "tz_date_column"])
+def test_shared_frame_round_trip(frame):
+    frame = frame.assign(flag=frame['close'] > 100)
+
+    with share_frame(frame) as ref:
+        loaded = ref.load()
+        block = ref.block
+
+    pd.testing.assert_frame_equal(loaded, frame, check_freq=False)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=block)
+
+
+def test_object_columns_are_not_shared():
+    with pytest.raises(TypeError):
+        with share_frame(_price_df().assign(symbol='TEST')):
+            pass
+
+
+def test_worker_result_matches_inline(pool):
+    frame = _alpaca_frame()
+
+    indicators, stage = pool.run(technical_evaluation, frame)
+
+    assert (indicators, stage) == technical_evaluation(frame)
+    stats = pool.stats()
+    assert stats['mode'] == 'process' and stats['started']
+    assert stats['completed'] >= 1 and stats['in_flight'] == 0 and stats['queue_depth'] == 0
+
+
+def test_unshareable_frames_run_inline(pool):
+    inline_runs = pool.stats()['inline_runs']
+    frame = _price_df().assign(symbol='TEST')
+
+    assert pool.run(technical_evaluation, frame) == technical_evaluation(frame)
+    assert pool.stats()['inline_runs'] == inline_runs + 1
+
+
+def test_dead_worker_falls_back_inline_and_restarts(pool):
+    assert pool.run(_die_in_worker) == "inline"
+
+    stats = pool.stats()
+    assert stats['restarts'] == 1 and stats['failed'] == 1
+    assert pool.run(technical_evaluation, _price_df())[1].score_points is not None
+
+
+def test_disabled_or_saturated_pool_runs_inline():
+    disabled = ComputePool(workers=0, max_queue=8)
+    saturated = ComputePool(workers=2, max_queue=0)
+
+    for pool in (disabled, saturated):
+        pool.run(technical_evaluation, _price_df())
+        assert pool.stats()['inline_runs'] == 1
+        assert not pool.stats()['started']
+    assert disabled.stats()['mode'] == 'inline'
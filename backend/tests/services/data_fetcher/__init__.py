@@ -0,0 +1 @@
+# Data fetcher tests
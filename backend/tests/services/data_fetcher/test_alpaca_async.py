@@ -0,0 +1,232 @@
+"""
+Tests for the async Alpaca market-data client, run against a local fake
+Alpaca data server (aiohttp test server).
+
+The async AlpacaService methods must return exactly what the sync SDK
+path returns for the same payload, so each is compared with its sync twin
+fed the same JSON through the alpaca-py models.
+"""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from alpaca.data.historical.utils import parse_obj_as_symbol_dict
+from alpaca.data.models import BarSet, Snapshot
+
+from app.services.data_fetcher.alpaca_async import AlpacaAPIError, AsyncAlpacaDataClient
+from app.services.data_fetcher.alpaca_service import AlpacaService
+
+
+def _bar(day, close):
+    return {"t": f"2026-01-{day:02d}T05:00:00Z", "o": close - 1, "h": close + 1,
+            "l": close - 2, "c": close, "v": 1000 * day, "n": 10 + day, "vw": close - 0.5}
+
+
+BARS = {"AAPL": [_bar(d, 100.0 + d) for d in range(2, 12)]}
+
+SNAPSHOTS = {
+    "AAPL": {
+        "latestTrade": {"t": "2026-01-12T20:59:59.123456789Z", "p": 112.5, "s": 100, "x": "V", "i": 1, "c": ["@"], "z": "C"},
+        "latestQuote": {"t": "2026-01-12T20:59:59Z", "bp": 112.4, "ap": 112.6, "bs": 3, "as": 5,
+                        "bx": "V", "ax": "V", "c": ["R"], "z": "C"},
+        "minuteBar": None,
+        "dailyBar": _bar(12, 112.0),
+        "prevDailyBar": _bar(11, 111.0),
+    },
+    "MSFT": {
+        "latestTrade": {"t": "2026-01-12T20:59:59Z", "p": 400.0, "s": 1, "x": "V", "i": 2, "c": ["@"], "z": "C"},
+        "latestQuote": None,
+        "minuteBar": None,
+        "dailyBar": _bar(12, 401.0),
+        "prevDailyBar": None,
+    },
+}
+
+
+class FakeAlpaca:
+    """Bars (paged, page_size bars per page) and snapshots, with injectable failures."""
+
+    def __init__(self, page_size=4):
+        self.page_size = page_size
+        self.requests = []
+        self.peers = set()
+        self.fail_with = []  # statuses to return before succeeding
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/v2/stocks/bars", self.bars)
+        app.router.add_get("/v2/stocks/snapshots", self.snapshots)
+        return app
+
+    def _record(self, request):
+        self.requests.append(request)
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if request.headers.get("APCA-API-KEY-ID") != "key":
+            return web.json_response({"message": "forbidden"}, status=403)
+        if self.fail_with:
+            return web.json_response({"message": "slow down"}, status=self.fail_with.pop(0),
+                                     headers={"Retry-After": "0"})
+        return None
+
+    async def bars(self, request):
+        error = self._record(request)
+        if error:
+            return error
+        rows = [b for s in request.query["symbols"].split(",") for b in BARS.get(s, [])]
+        offset = int(request.query.get("page_token", 0))
+        limit = int(request.query["limit"])
+        page = rows[offset:offset + min(limit, self.page_size)]
+        nxt = offset + len(page)
+        return web.json_response({
+            "bars": {"AAPL": page} if page else {},
+            "next_page_token": str(nxt) if nxt < len(rows) else None,
+        })
+
+    async def snapshots(self, request):
+        error = self._record(request)
+        if error:
+            return error
+        return web.json_response({s: SNAPSHOTS[s] for s in request.query["symbols"].split(",") if s in SNAPSHOTS})
+
+
+@pytest_asyncio.fixture
+async def fake():
+    fake = FakeAlpaca()
+    server = TestServer(fake.app())
+    await server.start_server()
+    fake.url = str(server.make_url("/v2"))
+    yield fake
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def client(fake):
+    client = AsyncAlpacaDataClient("key", "secret", base_url=fake.url, max_retries=2, backoff_base=0.001)
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def service(client):
+    svc = AlpacaService()
+    svc.data_feed = "iex"
+    svc._async_client = client
+    svc._data_client = MagicMock()
+    # alpaca-py returns at most `limit` bars counted from `start`
+    svc._data_client.get_stock_bars.side_effect = lambda req: BarSet(
+        {s: rows[:req.limit] for s, rows in BARS.items()}
+    )
+    svc._data_client.get_stock_snapshot.side_effect = lambda req: parse_obj_as_symbol_dict(Snapshot, SNAPSHOTS)
+    return svc
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_bars_follow_pages_and_respect_limit(fake, client):
+    start = datetime(2026, 1, 1)  # naive → UTC, as alpaca-py sends it
+
+    everything = await client.get_stock_bars(["AAPL"], "1Day", start=start, feed="iex")
+    limited = await client.get_stock_bars(["AAPL"], "1Day", start=start, limit=6)
+
+    assert everything["AAPL"] == BARS["AAPL"]
+    assert limited["AAPL"] == BARS["AAPL"][:6]
+    assert fake.requests[0].query["start"] == "2026-01-01T00:00:00+00:00"
+    assert fake.requests[0].query["feed"] == "iex"
+    # 10 bars in pages of 4 → 3 requests, then 4 + 2 for the limited call
+    assert len(fake.requests) == 5
+    assert [int(r.query["limit"]) for r in fake.requests[3:]] == [6, 2]
+
+
+@pytest.mark.asyncio
+async def test_connections_are_kept_alive(fake, client):
+    for _ in range(5):
+        await client.get_stock_snapshots(["AAPL"])
+    assert len(fake.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_retried(fake, client):
+    fake.fail_with = [429, 503]
+
+    snapshots = await client.get_stock_snapshots(["AAPL"])
+
+    assert snapshots["AAPL"]["latestTrade"]["p"] == 112.5
+    assert len(fake.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded_and_auth_errors_are_not_retried(fake, client):
+    fake.fail_with = [429, 429, 429]
+    with pytest.raises(AlpacaAPIError) as exc:
+        await client.get_stock_snapshots(["AAPL"])
+    assert exc.value.status == 429
+    assert len(fake.requests) == 3
+
+    bad = AsyncAlpacaDataClient("wrong", "secret", base_url=fake.url)
+    try:
+        with pytest.raises(AlpacaAPIError) as exc:
+            await bad.get_stock_snapshots(["AAPL"])
+    finally:
+        await bad.close()
+    assert exc.value.status == 403
+    assert len(fake.requests) == 4
+
+
+def test_backoff_is_jittered_and_capped():
+    client = AsyncAlpacaDataClient("key", "secret", backoff_base=1.0, backoff_cap=5.0)
+    delays = {client._backoff(10, None) for _ in range(50)}
+    assert len(delays) > 1
+    assert all(0 <= d <= 5.0 for d in delays)
+    assert client._backoff(0, "2") == 2.0
+
+
+# =============================================================================
+# SERVICE: SAME OUTPUT AS THE SYNC SDK PATH
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_historical_prices_match_sync(service):
+    sync_df = service.get_historical_prices("AAPL", period="1mo")
+    async_df = await service.get_historical_prices_async("AAPL", period="1mo")
+
+    pd.testing.assert_frame_equal(async_df, sync_df)
+
+
+@pytest.mark.asyncio
+async def test_bars_match_sync(service):
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2026, 1, 31, tzinfo=timezone.utc)
+
+    sync_df = service.get_bars("AAPL", "1d", limit=5, start=start, end=end)
+    async_df = await service.get_bars_async("AAPL", "1d", limit=5, start=start, end=end)
+
+    assert list(async_df.columns) == ["open", "high", "low", "close", "volume", "vwap", "trades", "datetime"]
+    pd.testing.assert_frame_equal(async_df, sync_df)
+
+
+@pytest.mark.asyncio
+async def test_snapshots_match_sync(service):
+    sync_multi = service.get_multi_snapshots(["AAPL", "MSFT"])
+    async_multi = await service.get_multi_snapshots_async(["AAPL", "MSFT"])
+    assert async_multi == sync_multi
+
+    sync_one = service.get_snapshot("AAPL")
+    async_one = await service.get_snapshot_async("AAPL")
+    sync_one.pop("timestamp"), async_one.pop("timestamp")
+    assert async_one == sync_one
+    assert async_one["latest_trade"]["timestamp"] == "2026-01-12T20:59:59.123456+00:00"
+
+
+@pytest.mark.asyncio
+async def test_missing_symbol_and_server_errors_return_empty(fake, service):
+    assert await service.get_historical_prices_async("ZZZZ") is None
+
+    fake.fail_with = [500, 500, 500]
+    assert await service.get_multi_snapshots_async(["AAPL"]) == {}
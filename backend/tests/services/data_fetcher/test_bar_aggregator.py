@@ -0,0 +1,195 @@
+"""
+Tests for the live bar aggregator and its PriceStreamService / AlpacaService wiring.
+
+Trades are synthetic; REST responses are DataFrames shaped like
+AlpacaService.get_bars output. No network calls.
+"""
+import types
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.data_fetcher.bar_aggregator import BarRing, LiveBarStore, BAR_DTYPE
+from app.services.data_fetcher.price_stream_service import PriceStreamService
+from app.services.data_fetcher.alpaca_service import AlpacaService
+
+
+T0 = datetime(2026, 2, 10, 15, 0, tzinfo=timezone.utc)  # 10:00 ET
+
+
+def _rest_bars(n, timeframe_minutes=5, end=T0, price=100.0):
+    """REST-style bars ending with the bar that starts at `end`."""
+    times = [end - timedelta(minutes=timeframe_minutes * i) for i in range(n - 1, -1, -1)]
+    return pd.DataFrame({
+        "open": [price] * n,
+        "high": [price + 1] * n,
+        "low": [price - 1] * n,
+        "close": [price] * n,
+        "volume": [1000.0] * n,
+        "vwap": [price] * n,
+        "trades": [10] * n,
+        "datetime": pd.to_datetime(times, utc=True),
+    })
+
+
+# =====================================================================
+# BarRing
+# =====================================================================
+
+def test_ring_wraps_and_keeps_newest():
+    ring = BarRing(4)
+    for i in range(6):
+        ring.add_trade(i * 60, 100.0 + i, 1)
+    bars = ring.ordered()
+    assert len(ring) == 4
+    assert list(bars["ts"]) == [120, 180, 240, 300]
+    assert list(ring.ordered(2)["close"]) == [104.0, 105.0]
+
+
+def test_ring_merges_trades_into_current_bar():
+    ring = BarRing(8)
+    for price, size in ((10.0, 100), (12.0, 50), (9.0, 50), (11.0, 100)):
+        ring.add_trade(0, price, size)
+    row = ring.ordered()[0]
+    assert (row["open"], row["high"], row["low"], row["close"]) == (10.0, 12.0, 9.0, 11.0)
+    assert row["volume"] == 300
+    assert row["trades"] == 4
+
+
+def test_ring_drops_out_of_order_trades():
+    ring = BarRing(8)
+    ring.add_trade(120, 10.0, 1)
+    assert ring.add_trade(60, 99.0, 1) is False
+    assert len(ring) == 1
+
+
+# =====================================================================
+# LiveBarStore
+# =====================================================================
+
+def test_unseeded_symbol_is_not_served():
+    store = LiveBarStore()
+    store.add_trade("AAPL", T0, 100.0, 10)
+    assert store.get_frame("AAPL", "5m", 1) is None
+
+
+def test_seed_then_stream_extends_bars():
+    store = LiveBarStore()
+    store.seed("AAPL", "5m", _rest_bars(50), requested=50)
+
+    # Trades in the current (10:00) bar and the next (10:05) bar
+    store.add_trade("AAPL", T0 + timedelta(minutes=1), 103.0, 500)
+    store.add_trade("AAPL", T0 + timedelta(minutes=6), 104.0, 200)
+    store.add_trade("AAPL", T0 + timedelta(minutes=7), 102.0, 200)
+
+    df = store.get_frame("AAPL", "5m", 51)
+    assert len(df) == 51
+    assert list(df.columns) == ["open", "high", "low", "close", "volume", "vwap", "trades", "datetime"]
+
+    prev, last = df.iloc[-2], df.iloc[-1]
+    assert prev["high"] == 103.0 and prev["close"] == 103.0
+    assert prev["volume"] == 1500.0
+    assert prev["vwap"] == pytest.approx((100.0 * 1000 + 103.0 * 500) / 1500)
+    assert last["datetime"] == pd.Timestamp(T0 + timedelta(minutes=5))
+    assert (last["open"], last["high"], last["low"], last["close"]) == (104.0, 104.0, 102.0, 102.0)
+    assert last["vwap"] == pytest.approx(103.0)
+
+
+def test_insufficient_history_falls_back_unless_exhausted():
+    store = LiveBarStore()
+    store.seed("AAPL", "5m", _rest_bars(20), requested=20)
+    assert store.get_frame("AAPL", "5m", 100) is None
+
+    store.seed("NEWCO", "5m", _rest_bars(20), requested=100)  # REST had only 20
+    assert len(store.get_frame("NEWCO", "5m", 100)) == 20
+
+
+def test_reseed_keeps_streamed_bars_newer_than_rest():
+    store = LiveBarStore()
+    store.seed("AAPL", "1m", _rest_bars(10, 1), requested=10)
+    store.add_trade("AAPL", T0 + timedelta(minutes=2), 105.0, 10)
+
+    store.seed("AAPL", "1m", _rest_bars(10, 1), requested=10)
+
+    df = store.get_frame("AAPL", "1m", 11)
+    assert df.iloc[-1]["close"] == 105.0
+
+
+def test_aggregates_all_timeframes_from_one_trade():
+    store = LiveBarStore()
+    for tf, minutes in (("1m", 1), ("5m", 5), ("15m", 15), ("1h", 60)):
+        store.seed("AAPL", tf, _rest_bars(5, minutes), requested=5)
+
+    store.add_trade("AAPL", T0 + timedelta(seconds=30), 150.0, 10)
+
+    for tf in ("1m", "5m", "15m", "1h"):
+        assert store.get_frame("AAPL", tf, 5).iloc[-1]["high"] == 150.0
+
+
+# =====================================================================
+# PriceStreamService / AlpacaService wiring
+# =====================================================================
+
+@pytest.fixture
+def live_stream():
+    stream = PriceStreamService()
+    stream._running = True
+    stream._subscribed_symbols = {"AAPL"}
+    return stream
+
+
+def test_stream_trade_handler_updates_bars(live_stream):
+    live_stream.backfill_bars("AAPL", "5m", _rest_bars(30), requested=30)
+    live_stream._handle_trade(types.SimpleNamespace(
+        symbol="AAPL", price=110.0, size=5,
+        timestamp=T0 + timedelta(minutes=2), conditions=[],
+    ))
+    assert live_stream.get_live_bars("AAPL", "5m", 30).iloc[-1]["high"] == 110.0
+    assert live_stream.get_latest_bar("AAPL", "5m")["close"] == 110.0
+
+
+def test_unsubscribed_or_stopped_stream_not_served(live_stream):
+    live_stream.backfill_bars("AAPL", "5m", _rest_bars(30), requested=30)
+    assert live_stream.get_live_bars("MSFT", "5m", 10) is None
+    assert live_stream.get_live_bars("AAPL", "4h", 10) is None
+
+    live_stream._running = False
+    assert live_stream.get_live_bars("AAPL", "5m", 10) is None
+
+
+def test_get_bars_serves_live_without_rest(live_stream):
+    live_stream.backfill_bars("AAPL", "5m", _rest_bars(100), requested=100)
+    svc = AlpacaService.__new__(AlpacaService)
+    svc._data_client = None
+
+    with patch(
+        "app.services.data_fetcher.price_stream_service.get_price_stream_service",
+        return_value=live_stream,
+    ):
+        df = svc.get_bars("AAPL", "5m", limit=100)
+
+    assert df is not None and len(df) == 100
+
+
+def test_get_bars_backfills_live_store_from_rest(live_stream):
+    svc = AlpacaService.__new__(AlpacaService)
+    bar = types.SimpleNamespace(
+        open=1.0, high=2.0, low=0.5, close=1.5, volume=100, vwap=1.2,
+        trade_count=3, timestamp=T0,
+    )
+    svc._data_client = types.SimpleNamespace(
+        get_stock_bars=lambda request: {"AAPL": [bar]}
+    )
+    svc.data_feed = "sip"
+
+    with patch(
+        "app.services.data_fetcher.price_stream_service.get_price_stream_service",
+        return_value=live_stream,
+    ), patch("app.services.data_fetcher.alpaca_service.ALPACA_AVAILABLE", True):
+        svc.get_bars("AAPL", "5m", limit=10)
+
+    # REST returned fewer bars than requested → history exhausted, servable
+    assert len(live_stream.get_live_bars("AAPL", "5m", 10)) == 1
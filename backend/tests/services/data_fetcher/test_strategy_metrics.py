@@ -0,0 +1,88 @@
+"""
+Tests for local strategy metrics (vectorized bulk indicators from daily bars).
+
+Values are checked against the `ta` library (Wilder definitions, as served
+by FMP) and the multi-symbol pass against single-symbol runs, so padding
+for unequal histories can't leak across columns.
+"""
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from ta.momentum import RSIIndicator
+from ta.trend import ADXIndicator, EMAIndicator, SMAIndicator
+from ta.volatility import AverageTrueRange
+
+from app.services.data_fetcher.strategy_metrics import (
+    METRIC_KEYS, LocalStrategyMetrics, compute_strategy_metrics,
+)
+
+
+def _bars(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    return pd.DataFrame({
+        "date": pd.date_range("2025-01-01", periods=n, freq="B", tz="UTC"),
+        "open": close,
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": 1_000_000,
+    })
+
+
+def test_matches_ta_library():
+    df = _bars(252, seed=1)
+    metrics = compute_strategy_metrics({"AAPL": df})["AAPL"]
+
+    c, h, lo = df["close"], df["high"], df["low"]
+    assert metrics["sma20"] == pytest.approx(SMAIndicator(c, 20).sma_indicator().iloc[-1])
+    assert metrics["sma200"] == pytest.approx(SMAIndicator(c, 200).sma_indicator().iloc[-1])
+    assert metrics["ema12"] == pytest.approx(EMAIndicator(c, 12).ema_indicator().iloc[-1])
+    assert metrics["ema26"] == pytest.approx(EMAIndicator(c, 26).ema_indicator().iloc[-1])
+    assert metrics["rsi"] == pytest.approx(RSIIndicator(c, 14).rsi().iloc[-1], rel=1e-6)
+    # ta seeds ATR/ADX with a simple average; after a year the seed is negligible
+    assert metrics["atr"] == pytest.approx(AverageTrueRange(h, lo, c, 14).average_true_range().iloc[-1], rel=1e-3)
+    assert metrics["adx"] == pytest.approx(ADXIndicator(h, lo, c, 14).adx().iloc[-1], rel=0.05)
+
+
+def test_bulk_pass_matches_single_symbol_runs():
+    bars = {"AAA": _bars(252, 2), "BBB": _bars(120, 3), "CCC": _bars(30, 4)}
+
+    bulk = compute_strategy_metrics(bars)
+
+    for symbol, df in bars.items():
+        single = compute_strategy_metrics({symbol: df})[symbol]
+        for key in METRIC_KEYS:
+            if single[key] is None:
+                assert bulk[symbol][key] is None
+            else:
+                assert bulk[symbol][key] == pytest.approx(single[key])
+
+
+def test_short_history_leaves_long_indicators_empty():
+    metrics = compute_strategy_metrics({"NEW": _bars(60, 5)})["NEW"]
+
+    assert metrics["sma200"] is None
+    assert metrics["sma50"] is not None
+    assert set(metrics) == set(METRIC_KEYS)
+
+
+@patch("app.services.data_fetcher.strategy_metrics.cache")
+def test_missing_bars_fall_back_to_fmp(mock_cache):
+    mock_cache.get.return_value = None
+    alpaca = MagicMock()
+    alpaca.get_multi_historical_prices.return_value = {"AAPL": _bars(252, 6)}
+    fmp = MagicMock()
+    fmp.get_bulk_strategy_metrics.return_value = {"OTC": {"rsi": 50.0}}
+
+    with patch("app.services.data_fetcher.alpaca_service.alpaca_service", alpaca), \
+            patch("app.services.data_fetcher.fmp_service.fmp_service", fmp):
+        result = LocalStrategyMetrics().get_bulk_strategy_metrics(["AAPL", "OTC"])
+
+    alpaca.get_multi_historical_prices.assert_called_once_with(["AAPL", "OTC"], period="1y")
+    fmp.get_bulk_strategy_metrics.assert_called_once_with(["OTC"])
+    assert result["OTC"] == {"rsi": 50.0}
+    assert result["AAPL"]["sma200"] is not None
@@ -0,0 +1,144 @@
+"""
+Tests for the batched Tastytrade metrics cache (tastytrade_metrics.py):
+concurrent lookups share one multi-symbol call, cached entries follow the
+market-hours TTL, and a signal cycle issues at most one call.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.services.data_fetcher.tastytrade import TastyTradeService
+from app.services.data_fetcher.tastytrade_metrics import (
+    MARKET_HOURS_TTL, MISS_TTL, MetricsLoader, metrics_ttl,
+)
+
+ET = ZoneInfo("America/New_York")
+KNOWN = {"AAPL": 21.5, "MSFT": 34.0, "NVDA": 55.25}
+
+
+def _info(symbol):
+    return SimpleNamespace(
+        symbol=symbol,
+        tw_implied_volatility_index_rank=KNOWN[symbol],
+        tos_implied_volatility_index_rank=None,
+        implied_volatility_percentile=str(KNOWN[symbol] + 10),
+        implied_volatility_30_day=None, historical_volatility_30_day=None,
+        beta=1.2,
+    )
+
+
+class FakeMetricsAPI:
+    """Records each get_market_metrics call's symbol list."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, symbols):
+        with self.lock:
+            self.calls.append(sorted(symbols))
+        return {s: _info(s) for s in symbols if s in KNOWN}
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+MARKET_OPEN = datetime(2026, 2, 10, 11, 0, tzinfo=ET)   # Tuesday
+
+
+@pytest.mark.parametrize("now,expected", [
+    (datetime(2026, 2, 10, 11, 0, tzinfo=ET), MARKET_HOURS_TTL),
+    (datetime(2026, 2, 10, 8, 30, tzinfo=ET), 3600),                   # until 9:30
+    (datetime(2026, 2, 10, 17, 0, tzinfo=ET), 16.5 * 3600),            # until tomorrow 9:30
+    (datetime(2026, 2, 13, 16, 0, tzinfo=ET), (2 * 24 + 17.5) * 3600),  # Friday close → Monday open
+])
+def test_metrics_ttl_follows_market_hours(now, expected):
+    assert metrics_ttl(now.astimezone(timezone.utc)) == expected
+
+
+def test_concurrent_lookups_share_one_call():
+    api = FakeMetricsAPI()
+    loader = MetricsLoader(api, window=0.05, clock=Clock(MARKET_OPEN))
+    results = {}
+
+    def lookup(symbol):
+        results[symbol] = loader.get(symbol)
+
+    threads = [threading.Thread(target=lookup, args=(s,)) for s in ["aapl", "MSFT", "NVDA", "ZZZZ", "AAPL"]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert api.calls == [["AAPL", "MSFT", "NVDA", "ZZZZ"]]
+    assert results["NVDA"].tw_implied_volatility_index_rank == 55.25
+    assert results["ZZZZ"] is None
+
+    # Served from cache afterwards
+    assert loader.get("MSFT").symbol == "MSFT"
+    assert loader.get("ZZZZ") is None
+    assert len(api.calls) == 1
+
+
+def test_entries_expire_with_ttl():
+    api = FakeMetricsAPI()
+    clock = Clock(MARKET_OPEN)
+    loader = MetricsLoader(api, window=0, clock=clock)
+    loader.prime(["AAPL", "ZZZZ"])
+
+    clock.now += timedelta(seconds=MISS_TTL + 1)
+    loader.get_many(["AAPL", "ZZZZ"])
+    assert api.calls[-1] == ["ZZZZ"]                # misses retried after MISS_TTL
+
+    clock.now += timedelta(seconds=MARKET_HOURS_TTL)
+    loader.get("AAPL")
+    assert api.calls[-1] == ["AAPL"]
+    assert len(api.calls) == 3
+
+
+def test_prime_chunks_large_batches_and_survives_errors():
+    api = MagicMock(side_effect=[RuntimeError("503"), {"MSFT": _info("MSFT")}])
+    loader = MetricsLoader(api, max_batch=2, clock=Clock(MARKET_OPEN))
+
+    assert loader.prime(["AAPL", "NVDA", "MSFT"]) == 2
+    assert [c.args[0] for c in api.call_args_list] == [["AAPL", "NVDA"], ["MSFT"]]
+
+    # The failed chunk is cached as a miss — no retry until MISS_TTL
+    assert list(loader.get_many(["AAPL", "NVDA", "MSFT"])) == ["MSFT"]
+    assert loader.stats()["calls"] == 2
+
+
+def test_service_getters_and_signal_cycle_make_one_call():
+    api = FakeMetricsAPI()
+    service = TastyTradeService()
+    service.metrics = MetricsLoader(api, window=0, clock=Clock(MARKET_OPEN))
+
+    with patch.object(TastyTradeService, "is_available", return_value=True):
+        assert service.prefetch_metrics(["AAPL", "MSFT"]) == 1
+        assert service.get_iv_rank("AAPL") == 21.5
+        assert service.get_iv_percentile("aapl") == 31.5
+        assert service.get_iv_rank("ZZZZ") is None   # one more call for the new symbol
+        assert len(api.calls) == 2
+
+        from app.services.signals.signal_engine import SignalEngine
+        engine = SignalEngine()
+        items = [SimpleNamespace(symbol=s) for s in ("NVDA", "AAPL", "NVDA")]
+        with patch("app.services.data_fetcher.tastytrade.get_tastytrade_service", return_value=service):
+            assert engine._prefetch_iv_metrics(sorted({i.symbol for i in items})) == 1
+            assert engine._fetch_iv_rank("NVDA") == 55.25
+            assert engine._fetch_iv_rank("AAPL") == 21.5
+        assert api.calls[-1] == ["NVDA"]
+        assert len(api.calls) == 3
+
+    # Unconfigured service: no calls, no values
+    assert service.get_iv_rank("AAPL") is None
+    assert service.prefetch_metrics(["AAPL"]) == 0
@@ -0,0 +1,167 @@
+"""
+Tests for the async screening pipeline (screen_single_stock_async and friends).
+
+The async path reuses the sync stage helpers, so for identical provider data
+it must produce the same result dict. Also covers per-provider semaphores,
+completion-order streaming and the RateLimiter's coroutine wait.
+"""
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.data_fetcher.rate_limiter import RateLimiter
+from app.services.screening import engine as engine_module
+from app.services.screening.engine import ScreeningEngine
+
+
+STOCK_INFO = {
+    'name': 'Test Corp',
+    'sector': 'Technology',
+    'market_cap': 50_000_000_000,
+    'exchange': 'NMS',
+    'current_price': 150.0,
+}
+
+FUNDAMENTALS = {
+    'revenue_growth': 0.25,
+    'earnings_growth': 0.20,
+    'profit_margins': 0.15,
+    'gross_margins': 0.40,
+    'return_on_equity': 0.18,
+    'debt_to_equity': 80,
+    'current_ratio': 2.0,
+    'market_cap': 50_000_000_000,
+    'current_price': 150.0,
+}
+
+
+def _price_df(n=300):
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0.1, 0.5, n))
+    return pd.DataFrame({
+        'open': close * 0.99,
+        'high': close * 1.02,
+        'low': close * 0.98,
+        'close': close,
+        'volume': rng.integers(500_000, 5_000_000, size=n),
+    }, index=pd.bdate_range(end=datetime(2026, 1, 2), periods=n))
+
+
+@pytest.fixture
+def engine():
+    with patch('app.services.screening.engine.get_sentiment_analyzer'), \
+            patch('app.services.screening.engine.get_catalyst_service'):
+        return ScreeningEngine()
+
+
+def _providers(stock_info=STOCK_INFO, fundamentals=FUNDAMENTALS, prices=None, chain=None):
+    fmp = MagicMock()
+    fmp.get_stock_info.return_value = stock_info
+    fmp.get_fundamentals.return_value = fundamentals
+    fmp.get_stock_info_async = AsyncMock(return_value=stock_info)
+    fmp.get_fundamentals_async = AsyncMock(return_value=fundamentals)
+    alpaca = MagicMock()
+    alpaca.get_historical_prices.side_effect = lambda *a, **k: None if prices is None else prices.copy()
+    alpaca.get_historical_prices_async = AsyncMock(
+        side_effect=lambda *a, **k: None if prices is None else prices.copy()
+    )
+    alpaca.get_options_chain.return_value = chain
+    return fmp, alpaca
+
+
+def _without_timestamp(result):
+    return {k: v for k, v in result.items() if k != 'screened_at'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scenario", ["no_info", "no_fundamentals", "no_prices", "no_options", "full"])
+async def test_async_result_matches_sync(engine, scenario):
+    kwargs = {
+        "no_info": dict(stock_info=None),
+        "no_fundamentals": dict(fundamentals=None),
+        "no_prices": dict(),
+        "no_options": dict(prices=_price_df()),
+        "full": dict(prices=_price_df(), chain={'calls': [], 'puts': []}),
+    }[scenario]
+    fmp, alpaca = _providers(**kwargs)
+    leaps = {'available': True, 'atm_option': {'strike': 150.0, 'implied_volatility': 0.35,
+                                               'bid': 20.0, 'ask': 22.0, 'open_interest': 500}}
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca), \
+            patch.object(engine, '_leaps_summary', return_value=leaps):
+        sync_result = engine.screen_single_stock('TEST')
+        engine.stage_cache.clear()  # compare computed results, not memo replays
+        async_result = await engine.screen_single_stock_async('TEST')
+
+    assert _without_timestamp(async_result) == _without_timestamp(sync_result)
+
+
+@pytest.mark.asyncio
+async def test_provider_semaphore_bounds_concurrency(engine):
+    in_flight = peak = 0
+
+    async def slow_info(symbol):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return None
+
+    fmp = MagicMock()
+    fmp.get_stock_info_async = slow_info
+    symbols = [f"S{i}" for i in range(30)]
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.dict(engine_module.ASYNC_PROVIDER_LIMITS, {"fmp": 3}):
+        results = await engine.screen_multiple_stocks_async(symbols)
+
+    assert peak == 3
+    assert sorted(r['symbol'] for r in results) == sorted(symbols)
+    assert all(r['failed_at'] == 'data_fetch' for r in results)
+
+
+@pytest.mark.asyncio
+async def test_iter_screen_yields_in_completion_order(engine):
+    delays = {"SLOW": 0.05, "FAST": 0.0}
+
+    async def info(symbol):
+        await asyncio.sleep(delays[symbol])
+        return None
+
+    fmp = MagicMock()
+    fmp.get_stock_info_async = info
+
+    with patch.object(engine_module, 'fmp_service', fmp):
+        order = [r['symbol'] async for r in engine.iter_screen_async(["SLOW", "FAST"])]
+
+    assert order == ["FAST", "SLOW"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_wait_async_paces_without_blocking():
+    limiter = RateLimiter(max_requests=2, time_window=0.2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.wait_async()
+    elapsed = time.monotonic() - start
+    task.cancel()
+
+    assert elapsed >= 0.15
+    # The loop kept running while the third request waited
+    assert ticks >= 5
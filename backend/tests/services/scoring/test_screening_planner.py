@@ -0,0 +1,171 @@
+"""
+Tests for the cost-ordered screening plan (planner.py) and the engine's
+early exits: symbols rejected by a cheap gate never trigger the expensive
+fetches behind it.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.screening import engine as engine_module
+from app.services.screening.engine import ScreeningEngine
+from app.services.screening.planner import (
+    Gate,
+    SCREENING_PLAN,
+    ScreeningStats,
+    plan_gates,
+    universe_rejection,
+)
+from app.services.scoring.types import CoverageInfo, StageResult
+
+from tests.services.scoring.test_async_screening import FUNDAMENTALS, STOCK_INFO, _price_df
+
+
+@pytest.fixture
+def engine():
+    with patch('app.services.screening.engine.get_sentiment_analyzer'), \
+            patch('app.services.screening.engine.get_catalyst_service'):
+        return ScreeningEngine()
+
+
+def _providers(prices=None):
+    fmp = MagicMock()
+    fmp.get_stock_info.return_value = STOCK_INFO
+    fmp.get_fundamentals.return_value = FUNDAMENTALS
+    alpaca = MagicMock()
+    alpaca.get_historical_prices.side_effect = lambda *a, **k: None if prices is None else prices.copy()
+    alpaca.get_options_chain.return_value = {'calls': [], 'puts': []}
+    return fmp, alpaca
+
+
+def _stage(points, total):
+    return StageResult(
+        stage_id="x", criteria={}, coverage=CoverageInfo(1, 1, 1),
+        score_points=points, points_total_max=total,
+    )
+
+
+# =============================================================================
+# PLAN
+# =============================================================================
+
+def test_plan_runs_cheap_gates_before_options():
+    order = [g.name for g in SCREENING_PLAN]
+
+    assert order == ["universe", "stock_info", "technical", "fundamental",
+                     "composite_ceiling", "options", "scoring"]
+
+
+def test_plan_respects_dependencies_and_costs():
+    gates = (
+        Gate("b", needs=("big",)),
+        Gate("a", needs=("small",)),
+        Gate("c", after=("b",)),
+    )
+    order = [g.name for g in plan_gates(gates, {"big": 5, "small": 1})]
+    assert order == ["a", "b", "c"]
+
+    with pytest.raises(ValueError):
+        plan_gates((Gate("x", after=("y",)),), {})
+
+
+@pytest.mark.parametrize("row,criteria,expected", [
+    (None, None, None),
+    ({"price": 50.0, "market_cap": 2e9}, None, None),
+    ({"price": 50.0, "market_cap": 1e8}, None, "market_cap_ok_failed"),
+    ({"price": 50.0, "market_cap": 2e11}, {"market_cap_max": 1e11}, "market_cap_ok_failed"),
+    ({"price": 2.0, "market_cap": 2e9}, None, "price_ok_failed"),
+    ({"price": 2.0, "market_cap": 2e9}, {"price_min": 1.0}, None),
+    ({"price": None, "market_cap": None}, None, None),
+])
+def test_universe_rejection(row, criteria, expected):
+    assert universe_rejection(row, criteria) == expected
+
+
+# =============================================================================
+# EARLY EXITS
+# =============================================================================
+
+def test_universe_gate_skips_every_fetch(engine):
+    fmp, alpaca = _providers()
+    stats = ScreeningStats()
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca):
+        result = engine.screen_single_stock('PENNY', universe_row={'price': 1.5}, stats=stats)
+
+    assert result['failed_at'] == 'universe_prefilter'
+    fmp.get_stock_info.assert_not_called()
+    alpaca.get_historical_prices.assert_not_called()
+    assert stats.to_dict()['fetch_cost'] == 0
+
+
+def test_technical_failure_skips_fundamentals_and_options(engine):
+    fmp, alpaca = _providers(prices=None)
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca):
+        result = engine.screen_single_stock('TEST')
+
+    assert result['failed_at'] == 'price_data'
+    fmp.get_fundamentals.assert_not_called()
+    alpaca.get_options_chain.assert_not_called()
+
+
+def test_composite_ceiling_skips_options_fetch(engine):
+    fmp, alpaca = _providers(prices=_price_df())
+    stats = ScreeningStats()
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca), \
+            patch.object(engine, '_composite_ceiling', return_value=10.0), \
+            patch.object(engine, '_leaps_summary') as leaps:
+        result = engine.screen_single_stock('TEST', stats=stats)
+
+    assert result['failed_at'] == 'composite_score_minimum'
+    alpaca.get_options_chain.assert_not_called()
+    leaps.assert_not_called()
+
+    summary = {s['stage']: s for s in stats.to_dict()['stages']}
+    assert summary['composite_ceiling'] == {'stage': 'composite_ceiling', 'entered': 1, 'rejected': 1}
+    assert summary['options']['entered'] == 0
+    assert stats.fetches['options_chain'] == 0
+
+
+def test_composite_ceiling_is_an_upper_bound(engine):
+    fund, tech, mom = _stage(60, 100), _stage(50, 90), _stage(10, 100)
+    ceiling = engine._composite_ceiling(fund, tech, mom)
+
+    for options_points in (0, 40, 100):
+        actual = engine._calculate_composite_score_v1(fund, tech, _stage(options_points, 100), mom)
+        assert actual['score'] <= ceiling
+
+
+def test_fetch_error_is_reported_on_result(engine):
+    fmp, alpaca = _providers()
+    fmp.get_stock_info.side_effect = RuntimeError("boom")
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca):
+        result = engine.screen_single_stock('TEST')
+
+    assert result['failed_at'] == 'error'
+    assert result['error'] == 'boom'
+
+
+def test_stats_count_rejections_across_symbols(engine):
+    fmp, alpaca = _providers(prices=None)
+    stats = ScreeningStats()
+    rows = {'LOW': {'price': 1.0}}
+
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca):
+        engine.screen_multiple_stocks(['LOW', 'A', 'B'], universe_rows=rows, stats=stats)
+
+    summary = {s['stage']: (s['entered'], s['rejected']) for s in stats.to_dict()['stages']}
+    assert summary['universe'] == (3, 1)
+    assert summary['stock_info'] == (2, 0)
+    assert summary['technical'] == (2, 2)
+    assert summary['fundamental'] == (0, 0)
+    assert stats.fetches == {'stock_info': 2, 'price_history': 2, 'fundamentals': 0,
+                             'options_chain': 0, 'leaps_summary': 0}
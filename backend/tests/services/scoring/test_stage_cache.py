@@ -0,0 +1,132 @@
+"""
+Tests for the screening stage memo (stage_cache.py): repeated scans replay
+stages whose inputs and thresholds are unchanged, recompute the ones that
+changed, and produce the same result dicts as a fresh engine.
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from app.services.screening import engine as engine_module
+from app.services.screening.engine import ScreeningEngine
+from app.services.screening.planner import ScreeningStats
+from app.services.screening.stage_cache import StageCache, criteria_hash, data_version
+
+from tests.services.scoring.test_async_screening import FUNDAMENTALS, STOCK_INFO, _price_df
+
+
+def _engine():
+    with patch('app.services.screening.engine.get_sentiment_analyzer'), \
+            patch('app.services.screening.engine.get_catalyst_service'):
+        return ScreeningEngine()
+
+
+@pytest.fixture
+def engine():
+    return _engine()
+
+
+@pytest.fixture
+def providers():
+    prices = _price_df()
+    fmp = MagicMock()
+    fmp.get_stock_info.return_value = STOCK_INFO
+    fmp.get_fundamentals.return_value = FUNDAMENTALS
+    alpaca = MagicMock()
+    alpaca.get_historical_prices.side_effect = lambda *a, **k: prices.copy()
+    alpaca.get_options_chain.return_value = {'calls': [], 'puts': []}
+    leaps = {'available': True, 'atm_option': {'strike': 150.0, 'implied_volatility': 0.35,
+                                               'bid': 20.0, 'ask': 22.0, 'open_interest': 500}}
+    with patch.object(engine_module, 'fmp_service', fmp), \
+            patch.object(engine_module, 'alpaca_service', alpaca), \
+            patch.object(ScreeningEngine, '_leaps_summary', return_value=leaps):
+        yield fmp, alpaca
+
+
+def _without_timestamp(result):
+    return {k: v for k, v in result.items() if k != 'screened_at'}
+
+
+def test_rescreen_replays_every_stage(engine, providers):
+    first = engine.screen_single_stock('TEST')
+    stats = ScreeningStats()
+
+    with patch.object(engine, '_stage_technical', wraps=engine._stage_technical) as technical:
+        second = engine.screen_single_stock('TEST', stats=stats)
+
+    technical.assert_not_called()
+    assert _without_timestamp(second) == _without_timestamp(first)
+    cache = stats.to_dict()['cache']
+    assert cache['hit_ratio'] == 1.0
+    assert set(cache['stages']) == {'fundamental', 'technical', 'momentum', 'options'}
+
+
+def test_new_criteria_recompute_only_fundamentals(engine, providers):
+    engine.screen_single_stock('TEST')
+    stats = ScreeningStats()
+    criteria = {'market_cap_min': 1_000_000_000}
+
+    rescored = engine.screen_single_stock('TEST', criteria, stats=stats)
+
+    cache = stats.to_dict()['cache']['stages']
+    assert cache['fundamental'] == {'hits': 0, 'misses': 1, 'hit_ratio': 0.0}
+    assert cache['technical']['hits'] == 1
+    assert _without_timestamp(rescored) == _without_timestamp(_engine().screen_single_stock('TEST', criteria))
+
+
+def test_new_bar_recomputes_price_stages(engine, providers):
+    _, alpaca = providers
+    engine.screen_single_stock('TEST')
+    alpaca.get_historical_prices.side_effect = lambda *a, **k: _price_df(301)
+    stats = ScreeningStats()
+
+    engine.screen_single_stock('TEST', stats=stats)
+
+    cache = stats.to_dict()['cache']['stages']
+    assert cache['technical']['misses'] == 1
+    assert cache['momentum']['misses'] == 1
+    assert cache['fundamental']['hits'] == 1
+
+
+def test_edits_to_a_result_do_not_leak_into_the_cache(engine, providers):
+    first = engine.screen_single_stock('TEST')
+    first['technical_indicators']['rsi_14'] = -1
+    first['criteria']['technical'].clear()
+    first['passed_stages'].clear()
+
+    second = engine.screen_single_stock('TEST')
+
+    assert second['technical_indicators']['rsi_14'] != -1
+    assert second['criteria']['technical']
+    assert 'technical' in second['passed_stages']
+
+
+def test_stage_cache_expires_and_evicts():
+    cache = StageCache(ttl_seconds=0.05, max_entries=2)
+    for i in range(3):
+        cache.set(cache.key('technical', f'S{i}', 'v1'), i)
+
+    assert cache.size == 2
+    assert cache.get(cache.key('technical', 'S0', 'v1')) is None
+    assert cache.get(cache.key('technical', 'S2', 'v1')) == 2
+
+    time.sleep(0.06)
+    assert cache.get(cache.key('technical', 'S2', 'v1')) is None
+
+
+def test_versions_and_criteria_hash():
+    prices = _price_df()
+    assert data_version(prices) == data_version(prices.copy())
+    assert data_version(prices) != data_version(prices.iloc[:-1])
+    assert data_version(None) == 'none'
+
+    # Provider frames: RangeIndex, bar times in 'date'. A rolled window
+    # (one bar dropped, one added, same last close) is a new version.
+    bars = prices.reset_index(names='date')
+    rolled = bars.assign(date=bars['date'] + pd.offsets.BDay(1))
+    assert data_version(bars) != data_version(rolled)
+    assert data_version({'a': 1, 'b': 2}) == data_version({'b': 2, 'a': 1})
+    assert criteria_hash(None) == criteria_hash({})
+    assert criteria_hash({'price_min': 5}) != criteria_hash({'price_min': 10})
@@ -0,0 +1,97 @@
+"""
+Tests for the daily universe snapshot (universe_snapshot.py): presets are
+vectorized filters over one FMP pull, membership bitmaps are shared per
+distinct bounds, and get_dynamic_universe_rows no longer calls FMP per preset.
+"""
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.data import universe_snapshot
+from app.data.presets_catalog import LEAPS_PRESETS
+from app.data.stock_universe import get_dynamic_universe_rows, get_universe_by_criteria
+from app.data.universe_snapshot import UniverseSnapshot, criteria_bounds, get_universe_snapshot
+
+
+def _rows(n=3000, seed=11):
+    rng = np.random.default_rng(seed)
+    caps = np.exp(rng.uniform(np.log(3e8), np.log(3e12), n))
+    prices = rng.uniform(3, 600, n)
+    rows = [
+        {"symbol": f"S{i:04d}", "market_cap": float(c), "price": round(float(p), 2),
+         "volume": 250_000, "sector": "Technology"}
+        for i, (c, p) in enumerate(zip(caps, prices))
+    ]
+    rows[5]["market_cap"] = None
+    return rows
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot():
+    universe_snapshot.reset_universe_snapshot()
+    yield
+    universe_snapshot.reset_universe_snapshot()
+
+
+@pytest.fixture
+def fmp():
+    with patch("app.services.data_fetcher.fmp_service.fmp_service") as service:
+        service.is_available = True
+        service.get_screener_rows.return_value = _rows()
+        yield service
+
+
+def test_preset_membership_matches_row_filter():
+    rows = _rows()
+    snapshot = UniverseSnapshot(rows, date(2026, 1, 5))
+
+    for name in ("conservative", "moderate", "aggressive"):
+        criteria = LEAPS_PRESETS[name]
+        cap_min, cap_max, price_min, price_max = criteria_bounds(criteria)
+        expected = [
+            r["symbol"] for r in rows
+            if r["market_cap"] is not None and cap_min <= r["market_cap"] <= cap_max
+            and price_min <= r["price"] <= price_max
+        ]
+        assert snapshot.members(criteria, limit=None) == expected
+        symbols, by_symbol = snapshot.member_rows(criteria, limit=100)
+        assert symbols == expected[:100]
+        assert by_symbol[symbols[0]] is rows[int(symbols[0][1:])]
+
+    assert "S0005" not in snapshot.members({}, limit=None)
+
+
+def test_bitmaps_shared_per_distinct_bounds():
+    snapshot = UniverseSnapshot(_rows(), date(2026, 1, 5))
+    distinct = {criteria_bounds(p) for p in LEAPS_PRESETS.values()}
+
+    assert snapshot.precompute(list(LEAPS_PRESETS.values())) == len(distinct)
+    a, b = LEAPS_PRESETS["conservative"], dict(LEAPS_PRESETS["conservative"], rsi_min=10)
+    assert snapshot.bitmap(a) is snapshot.bitmap(b)
+    assert snapshot.bitmap(a).nbytes == (len(snapshot) + 7) // 8
+
+
+def test_presets_share_one_daily_pull(fmp):
+    for name in list(LEAPS_PRESETS)[:10]:
+        symbols, rows = get_dynamic_universe_rows(LEAPS_PRESETS[name])
+        assert len(rows) <= universe_snapshot.PRESET_LIMIT
+        assert set(rows) <= set(symbols)
+    assert fmp.get_screener_rows.call_count == 1
+    assert fmp.get_screener_rows.call_args.kwargs == universe_snapshot.SNAPSHOT_PULL
+
+    get_universe_snapshot().as_of -= timedelta(days=1)
+    get_dynamic_universe_rows(LEAPS_PRESETS["moderate"])
+    assert fmp.get_screener_rows.call_count == 2
+
+
+def test_failed_pull_keeps_previous_snapshot_then_falls_back(fmp):
+    first = get_universe_snapshot()
+    first.as_of -= timedelta(days=1)
+    fmp.get_screener_rows.side_effect = RuntimeError("FMP down")
+    assert get_universe_snapshot() is first
+
+    universe_snapshot.reset_universe_snapshot()
+    criteria = LEAPS_PRESETS["conservative"]
+    assert get_dynamic_universe_rows(criteria) == (get_universe_by_criteria(criteria["market_cap_max"]), {})
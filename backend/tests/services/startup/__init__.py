@@ -0,0 +1 @@
+# Startup and cold-start tests
@@ -0,0 +1,117 @@
+"""
+Tests for API startup (app/services/startup.py): heavy SDKs stay out of the
+import path, the orphaned-scan cleanup is one UPDATE, and the warm-up runs
+in the background with its phases in the startup profile.
+"""
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.autopilot_log import AutopilotLog
+from app.services import startup
+from app.services.startup import StartupProfile, interrupt_orphaned_scans
+
+BACKEND = Path(__file__).resolve().parents[3]
+
+
+def test_app_import_leaves_heavy_sdks_unloaded():
+    code = (
+        "import json, sys, app.main\n"
+        "from app.services.startup import startup_profile\n"
+        "heavy = ('anthropic', 'tastytrade', 'backtrader', 'telegram')\n"
+        "print(json.dumps({'loaded': [m for m in heavy if m in sys.modules],"
+        " 'report': startup_profile.report()}))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True, timeout=120,
+    )
+    assert out.returncode == 0, out.stderr[-2000:]
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+
+    assert result["loaded"] == []
+    report = result["report"]
+    assert report["warmup"] == "pending"
+    assert "app.api.endpoints.screener" in report["imports_ms"]
+    assert "import_endpoints" in report["phases_ms"]
+
+
+def test_orphaned_scans_interrupted_in_one_update():
+    engine = create_engine("sqlite://")
+    AutopilotLog.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    t0 = datetime(2026, 3, 2, 9, 30)
+    events = [
+        ("scan_started", 0), ("scan_complete", 5),   # finished
+        ("scan_started", 10), ("scan_failed", 12),   # failed
+        ("scan_started", 20),                        # killed by a deploy
+        ("scan_started", 30),                        # killed too
+    ]
+    db.add_all(
+        AutopilotLog(event_type=kind, timestamp=t0 + timedelta(minutes=m)) for kind, m in events
+    )
+    db.commit()
+
+    statements = []
+    listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        cleaned = interrupt_orphaned_scans(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert cleaned == 2
+    assert len(statements) == 1 and statements[0].startswith("UPDATE")
+    rows = db.query(AutopilotLog).order_by(AutopilotLog.timestamp).all()
+    assert [r.event_type for r in rows] == [
+        "scan_started", "scan_complete", "scan_started", "scan_failed",
+        "scan_interrupted", "scan_interrupted",
+    ]
+    assert rows[-1].details == {"reason": "Process restarted before scan completed"}
+    assert interrupt_orphaned_scans(db) == 0
+
+
+def test_profile_report():
+    profile = StartupProfile()
+    profile.import_module("json")
+    profile.import_module("json")
+    with pytest.raises(RuntimeError):
+        with profile.phase("init_db"):
+            raise RuntimeError("db down")
+
+    report = profile.report(top=1)
+    assert list(report["imports_ms"]) == ["json"]
+    assert set(report["phases_ms"]) == {"init_db"}
+
+
+@pytest.mark.asyncio
+async def test_warm_start_runs_in_background():
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    settings = SimpleNamespace(TELEGRAM_BOT_TOKEN="")
+
+    def slow_clients(_settings):
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result(timeout=5)
+
+    with patch.object(startup, "startup_profile", StartupProfile()) as profile, \
+            patch.object(startup, "prepare_database") as database, \
+            patch.object(startup, "initialize_optional_services", side_effect=slow_clients) as services:
+        task = asyncio.create_task(startup.warm_start(settings))
+        await asyncio.sleep(0.05)
+        assert profile.warmup == "running" and not task.done()
+
+        release.set()
+        await asyncio.wait_for(task, timeout=5)
+
+    assert profile.warmup == "done"
+    services.assert_called_once_with(settings)
+    database.assert_not_called()   # awaited by the startup event, before settings reads
+    assert "warmup" in profile.report()["phases_ms"]
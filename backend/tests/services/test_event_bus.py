@@ -0,0 +1,123 @@
+"""
+Tests for the app event bus (event_bus.py) and the /ws/events endpoint:
+topic filtering, publishes from worker threads, retained state for new
+subscribers, bounded queues, and the publishers that replace polling.
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.api.endpoints import websocket as ws_endpoints
+from app.services import event_bus
+from app.services.event_bus import EventBus
+from app.services.health_monitor import HealthMonitor
+from app.services.trading.auto_trader import AutoTrader
+
+
+@pytest.mark.asyncio
+async def test_topic_filtering_and_thread_publish():
+    bus = EventBus(backend="memory")
+    bus.start()
+    signals = bus.subscribe(["signals"])
+    everything = bus.subscribe()
+
+    bus.publish("signals.new", {"symbol": "AAPL"})
+    bus.publish("bot.status", {"status": "running"})
+    thread = threading.Thread(target=bus.publish, args=("signals.unread", {"unread_count": 2}))
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0)   # let call_soon_threadsafe deliveries run
+
+    assert [e["topic"] for e in [signals.queue.get_nowait() for _ in range(signals.queue.qsize())]] == [
+        "signals.new", "signals.unread",
+    ]
+    assert everything.queue.qsize() == 3
+    assert (await everything.get())["data"] == {"symbol": "AAPL"}
+
+    bus.unsubscribe(signals)
+    bus.publish("signals.new", {"symbol": "MSFT"})
+    assert signals.queue.empty()
+    assert bus.stats()["subscribers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retained_state_and_bounded_queue():
+    bus = EventBus(backend="memory")
+    bus.publish("bot.status", {"status": "stopped"}, retain=True)   # before start: kept, not delivered
+    bus.publish("bot.status", {"status": "running"}, retain=True)
+    bus.publish("signals.new", {"symbol": "AAPL"})                   # not retained
+
+    assert [e["data"] for e in bus.retained()] == [{"status": "running"}]
+    assert bus.retained(["signals"]) == []
+
+    sub = bus.subscribe(maxsize=3)
+    for i in range(5):
+        bus.publish("signals.new", {"i": i})
+    assert [sub.queue.get_nowait()["data"]["i"] for _ in range(3)] == [2, 3, 4]
+    assert bus.stats()["dropped"] == 2
+
+
+def test_ws_events_sends_retained_then_live_events():
+    bus = EventBus(backend="memory")
+    bus.publish("bot.status", {"status": "running"}, retain=True)
+    bus.publish("health.status", {"status": "healthy"}, retain=True)
+    app = FastAPI()
+    app.include_router(ws_endpoints.router, prefix="/ws")
+
+    with patch.object(ws_endpoints, "get_event_bus", return_value=bus), TestClient(app) as client:
+        with client.websocket_connect("/ws/events?topics=bot,signals") as ws:
+            assert ws.receive_json()["data"] == {"status": "running"}
+
+            ws.send_json({"action": "ping"})
+            assert ws.receive_json() == {"type": "pong"}
+
+            # Published from a worker thread (as scheduler jobs do)
+            thread = threading.Thread(target=bus.publish, args=("signals.unread", {"unread_count": 4}))
+            thread.start()
+            thread.join()
+            event = ws.receive_json()
+            assert (event["topic"], event["data"]) == ("signals.unread", {"unread_count": 4})
+
+            ws.send_json({"action": "subscribe", "topics": ["health"]})
+            assert ws.receive_json()["topic"] == "health.status"
+            assert ws.receive_json() == {"type": "subscribed", "topics": ["health"]}
+
+        assert bus.stats()["subscribers"] == 0
+
+        with patch("app.api.endpoints.app_auth._get_app_password", return_value="secret"):
+            with pytest.raises(WebSocketDisconnect):
+                with client.websocket_connect("/ws/events?token=bogus") as ws:
+                    ws.receive_json()
+
+
+def test_publishers_send_state_and_transitions():
+    bus = EventBus(backend="memory")
+    with patch.object(event_bus, "_event_bus", bus):
+        state = SimpleNamespace(
+            status="running", started_at=None, daily_pl=125.0, daily_start_equity=10_000.0,
+            daily_trades_count=2, daily_wins=1, daily_losses=1, open_positions_count=1,
+            open_stock_positions=1, open_option_positions=0, circuit_breaker_level="none",
+            last_health_check=None, last_error=None, consecutive_errors=0,
+        )
+        AutoTrader().publish_state(state)
+        (bot,) = bus.retained(["bot"])
+        assert bot["data"]["status"] == "running"
+        assert bot["data"]["daily_pl_pct"] == 1.25
+
+        monitor = HealthMonitor()
+        monitor._redis = None
+        for status in ["healthy", "healthy", "degraded", "degraded", "healthy"]:
+            monitor.publish_status(status)
+        monitor.record_job_run("auto_scan", "ok", 1.0)
+        monitor.record_job_run("auto_scan", "error", 1.0, "boom")
+        monitor.record_job_run("auto_scan", "error", 1.0, "boom")
+
+    assert bus.retained(["health.status"])[0]["data"] == {"status": "healthy", "previous": "degraded"}
+    # Three status transitions + one job flip (repeats publish nothing)
+    assert bus.published == 1 + 3 + 1
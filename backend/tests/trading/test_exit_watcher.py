@@ -0,0 +1,292 @@
+"""
+Tests for StreamingExitWatcher / ExitTriggerBook — tick-driven exits.
+
+Ticks are fed synthetically (plain dicts shaped like PriceStreamService trade
+broadcasts) so the event-driven path is exercised without a live stream.
+Semantics must match PositionMonitor._check_single_position: same trigger
+comparisons, same SL > TP > trailing priority.
+"""
+import types
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.executed_trade import ExitReason
+from app.services.data_fetcher.price_stream_service import PriceStreamService
+from app.services.trading.exit_watcher import (
+    ExitTriggerBook, StreamingExitWatcher, WatchedPosition,
+)
+
+from tests.trading.conftest import make_trade
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _tick(symbol, price):
+    return {"type": "trade", "symbol": symbol, "price": price, "size": 100}
+
+
+def _make_watcher():
+    """Watcher with a recording exit handler and inline dispatch (no worker thread)."""
+    fired = []
+    watcher = StreamingExitWatcher(price_stream=MagicMock(), exit_handler=fired.extend)
+    return watcher, fired
+
+
+def _feed(watcher, symbol, prices):
+    for price in prices:
+        watcher.on_price_update(_tick(symbol, price))
+
+
+# =====================================================================
+# ExitTriggerBook — core semantics
+# =====================================================================
+
+def test_long_stop_and_target():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(1, "AAPL", is_long=True, stop_loss=95.0, take_profit=120.0))
+
+    assert book.evaluate("AAPL", 100.0) == []
+    signals = book.evaluate("AAPL", 94.5)
+
+    assert len(signals) == 1
+    assert signals[0].reason == ExitReason.STOP_LOSS
+    assert signals[0].trigger_price == 95.0
+    assert signals[0].current_price == 94.5
+    # One-shot: the position is gone after firing
+    assert 1 not in book
+    assert book.evaluate("AAPL", 90.0) == []
+
+
+def test_short_stop_and_target():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(1, "TSLA", is_long=False, stop_loss=105.0, take_profit=80.0))
+    book.add(WatchedPosition(2, "TSLA", is_long=False, stop_loss=110.0, take_profit=80.0))
+
+    signals = book.evaluate("TSLA", 106.0)
+    assert [(s.trade_id, s.reason) for s in signals] == [(1, ExitReason.STOP_LOSS)]
+
+    signals = book.evaluate("TSLA", 79.0)
+    assert [(s.trade_id, s.reason) for s in signals] == [(2, ExitReason.TAKE_PROFIT)]
+
+
+def test_trigger_at_exact_level_fires():
+    """Matches the poll's <= / >= comparisons."""
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(1, "AAPL", is_long=True, stop_loss=95.0, take_profit=120.0))
+    assert book.evaluate("AAPL", 120.0)[0].reason == ExitReason.TAKE_PROFIT
+
+
+def test_symbols_are_isolated():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(1, "AAPL", is_long=True, stop_loss=95.0))
+    assert book.evaluate("MSFT", 10.0) == []
+    assert 1 in book
+
+
+def test_stop_loss_wins_over_trailing_on_same_tick():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(
+        1, "AAPL", is_long=True, stop_loss=95.0,
+        trailing_pct=5.0, high_water=100.0,
+    ))
+    signals = book.evaluate("AAPL", 90.0)
+    assert len(signals) == 1
+    assert signals[0].reason == ExitReason.STOP_LOSS
+
+
+def test_long_trailing_ratchets_and_fires():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(1, "NVDA", is_long=True, trailing_pct=5.0, high_water=100.0))
+
+    # Rally to 120 moves the trail to 114
+    for price in (105.0, 112.0, 120.0, 116.0):
+        assert book.evaluate("NVDA", price) == []
+    assert book.get(1).high_water == 120.0
+
+    signals = book.evaluate("NVDA", 113.9)
+    assert len(signals) == 1
+    assert signals[0].reason == ExitReason.TRAILING_STOP
+    assert signals[0].trigger_price == 114.0
+
+
+def test_short_trailing_ratchets_and_fires():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(1, "NVDA", is_long=False, trailing_pct=10.0, high_water=100.0))
+
+    for price in (95.0, 80.0, 85.0):
+        assert book.evaluate("NVDA", price) == []
+    assert book.get(1).high_water == 80.0
+
+    signals = book.evaluate("NVDA", 88.0)
+    assert signals[0].reason == ExitReason.TRAILING_STOP
+    assert signals[0].trigger_price == 88.0
+
+
+def test_remove_cleans_all_indexes():
+    book = ExitTriggerBook()
+    book.add(WatchedPosition(
+        1, "AAPL", is_long=True, stop_loss=95.0, take_profit=120.0,
+        trailing_pct=5.0, high_water=100.0,
+    ))
+    book.evaluate("AAPL", 110.0)  # ratchet first
+    book.remove(1)
+
+    assert len(book) == 0
+    assert book.symbols == set()
+    assert book.evaluate("AAPL", 1.0) == []
+
+
+def test_many_positions_only_crossed_ones_fire():
+    book = ExitTriggerBook()
+    for i in range(1, 501):
+        book.add(WatchedPosition(i, "SPY", is_long=True, stop_loss=float(i)))
+
+    signals = book.evaluate("SPY", 490.5)
+    assert sorted(s.trade_id for s in signals) == list(range(491, 501))
+    assert len(book) == 490
+
+
+# =====================================================================
+# StreamingExitWatcher — synthetic tick feed
+# =====================================================================
+
+def test_synthetic_feed_dispatches_exit():
+    watcher, fired = _make_watcher()
+    trade = make_trade(id=7, symbol="AAPL", stop_loss_price=95.0, take_profit_price=120.0)
+    watcher.sync([trade])
+
+    _feed(watcher, "AAPL", [100.0, 99.0, 97.5, 94.9, 93.0])
+
+    assert len(fired) == 1
+    assert fired[0].trade_id == 7
+    assert fired[0].reason == ExitReason.STOP_LOSS
+    assert fired[0].current_price == 94.9
+    assert watcher.get_status()["exits_fired"] == 1
+
+
+def test_quotes_are_ignored():
+    watcher, fired = _make_watcher()
+    watcher.sync([make_trade(id=1, stop_loss_price=95.0)])
+
+    watcher.on_price_update({"type": "quote", "symbol": "AAPL", "bid": 90.0, "ask": 90.1})
+
+    assert fired == []
+
+
+def test_sync_skips_options_and_drops_closed_trades():
+    watcher, _ = _make_watcher()
+    stock = make_trade(id=1, symbol="AAPL", stop_loss_price=95.0)
+    option = make_trade(id=2, symbol="AAPL", asset_type="option", stop_loss_price=2.0)
+    watcher.sync([stock, option])
+    assert watcher.get_status()["positions_watched"] == 1
+
+    watcher.sync([])
+    assert watcher.get_status()["positions_watched"] == 0
+
+
+def test_sync_persists_streamed_high_water():
+    watcher, _ = _make_watcher()
+    trade = make_trade(
+        id=1, entry_price=100.0, trailing_stop_pct=5.0, trailing_stop_high_water=100.0,
+        stop_loss_price=None, take_profit_price=None,
+    )
+    watcher.sync([trade])
+    _feed(watcher, "AAPL", [104.0, 110.0, 108.0])
+
+    updated = watcher.sync([trade])
+
+    assert updated == 1
+    assert trade.trailing_stop_high_water == 110.0
+
+
+def test_sync_keeps_db_high_water_when_higher():
+    watcher, _ = _make_watcher()
+    trade = make_trade(
+        id=1, entry_price=100.0, trailing_stop_pct=5.0, trailing_stop_high_water=100.0,
+        stop_loss_price=None, take_profit_price=None,
+    )
+    watcher.sync([trade])
+    trade.trailing_stop_high_water = 130.0  # poll saw a higher print
+
+    assert watcher.sync([trade]) == 0
+    _feed(watcher, "AAPL", [124.0])  # 130 * 0.95 = 123.5 → no exit yet
+    assert watcher.get_status()["exits_fired"] == 0
+
+
+def test_handler_errors_do_not_break_stream():
+    def boom(_signals):
+        raise RuntimeError("broker down")
+
+    watcher = StreamingExitWatcher(price_stream=MagicMock(), exit_handler=boom)
+    watcher.sync([make_trade(id=1, stop_loss_price=95.0)])
+
+    signals = watcher.on_price_update(_tick("AAPL", 90.0))
+    assert len(signals) == 1
+
+
+def test_price_stream_trade_handler_feeds_watcher():
+    """End-to-end through PriceStreamService._handle_trade callbacks."""
+    stream = PriceStreamService()
+    fired = []
+    watcher = StreamingExitWatcher(price_stream=stream, exit_handler=fired.extend)
+    stream.register_callback(watcher.on_price_update)
+    watcher.sync([make_trade(id=3, symbol="MSFT", direction="sell",
+                             stop_loss_price=410.0, take_profit_price=380.0)])
+
+    for price in (400.0, 395.0, 379.5):
+        stream._handle_trade(types.SimpleNamespace(
+            symbol="MSFT", price=price, size=10,
+            timestamp=datetime.now(timezone.utc), conditions=[],
+        ))
+
+    assert [(s.trade_id, s.reason) for s in fired] == [(3, ExitReason.TAKE_PROFIT)]
+
+
+# =====================================================================
+# PriceStreamService pinning
+# =====================================================================
+
+@pytest.mark.asyncio
+async def test_pinned_symbols_survive_client_unsubscribe():
+    stream = PriceStreamService()
+    await stream.subscribe({"AAPL", "MSFT"})
+    await stream.track_symbols("exit_watcher", {"AAPL"})
+
+    await stream.unsubscribe({"AAPL", "MSFT"})
+
+    assert stream.subscribed_symbols == {"AAPL"}
+
+
+@pytest.mark.asyncio
+async def test_pins_are_per_owner():
+    stream = PriceStreamService()
+    await stream.track_symbols("exit_watcher", {"AAPL"})
+    await stream.track_symbols("signal_queue", {"AAPL", "NVDA"})
+
+    await stream.track_symbols("signal_queue", set())
+
+    assert stream.pinned_symbols() == {"AAPL"}
+
+
+@pytest.mark.asyncio
+async def test_replacing_owner_set_unsubscribes_dropped_symbols():
+    stream = PriceStreamService()
+    stream._stream = MagicMock()
+    stream._running = True
+    await stream.subscribe({"TSLA"})                                   # a WebSocket client
+    await stream.track_symbols("exit_watcher", {"AAPL", "MSFT", "TSLA"})
+    await stream.track_symbols("signal_queue", {"MSFT"})
+
+    await stream.track_symbols("exit_watcher", {"NVDA"})
+
+    assert stream.subscribed_symbols == {"NVDA", "MSFT", "TSLA"}
+    stream._stream.unsubscribe_trades.assert_called_once_with("AAPL")
+    stream._stream.unsubscribe_quotes.assert_called_once_with("AAPL")
+
+    await stream.unsubscribe({"TSLA"})
+    await stream.track_symbols("signal_queue", set())
+    assert stream.subscribed_symbols == {"NVDA"}
@@ -0,0 +1,157 @@
+"""
+Tests for the SQL-side trade journal analytics (trade_journal.py).
+
+Runs against an in-memory SQLite database. Daily stats, the per-day
+rollup, the performance summary and the exit-reason breakdown must match
+a plain Python pass over the same trades, and a summary must issue the
+same number of statements however many trades are in the range.
+"""
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.daily_bot_performance import DailyBotPerformance
+from app.models.daily_trade_rollup import DailyTradeRollup
+from app.models.executed_trade import ExecutedTrade
+from app.models.signal_queue import SignalQueue
+from app.models.trading_signal import TradingSignal
+from app.services.trading.trade_journal import TradeJournal
+
+START = date(2026, 3, 2)
+STRATEGIES = ["orb_breakout_long", "vwap_pullback_long", "mean_reversion"]
+REASONS = ["take_profit", "stop_loss", "time_exit", "circuit_breaker"]
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        SignalQueue.__table__, TradingSignal.__table__, ExecutedTrade.__table__,
+        DailyBotPerformance.__table__, DailyTradeRollup.__table__,
+    ])
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_trades(db, n, days=10, seed=3):
+    rng = random.Random(seed)
+    signals = [
+        TradingSignal(symbol="AAPL", timeframe="5m", strategy=s, direction="buy")
+        for s in STRATEGIES
+    ]
+    db.add_all(signals)
+    db.flush()
+
+    trades = []
+    for i in range(n):
+        day = START + timedelta(days=rng.randrange(days))
+        trade = ExecutedTrade(
+            symbol="AAPL", direction="buy", quantity=1,
+            signal_id=rng.choice(signals).id if rng.random() < 0.8 else None,
+            asset_type=rng.choice(["stock", "option"]),
+            status="closed",
+            exit_filled_at=datetime(day.year, day.month, day.day, 14, tzinfo=timezone.utc)
+            + timedelta(minutes=rng.randrange(300)),
+            exit_reason=rng.choice(REASONS + [None]),
+            realized_pl=rng.choice([round(rng.uniform(-200, 300), 2), 0.0, None]),
+            fees=round(rng.uniform(0, 2), 2),
+            hold_duration_minutes=rng.choice([None, 0, rng.randrange(1, 400)]),
+            notes=rng.choice([None, "manual"]),
+        )
+        trades.append(trade)
+    db.add_all(trades)
+    # An open trade never counts
+    db.add(ExecutedTrade(symbol="MSFT", direction="buy", quantity=1, status="open", realized_pl=999))
+    db.commit()
+    return trades
+
+
+def _strategy(t):
+    return t.signal.strategy if t.signal else (t.notes or "unknown")
+
+
+def test_daily_stats_and_rollup_match_trades(db):
+    trades = _add_trades(db, 60, days=1)
+    daily = TradeJournal(db).update_daily_stats(START)
+
+    pls = [t.realized_pl or 0 for t in trades]
+    holds = [t.hold_duration_minutes for t in trades if t.hold_duration_minutes]
+    assert daily.trades_count == len(trades)
+    assert (daily.wins, daily.losses) == (sum(p > 0 for p in pls), sum(p < 0 for p in pls))
+    assert daily.gross_pl == round(sum(pls), 2)
+    assert daily.total_fees == round(sum(t.fees for t in trades), 2)
+    assert (daily.best_trade_pl, daily.worst_trade_pl) == (round(max(pls), 2), round(min(pls), 2))
+    assert daily.avg_hold_minutes == round(sum(holds) / len(holds), 1)
+    assert daily.options_traded == sum(t.asset_type == "option" for t in trades)
+    assert daily.circuit_breaker_triggered == any(t.exit_reason == "circuit_breaker" for t in trades)
+
+    running, worst = 0.0, 0.0
+    for t in sorted(trades, key=lambda t: (t.exit_filled_at, t.id)):
+        running += t.realized_pl or 0
+        worst = min(worst, running)
+    assert daily.max_drawdown_pct == round(worst, 2)
+
+    # Recomputing replaces the day's rollup rows instead of adding to them
+    TradeJournal(db).update_daily_stats(START)
+    rollups = db.query(DailyTradeRollup).all()
+    assert sum(r.trades_count for r in rollups) == len(trades)
+    assert {r.strategy for r in rollups} == {_strategy(t) for t in trades}
+
+
+def test_summary_and_exit_reasons_match_trades(db):
+    trades = _add_trades(db, 200)
+    journal = TradeJournal(db)
+    assert journal.rebuild_daily_stats() == len({t.exit_filled_at.date() for t in trades})
+
+    end = START + timedelta(days=5)
+    in_range = [t for t in trades if t.exit_filled_at.date() <= end]
+    summary = journal.get_performance_summary(START, end)
+
+    pls = [t.realized_pl or 0 for t in in_range]
+    wins = [p for p in pls if p > 0]
+    losses = [p for p in pls if p < 0]
+    assert summary["total_trades"] == len(in_range)
+    assert (summary["wins"], summary["losses"]) == (len(wins), len(losses))
+    assert summary["total_pl"] == round(sum(pls), 2)
+    assert summary["profit_factor"] == round(abs(sum(wins) / sum(losses)), 2)
+    assert summary["avg_loss"] == round(sum(losses) / len(losses), 2)
+    assert len(summary["daily_records"]) == len({t.exit_filled_at.date() for t in in_range})
+
+    for strategy in {_strategy(t) for t in in_range}:
+        group = [t.realized_pl or 0 for t in in_range if _strategy(t) == strategy]
+        assert summary["by_strategy"][strategy]["count"] == len(group)
+        assert summary["by_strategy"][strategy]["pl"] == pytest.approx(round(sum(group), 2), abs=0.011)
+    assert sum(v["count"] for v in summary["by_asset_type"].values()) == len(in_range)
+
+    breakdown = journal.get_exit_reason_breakdown(START, end)
+    assert breakdown["unknown"]["count"] == sum(t.exit_reason is None for t in in_range)
+    assert sum(v["count"] for v in breakdown.values()) == len(in_range)
+
+    assert journal.get_performance_summary(date(2020, 1, 1), date(2020, 2, 1))["total_trades"] == 0
+
+
+@pytest.mark.parametrize("n", [20, 2000])
+def test_summary_statement_count_is_independent_of_trades(engine, db, n):
+    _add_trades(db, n)
+    TradeJournal(db).rebuild_daily_stats()
+
+    statements = []
+    listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        TradeJournal(db).get_performance_summary(START, START + timedelta(days=30))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # Daily records, totals, by strategy, by asset type
+    assert len(statements) == 4
@@ -0,0 +1,84 @@
+"""
+Tests for the shared orjson serialization layer (app/utils/serialization.py).
+"""
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+from app.services.signals.signal_engine import SignalEngine
+from app.utils.serialization import FastJSONResponse, dumps, loads, to_native
+
+
+class Side(Enum):
+    BUY = "buy"
+
+
+def _scan_result():
+    return {
+        'symbol': 'TEST',
+        'score': np.float64(71.25),
+        'passed_all': np.bool_(True),
+        'technical_indicators': {'rsi_14': np.float32(55.5), 'volume': np.int64(1_200_000), 'sma_200': float('nan')},
+        'returns': np.array([0.1, 0.2]),
+        'half': np.float16(0.5),
+        'screened_at': datetime(2026, 1, 2, 15, 30, tzinfo=timezone.utc),
+        'bar_time': pd.Timestamp('2026-01-02 09:30'),
+        'missing_time': pd.NaT,
+        'day': date(2026, 1, 2),
+        'premium': Decimal('12.50'),
+        'side': Side.BUY,
+        'tags': {'growth'},
+        'by_strike': {150: 'atm'},
+    }
+
+
+def test_numpy_and_friends_encode_in_one_pass():
+    decoded = loads(dumps(_scan_result()))
+
+    assert decoded == {
+        'symbol': 'TEST',
+        'score': 71.25,
+        'passed_all': True,
+        'technical_indicators': {'rsi_14': 55.5, 'volume': 1_200_000, 'sma_200': None},
+        'returns': [0.1, 0.2],
+        'half': 0.5,
+        'screened_at': '2026-01-02T15:30:00+00:00',
+        'bar_time': '2026-01-02T09:30:00',
+        'missing_time': None,
+        'day': '2026-01-02',
+        'premium': 12.5,
+        'side': 'buy',
+        'tags': ['growth'],
+        'by_strike': {'150': 'atm'},
+    }
+
+
+def test_unknown_types_fall_back_to_str():
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    assert loads(dumps({'x': Opaque()})) == {'x': 'opaque'}
+
+
+def test_to_native_returns_plain_python():
+    native = to_native(_scan_result())
+
+    assert type(native['score']) is float
+    assert type(native['technical_indicators']['volume']) is int
+    assert native['passed_all'] is True
+    json.dumps(native, allow_nan=False)  # plain-json safe, as JSON columns need
+
+
+def test_response_class_and_signal_engine_use_the_encoder():
+    response = FastJSONResponse({'score': np.float64(1.5), 'n': np.int64(2)})
+    assert response.body == b'{"score":1.5,"n":2}'
+    assert response.media_type == 'application/json'
+
+    assert SignalEngine._to_native({'entry_price': np.float64(10.0), 'levels': (np.int64(1), 2)}) == {
+        'entry_price': 10.0, 'levels': [1, 2],
+    }
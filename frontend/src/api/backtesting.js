@@ -1,11 +1,17 @@
 /**
  * Backtesting API client
- * Run backtests, poll results, list history
+ * Run backtests, poll results, list history, parameter sweeps
  */
-import apiClient from './axios';
+import apiClient, { API_BASE_URL } from './axios';
 
 const PREFIX = '/api/v1/backtesting';
 
+const TOKEN_KEY = 'leaps_auth_token';
+function _tokenParam() {
+  const t = localStorage.getItem(TOKEN_KEY);
+  return t ? `?token=${encodeURIComponent(t)}` : '';
+}
+
 // =============================================================================
 // Run & Results
 // =============================================================================
@@ -15,8 +21,12 @@ export const runBacktest = async (config) => {
   return response.data;
 };
 
-export const getResults = async (id) => {
-  const response = await apiClient.get(`${PREFIX}/results/${id}`);
+/**
+ * @param {number} id
+ * @param {{points?: number}} params - equity curve points (LTTB-downsampled, 0 = every bar)
+ */
+export const getResults = async (id, params = {}) => {
+  const response = await apiClient.get(`${PREFIX}/results/${id}`, { params });
   return response.data;
 };
 
@@ -34,11 +44,86 @@ export const deleteBacktest = async (id) => {
   return response.data;
 };
 
+// =============================================================================
+// Parameter Sweeps
+// =============================================================================
+
+export const startSweep = async (config) => {
+  const response = await apiClient.post(`${PREFIX}/sweep`, config);
+  return response.data;
+};
+
+export const getSweep = async (id, { rows = false } = {}) => {
+  const response = await apiClient.get(`${PREFIX}/sweep/${id}`, { params: { rows } });
+  return response.data;
+};
+
+export const listSweeps = async (params = {}) => {
+  const response = await apiClient.get(`${PREFIX}/sweeps`, { params });
+  return response.data;
+};
+
+export const deleteSweep = async (id) => {
+  const response = await apiClient.delete(`${PREFIX}/sweep/${id}`);
+  return response.data;
+};
+
+/**
+ * Follow a running sweep over SSE. onProgress receives the current top runs
+ * (rebuilt from the server's top-N diffs); onComplete the stored sweep with
+ * its final ranking.
+ * @returns {function} - Abort function to close the stream
+ */
+export const streamSweep = (id, onProgress, onComplete, onError) => {
+  const eventSource = new EventSource(`${API_BASE_URL}${PREFIX}/sweep/${id}/stream${_tokenParam()}`);
+  const rows = new Map();
+  const ranks = new Map();
+
+  eventSource.onmessage = (event) => {
+    try {
+      const data = JSON.parse(event.data);
+      if (data.type === 'progress') {
+        (data.removed || []).forEach((key) => {
+          rows.delete(key);
+          ranks.delete(key);
+        });
+        (data.rows || []).forEach((row) => rows.set(row.id, row));
+        Object.entries(data.ranks || {}).forEach(([key, rank]) => ranks.set(key, rank));
+        onProgress({
+          processed: data.processed,
+          total: data.total,
+          top: [...rows.values()].sort((a, b) => ranks.get(a.id) - ranks.get(b.id)),
+        });
+      } else if (data.type === 'complete') {
+        eventSource.close();
+        onComplete(data);
+      } else if (data.type === 'error') {
+        eventSource.close();
+        onError(new Error(data.message));
+      }
+    } catch (err) {
+      console.error('Error parsing SSE data:', err);
+    }
+  };
+
+  eventSource.onerror = () => {
+    eventSource.close();
+    onError(new Error('Connection lost. Please try again.'));
+  };
+
+  return () => eventSource.close();
+};
+
 const backtestAPI = {
   runBacktest,
   getResults,
   listBacktests,
   deleteBacktest,
+  startSweep,
+  getSweep,
+  listSweeps,
+  deleteSweep,
+  streamSweep,
 };
 
 export default backtestAPI;
@@ -16,11 +16,38 @@ export const savedScansAPI = {
   },
 
   /**
-   * Get results for a specific scan type
+   * Get results for a specific scan type (sorted by score)
    * @param {string} scanType - The preset name
+   * @param {Object} params - Optional { fields: 'summary'|'full', limit, cursor }
    */
-  getResults: async (scanType) => {
-    const response = await apiClient.get(`${API_PREFIX}/results/${scanType}`);
+  getResults: async (scanType, params = {}) => {
+    const response = await apiClient.get(`${API_PREFIX}/results/${scanType}`, { params });
+    return response.data;
+  },
+
+  /**
+   * Get every summary row for a scan type, following next_cursor pages
+   * @param {string} scanType - The preset name
+   */
+  getAllSummaries: async (scanType) => {
+    let data = await savedScansAPI.getResults(scanType, { fields: 'summary', limit: 1000 });
+    const stocks = [...(data.stocks || [])];
+    while (data.next_cursor) {
+      data = await savedScansAPI.getResults(scanType, {
+        fields: 'summary', limit: 1000, cursor: data.next_cursor,
+      });
+      stocks.push(...(data.stocks || []));
+    }
+    return { ...data, stocks, next_cursor: null };
+  },
+
+  /**
+   * Get one saved stock with its full stock_data
+   * @param {string} scanType - The preset name
+   * @param {string} symbol - Stock symbol
+   */
+  getStock: async (scanType, symbol) => {
+    const response = await apiClient.get(`${API_PREFIX}/results/${scanType}/${symbol}`);
     return response.data;
   },
 
@@ -9,6 +9,33 @@ function _tokenParam() {
   return t ? `?token=${encodeURIComponent(t)}` : '';
 }
 
+/**
+ * Scan stream state: rebuilds the running top-N from progress diffs
+ * (rows entering, symbols removed, new ranks) and collects the chunked
+ * final results.
+ */
+function _scanStreamState() {
+  const rows = new Map();
+  const ranks = new Map();
+  const results = [];
+
+  return {
+    applyProgress(data) {
+      (data.removed || []).forEach((symbol) => {
+        rows.delete(symbol);
+        ranks.delete(symbol);
+      });
+      (data.rows || []).forEach((row) => rows.set(row.symbol, row));
+      Object.entries(data.ranks || {}).forEach(([symbol, rank]) => ranks.set(symbol, rank));
+      return [...rows.values()].sort((a, b) => ranks.get(a.symbol) - ranks.get(b.symbol));
+    },
+    addResults(data) {
+      results.push(...(data.results || []));
+    },
+    results: () => results,
+  };
+}
+
 export const screenerAPI = {
   /**
    * Screen multiple stocks
@@ -119,6 +146,7 @@ export const screenerAPI = {
     const eventSource = new EventSource(
       `${API_BASE_URL}/api/v1/screener/scan/stream/${preset}${_tokenParam()}`
     );
+    const stream = _scanStreamState();
 
     eventSource.onmessage = (event) => {
       try {
@@ -139,15 +167,17 @@ export const screenerAPI = {
             processed: data.processed,
             total: data.total,
             passed: data.passed,
-            candidates: data.top_candidates || []
+            candidates: stream.applyProgress(data)
           });
+        } else if (data.type === 'results') {
+          stream.addResults(data);
         } else if (data.type === 'complete') {
           eventSource.close();
           onComplete({
             processed: data.processed,
             total: data.total,
             passed: data.passed,
-            results: data.results || []
+            results: stream.results()
           });
         } else if (data.type === 'error') {
           eventSource.close();
@@ -265,6 +295,7 @@ export const screenerAPI = {
     const eventSource = new EventSource(
       `${API_BASE_URL}/api/v1/screener/scan/stream/all${_tokenParam()}`
     );
+    const stream = _scanStreamState();
 
     eventSource.onmessage = (event) => {
       try {
@@ -285,15 +316,17 @@ export const screenerAPI = {
             processed: data.processed,
             total: data.total,
             passed: data.passed,
-            candidates: data.top_candidates || [],
+            candidates: stream.applyProgress(data),
           });
+        } else if (data.type === 'results') {
+          stream.addResults(data);
         } else if (data.type === 'complete') {
           eventSource.close();
           onComplete({
             processed: data.processed,
             total: data.total,
             passed: data.passed,
-            results: data.results || [],
+            results: stream.results(),
             presetSummary: data.preset_summary || null,
             durationSeconds: data.duration_seconds || null,
           });
@@ -21,21 +21,14 @@ const CB_LABELS = {
 
 export default function BotStatusBar() {
   const status = useBotStore(state => state.status);
-  const fetchStatus = useBotStore(state => state.fetchStatus);
   const startPolling = useBotStore(state => state.startPolling);
   const stopPolling = useBotStore(state => state.stopPolling);
   const emergencyStop = useBotStore(state => state.emergencyStop);
 
   useEffect(() => {
-    fetchStatus();
-    // Only start polling if bot might be active
-    const checkAndPoll = async () => {
-      const currentStatus = useBotStore.getState().status;
-      if (currentStatus && currentStatus.status !== 'stopped') {
-        startPolling(10000);
-      }
-    };
-    checkAndPoll();
+    // Starts the bot.status listener too, so the bar appears when the bot starts;
+    // the 10s poll only runs while the event stream is down
+    startPolling(10000);
     return () => stopPolling();
   }, []);
 
@@ -14,6 +14,7 @@ import { autopilotApi } from '../api/autopilot';
 import apiClient from '../api/axios';
 import FullAutoBanner from '../components/common/FullAutoBanner';
 import useFullAutoLock from '../hooks/useFullAutoLock';
+import useEventStreamStore, { isEventStreamFresh } from '../stores/eventStreamStore';
 
 // =============================================================================
 // Helpers
@@ -253,10 +254,36 @@ export default function Autopilot() {
     fetchPresets();
   }, []);
 
-  // Polling: status every 15s, activity every 30s
+  // Pushed updates: scan/bot/signal/trade events refetch status + activity
+  const lastStatusAt = useRef(0);
+  const lastActivityAt = useRef(0);
   useEffect(() => {
-    const statusInterval = setInterval(fetchStatus, 15000);
-    const activityInterval = setInterval(fetchActivity, 30000);
+    const events = useEventStreamStore.getState();
+    let timer = null;
+    const refresh = () => {
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        lastStatusAt.current = lastActivityAt.current = Date.now();
+        fetchStatus();
+        fetchActivity();
+      }, 1000);
+    };
+    const offs = ['scan', 'bot', 'signals.new', 'trades'].map((topic) => events.on(topic, refresh));
+    return () => {
+      clearTimeout(timer);
+      offs.forEach((off) => off());
+    };
+  }, [fetchStatus, fetchActivity]);
+
+  // Polling fallback: status every 15s, activity every 30s (skipped while events are pushed)
+  useEffect(() => {
+    const poll = (fetchFn, lastAt) => () => {
+      if (isEventStreamFresh(lastAt.current)) return;
+      lastAt.current = Date.now();
+      fetchFn();
+    };
+    const statusInterval = setInterval(poll(fetchStatus, lastStatusAt), 15000);
+    const activityInterval = setInterval(poll(fetchActivity, lastActivityAt), 30000);
     return () => {
       clearInterval(statusInterval);
       clearInterval(activityInterval);
@@ -19,6 +19,11 @@ const STRATEGIES = [
   { value: 'mean_reversion', label: 'Mean Reversion', timeframes: ['1d'] },
 ];
 
+const ENGINES = [
+  { value: 'vectorized', label: 'Vectorized (fast)' },
+  { value: 'backtrader', label: 'Backtrader (validation)' },
+];
+
 const CAP_SIZES = [
   { value: 'large_cap', label: 'Large Cap' },
   { value: 'mid_cap', label: 'Mid Cap' },
@@ -273,6 +278,7 @@ export default function Backtesting() {
   const [endDate, setEndDate] = useState(today());
   const [capital, setCapital] = useState(100000);
   const [positionPct, setPositionPct] = useState(10);
+  const [engine, setEngine] = useState('vectorized');
 
   // Load history on mount
   useEffect(() => {
@@ -303,6 +309,7 @@ export default function Backtesting() {
         end_date: endDate,
         initial_capital: capital,
         position_size_pct: positionPct,
+        engine,
       });
     } catch (err) {
       // Error already set in store
@@ -459,6 +466,20 @@ export default function Backtesting() {
                 className="w-full px-3 py-2 rounded-lg border border-gray-300 dark:border-gray-600 bg-white dark:bg-gray-700 text-gray-900 dark:text-white text-sm focus:ring-2 focus:ring-blue-500"
               />
             </div>
+
+            {/* Engine */}
+            <div>
+              <label className="block text-xs font-medium text-gray-600 dark:text-gray-400 mb-1">Engine</label>
+              <select
+                value={engine}
+                onChange={e => setEngine(e.target.value)}
+                className="w-full px-3 py-2 rounded-lg border border-gray-300 dark:border-gray-600 bg-white dark:bg-gray-700 text-gray-900 dark:text-white text-sm focus:ring-2 focus:ring-blue-500"
+              >
+                {ENGINES.map(en => (
+                  <option key={en.value} value={en.value}>{en.label}</option>
+                ))}
+              </select>
+            </div>
           </div>
 
           {/* Run Button */}
@@ -9,8 +9,9 @@
  *   - Auto-refresh every 15 seconds (toggleable)
  *   - Force-check button for manual refresh
  */
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import apiClient from '../api/axios';
+import useEventStreamStore, { isEventStreamFresh } from '../stores/eventStreamStore';
 
 // ── Status styling ───────────────────────────────────────────────────────────
 
@@ -174,11 +175,28 @@ export default function Health() {
     fetchDashboard();
   }, []);
 
-  // Auto-refresh polling
+  // Auto-refresh: health.* transitions refetch; the 15s poll only runs while the event stream is down
+  const lastFetchAt = useRef(0);
   useEffect(() => {
     if (!autoRefresh) return;
-    const interval = setInterval(fetchDashboard, 15000);
-    return () => clearInterval(interval);
+    let timer = null;
+    const off = useEventStreamStore.getState().on('health', () => {
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        lastFetchAt.current = Date.now();
+        fetchDashboard();
+      }, 1000);
+    });
+    const interval = setInterval(() => {
+      if (isEventStreamFresh(lastFetchAt.current)) return;
+      lastFetchAt.current = Date.now();
+      fetchDashboard();
+    }, 15000);
+    return () => {
+      off();
+      clearTimeout(timer);
+      clearInterval(interval);
+    };
   }, [autoRefresh, fetchDashboard]);
 
   // Derived values
@@ -189,6 +207,7 @@ export default function Health() {
   const autoScan = dashboard?.auto_scan || {};
   const bot = dashboard?.trading_bot || {};
   const telegram = dashboard?.telegram || {};
+  const compute = dashboard?.compute_pool || {};
 
   // Sort jobs: overdue first, then errored, then by name
   const sortedJobs = Object.entries(jobs).sort(([, a], [, b]) => {
@@ -471,6 +490,25 @@ export default function Health() {
                 <StatusDot ok={telegram.running} />
               </div>
             </div>
+
+            {/* ── G. Compute Pool ──────────────────────────────────── */}
+            <div className="bg-white dark:bg-gray-800 rounded-xl border border-gray-200 dark:border-gray-700 p-4">
+              <div className="flex items-center gap-4">
+                <span className="text-lg">🧮</span>
+                <div className="flex-1">
+                  <span className="text-sm font-medium text-gray-900 dark:text-gray-100">Compute Pool</span>
+                  <span className="ml-3 text-xs text-gray-500 dark:text-gray-400">
+                    {compute.mode === 'process'
+                      ? `${compute.workers} workers · ${compute.in_flight || 0} in flight · queue ${compute.queue_depth || 0}/${compute.max_queue ?? '—'}`
+                      : 'Inline (no worker processes)'}
+                  </span>
+                  <span className="ml-3 text-xs text-gray-400 dark:text-gray-500">
+                    {compute.completed || 0} done · {compute.failed || 0} failed · {compute.inline_runs || 0} inline
+                  </span>
+                </div>
+                <StatusDot ok={!compute.max_queue || (compute.queue_depth || 0) < compute.max_queue} />
+              </div>
+            </div>
           </>
         )}
       </div>
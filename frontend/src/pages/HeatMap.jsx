@@ -211,7 +211,7 @@ export default function HeatMap() {
       const entries = await Promise.all(
         cats.map(async (cat) => {
           try {
-            const data = await savedScansAPI.getResults(cat.scan_type);
+            const data = await savedScansAPI.getAllSummaries(cat.scan_type);
             return [cat.display_name || cat.scan_type, data.stocks || []];
           } catch {
             return [cat.display_name || cat.scan_type, []];
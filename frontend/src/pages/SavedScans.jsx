@@ -13,6 +13,7 @@ import Card from '../components/common/Card';
 import StockDetail from '../components/screener/StockDetail';
 import { stocksAPI } from '../api/stocks';
 import { scanProcessingAPI } from '../api/scanProcessing';
+import { savedScansAPI } from '../api/savedScans';
 import { getChangeColor, formatChangePercent } from '../utils/formatters';
 
 // Format date for display
@@ -109,22 +110,31 @@ const CategoryItem = ({ category, isSelected, onClick, onDelete }) => {
 const StockRow = ({ stock, liveQuote, onDelete, onViewDetails, isSelected, onToggleSelect }) => {
   const [showDeleteConfirm, setShowDeleteConfirm] = useState(false);
 
-  // Extract data from stock_data if available
+  // Extract data from stock_data if available (summary rows don't carry it)
   const stockData = stock.stock_data || {};
   const indicators = stockData.technical_indicators || {};
 
   // Build stock object for detail view
-  const handleViewDetails = () => {
+  const handleViewDetails = async () => {
+    let fullData = stockData;
+    if (!stock.stock_data) {
+      try {
+        const full = await savedScansAPI.getStock(stock.scan_type, stock.symbol);
+        fullData = full.stock_data || {};
+      } catch (err) {
+        console.warn(`Could not load saved details for ${stock.symbol}:`, err);
+      }
+    }
     // Merge saved stock data with stock_data for full detail view
     const detailStock = {
-      ...stockData,
+      ...fullData,
       symbol: stock.symbol,
-      name: stock.company_name || stockData.company_name || stockData.name,
-      current_price: stock.current_price || stockData.current_price,
-      market_cap: stock.market_cap || stockData.market_cap,
-      score: stock.score || stockData.composite_score,
-      composite_score: stock.score || stockData.composite_score,
-      iv_rank: stock.iv_rank || stockData.iv_rank,
+      name: stock.company_name || fullData.company_name || fullData.name,
+      current_price: stock.current_price || fullData.current_price,
+      market_cap: stock.market_cap || fullData.market_cap,
+      score: stock.score || fullData.composite_score,
+      composite_score: stock.score || fullData.composite_score,
+      iv_rank: stock.iv_rank || fullData.iv_rank,
     };
     onViewDetails(detailStock);
   };
@@ -176,7 +186,7 @@ const StockRow = ({ stock, liveQuote, onDelete, onViewDetails, isSelected, onTog
         {(stock.iv_rank || stockData.iv_rank)?.toFixed(1) || '-'}%
       </td>
       <td className="px-4 py-4 whitespace-nowrap text-sm text-gray-600 dark:text-gray-400">
-        {(indicators.rsi || stockData.rsi)?.toFixed(1) || '-'}
+        {(stock.rsi || indicators.rsi || stockData.rsi)?.toFixed(1) || '-'}
       </td>
       <td className="px-4 py-4 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400">
         {formatDate(stock.scanned_at)}
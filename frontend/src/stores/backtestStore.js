@@ -5,6 +5,11 @@
 import { create } from 'zustand';
 import backtestAPI from '../api/backtesting';
 
+// Equity curve resolution to request: about one point per chart pixel
+function equityPoints() {
+  return Math.min(2000, Math.max(200, Math.round(window.innerWidth || 500)));
+}
+
 const useBacktestStore = create((set, get) => ({
   // State
   backtests: [],
@@ -38,7 +43,7 @@ const useBacktestStore = create((set, get) => ({
     const poll = async () => {
       if (document.hidden) return; // Skip polling when tab is hidden
       try {
-        const result = await backtestAPI.getResults(backtestId);
+        const result = await backtestAPI.getResults(backtestId, { points: equityPoints() });
         set({ currentResult: result });
         if (result.status === 'completed' || result.status === 'failed') {
           get().stopPolling();
@@ -81,7 +86,7 @@ const useBacktestStore = create((set, get) => ({
   // ─── Load Specific Result ──────────────────────────────────────
   loadResult: async (id) => {
     try {
-      const result = await backtestAPI.getResults(id);
+      const result = await backtestAPI.getResults(id, { points: equityPoints() });
       set({ currentResult: result, error: null });
       return result;
     } catch (err) {
@@ -1,9 +1,11 @@
 /**
  * Bot Store — Zustand store for trading bot state
  * Handles: config, status, active trades, performance, polling
+ * (bot.status / trades.* events replace the poll while the event stream is up)
  */
 import { create } from 'zustand';
 import botAPI from '../api/bot';
+import useEventStreamStore, { isEventStreamFresh } from './eventStreamStore';
 
 const useBotStore = create((set, get) => ({
   // State
@@ -202,10 +204,31 @@ const useBotStore = create((set, get) => ({
   // ─── Polling (with exponential backoff on errors) ───────────
   _pollTimer: null,
   _consecutiveErrors: 0,
+  _lastFetchAt: 0,
+  _eventUnsubs: [],
 
   startPolling: (baseIntervalMs = 10000) => {
-    const { _pollTimer } = get();
-    if (_pollTimer) return;
+    const { _pollTimer, _eventUnsubs } = get();
+    if (_pollTimer || _eventUnsubs.length) return;
+
+    // Pushed updates: state fields merged into status, trades refetched on entries/exits
+    const events = useEventStreamStore.getState();
+    let tradesTimer = null;
+    set({
+      _eventUnsubs: [
+        events.on('bot.status', (data) => {
+          if (!get().status) {
+            get().fetchStatus();
+            return;
+          }
+          set((state) => ({ status: { ...state.status, ...data } }));
+        }),
+        events.on('trades', () => {
+          clearTimeout(tradesTimer);
+          tradesTimer = setTimeout(() => get().fetchActiveTrades(), 1000);
+        }),
+      ],
+    });
 
     const schedulePoll = () => {
       const { _consecutiveErrors } = get();
@@ -215,15 +238,15 @@ const useBotStore = create((set, get) => ({
         60000
       );
       const timer = setTimeout(async () => {
-        if (document.hidden) {
-          // Tab hidden — schedule next poll without fetching
+        if (document.hidden || isEventStreamFresh(get()._lastFetchAt)) {
+          // Tab hidden or updates pushed — schedule next poll without fetching
           schedulePoll();
           return;
         }
         try {
           await get().fetchStatus();
           await get().fetchActiveTrades();
-          set({ _consecutiveErrors: 0 }); // Reset on success
+          set({ _consecutiveErrors: 0, _lastFetchAt: Date.now() }); // Reset on success
         } catch {
           set({ _consecutiveErrors: get()._consecutiveErrors + 1 });
         }
@@ -238,7 +261,7 @@ const useBotStore = create((set, get) => ({
       try {
         await get().fetchStatus();
         await get().fetchActiveTrades();
-        set({ _consecutiveErrors: 0 });
+        set({ _consecutiveErrors: 0, _lastFetchAt: Date.now() });
       } catch {
         set({ _consecutiveErrors: 1 });
       }
@@ -247,11 +270,12 @@ const useBotStore = create((set, get) => ({
   },
 
   stopPolling: () => {
-    const { _pollTimer } = get();
+    const { _pollTimer, _eventUnsubs } = get();
+    _eventUnsubs.forEach((off) => off());
     if (_pollTimer) {
       clearTimeout(_pollTimer);
-      set({ _pollTimer: null, _consecutiveErrors: 0 });
     }
+    set({ _pollTimer: null, _consecutiveErrors: 0, _eventUnsubs: [] });
   },
 
   // ─── Clear Error ────────────────────────────────────────────
@@ -0,0 +1,165 @@
+/**
+ * Zustand store for the app event stream (/ws/events)
+ *
+ * Manages:
+ * - One WebSocket per tab to the backend event bus
+ * - Topic listeners (on/off) for stores and pages
+ * - Connection status, which pollers check to skip their timer fetches
+ *
+ * The server pushes signals.new, signals.unread, trades.entry, trades.exit,
+ * bot.status, scan.progress, health.status and health.job. State topics are
+ * replayed on connect, so listeners get current values right away. While
+ * disconnected, the polling stores fall back to their normal intervals.
+ */
+import { create } from 'zustand';
+import { WS_BASE_URL } from '../api/axios';
+
+const TOKEN_KEY = 'leaps_auth_token';
+
+// While connected, pollers still refetch this often as a safety net
+export const RESYNC_INTERVAL_MS = 5 * 60 * 1000;
+
+// Use module-level variables for WebSocket (not in store state)
+let ws = null;
+let reconnectTimeout = null;
+let heartbeatInterval = null;
+const listeners = new Set();
+
+function _matches(topic, prefix) {
+  return topic === prefix || topic.startsWith(`${prefix}.`);
+}
+
+function _url() {
+  const t = localStorage.getItem(TOKEN_KEY);
+  return `${WS_BASE_URL}/ws/events${t ? `?token=${encodeURIComponent(t)}` : ''}`;
+}
+
+const useEventStreamStore = create((set, get) => ({
+  // Connection state
+  isConnected: false,
+  error: null,
+  reconnectAttempts: 0,
+  reconnectDelay: 3000,
+  maxReconnectDelay: 60000,
+
+  /**
+   * Connect to the event stream (no-op if already open/connecting)
+   */
+  connect: () => {
+    if (ws?.readyState === WebSocket.OPEN || ws?.readyState === WebSocket.CONNECTING) {
+      return;
+    }
+
+    try {
+      const socket = new WebSocket(_url());
+      ws = socket;
+
+      socket.onopen = () => {
+        if (ws !== socket || socket.readyState !== WebSocket.OPEN) {
+          return;
+        }
+        set({ isConnected: true, error: null, reconnectAttempts: 0 });
+
+        if (heartbeatInterval) clearInterval(heartbeatInterval);
+        heartbeatInterval = setInterval(() => {
+          if (ws?.readyState === WebSocket.OPEN) {
+            ws.send(JSON.stringify({ action: 'ping' }));
+          }
+        }, 30000);
+      };
+
+      socket.onmessage = (event) => {
+        let data;
+        try {
+          data = JSON.parse(event.data);
+        } catch (e) {
+          console.error('[EventStream] Parse error:', e);
+          return;
+        }
+        if (data.type !== 'event') return;
+
+        for (const { prefix, handler } of listeners) {
+          if (_matches(data.topic, prefix)) {
+            try {
+              handler(data.data, data);
+            } catch (e) {
+              console.error(`[EventStream] Listener error (${data.topic}):`, e);
+            }
+          }
+        }
+      };
+
+      socket.onerror = () => {
+        set({ error: 'Connection error' });
+      };
+
+      socket.onclose = () => {
+        if (ws === socket) {
+          ws = null;
+        }
+        if (heartbeatInterval) {
+          clearInterval(heartbeatInterval);
+          heartbeatInterval = null;
+        }
+        set({ isConnected: false });
+
+        // Keep retrying with backoff while anyone is listening (pollers cover the gap)
+        if (listeners.size === 0) return;
+        const { reconnectAttempts, reconnectDelay, maxReconnectDelay } = get();
+        const delay = Math.min(reconnectDelay * Math.pow(2, reconnectAttempts), maxReconnectDelay);
+        set({ reconnectAttempts: reconnectAttempts + 1 });
+        reconnectTimeout = setTimeout(() => get().connect(), delay);
+      };
+    } catch (e) {
+      console.error('[EventStream] Connection failed:', e);
+      set({ error: 'Failed to connect' });
+    }
+  },
+
+  /**
+   * Disconnect from the event stream
+   */
+  disconnect: () => {
+    if (reconnectTimeout) {
+      clearTimeout(reconnectTimeout);
+      reconnectTimeout = null;
+    }
+    if (heartbeatInterval) {
+      clearInterval(heartbeatInterval);
+      heartbeatInterval = null;
+    }
+    if (ws) {
+      ws.close();
+      ws = null;
+    }
+    set({ isConnected: false, reconnectAttempts: 0 });
+  },
+
+  /**
+   * Listen to a topic or topic prefix ('signals' matches 'signals.new').
+   * Connects on first listener; returns an unsubscribe function.
+   * @param {string} prefix
+   * @param {(data: Object, event: Object) => void} handler
+   */
+  on: (prefix, handler) => {
+    const entry = { prefix, handler };
+    listeners.add(entry);
+    get().connect();
+    return () => {
+      listeners.delete(entry);
+      if (listeners.size === 0) get().disconnect();
+    };
+  },
+}));
+
+/**
+ * True when a poller may skip its fetch: the stream is connected and the
+ * last fetch is newer than RESYNC_INTERVAL_MS.
+ * @param {number} lastFetchAt - Date.now() of the poller's last fetch
+ */
+export function isEventStreamFresh(lastFetchAt) {
+  return useEventStreamStore.getState().isConnected
+    && Date.now() - (lastFetchAt || 0) < RESYNC_INTERVAL_MS;
+}
+
+export default useEventStreamStore;
@@ -61,7 +61,8 @@ const useSavedScansStore = create((set, get) => ({
   fetchCategoryStocks: async (scanType) => {
     set({ loading: true, error: null, selectedCategory: scanType });
     try {
-      const data = await savedScansAPI.getResults(scanType);
+      // Summary rows only — full stock_data is fetched per stock on demand
+      const data = await savedScansAPI.getAllSummaries(scanType);
       set({
         selectedCategoryStocks: data.stocks || [],
         loading: false
@@ -5,11 +5,12 @@
  * - Signal queue (stocks being monitored)
  * - Trading signals (generated buy/sell signals)
  * - Unread count for bell icon
- * - Polling for updates
+ * - Updates pushed over the event stream, with polling as the fallback
  */
 import { create } from 'zustand';
 import signalsAPI from '../api/signals';
 import tradingAPI from '../api/trading';
+import useEventStreamStore, { isEventStreamFresh } from './eventStreamStore';
 
 // Notification sound (will be loaded on first play)
 let notificationSound = null;
@@ -195,22 +196,29 @@ const useSignalsStore = create((set, get) => ({
   fetchUnreadCount: async () => {
     try {
       const data = await signalsAPI.getUnreadCount();
-      const prevCount = get().unreadCount;
-      const newCount = data.unread_count || 0;
-
-      // Play sound if new signals arrived
-      if (newCount > prevCount && prevCount >= 0) {
-        get().playNotificationSound();
-      }
-
-      set({ unreadCount: newCount });
-      return newCount;
+      set({ _lastFetchAt: Date.now() });
+      return get().setUnreadCount(data.unread_count || 0);
     } catch (error) {
       console.error('Error fetching unread count:', error);
       return 0;
     }
   },
 
+  /**
+   * Set the unread count (from a fetch or a signals.unread event)
+   */
+  setUnreadCount: (newCount) => {
+    const prevCount = get().unreadCount;
+
+    // Play sound if new signals arrived
+    if (newCount > prevCount && prevCount >= 0) {
+      get().playNotificationSound();
+    }
+
+    set({ unreadCount: newCount });
+    return newCount;
+  },
+
   /**
    * Get full signal details
    */
@@ -432,22 +440,38 @@ const useSignalsStore = create((set, get) => ({
   // Backoff state for resilient polling
   _pollTimer: null,
   _pollErrors: 0,
+  _lastFetchAt: 0,
+  _eventUnsubs: [],
 
   /**
    * Start polling for unread count and new signals (with exponential backoff)
    */
   startPolling: (baseIntervalMs = 30000) => {
-    const { _pollTimer } = get();
-    if (_pollTimer) return;
+    const { _pollTimer, _eventUnsubs } = get();
+    if (_pollTimer || _eventUnsubs.length) return;
 
     console.log('Starting signal polling...');
 
+    // Pushed updates: the badge count directly, a loaded signal list refetched on new signals
+    const events = useEventStreamStore.getState();
+    let refetchTimer = null;
+    set({
+      _eventUnsubs: [
+        events.on('signals.unread', (data) => get().setUnreadCount(data.unread_count || 0)),
+        events.on('signals.new', () => {
+          if (get().signals.length === 0) return;
+          clearTimeout(refetchTimer);
+          refetchTimer = setTimeout(() => get().fetchSignals(), 1000);
+        }),
+      ],
+    });
+
     const schedulePoll = () => {
       const { _pollErrors } = get();
       // Exponential backoff: base * 2^errors, capped at 2 minutes
       const delay = Math.min(baseIntervalMs * Math.pow(2, _pollErrors), 120000);
       const timer = setTimeout(async () => {
-        if (document.hidden) {
+        if (document.hidden || isEventStreamFresh(get()._lastFetchAt)) {
           schedulePoll();
           return;
         }
@@ -476,12 +500,13 @@ const useSignalsStore = create((set, get) => ({
    * Stop polling
    */
   stopPolling: () => {
-    const { _pollTimer } = get();
+    const { _pollTimer, _eventUnsubs } = get();
+    _eventUnsubs.forEach((off) => off());
     if (_pollTimer) {
       console.log('Stopping signal polling');
       clearTimeout(_pollTimer);
-      set({ _pollTimer: null, _pollErrors: 0 });
     }
+    set({ _pollTimer: null, _pollErrors: 0, _eventUnsubs: [] });
   },
 
   // ==========================================================================